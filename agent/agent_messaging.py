@@ -10,18 +10,23 @@ Architecture:
 Features:
     - Real-time message streaming
     - Request/response for user approvals
-    - Message queueing and delivery
+    - Message queueing and delivery (callbacks or per-listener queues)
     - Timeout handling for responses
+    - Bounded history; evicted messages can spill to a JSON-lines file
 """
 
 from __future__ import annotations
 
 import asyncio
+import json
 import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional
+from itertools import islice
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -101,14 +106,29 @@ class AgentMessageBus:
             requires_response=True,
             response_timeout=300
         )
+
+        # Or consume messages as a stream
+        queue = bus.listen()
+        message = await queue.get()
     """
 
-    def __init__(self):
-        """Initialize message bus"""
+    def __init__(self, max_history: int = 1000, spill_path: Optional[Path] = None):
+        """
+        Initialize message bus
+
+        Args:
+            max_history: Messages kept in memory
+            spill_path: JSON-lines file that receives messages trimmed
+                        from history (None = discard them)
+        """
         self.listeners: List[Callable] = []
+        self.queues: List[asyncio.Queue] = []
         self.pending_responses: Dict[str, asyncio.Future] = {}
-        self.message_history: List[AgentMessage] = []
-        self.max_history: int = 1000
+        self.message_history: Deque[AgentMessage] = deque()
+        self.max_history: int = max_history
+        self.spill_path = spill_path
+        self._by_id: Dict[str, AgentMessage] = {}
+        self._evicted_pending: set = set()  # Trimmed from history, still awaiting a response
 
     def subscribe(self, callback: Callable):
         """
@@ -130,6 +150,28 @@ class AgentMessageBus:
         if callback in self.listeners:
             self.listeners.remove(callback)
 
+    def listen(self, maxsize: int = 1000) -> asyncio.Queue:
+        """
+        Receive agent messages through a queue instead of a callback.
+
+        Posting never waits on a queue; when one is full its oldest
+        message is dropped.
+
+        Args:
+            maxsize: Messages buffered for this listener
+
+        Returns:
+            Queue of AgentMessage (close with stop_listening)
+        """
+        queue: asyncio.Queue = asyncio.Queue(maxsize=maxsize)
+        self.queues.append(queue)
+        return queue
+
+    def stop_listening(self, queue: asyncio.Queue):
+        """Stop feeding a queue returned by listen()"""
+        if queue in self.queues:
+            self.queues.remove(queue)
+
     async def post_message(
         self,
         role: AgentRole,
@@ -171,14 +213,16 @@ class AgentMessageBus:
         # Add to history
         self._add_to_history(message)
 
+        # Register before notifying so listeners can answer straight away
+        if requires_response:
+            future = asyncio.get_running_loop().create_future()
+            self.pending_responses[message_id] = future
+
         # Notify all listeners
         await self._notify_listeners(message)
 
         # Wait for response if needed
         if requires_response:
-            future = asyncio.Future()
-            self.pending_responses[message_id] = future
-
             try:
                 response = await asyncio.wait_for(
                     future,
@@ -192,6 +236,9 @@ class AgentMessageBus:
                 # Clean up
                 if message_id in self.pending_responses:
                     del self.pending_responses[message_id]
+                if message_id in self._evicted_pending:
+                    self._evicted_pending.discard(message_id)
+                    self._by_id.pop(message_id, None)
 
         return None
 
@@ -220,11 +267,12 @@ class AgentMessageBus:
         Returns:
             List of pending messages
         """
-        pending = []
-        for message in self.message_history:
-            if message.requires_response and message.message_id in self.pending_responses:
-                pending.append(message)
-        return pending
+        pending = [
+            self._by_id[message_id]
+            for message_id in self.pending_responses
+            if message_id in self._by_id
+        ]
+        return [m for m in sorted(pending, key=lambda m: m.timestamp) if m.requires_response]
 
     def get_recent_messages(self, count: int = 50) -> List[AgentMessage]:
         """
@@ -236,22 +284,46 @@ class AgentMessageBus:
         Returns:
             List of recent messages
         """
-        return self.message_history[-count:]
+        start = max(0, len(self.message_history) - count) if count > 0 else 0
+        return list(islice(self.message_history, start, None))
+
+    def get_message(self, message_id: str) -> Optional[AgentMessage]:
+        """
+        Get a message from history (or still awaiting a response) by ID.
+
+        Args:
+            message_id: Message identifier
+
+        Returns:
+            AgentMessage, or None if unknown or trimmed from history
+        """
+        return self._by_id.get(message_id)
 
     def clear_history(self):
         """Clear message history"""
         self.message_history.clear()
+        self._by_id = {
+            message_id: message
+            for message_id, message in self._by_id.items()
+            if message_id in self.pending_responses
+        }
+        self._evicted_pending.update(self._by_id)
 
     async def _notify_listeners(self, message: AgentMessage):
         """Notify all subscribed listeners of new message"""
+        for queue in self.queues:
+            if queue.full():
+                queue.get_nowait()
+            queue.put_nowait(message)
+
         tasks = []
+        loop = asyncio.get_running_loop()
         for listener in self.listeners:
             # Call listener (could be async or sync)
             if asyncio.iscoroutinefunction(listener):
                 tasks.append(asyncio.create_task(listener(message)))
             else:
                 # Sync callback - run in executor
-                loop = asyncio.get_event_loop()
                 tasks.append(loop.run_in_executor(None, listener, message))
 
         # Wait for all listeners to process
@@ -261,10 +333,30 @@ class AgentMessageBus:
     def _add_to_history(self, message: AgentMessage):
         """Add message to history with size limit"""
         self.message_history.append(message)
+        self._by_id[message.message_id] = message
 
         # Trim history if too large
-        if len(self.message_history) > self.max_history:
-            self.message_history = self.message_history[-self.max_history:]
+        evicted = []
+        while len(self.message_history) > self.max_history:
+            old = self.message_history.popleft()
+            evicted.append(old)
+            if old.message_id in self.pending_responses:
+                self._evicted_pending.add(old.message_id)
+            else:
+                self._by_id.pop(old.message_id, None)
+
+        if evicted and self.spill_path:
+            self._spill(evicted)
+
+    def _spill(self, messages: List[AgentMessage]):
+        """Append messages trimmed from history to the spill file"""
+        try:
+            self.spill_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(self.spill_path, "a", encoding="utf-8") as f:
+                for message in messages:
+                    f.write(json.dumps(message.to_dict(), default=str) + "\n")
+        except OSError:
+            pass  # Spilling is best effort; history stays bounded regardless
 
     def _generate_message_id(self) -> str:
         """Generate unique message ID"""
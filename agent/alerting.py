@@ -13,6 +13,12 @@ Features:
 - Slack webhook notifications
 - PagerDuty integration
 - Alert history tracking
+- Asynchronous dispatch: one delivery queue and worker pool per channel,
+  so a slow channel never blocks the caller or other channels
+- Grouping: repeats of an alert (same rule and fingerprint) within a
+  window are folded into one follow-up notification
+- Per-channel rate limiting (token bucket)
+- Incremental rule evaluation from the metrics stream (no polling)
 
 Usage:
     >>> from agent.alerting import get_alert_manager
@@ -28,22 +34,31 @@ Usage:
     >>>
     >>> # Check alerts
     >>> alert_mgr.check_all_rules()
+
+With a MetricsCollector attached, rules are also evaluated as metrics
+are recorded, and triggered alerts are queued for delivery without
+waiting on any channel.
 """
 
 from __future__ import annotations
 
+import asyncio
+import atexit
 import json
 import os
 import smtplib
 import sqlite3
+import threading
 import time
-from dataclasses import dataclass, field
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field, replace
 from datetime import datetime, timedelta
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple
 from urllib import parse, request
 
 # Import monitoring module
@@ -105,6 +120,28 @@ class Alert:
     threshold: float
     timestamp: str
     metadata: Dict[str, Any] = field(default_factory=dict)
+    fingerprint: str = ""  # Distinguishes alerts of one rule for grouping
+
+    @property
+    def group_key(self) -> Tuple[str, str]:
+        return (self.rule_name, self.fingerprint)
+
+
+@dataclass
+class ChannelLimits:
+    """Delivery limits for one notification channel."""
+    rate_per_minute: float = 30.0  # Sustained sends per minute
+    burst: int = 10  # Sends allowed back to back
+    concurrency: int = 2  # Sends in flight at once
+    queue_size: int = 1000  # Oldest alerts are dropped beyond this
+
+    def __post_init__(self):
+        if self.rate_per_minute <= 0:
+            raise ValueError(f"rate_per_minute must be positive, got {self.rate_per_minute}")
+
+
+# Repeats of an alert within this window are grouped into one follow-up
+DEFAULT_GROUP_WINDOW_SECONDS = 60.0
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -398,6 +435,313 @@ class PagerDutyNotifier:
             return False
 
 
+# ══════════════════════════════════════════════════════════════════════
+# Alert Dispatcher
+# ══════════════════════════════════════════════════════════════════════
+
+
+class _TokenBucket:
+    """Async token bucket; acquire() waits until a send is allowed."""
+
+    def __init__(self, limits: ChannelLimits):
+        self.rate = limits.rate_per_minute / 60.0
+        self.capacity = max(1, limits.burst)
+        self.tokens = float(self.capacity)
+        self.updated = time.monotonic()
+
+    async def acquire(self) -> None:
+        while True:
+            now = time.monotonic()
+            self.tokens = min(self.capacity, self.tokens + (now - self.updated) * self.rate)
+            self.updated = now
+            if self.tokens >= 1:
+                self.tokens -= 1
+                return
+            await asyncio.sleep((1 - self.tokens) / self.rate)
+
+
+@dataclass
+class _AlertGroup:
+    channels: List[str]
+    count: int = 0
+    latest: Optional[Alert] = None
+
+
+class AlertDispatcher:
+    """
+    Asynchronous, rate-limited fan-out of alerts to notification channels.
+
+    Runs an event loop in a background thread. dispatch() only hands the
+    alert to that loop, so callers never wait on a channel. Each channel
+    has its own bounded queue, token bucket and worker threads for the
+    (blocking) notifier, so a slow or failing channel only delays itself.
+
+    The first alert for a (rule, fingerprint) pair is sent right away;
+    repeats within ``group_window_seconds`` are counted and sent as one
+    follow-up when the window closes.
+    """
+
+    def __init__(
+        self,
+        notifiers: Dict[str, Any],
+        limits: Optional[Dict[str, ChannelLimits]] = None,
+        default_limits: Optional[ChannelLimits] = None,
+        group_window_seconds: float = DEFAULT_GROUP_WINDOW_SECONDS,
+    ):
+        """
+        Initialize dispatcher.
+
+        Args:
+            notifiers: Channel name -> object with send(alert) -> bool
+            limits: Per-channel limit overrides
+            default_limits: Limits for channels without an override
+            group_window_seconds: Grouping window (0 = send every alert)
+        """
+        self.notifiers = notifiers
+        self.limits = limits or {}
+        self.default_limits = default_limits or ChannelLimits()
+        self.group_window = group_window_seconds
+
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._thread: Optional[threading.Thread] = None
+        self._start_lock = threading.Lock()
+        self._queues: Dict[str, asyncio.Queue] = {}
+        self._executors: Dict[str, ThreadPoolExecutor] = {}
+        self._groups: Dict[Tuple[str, str], _AlertGroup] = {}
+        self._stats: Dict[str, Dict[str, int]] = {}
+        self._suppressed = 0
+
+    def _ensure_started(self) -> asyncio.AbstractEventLoop:
+        with self._start_lock:
+            if self._loop is None:
+                loop = asyncio.new_event_loop()
+                self._thread = threading.Thread(
+                    target=loop.run_forever, name="alert-dispatcher", daemon=True
+                )
+                self._thread.start()
+                self._loop = loop
+        return self._loop
+
+    def dispatch(self, alert: Alert, channels: List[str]) -> None:
+        """
+        Queue an alert for delivery (returns immediately).
+
+        Args:
+            alert: Alert to send
+            channels: Channel names to notify
+        """
+        self._ensure_started().call_soon_threadsafe(self._accept, alert, list(channels))
+
+    # Everything below runs on the dispatcher loop
+
+    def _accept(self, alert: Alert, channels: List[str]) -> None:
+        if self.group_window <= 0:
+            self._fan_out(alert, channels)
+            return
+
+        group = self._groups.get(alert.group_key)
+        if group is not None:
+            group.count += 1
+            group.latest = alert
+            group.channels.extend(c for c in channels if c not in group.channels)
+            self._suppressed += 1
+            return
+
+        self._groups[alert.group_key] = _AlertGroup(channels=list(channels))
+        self._loop.call_later(self.group_window, self._close_group, alert.group_key)
+        self._fan_out(alert, channels)
+
+    def _close_group(self, key: Tuple[str, str]) -> None:
+        group = self._groups.pop(key, None)
+        if group is None or not group.count:
+            return
+        latest = group.latest
+        summary = replace(
+            latest,
+            message=(
+                f"{latest.message} ({group.count} similar alert"
+                f"{'s' if group.count != 1 else ''} in the last {self.group_window:g}s)"
+            ),
+            metadata={**latest.metadata, "grouped_count": group.count},
+        )
+        self._fan_out(summary, group.channels)
+
+    def _fan_out(self, alert: Alert, channels: List[str]) -> None:
+        for channel in channels:
+            if channel not in self.notifiers:
+                print(f"[AlertManager] Unknown channel: {channel}")
+                continue
+
+            queue = self._queues.get(channel)
+            if queue is None:
+                queue = self._start_channel(channel)
+
+            if queue.full():
+                # Drop the oldest queued alert rather than block or grow
+                queue.get_nowait()
+                queue.task_done()
+                self._stats[channel]["dropped"] += 1
+            queue.put_nowait(alert)
+
+    def _start_channel(self, channel: str) -> asyncio.Queue:
+        limits = self.limits.get(channel, self.default_limits)
+        queue: asyncio.Queue = asyncio.Queue(maxsize=limits.queue_size)
+        self._queues[channel] = queue
+        self._executors[channel] = ThreadPoolExecutor(
+            max_workers=limits.concurrency, thread_name_prefix=f"alert-{channel}"
+        )
+        self._stats[channel] = {"sent": 0, "failed": 0, "dropped": 0}
+
+        bucket = _TokenBucket(limits)
+        for _ in range(limits.concurrency):
+            self._loop.create_task(self._worker(channel, queue, bucket))
+        return queue
+
+    async def _worker(self, channel: str, queue: asyncio.Queue, bucket: _TokenBucket) -> None:
+        notifier = self.notifiers[channel]
+        executor = self._executors[channel]
+        while True:
+            alert = await queue.get()
+            try:
+                await bucket.acquire()
+                sent = await self._loop.run_in_executor(executor, notifier.send, alert)
+                self._stats[channel]["sent" if sent else "failed"] += 1
+            except Exception as e:
+                self._stats[channel]["failed"] += 1
+                print(f"[AlertManager] {channel} notification failed: {e}")
+            finally:
+                queue.task_done()
+
+    async def _join_queues(self) -> None:
+        await asyncio.gather(*(queue.join() for queue in list(self._queues.values())))
+
+    async def _cancel_workers(self) -> None:
+        workers = [t for t in asyncio.all_tasks() if t is not asyncio.current_task()]
+        for task in workers:
+            task.cancel()
+        await asyncio.gather(*workers, return_exceptions=True)
+
+    # Thread-safe helpers
+
+    def drain(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait until every queued alert has been delivered (or failed).
+
+        Grouped follow-ups that are still inside their window are not
+        waited for.
+
+        Args:
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            True if all queues emptied in time
+        """
+        if self._loop is None:
+            return True
+        # Let alerts handed over by dispatch() reach their queues first
+        asyncio.run_coroutine_threadsafe(asyncio.sleep(0), self._loop).result(timeout)
+        future = asyncio.run_coroutine_threadsafe(self._join_queues(), self._loop)
+        try:
+            future.result(timeout)
+            return True
+        except Exception:
+            future.cancel()
+            return False
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Per-channel sent/failed/dropped/queued counts and grouped repeats."""
+        channels = {
+            channel: {**counts, "queued": self._queues[channel].qsize()}
+            for channel, counts in self._stats.items()
+        }
+        return {"channels": channels, "suppressed": self._suppressed, "open_groups": len(self._groups)}
+
+    def close(self, timeout: Optional[float] = 10.0) -> None:
+        """Deliver queued alerts, then stop the loop and worker threads."""
+        if self._loop is None:
+            return
+        self.drain(timeout)
+        asyncio.run_coroutine_threadsafe(self._cancel_workers(), self._loop).result(timeout)
+        self._loop.call_soon_threadsafe(self._loop.stop)
+        self._thread.join(timeout)
+        self._loop.close()
+        for executor in self._executors.values():
+            executor.shutdown(wait=False)
+        self._loop = None
+        self._queues.clear()
+        self._executors.clear()
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Streaming Rule State
+# ══════════════════════════════════════════════════════════════════════
+
+
+class _MissionWindow:
+    """Running mission totals over a sliding time window."""
+
+    def __init__(self, span: timedelta):
+        self.span = span
+        self.events: Deque[Tuple[datetime, float, bool, bool]] = deque()
+        self.total = 0
+        self.successful = 0
+        self.failed = 0
+        self.cost = 0.0
+
+    def add(self, timestamp: datetime, status: str, cost: float) -> None:
+        event = (timestamp, cost, status == "success", status == "failed")
+        self.events.append(event)
+        self.total += 1
+        self.successful += event[2]
+        self.failed += event[3]
+        self.cost += cost
+
+    def evict(self, now: datetime) -> None:
+        cutoff = now - self.span
+        while self.events and self.events[0][0] < cutoff:
+            _, cost, successful, failed = self.events.popleft()
+            self.total -= 1
+            self.successful -= successful
+            self.failed -= failed
+            self.cost -= cost
+
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "total_missions": self.total,
+            "successful_missions": self.successful,
+            "failed_missions": self.failed,
+            "success_rate": self.successful / self.total if self.total else 0,
+            "failure_rate": self.failed / self.total if self.total else 0,
+            "total_cost_usd": self.cost,
+        }
+
+
+class StreamingRuleState:
+    """
+    Incrementally maintained inputs for the built-in alert conditions.
+
+    Mirrors the windows the polling conditions query (24h totals, 1h and
+    2h failure rates, latest queue length), updated per metric event.
+    """
+
+    def __init__(self):
+        self.day = _MissionWindow(timedelta(hours=24))
+        self.last_hour = _MissionWindow(timedelta(hours=1))
+        self.last_two_hours = _MissionWindow(timedelta(hours=2))
+        self.health: Optional[Dict[str, Any]] = None
+
+    def add_mission(self, timestamp: str, status: str, cost_usd: float) -> None:
+        moment = datetime.fromisoformat(timestamp)
+        for window in (self.day, self.last_hour, self.last_two_hours):
+            window.add(moment, status, cost_usd)
+        self.evict()
+
+    def evict(self, now: Optional[datetime] = None) -> None:
+        now = now or datetime.utcnow()
+        for window in (self.day, self.last_hour, self.last_two_hours):
+            window.evict(now)
+
+
 # ══════════════════════════════════════════════════════════════════════
 # Alert Manager
 # ══════════════════════════════════════════════════════════════════════
@@ -408,12 +752,25 @@ class AlertManager:
     Alert management system.
 
     Evaluates alert rules and sends notifications via configured channels.
+
+    Rules can be checked by polling (check_all_rules) or, when the
+    metrics collector supports subscribe(), evaluated on every recorded
+    metric from in-memory windows. Notifications go through an
+    AlertDispatcher and never block the caller.
     """
 
+    # Conditions evaluated when each kind of metric arrives
+    STREAM_CONDITIONS = {
+        "mission": ("daily_cost_exceeds", "success_rate_below", "error_rate_increases"),
+        "health": ("queue_length_exceeds",),
+    }
+
     def __init__(
         self,
         db_path: Optional[Path] = None,
         metrics_collector: Optional[MetricsCollector] = None,
+        dispatcher: Optional[AlertDispatcher] = None,
+        stream: bool = True,
     ):
         """
         Initialize alert manager.
@@ -421,6 +778,9 @@ class AlertManager:
         Args:
             db_path: Path to SQLite database (None = default location)
             metrics_collector: Metrics collector instance
+            dispatcher: Notification dispatcher (default: one over the
+                        email, Slack and PagerDuty notifiers)
+            stream: Evaluate rules as metrics are recorded
         """
         if db_path is None:
             if PATHS_AVAILABLE:
@@ -447,6 +807,17 @@ class AlertManager:
         self.email_notifier = EmailNotifier()
         self.slack_notifier = SlackNotifier()
         self.pagerduty_notifier = PagerDutyNotifier()
+        self.dispatcher = dispatcher or AlertDispatcher({
+            "email": self.email_notifier,
+            "slack": self.slack_notifier,
+            "pagerduty": self.pagerduty_notifier,
+        })
+
+        # In-memory rule and cooldown caches (kept in sync with the database)
+        self._rules_lock = threading.RLock()
+        self._rules_cache: Optional[List[AlertRule]] = None
+        self._cooldowns: Dict[str, datetime] = self._load_cooldowns()
+        self.stream_state = StreamingRuleState()
 
         # Built-in alert conditions
         self.conditions: Dict[str, Callable] = {
@@ -456,6 +827,15 @@ class AlertManager:
             "approval_timeout": self._check_approval_timeout,
             "queue_length_exceeds": self._check_queue_length_exceeds,
         }
+        self.stream_conditions: Dict[str, Callable] = {
+            "daily_cost_exceeds": self._stream_daily_cost_exceeds,
+            "success_rate_below": self._stream_success_rate_below,
+            "error_rate_increases": self._stream_error_rate_increases,
+            "queue_length_exceeds": self._stream_queue_length_exceeds,
+        }
+
+        if stream and self.metrics is not None and hasattr(self.metrics, "subscribe"):
+            self.attach(self.metrics)
 
     def _init_database(self) -> None:
         """Create database tables if they don't exist."""
@@ -516,6 +896,7 @@ class AlertManager:
                 now,
             ))
             conn.commit()
+        self._rules_cache = None
 
     def get_rules(self, enabled_only: bool = True) -> List[AlertRule]:
         """
@@ -560,6 +941,7 @@ class AlertManager:
                 (self._now(), name),
             )
             conn.commit()
+        self._rules_cache = None
 
     def enable_rule(self, name: str) -> None:
         """Enable alert rule."""
@@ -569,6 +951,14 @@ class AlertManager:
                 (self._now(), name),
             )
             conn.commit()
+        self._rules_cache = None
+
+    def _enabled_rules(self) -> List[AlertRule]:
+        """Enabled rules from memory (reloaded after any rule change)."""
+        with self._rules_lock:
+            if self._rules_cache is None:
+                self._rules_cache = self.get_rules(enabled_only=True)
+            return self._rules_cache
 
     # ──────────────────────────────────────────────────────────────────
     # Alert Conditions
@@ -671,6 +1061,123 @@ class AlertManager:
             )
         return None
 
+    # ──────────────────────────────────────────────────────────────────
+    # Streaming Evaluation
+    # ──────────────────────────────────────────────────────────────────
+
+    def attach(self, metrics_collector: MetricsCollector) -> None:
+        """
+        Evaluate rules on every metric the collector records.
+
+        Seeds the in-memory windows from the last 24 hours of missions.
+
+        Args:
+            metrics_collector: Collector with subscribe()
+        """
+        self.stream_state = StreamingRuleState()
+        if hasattr(metrics_collector, "recent_missions"):
+            for event in metrics_collector.recent_missions(hours=24):
+                self.stream_state.add_mission(event["timestamp"], event["status"], event["cost_usd"])
+        metrics_collector.subscribe(self.on_metric)
+
+    def on_metric(self, kind: str, event: Dict[str, Any]) -> List[Alert]:
+        """
+        Update rule state with one metric and fire any rules it trips.
+
+        Args:
+            kind: Metric kind ("mission", "health", ...)
+            event: Metric fields as recorded
+
+        Returns:
+            Alerts fired by this metric
+        """
+        conditions = self.STREAM_CONDITIONS.get(kind)
+        if not conditions:
+            return []
+
+        with self._rules_lock:
+            if kind == "mission":
+                self.stream_state.add_mission(event["timestamp"], event["status"], event["cost_usd"])
+            elif kind == "health":
+                self.stream_state.health = event
+
+            fired = []
+            for rule in self._enabled_rules():
+                if rule.condition not in conditions or self._is_in_cooldown(rule.name):
+                    continue
+                alert = self.stream_conditions[rule.condition](rule)
+                if alert:
+                    self._fire(alert, rule)
+                    fired.append(alert)
+        return fired
+
+    def _stream_daily_cost_exceeds(self, rule: AlertRule) -> Optional[Alert]:
+        stats = self.stream_state.day.stats()
+        current_cost = stats["total_cost_usd"]
+        if current_cost > rule.threshold:
+            return Alert(
+                rule_name=rule.name,
+                severity=rule.severity,
+                message=f"Daily cost ${current_cost:.2f} exceeds threshold ${rule.threshold:.2f}",
+                current_value=current_cost,
+                threshold=rule.threshold,
+                timestamp=self._now(),
+                metadata={"stats": stats},
+            )
+        return None
+
+    def _stream_success_rate_below(self, rule: AlertRule) -> Optional[Alert]:
+        stats = self.stream_state.day.stats()
+        success_rate = stats["success_rate"] * 100  # Convert to percentage
+        if success_rate < rule.threshold:
+            return Alert(
+                rule_name=rule.name,
+                severity=rule.severity,
+                message=f"Success rate {success_rate:.1f}% is below threshold {rule.threshold:.1f}%",
+                current_value=success_rate,
+                threshold=rule.threshold,
+                timestamp=self._now(),
+                metadata={"stats": stats},
+            )
+        return None
+
+    def _stream_error_rate_increases(self, rule: AlertRule) -> Optional[Alert]:
+        recent_stats = self.stream_state.last_hour.stats()
+        previous_stats = self.stream_state.last_two_hours.stats()
+        recent_rate = recent_stats["failure_rate"]
+        previous_rate = previous_stats["failure_rate"]
+
+        if previous_rate > 0 and recent_rate > previous_rate * rule.threshold:
+            increase_factor = recent_rate / previous_rate
+            return Alert(
+                rule_name=rule.name,
+                severity=rule.severity,
+                message=f"Error rate increased {increase_factor:.1f}x (from {previous_rate:.1%} to {recent_rate:.1%})",
+                current_value=increase_factor,
+                threshold=rule.threshold,
+                timestamp=self._now(),
+                metadata={"recent_stats": recent_stats, "previous_stats": previous_stats},
+            )
+        return None
+
+    def _stream_queue_length_exceeds(self, rule: AlertRule) -> Optional[Alert]:
+        health = self.stream_state.health
+        if not health:
+            return None
+
+        queue_length = health["queue_length"]
+        if queue_length > rule.threshold:
+            return Alert(
+                rule_name=rule.name,
+                severity=rule.severity,
+                message=f"Queue length {queue_length} exceeds threshold {rule.threshold}",
+                current_value=queue_length,
+                threshold=rule.threshold,
+                timestamp=self._now(),
+                metadata={"health": health},
+            )
+        return None
+
     # ──────────────────────────────────────────────────────────────────
     # Alert Evaluation
     # ──────────────────────────────────────────────────────────────────
@@ -711,42 +1218,49 @@ class AlertManager:
             alert = self.check_rule(rule)
             if alert:
                 alerts.append(alert)
-                # Send notifications
-                self._send_alert(alert, rule.channels)
-                # Record in history
-                self._record_alert(alert, rule.channels)
-                # Set cooldown
-                self._set_cooldown(rule.name, rule.cooldown_minutes)
+                self._fire(alert, rule)
 
         return alerts
 
+    def _fire(self, alert: Alert, rule: AlertRule) -> None:
+        """Queue notifications, record history and start the cooldown."""
+        # Send notifications (queued; doesn't wait for delivery)
+        self._send_alert(alert, rule.channels)
+        # Record in history
+        self._record_alert(alert, rule.channels)
+        # Set cooldown
+        self._set_cooldown(rule.name, rule.cooldown_minutes)
+
     # ──────────────────────────────────────────────────────────────────
     # Cooldown Management
     # ──────────────────────────────────────────────────────────────────
 
+    def _load_cooldowns(self) -> Dict[str, datetime]:
+        """Active cooldowns from the database."""
+        with sqlite3.connect(self.db_path) as conn:
+            rows = conn.execute("SELECT rule_name, cooldown_until FROM alert_cooldowns").fetchall()
+        return {name: datetime.fromisoformat(until) for name, until in rows}
+
     def _is_in_cooldown(self, rule_name: str) -> bool:
-        """Check if rule is in cooldown period."""
+        """Check if rule is in cooldown period (from memory, no database read)."""
+        cooldown_until = self._cooldowns.get(rule_name)
+        if cooldown_until is None:
+            return False
+        if datetime.utcnow() < cooldown_until:
+            return True
+
+        # Cooldown expired, remove it
+        self._cooldowns.pop(rule_name, None)
         with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute(
-                "SELECT cooldown_until FROM alert_cooldowns WHERE rule_name = ?",
-                (rule_name,),
-            )
-            row = cursor.fetchone()
-            if row:
-                cooldown_until = datetime.fromisoformat(row[0])
-                if datetime.utcnow() < cooldown_until:
-                    return True
-                else:
-                    # Cooldown expired, remove it
-                    conn.execute("DELETE FROM alert_cooldowns WHERE rule_name = ?", (rule_name,))
-                    conn.commit()
+            conn.execute("DELETE FROM alert_cooldowns WHERE rule_name = ?", (rule_name,))
+            conn.commit()
         return False
 
     def _set_cooldown(self, rule_name: str, cooldown_minutes: int) -> None:
         """Set cooldown for rule."""
         now = datetime.utcnow()
         cooldown_until = now + timedelta(minutes=cooldown_minutes)
+        self._cooldowns[rule_name] = cooldown_until
 
         with sqlite3.connect(self.db_path) as conn:
             conn.execute("""
@@ -760,16 +1274,20 @@ class AlertManager:
     # ──────────────────────────────────────────────────────────────────
 
     def _send_alert(self, alert: Alert, channels: List[str]) -> None:
-        """Send alert via configured channels."""
-        for channel in channels:
-            if channel == "email":
-                self.email_notifier.send(alert)
-            elif channel == "slack":
-                self.slack_notifier.send(alert)
-            elif channel == "pagerduty":
-                self.pagerduty_notifier.send(alert)
-            else:
-                print(f"[AlertManager] Unknown channel: {channel}")
+        """Queue alert for delivery via configured channels (non-blocking)."""
+        self.dispatcher.dispatch(alert, channels)
+
+    def flush_notifications(self, timeout: Optional[float] = None) -> bool:
+        """
+        Wait for queued notifications to be delivered.
+
+        Args:
+            timeout: Seconds to wait (None = no limit)
+
+        Returns:
+            True if every queued notification was attempted in time
+        """
+        return self.dispatcher.drain(timeout)
 
     def _record_alert(self, alert: Alert, channels: List[str]) -> None:
         """Record alert in history."""
@@ -852,6 +1370,8 @@ def get_alert_manager() -> AlertManager:
     global _alert_manager
     if _alert_manager is None:
         _alert_manager = AlertManager()
+        # Deliver queued notifications before the process exits
+        atexit.register(_alert_manager.dispatcher.close)
     return _alert_manager
 
 
@@ -7,17 +7,27 @@ This module implements a flexible approval workflow engine that supports:
 - Parallel approval requirements
 - Timeouts and escalations
 - Integration with the orchestrator for pause/resume
+- Bulk request creation and decision processing in one transaction
+
+Each thread reuses one WAL-mode SQLite connection, workflow definitions are
+cached in memory once registered or loaded, and step conditions are
+validated and compiled once per distinct expression.
 
 Author: AI Agent System
 Created: Phase 3.1 - Approval Workflows
 """
 
+import ast
 import json
 import sqlite3
+import threading
 import uuid
+from contextlib import contextmanager
+from functools import lru_cache
+from types import CodeType
 from dataclasses import dataclass, field, asdict
 from datetime import datetime, timedelta
-from typing import Dict, List, Optional, Set, Any, Tuple
+from typing import Dict, Iterable, Iterator, List, Optional, Set, Any, Tuple
 from enum import Enum
 import logging
 from pathlib import Path
@@ -173,6 +183,71 @@ class ApprovalRequest:
             self.updated_at = self.created_at
 
 
+# ============================================================================
+# CONDITIONS
+# ============================================================================
+
+# Names a condition can use besides ``payload``
+_CONDITION_GLOBALS: Dict[str, Any] = {
+    '__builtins__': {},
+    'len': len,
+    'str': str,
+    'int': int,
+    'float': float,
+    'bool': bool,
+    'abs': abs,
+    'min': min,
+    'max': max,
+    'sum': sum,
+    'any': any,
+    'all': all,
+    'True': True,
+    'False': False,
+    'None': None,
+}
+
+
+@lru_cache(maxsize=1024)
+def compile_condition(condition: str) -> Optional[CodeType]:
+    """
+    Validate and compile a condition expression.
+
+    The expression is parsed and checked against an allow-list of AST node
+    types (no lambdas, comprehensions, imports, etc.) once; the result is
+    cached, so evaluating the same step condition for many requests only
+    runs the compiled code.
+
+    Args:
+        condition: Python expression, e.g. "payload['amount'] > 10000"
+
+    Returns:
+        Compiled code object, or None if the expression is invalid or unsafe
+    """
+    try:
+        # Parse the condition to validate it's a safe expression
+        tree = ast.parse(condition, mode='eval')
+    except SyntaxError as e:
+        logger.error(f"Invalid condition syntax '{condition}': {e}")
+        return None
+
+    # Allow only safe node types (no function definitions, imports, etc.)
+    allowed_types = (
+        ast.Expression, ast.BoolOp, ast.BinOp, ast.UnaryOp,
+        ast.Compare, ast.Call, ast.Constant, ast.Num, ast.Str,
+        ast.Name, ast.Attribute, ast.Subscript, ast.Index,
+        ast.Load, ast.And, ast.Or, ast.Not, ast.Eq, ast.NotEq,
+        ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn,
+        ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod,
+        ast.List, ast.Tuple, ast.Dict, ast.Set,
+    )
+    for node in ast.walk(tree):
+        if not isinstance(node, allowed_types):
+            logger.warning(f"Unsafe AST node type in condition: {type(node).__name__}")
+            return None
+
+    return compile(tree, '<condition>', 'eval')
+
+
 # ============================================================================
 # APPROVAL ENGINE
 # ============================================================================
@@ -187,19 +262,89 @@ class ApprovalEngine:
     - Decision processing
     - Timeout handling
     - State persistence
+
+    Each thread gets one long-lived WAL connection. Workflow definitions
+    are cached per engine after register_workflow/get_workflow, so a
+    workflow replaced through another engine instance is only seen here
+    after a restart.
     """
 
-    def __init__(self, db_path: str = "data/knowledge_graph.db"):
+    def __init__(self, db_path: str = "data/knowledge_graph.db", busy_timeout_ms: int = 5000):
         self.db_path = db_path
+        self.busy_timeout_ms = busy_timeout_ms
+        self._local = threading.local()
+
+        # Workflow cache: workflow_id -> workflow, (domain, task_type) -> workflow_id
+        self._workflows: Dict[str, ApprovalWorkflow] = {}
+        self._workflow_ids: Dict[Tuple[str, str], str] = {}
+        self._workflow_lock = threading.Lock()
+
         self._ensure_schema()
         logger.info(f"ApprovalEngine initialized with database: {db_path}")
 
+    @staticmethod
+    def _is_open(conn: sqlite3.Connection) -> bool:
+        """Check a connection has not been closed by a caller"""
+        try:
+            return conn.total_changes >= 0  # Raises once the connection is closed
+        except sqlite3.ProgrammingError:
+            return False
+
     def _get_connection(self) -> sqlite3.Connection:
-        """Get database connection"""
-        conn = sqlite3.connect(self.db_path)
+        """
+        Get this thread's database connection.
+
+        The connection is opened on first use and reused afterwards; callers
+        should not close it (a closed connection is transparently reopened).
+        """
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None and self._is_open(conn):
+            return conn
+
+        conn = sqlite3.connect(self.db_path, timeout=self.busy_timeout_ms / 1000)
         conn.row_factory = sqlite3.Row
+        conn.execute("PRAGMA journal_mode=WAL")
+        conn.execute("PRAGMA synchronous=NORMAL")
+        conn.execute(f"PRAGMA busy_timeout={int(self.busy_timeout_ms)}")
+        self._local.conn = conn
+        self._local.depth = 0
         return conn
 
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """
+        Run a block of writes in one transaction.
+
+        Nested blocks join the outermost one, so the bulk APIs can wrap the
+        single-item methods and commit once. Any exception rolls back the
+        whole transaction.
+        """
+        conn = self._get_connection()
+        if self._local.depth:
+            self._local.depth += 1
+            try:
+                yield conn
+            finally:
+                self._local.depth -= 1
+            return
+
+        self._local.depth = 1
+        try:
+            yield conn
+            conn.commit()
+        except BaseException:
+            conn.rollback()
+            raise
+        finally:
+            self._local.depth = 0
+
+    def close(self):
+        """Close the calling thread's database connection"""
+        conn = getattr(self._local, 'conn', None)
+        if conn is not None:
+            conn.close()
+            self._local.conn = None
+
     def _ensure_schema(self):
         """Create approval tables if they don't exist"""
         conn = self._get_connection()
@@ -268,7 +413,6 @@ class ApprovalEngine:
         cursor.execute("CREATE INDEX IF NOT EXISTS idx_decisions_approver ON approval_decisions(approver_user_id)")
 
         conn.commit()
-        conn.close()
         logger.info("Approval workflow schema created/verified")
 
     # ========================================================================
@@ -285,54 +429,67 @@ class ApprovalEngine:
         Returns:
             True if registered successfully
         """
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
         try:
             # Serialize steps
             steps_json = json.dumps([asdict(step) for step in workflow.steps])
 
-            cursor.execute("""
-                INSERT OR REPLACE INTO approval_workflows
-                (workflow_id, domain, task_type, workflow_name, description,
-                 steps, auto_approve_conditions, created_at, created_by, updated_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                workflow.workflow_id,
-                workflow.domain,
-                workflow.task_type,
-                workflow.workflow_name,
-                workflow.description,
-                steps_json,
-                workflow.auto_approve_conditions,
-                workflow.created_at,
-                workflow.created_by,
-                datetime.utcnow().isoformat(),
-                None
-            ))
-
-            conn.commit()
-            logger.info(f"Registered workflow: {workflow.workflow_id} ({workflow.domain}/{workflow.task_type})")
-            return True
+            with self._transaction() as conn:
+                conn.execute("""
+                    INSERT OR REPLACE INTO approval_workflows
+                    (workflow_id, domain, task_type, workflow_name, description,
+                     steps, auto_approve_conditions, created_at, created_by, updated_at, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    workflow.workflow_id,
+                    workflow.domain,
+                    workflow.task_type,
+                    workflow.workflow_name,
+                    workflow.description,
+                    steps_json,
+                    workflow.auto_approve_conditions,
+                    workflow.created_at,
+                    workflow.created_by,
+                    datetime.utcnow().isoformat(),
+                    None
+                ))
 
         except Exception as e:
             logger.error(f"Failed to register workflow {workflow.workflow_id}: {e}")
-            conn.rollback()
             return False
-        finally:
-            conn.close()
+
+        self._cache_workflow(workflow)
+        logger.info(f"Registered workflow: {workflow.workflow_id} ({workflow.domain}/{workflow.task_type})")
+        return True
+
+    def _cache_workflow(self, workflow: ApprovalWorkflow):
+        """Cache a workflow and compile its conditions ahead of first use"""
+        key = (workflow.domain, workflow.task_type)
+        with self._workflow_lock:
+            # (domain, task_type) is unique, so INSERT OR REPLACE dropped any
+            # other workflow registered for the same type
+            previous_id = self._workflow_ids.get(key)
+            if previous_id and previous_id != workflow.workflow_id:
+                self._workflows.pop(previous_id, None)
+            stale = self._workflows.get(workflow.workflow_id)
+            if stale and (stale.domain, stale.task_type) != key:
+                self._workflow_ids.pop((stale.domain, stale.task_type), None)
+
+            self._workflows[workflow.workflow_id] = workflow
+            self._workflow_ids[key] = workflow.workflow_id
+
+        for condition in [workflow.auto_approve_conditions] + [s.condition for s in workflow.steps]:
+            if condition:
+                compile_condition(condition)
 
     def get_workflow(self, workflow_id: str) -> Optional[ApprovalWorkflow]:
-        """Get workflow by ID"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        """Get workflow by ID (cached after the first lookup)"""
+        workflow = self._workflows.get(workflow_id)
+        if workflow is not None:
+            return workflow
 
-        cursor.execute("""
+        row = self._get_connection().execute("""
             SELECT * FROM approval_workflows WHERE workflow_id = ?
-        """, (workflow_id,))
-
-        row = cursor.fetchone()
-        conn.close()
+        """, (workflow_id,)).fetchone()
 
         if not row:
             return None
@@ -341,7 +498,7 @@ class ApprovalEngine:
         steps_data = json.loads(row['steps'])
         steps = [ApprovalStep(**step_dict) for step_dict in steps_data]
 
-        return ApprovalWorkflow(
+        workflow = ApprovalWorkflow(
             workflow_id=row['workflow_id'],
             domain=row['domain'],
             task_type=row['task_type'],
@@ -352,24 +509,23 @@ class ApprovalEngine:
             created_at=row['created_at'],
             created_by=row['created_by']
         )
+        self._cache_workflow(workflow)
+        return workflow
 
     def get_workflow_by_type(self, domain: str, task_type: str) -> Optional[ApprovalWorkflow]:
         """Get workflow by domain and task type"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
+        workflow_id = self._workflow_ids.get((domain, task_type))
+        if workflow_id is None:
+            row = self._get_connection().execute("""
+                SELECT workflow_id FROM approval_workflows
+                WHERE domain = ? AND task_type = ?
+            """, (domain, task_type)).fetchone()
 
-        cursor.execute("""
-            SELECT workflow_id FROM approval_workflows
-            WHERE domain = ? AND task_type = ?
-        """, (domain, task_type))
+            if not row:
+                return None
+            workflow_id = row['workflow_id']
 
-        row = cursor.fetchone()
-        conn.close()
-
-        if not row:
-            return None
-
-        return self.get_workflow(row['workflow_id'])
+        return self.get_workflow(workflow_id)
 
     # ========================================================================
     # APPROVAL REQUEST MANAGEMENT
@@ -399,21 +555,82 @@ class ApprovalEngine:
         if not workflow:
             raise ValueError(f"Workflow {workflow_id} not found")
 
+        request = self._new_request(workflow, mission_id, payload, created_by)
+
+        # Save to database
+        self._save_request(request)
+
+        if request.status == ApprovalStatus.PENDING:
+            logger.info(f"Created approval request {request.request_id} for mission {mission_id}")
+            logger.info(f"  Current steps: {request.current_step_ids}")
+        else:
+            logger.info(f"Auto-approved request {request.request_id} for mission {mission_id}")
+
+        return request
+
+    def create_approval_requests(
+        self,
+        workflow_id: str,
+        items: Iterable[Dict[str, Any]],
+        created_by: Optional[str] = None
+    ) -> List[ApprovalRequest]:
+        """
+        Create many approval requests for one workflow in a single transaction.
+
+        Intended for batch imports: the workflow is looked up once and all
+        rows are written with one executemany, so either every request is
+        stored or none is.
+
+        Args:
+            workflow_id: ID of the workflow to use
+            items: Dicts with "mission_id", "payload" and optionally "created_by"
+            created_by: Default creator for items that don't set one
+
+        Returns:
+            The created requests, in input order
+        """
+        workflow = self.get_workflow(workflow_id)
+        if not workflow:
+            raise ValueError(f"Workflow {workflow_id} not found")
+
+        requests = [
+            self._new_request(
+                workflow,
+                item['mission_id'],
+                item['payload'],
+                item.get('created_by', created_by)
+            )
+            for item in items
+        ]
+        self._save_requests(requests)
+
+        auto_approved = sum(1 for r in requests if r.status == ApprovalStatus.APPROVED)
+        logger.info(
+            f"Created {len(requests)} approval requests for workflow {workflow_id} "
+            f"({auto_approved} auto-approved)"
+        )
+        return requests
+
+    def _new_request(
+        self,
+        workflow: ApprovalWorkflow,
+        mission_id: str,
+        payload: Dict[str, Any],
+        created_by: Optional[str]
+    ) -> ApprovalRequest:
+        """Build an unsaved request, auto-approving it if the workflow allows"""
         # Check auto-approve conditions
         if workflow.auto_approve_conditions:
             if self._evaluate_condition(workflow.auto_approve_conditions, payload):
-                logger.info(f"Auto-approving request for mission {mission_id}")
+                logger.debug(f"Auto-approving request for mission {mission_id}")
                 return self._create_auto_approved_request(workflow, mission_id, payload, created_by)
 
-        # Create request
-        request_id = str(uuid.uuid4())
-
         # Determine first step(s)
         current_step_ids, actual_index = self._get_next_steps(workflow, 0, payload)
 
-        request = ApprovalRequest(
-            request_id=request_id,
-            workflow_id=workflow_id,
+        return ApprovalRequest(
+            request_id=str(uuid.uuid4()),
+            workflow_id=workflow.workflow_id,
             mission_id=mission_id,
             domain=workflow.domain,
             task_type=workflow.task_type,
@@ -424,14 +641,6 @@ class ApprovalEngine:
             created_by=created_by
         )
 
-        # Save to database
-        self._save_request(request)
-
-        logger.info(f"Created approval request {request_id} for mission {mission_id}")
-        logger.info(f"  Current steps: {current_step_ids}")
-
-        return request
-
     def _create_auto_approved_request(
         self,
         workflow: ApprovalWorkflow,
@@ -439,7 +648,7 @@ class ApprovalEngine:
         payload: Dict[str, Any],
         created_by: Optional[str]
     ) -> ApprovalRequest:
-        """Create an auto-approved request"""
+        """Create an auto-approved request (the caller saves it)"""
         request_id = str(uuid.uuid4())
         now = datetime.utcnow().isoformat()
 
@@ -469,7 +678,6 @@ class ApprovalEngine:
         )
 
         request.decisions.append(decision)
-        self._save_request(request)
 
         return request
 
@@ -535,9 +743,6 @@ class ApprovalEngine:
 
         request.decisions.append(decision_record)
 
-        # Save decision to database
-        self._save_decision(decision_record)
-
         # Process based on decision type
         if decision == DecisionType.REJECT:
             request.status = ApprovalStatus.REJECTED
@@ -560,12 +765,42 @@ class ApprovalEngine:
             # Add to history but don't change state
             logger.info(f"Additional info requested for {request_id} by {approver_user_id}")
 
-        # Update request
+        # Save decision and updated request together
         request.updated_at = datetime.utcnow().isoformat()
-        self._save_request(request)
+        with self._transaction():
+            self._save_decision(decision_record)
+            self._save_request(request)
 
         return request
 
+    def process_decisions(self, decisions: Iterable[Dict[str, Any]]) -> List[ApprovalRequest]:
+        """
+        Process many decisions in a single transaction.
+
+        Decisions are applied in order, so several decisions on one request
+        (e.g. parallel approvers) see each other. If any decision is
+        invalid the whole batch is rolled back and the error is raised.
+
+        Args:
+            decisions: Dicts of process_decision arguments (request_id,
+                approver_user_id, decision, and optionally comments and
+                approver_role)
+
+        Returns:
+            The updated request after each decision, in input order
+        """
+        results = []
+        with self._transaction():
+            for index, item in enumerate(decisions):
+                try:
+                    results.append(self.process_decision(**item))
+                except Exception as e:
+                    logger.error(f"Decision batch rolled back at item {index}: {e}")
+                    raise
+
+        logger.info(f"Processed {len(results)} approval decisions")
+        return results
+
     def _validate_approver(
         self,
         step: ApprovalStep,
@@ -718,57 +953,16 @@ class ApprovalEngine:
         - "payload.get('is_urgent', False)"
 
         Security: Uses AST parsing to validate expression structure before
-        evaluation, preventing code injection attacks.
+        evaluation, preventing code injection attacks. Validation and
+        compilation happen once per distinct condition (see compile_condition).
         """
-        import ast
+        code = compile_condition(condition)
+        if code is None:
+            return False
 
         try:
-            # Parse the condition to validate it's a safe expression
-            tree = ast.parse(condition, mode='eval')
-
-            # Validate AST nodes are safe (no function definitions, imports, etc.)
-            for node in ast.walk(tree):
-                # Allow only safe node types
-                allowed_types = (
-                    ast.Expression, ast.BoolOp, ast.BinOp, ast.UnaryOp,
-                    ast.Compare, ast.Call, ast.Constant, ast.Num, ast.Str,
-                    ast.Name, ast.Attribute, ast.Subscript, ast.Index,
-                    ast.Load, ast.And, ast.Or, ast.Not, ast.Eq, ast.NotEq,
-                    ast.Lt, ast.LtE, ast.Gt, ast.GtE, ast.In, ast.NotIn,
-                    ast.Add, ast.Sub, ast.Mult, ast.Div, ast.Mod,
-                    ast.List, ast.Tuple, ast.Dict, ast.Set,
-                )
-                if not isinstance(node, allowed_types):
-                    logger.warning(f"Unsafe AST node type in condition: {type(node).__name__}")
-                    return False
-
-            # Create safe namespace with restricted builtins
-            namespace = {
-                'payload': payload,
-                'len': len,
-                'str': str,
-                'int': int,
-                'float': float,
-                'bool': bool,
-                'abs': abs,
-                'min': min,
-                'max': max,
-                'sum': sum,
-                'any': any,
-                'all': all,
-                'True': True,
-                'False': False,
-                'None': None,
-            }
-
-            # Compile and evaluate with restricted globals
-            code = compile(tree, '<condition>', 'eval')
-            result = eval(code, {"__builtins__": {}}, namespace)
-            return bool(result)
-
-        except SyntaxError as e:
-            logger.error(f"Invalid condition syntax '{condition}': {e}")
-            return False
+            # Evaluate with restricted globals
+            return bool(eval(code, _CONDITION_GLOBALS, {'payload': payload}))
         except Exception as e:
             logger.error(f"Failed to evaluate condition '{condition}': {e}")
             return False
@@ -785,7 +979,6 @@ class ApprovalEngine:
         row = cursor.fetchone()
 
         if not row:
-            conn.close()
             return None
 
         # Get decisions
@@ -794,7 +987,6 @@ class ApprovalEngine:
         """, (request_id,))
 
         decision_rows = cursor.fetchall()
-        conn.close()
 
         # Deserialize
         request = ApprovalRequest(
@@ -871,7 +1063,6 @@ class ApprovalEngine:
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
 
         # Filter by user/role and format results
         results = []
@@ -962,7 +1153,6 @@ class ApprovalEngine:
         """)
 
         rows = cursor.fetchall()
-        conn.close()
 
         timed_out = []
 
@@ -1008,71 +1198,64 @@ class ApprovalEngine:
 
     def _save_request(self, request: ApprovalRequest):
         """Save approval request to database"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
         try:
-            cursor.execute("""
+            self._save_requests([request])
+        except Exception as e:
+            logger.error(f"Failed to save request {request.request_id}: {e}")
+            raise
+
+    def _save_requests(self, requests: List[ApprovalRequest]):
+        """Save approval requests to database in one transaction"""
+        with self._transaction() as conn:
+            conn.executemany("""
                 INSERT OR REPLACE INTO approval_requests
                 (request_id, workflow_id, mission_id, domain, task_type, payload,
                  status, current_step_index, current_step_ids,
                  created_at, updated_at, completed_at, created_by, metadata)
                 VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                request.request_id,
-                request.workflow_id,
-                request.mission_id,
-                request.domain,
-                request.task_type,
-                json.dumps(request.payload),
-                request.status.value,
-                request.current_step_index,
-                json.dumps(request.current_step_ids),
-                request.created_at,
-                request.updated_at,
-                request.completed_at,
-                request.created_by,
-                json.dumps(request.metadata) if request.metadata else None
-            ))
-
-            conn.commit()
-        except Exception as e:
-            logger.error(f"Failed to save request {request.request_id}: {e}")
-            conn.rollback()
-            raise
-        finally:
-            conn.close()
+            """, [
+                (
+                    request.request_id,
+                    request.workflow_id,
+                    request.mission_id,
+                    request.domain,
+                    request.task_type,
+                    json.dumps(request.payload),
+                    request.status.value,
+                    request.current_step_index,
+                    json.dumps(request.current_step_ids),
+                    request.created_at,
+                    request.updated_at,
+                    request.completed_at,
+                    request.created_by,
+                    json.dumps(request.metadata) if request.metadata else None
+                )
+                for request in requests
+            ])
 
     def _save_decision(self, decision: ApprovalDecision):
         """Save approval decision to database"""
-        conn = self._get_connection()
-        cursor = conn.cursor()
-
         try:
-            cursor.execute("""
-                INSERT INTO approval_decisions
-                (decision_id, request_id, step_id, approver_user_id, approver_role,
-                 decision, comments, decided_at, metadata)
-                VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                decision.decision_id,
-                decision.request_id,
-                decision.step_id,
-                decision.approver_user_id,
-                decision.approver_role,
-                decision.decision.value,
-                decision.comments,
-                decision.decided_at,
-                json.dumps(decision.metadata) if decision.metadata else None
-            ))
-
-            conn.commit()
+            with self._transaction() as conn:
+                conn.execute("""
+                    INSERT INTO approval_decisions
+                    (decision_id, request_id, step_id, approver_user_id, approver_role,
+                     decision, comments, decided_at, metadata)
+                    VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)
+                """, (
+                    decision.decision_id,
+                    decision.request_id,
+                    decision.step_id,
+                    decision.approver_user_id,
+                    decision.approver_role,
+                    decision.decision.value,
+                    decision.comments,
+                    decision.decided_at,
+                    json.dumps(decision.metadata) if decision.metadata else None
+                ))
         except Exception as e:
             logger.error(f"Failed to save decision {decision.decision_id}: {e}")
-            conn.rollback()
             raise
-        finally:
-            conn.close()
 
     # ========================================================================
     # STATISTICS & REPORTING
@@ -1109,7 +1292,6 @@ class ApprovalEngine:
             """)
 
         row = cursor.fetchone()
-        conn.close()
 
         return {
             'total_requests': row['total'],
@@ -10,6 +10,17 @@ Key Features:
 - Tamper detection via signature verification
 - User-centric attribution (not agent-centric)
 - Comprehensive action tracking
+- O(1) appends: the chain head is cached in memory and in a signed
+  sidecar file instead of being re-read from the log
+- Size-based rotation into sealed segments, each with an index by
+  user, action, entity type and time
+- Chain verification of sealed segments in parallel worker processes
+
+Storage layout (for log_file=data/audit_log.jsonl):
+    audit_log.jsonl           Active segment (appends go here)
+    audit_log.jsonl.head      Signed chain head: last entry id/signature
+    audit_log.000001.jsonl    Sealed segments, oldest first
+    audit_log.000001.idx      Signed index for each sealed segment
 
 Logged Actions:
 - Tool executions
@@ -47,14 +58,33 @@ Usage:
 
 from __future__ import annotations
 
+import bisect
 import hashlib
 import hmac
 import json
 import os
+import threading
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from dataclasses import asdict, dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Dict, Iterator, List, Optional, Tuple
+
+try:
+    import fcntl
+except ImportError:  # Windows: in-process locking only
+    fcntl = None
+
+
+# Active segment is sealed once it would grow past this size
+SEGMENT_MAX_BYTES = int(os.getenv("AUDIT_LOG_SEGMENT_BYTES", str(64 * 1024 * 1024)))
+
+# Fields with posting lists in segment indexes
+INDEXED_FIELDS = ("user_id", "action", "entity_type")
+
+# Every Nth entry's timestamp/offset is kept for seeking by date
+TIME_INDEX_STRIDE = 256
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -94,6 +124,199 @@ class AuditEntry:
     prev_signature: str = ""
 
 
+# ══════════════════════════════════════════════════════════════════════
+# Signatures & Segment Verification
+# ══════════════════════════════════════════════════════════════════════
+
+
+def _sign(secret_key: bytes, entry: AuditEntry) -> str:
+    """HMAC-SHA256 over every field except the signature itself."""
+    entry_dict = asdict(entry)
+    entry_dict.pop("signature", None)  # Don't include signature in signature
+
+    canonical = json.dumps(entry_dict, sort_keys=True, ensure_ascii=False)
+    return hmac.new(secret_key, canonical.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _sign_document(secret_key: bytes, document: Dict[str, Any]) -> str:
+    """HMAC-SHA256 over a sidecar/index document (without its own "hmac")."""
+    body = {k: v for k, v in document.items() if k != "hmac"}
+    canonical = json.dumps(body, sort_keys=True, ensure_ascii=False)
+    return hmac.new(secret_key, canonical.encode("utf-8"), hashlib.sha256).hexdigest()
+
+
+def _verify_segment(path: str, secret_key: bytes, label: str) -> Dict[str, Any]:
+    """
+    Verify one segment on its own (runs in a worker process).
+
+    Checks every signature plus chain and ID continuity *within* the
+    segment, and reports the segment's boundary values so the caller can
+    check continuity *between* segments.
+    """
+    issues: List[str] = []
+    first_prev = None
+    first_id = None
+    prev_signature = None
+    prev_entry_id = None
+    count = 0
+
+    try:
+        with open(path, "r", encoding="utf-8") as f:
+            for line_num, line in enumerate(f, start=1):
+                if not line.strip():
+                    continue
+
+                entry = AuditEntry(**json.loads(line))
+                count += 1
+
+                # Check 1: Verify signature
+                expected_signature = _sign(secret_key, entry)
+                if not hmac.compare_digest(entry.signature, expected_signature):
+                    issues.append(
+                        f"{label}{line_num}: Signature mismatch for entry {entry.entry_id}. "
+                        f"Expected: {expected_signature[:16]}..., "
+                        f"Got: {entry.signature[:16]}..."
+                    )
+
+                if prev_signature is None:
+                    first_prev = entry.prev_signature
+                    first_id = entry.entry_id
+                    first_line = line_num
+                else:
+                    # Check 2: Verify signature chain
+                    if entry.prev_signature != prev_signature:
+                        issues.append(
+                            f"{label}{line_num}: Broken signature chain at entry {entry.entry_id}. "
+                            f"Expected prev_signature: {prev_signature[:16]}..., "
+                            f"Got: {entry.prev_signature[:16]}..."
+                        )
+
+                    # Check 3: Verify monotonic entry IDs
+                    if entry.entry_id != prev_entry_id + 1:
+                        issues.append(
+                            f"{label}{line_num}: Non-monotonic entry ID. "
+                            f"Expected: {prev_entry_id + 1}, Got: {entry.entry_id}"
+                        )
+
+                prev_signature = entry.signature
+                prev_entry_id = entry.entry_id
+
+    except Exception as e:
+        issues.append(f"Error reading log file {Path(path).name}: {e}")
+
+    return {
+        "issues": issues,
+        "count": count,
+        "first_prev_signature": first_prev,
+        "first_entry_id": first_id,
+        "first_line": first_line if count else None,
+        "last_signature": prev_signature,
+        "last_entry_id": prev_entry_id,
+    }
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Segment Index
+# ══════════════════════════════════════════════════════════════════════
+
+
+@dataclass
+class SegmentIndex:
+    """
+    Lookup structure for one log segment.
+
+    Posting lists map each user/action/entity type to the byte offsets of
+    its entries, so filtered queries read only matching lines. A sparse
+    time index (every TIME_INDEX_STRIDE entries) lets date-range scans
+    seek past older entries.
+    """
+
+    name: str
+    count: int = 0
+    size: int = 0
+    first_entry_id: Optional[int] = None
+    last_entry_id: Optional[int] = None
+    first_prev_signature: Optional[str] = None
+    last_signature: Optional[str] = None
+    first_timestamp: Optional[str] = None
+    last_timestamp: Optional[str] = None
+    postings: Dict[str, Dict[str, List[int]]] = field(
+        default_factory=lambda: {f: {} for f in INDEXED_FIELDS}
+    )
+    time_index: List[Tuple[str, int]] = field(default_factory=list)
+
+    def add(self, entry: Dict[str, Any], offset: int, length: int):
+        """Record an entry that starts at ``offset`` and spans ``length`` bytes."""
+        if self.count == 0:
+            self.first_entry_id = entry.get("entry_id")
+            self.first_prev_signature = entry.get("prev_signature")
+            self.first_timestamp = entry.get("timestamp")
+        if self.count % TIME_INDEX_STRIDE == 0:
+            self.time_index.append((entry.get("timestamp", ""), offset))
+
+        for name in INDEXED_FIELDS:
+            self.postings[name].setdefault(str(entry.get(name, "")), []).append(offset)
+
+        self.count += 1
+        self.size = offset + length
+        self.last_entry_id = entry.get("entry_id")
+        self.last_signature = entry.get("signature")
+        self.last_timestamp = entry.get("timestamp")
+
+    @classmethod
+    def build(cls, path: Path) -> SegmentIndex:
+        """Index a segment by scanning it."""
+        index = cls(name=path.name)
+        offset = 0
+        with open(path, "rb") as f:
+            for raw in f:
+                if raw.strip():
+                    try:
+                        index.add(json.loads(raw), offset, len(raw))
+                    except ValueError:
+                        pass  # Corrupt line; verification reports it
+                offset += len(raw)
+        index.size = offset
+        return index
+
+    def overlaps(self, start_date: Optional[str], end_date: Optional[str]) -> bool:
+        if not self.count:
+            return False
+        if start_date and self.last_timestamp < start_date:
+            return False
+        if end_date and self.first_timestamp > end_date:
+            return False
+        return True
+
+    def candidate_offsets(self, filters: Dict[str, str]) -> Optional[List[int]]:
+        """Offsets matching every field filter, or None when unfiltered."""
+        result = None
+        for name, value in filters.items():
+            offsets = self.postings[name].get(value, [])
+            result = offsets if result is None else sorted(set(result) & set(offsets))
+            if not result:
+                return []
+        return result
+
+    def seek_offset(self, start_date: Optional[str]) -> int:
+        """Byte offset from which entries may be at or after ``start_date``."""
+        if not start_date or not self.time_index:
+            return 0
+        position = bisect.bisect_left([ts for ts, _ in self.time_index], start_date)
+        return self.time_index[max(position - 1, 0)][1]
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["time_index"] = [list(item) for item in self.time_index]
+        return data
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> SegmentIndex:
+        data = {k: v for k, v in data.items() if k != "hmac"}
+        data["time_index"] = [tuple(item) for item in data.get("time_index", [])]
+        return cls(**data)
+
+
 # ══════════════════════════════════════════════════════════════════════
 # Audit Logger
 # ══════════════════════════════════════════════════════════════════════
@@ -104,15 +327,25 @@ class AuditLogger:
     WORM (Write-Once-Read-Many) audit logger with cryptographic signatures.
 
     Provides immutable audit trail for compliance and forensic analysis.
+    Appending never reads the log: the chain head lives in memory and in
+    a signed ``.head`` sidecar that is trusted only while the active
+    segment's size matches it (otherwise the tail line is re-read).
     """
 
-    def __init__(self, log_file: Optional[Path] = None, secret_key: Optional[str] = None):
+    def __init__(
+        self,
+        log_file: Optional[Path] = None,
+        secret_key: Optional[str] = None,
+        max_segment_bytes: Optional[int] = None,
+    ):
         """
         Initialize audit logger.
 
         Args:
             log_file: Path to audit log file (default: data/audit_log.jsonl)
             secret_key: Secret key for HMAC signatures (default: from env or generated)
+            max_segment_bytes: Seal the active file into a segment past this
+                               size (default: AUDIT_LOG_SEGMENT_BYTES or 64 MB)
         """
         if log_file is None:
             agent_dir = Path(__file__).resolve().parent
@@ -120,7 +353,9 @@ class AuditLogger:
             data_dir.mkdir(parents=True, exist_ok=True)
             log_file = data_dir / "audit_log.jsonl"
 
-        self.log_file = log_file
+        self.log_file = Path(log_file)
+        self.head_file = self.log_file.with_name(self.log_file.name + ".head")
+        self.max_segment_bytes = max_segment_bytes or SEGMENT_MAX_BYTES
 
         # Get or generate secret key for signatures
         if secret_key is None:
@@ -134,10 +369,12 @@ class AuditLogger:
                 )
 
         self.secret_key = secret_key.encode("utf-8")
+        self._lock = threading.RLock()
+        self._segment_indexes: Dict[str, SegmentIndex] = {}
+        self._active_index: Optional[SegmentIndex] = None
 
-        # Cache last signature for chaining
-        self._last_signature = self._get_last_signature()
-        self._entry_counter = self._get_last_entry_id() + 1
+        # Cache chain head for O(1) appends
+        self._load_head()
 
     def _generate_secret_key(self) -> str:
         """Generate a random secret key for HMAC signatures."""
@@ -145,38 +382,157 @@ class AuditLogger:
 
         return secrets.token_hex(32)
 
-    def _get_last_signature(self) -> str:
-        """Get signature of last log entry for blockchain-style chaining."""
-        if not self.log_file.exists():
-            return "GENESIS"  # First entry
+    # ──────────────────────────────────────────────────────────────
+    # Chain head
+    # ──────────────────────────────────────────────────────────────
 
+    def _active_size(self) -> int:
         try:
-            # Read last line
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                if lines:
-                    last_entry = json.loads(lines[-1])
-                    return last_entry.get("signature", "GENESIS")
-        except Exception:
-            pass
+            return self.log_file.stat().st_size
+        except FileNotFoundError:
+            return 0
 
-        return "GENESIS"
+    def _load_head(self) -> None:
+        """Restore last entry id/signature from the sidecar or the log tail."""
+        self._active_file_size = self._active_size()
+        self._active_index = None
 
-    def _get_last_entry_id(self) -> int:
-        """Get ID of last log entry for monotonic counter."""
-        if not self.log_file.exists():
-            return 0
+        head = self._read_head_file()
+        if head and head.get("size") == self._active_file_size:
+            self._last_signature = head["signature"]
+            self._entry_counter = head["entry_id"] + 1
+            return
+
+        # Sidecar missing, unsigned or stale (crash between append and
+        # sidecar update, or another writer): read the last line instead
+        last = self._read_last_entry(self.log_file)
+        if last is None:
+            segments = self._segment_paths()
+            last = self._read_last_entry(segments[-1]) if segments else None
 
+        self._last_signature = last.get("signature", "GENESIS") if last else "GENESIS"
+        self._entry_counter = (last.get("entry_id", 0) if last else 0) + 1
+
+    def _read_head_file(self) -> Optional[Dict[str, Any]]:
+        try:
+            head = json.loads(self.head_file.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            return None
+        if not hmac.compare_digest(head.get("hmac", ""), _sign_document(self.secret_key, head)):
+            return None
+        return head
+
+    def _write_head_file(self) -> None:
+        head = {
+            "entry_id": self._entry_counter - 1,
+            "signature": self._last_signature,
+            "size": self._active_file_size,
+        }
+        head["hmac"] = _sign_document(self.secret_key, head)
+        self._atomic_write(self.head_file, json.dumps(head))
+
+    @staticmethod
+    def _atomic_write(path: Path, text: str) -> None:
+        tmp = path.with_name(path.name + ".tmp")
+        tmp.write_text(text, encoding="utf-8")
+        os.replace(tmp, path)
+
+    @staticmethod
+    def _read_last_entry(path: Path) -> Optional[Dict[str, Any]]:
+        """Parse the last non-empty line by reading backwards from the end."""
         try:
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                lines = f.readlines()
-                if lines:
-                    last_entry = json.loads(lines[-1])
-                    return last_entry.get("entry_id", 0)
-        except Exception:
+            with open(path, "rb") as f:
+                f.seek(0, os.SEEK_END)
+                position = f.tell()
+                tail = b""
+                while position > 0:
+                    step = min(65536, position)
+                    position -= step
+                    f.seek(position)
+                    tail = f.read(step) + tail
+                    lines = [line for line in tail.split(b"\n") if line.strip()]
+                    # The first piece may be a partial line unless we hit the start
+                    if len(lines) > 1 or (lines and position == 0):
+                        return json.loads(lines[-1])
+        except (OSError, ValueError):
             pass
-
-        return 0
+        return None
+
+    # ──────────────────────────────────────────────────────────────
+    # Segments
+    # ──────────────────────────────────────────────────────────────
+
+    def _segment_path(self, sequence: int) -> Path:
+        return self.log_file.with_name(f"{self.log_file.stem}.{sequence:06d}{self.log_file.suffix}")
+
+    def _index_path(self, segment: Path) -> Path:
+        return segment.with_suffix(".idx")
+
+    def _segment_paths(self) -> List[Path]:
+        """Sealed segments, oldest first."""
+        prefix = self.log_file.stem + "."
+        found = []
+        for path in self.log_file.parent.glob(f"{prefix}*{self.log_file.suffix}"):
+            sequence = path.name[len(prefix):-len(self.log_file.suffix) or None]
+            if sequence.isdigit():
+                found.append((int(sequence), path))
+        return [path for _, path in sorted(found)]
+
+    def _segment_index(self, segment: Path) -> SegmentIndex:
+        """Index of a sealed segment (loaded from disk, rebuilt if missing)."""
+        index = self._segment_indexes.get(segment.name)
+        if index is not None:
+            return index
+
+        index_path = self._index_path(segment)
+        try:
+            data = json.loads(index_path.read_text(encoding="utf-8"))
+            if hmac.compare_digest(data.get("hmac", ""), _sign_document(self.secret_key, data)):
+                index = SegmentIndex.from_dict(data)
+        except (OSError, ValueError, TypeError):
+            index = None
+
+        if index is None:
+            index = SegmentIndex.build(segment)
+            self._write_index(segment, index)
+
+        self._segment_indexes[segment.name] = index
+        return index
+
+    def _write_index(self, segment: Path, index: SegmentIndex) -> None:
+        data = index.to_dict()
+        data["hmac"] = _sign_document(self.secret_key, data)
+        try:
+            self._atomic_write(self._index_path(segment), json.dumps(data))
+        except OSError as e:
+            print(f"[AuditLog] Failed to write segment index: {e}")
+
+    def _get_active_index(self) -> SegmentIndex:
+        if self._active_index is None or self._active_index.size != self._active_file_size:
+            self._active_index = (
+                SegmentIndex.build(self.log_file) if self.log_file.exists()
+                else SegmentIndex(name=self.log_file.name)
+            )
+        return self._active_index
+
+    def _rotate(self) -> None:
+        """Seal the active file as the next segment and start a new one."""
+        index = self._get_active_index()
+        segments = self._segment_paths()
+        sequence = int(segments[-1].stem.rsplit(".", 1)[-1]) + 1 if segments else 1
+        segment = self._segment_path(sequence)
+
+        os.replace(self.log_file, segment)
+        index.name = segment.name
+        self._write_index(segment, index)
+        self._segment_indexes[segment.name] = index
+
+        self._active_file_size = 0
+        self._active_index = SegmentIndex(name=self.log_file.name)
+
+    # ──────────────────────────────────────────────────────────────
+    # Writing
+    # ──────────────────────────────────────────────────────────────
 
     def _compute_signature(self, entry: AuditEntry) -> str:
         """
@@ -192,13 +548,7 @@ class AuditLogger:
         Returns:
             Hex-encoded HMAC-SHA256 signature
         """
-        # Create canonical representation (sorted keys for deterministic hash)
-        entry_dict = asdict(entry)
-        entry_dict.pop("signature", None)  # Don't include signature in signature
-
-        canonical = json.dumps(entry_dict, sort_keys=True, ensure_ascii=False)
-        signature = hmac.new(self.secret_key, canonical.encode("utf-8"), hashlib.sha256)
-        return signature.hexdigest()
+        return _sign(self.secret_key, entry)
 
     def log_action(
         self,
@@ -225,46 +575,88 @@ class AuditLogger:
         Returns:
             AuditEntry that was logged
         """
-        # Create entry
-        entry = AuditEntry(
-            entry_id=self._entry_counter,
-            user_id=user_id,
-            action=action,
-            entity_type=entity_type,
-            entity_id=entity_id,
-            timestamp=datetime.utcnow().isoformat() + "Z",
-            changes=changes or {},
-            reason=reason,
-            metadata=metadata or {},
-            prev_signature=self._last_signature,
-        )
-
-        # Compute signature
-        entry.signature = self._compute_signature(entry)
-
-        # Append to log file (WORM - Write-Once-Read-Many)
-        self._append_entry(entry)
-
-        # Update cache
-        self._last_signature = entry.signature
-        self._entry_counter += 1
+        with self._lock:
+            lock_handle = self._acquire_file_lock()
+            try:
+                # Another writer appended since our last write: pick up its head
+                if self._active_size() != self._active_file_size:
+                    self._load_head()
+
+                # Create entry
+                entry = AuditEntry(
+                    entry_id=self._entry_counter,
+                    user_id=user_id,
+                    action=action,
+                    entity_type=entity_type,
+                    entity_id=entity_id,
+                    timestamp=datetime.utcnow().isoformat() + "Z",
+                    changes=changes or {},
+                    reason=reason,
+                    metadata=metadata or {},
+                    prev_signature=self._last_signature,
+                )
+
+                # Compute signature
+                entry.signature = self._compute_signature(entry)
+
+                # Append to log file (WORM - Write-Once-Read-Many)
+                if self._append_entry(entry):
+                    # Update cache
+                    self._last_signature = entry.signature
+                    self._entry_counter += 1
+                    self._write_head_file()
+            finally:
+                self._release_file_lock(lock_handle)
 
         return entry
 
-    def _append_entry(self, entry: AuditEntry) -> None:
+    def _acquire_file_lock(self):
+        """Exclusive lock across processes sharing this log (POSIX only)."""
+        if fcntl is None:
+            return None
+        try:
+            self.log_file.parent.mkdir(parents=True, exist_ok=True)
+            handle = open(self.log_file.with_name(self.log_file.name + ".lock"), "a")
+            fcntl.flock(handle, fcntl.LOCK_EX)
+            return handle
+        except OSError:
+            return None
+
+    @staticmethod
+    def _release_file_lock(handle) -> None:
+        if handle is not None:
+            fcntl.flock(handle, fcntl.LOCK_UN)
+            handle.close()
+
+    def _append_entry(self, entry: AuditEntry) -> bool:
         """
         Append entry to log file (append-only, immutable).
 
         Args:
             entry: Audit entry to append
+
+        Returns:
+            True if the entry was written
         """
         try:
             # Ensure parent directory exists
             self.log_file.parent.mkdir(parents=True, exist_ok=True)
 
+            entry_dict = asdict(entry)
+            data = (json.dumps(entry_dict, ensure_ascii=False) + "\n").encode("utf-8")
+
+            if self._active_file_size and self._active_file_size + len(data) > self.max_segment_bytes:
+                self._rotate()
+
             # Append to JSONL file
-            with open(self.log_file, "a", encoding="utf-8") as f:
-                f.write(json.dumps(asdict(entry), ensure_ascii=False) + "\n")
+            with open(self.log_file, "ab") as f:
+                f.write(data)
+
+            offset = self._active_file_size
+            self._active_file_size += len(data)
+            if self._active_index is not None and self._active_index.size == offset:
+                self._active_index.add(entry_dict, offset, len(data))
+            return True
 
         except Exception as e:
             print(f"[AuditLog] ERROR: Failed to write audit log: {e}")
@@ -273,6 +665,44 @@ class AuditLogger:
             import sys
 
             print(f"[AuditLog] CRITICAL: Audit log write failure: {e}", file=sys.stderr)
+            return False
+
+    # ──────────────────────────────────────────────────────────────
+    # Querying
+    # ──────────────────────────────────────────────────────────────
+
+    def _indexed_segments(self) -> List[Tuple[Path, SegmentIndex]]:
+        """Sealed segments plus the active file, oldest first, with indexes."""
+        with self._lock:
+            if self._active_size() != self._active_file_size:
+                self._load_head()
+            segments = [(path, self._segment_index(path)) for path in self._segment_paths()]
+            if self.log_file.exists():
+                segments.append((self.log_file, self._get_active_index()))
+        return segments
+
+    @staticmethod
+    def _iter_lines(
+        path: Path, offsets: Optional[List[int]], start: int, end: int
+    ) -> Iterator[Dict[str, Any]]:
+        """Parsed entries at ``offsets``, or every entry in [start, end)."""
+        with open(path, "rb") as f:
+            if offsets is not None:
+                for offset in offsets:
+                    if offset >= end:
+                        break
+                    f.seek(offset)
+                    yield json.loads(f.readline())
+                return
+
+            f.seek(start)
+            position = start
+            for raw in f:
+                position += len(raw)
+                if position > end:
+                    break
+                if raw.strip():
+                    yield json.loads(raw)
 
     def query_logs(
         self,
@@ -286,6 +716,10 @@ class AuditLogger:
         """
         Query audit logs with filters.
 
+        Segments outside the date range are skipped, user/action/entity
+        filters read only the lines their index points at, and only
+        matching lines become AuditEntry objects.
+
         Args:
             user_id: Filter by user ID
             action: Filter by action type
@@ -297,32 +731,38 @@ class AuditLogger:
         Returns:
             List of matching audit entries (newest first)
         """
-        if not self.log_file.exists():
-            return []
+        filters = {
+            name: value
+            for name, value in (("user_id", user_id), ("action", action), ("entity_type", entity_type))
+            if value
+        }
 
         entries = []
         try:
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                for line in f:
-                    if not line.strip():
-                        continue
+            # Newest segment first so a limit can stop early
+            for path, index in reversed(self._indexed_segments()):
+                if not index.overlaps(start_date, end_date):
+                    continue
 
-                    entry_dict = json.loads(line)
-                    entry = AuditEntry(**entry_dict)
+                offsets = index.candidate_offsets(filters)
+                if offsets == []:
+                    continue
 
+                matched = []
+                for entry_dict in self._iter_lines(path, offsets, index.seek_offset(start_date), index.size):
                     # Apply filters
-                    if user_id and entry.user_id != user_id:
-                        continue
-                    if action and entry.action != action:
+                    if any(entry_dict.get(name) != value for name, value in filters.items()):
                         continue
-                    if entity_type and entry.entity_type != entity_type:
+                    timestamp = entry_dict.get("timestamp", "")
+                    if start_date and timestamp < start_date:
                         continue
-                    if start_date and entry.timestamp < start_date:
-                        continue
-                    if end_date and entry.timestamp > end_date:
+                    if end_date and timestamp > end_date:
                         continue
+                    matched.append(AuditEntry(**entry_dict))
 
-                    entries.append(entry)
+                entries.extend(matched)
+                if limit and len(entries) >= limit:
+                    break
 
         except Exception as e:
             print(f"[AuditLog] Error querying logs: {e}")
@@ -336,77 +776,112 @@ class AuditLogger:
 
         return entries
 
-    def verify_log_integrity(self) -> Tuple[bool, List[str]]:
+    # ──────────────────────────────────────────────────────────────
+    # Verification
+    # ──────────────────────────────────────────────────────────────
+
+    def verify_log_integrity(self, workers: Optional[int] = None) -> Tuple[bool, List[str]]:
         """
         Verify integrity of audit log (tamper detection).
 
         Checks:
         1. All signatures are valid (HMAC verification)
-        2. Signature chain is unbroken (prev_signature matches)
+        2. Signature chain is unbroken (prev_signature matches), including
+           across segment boundaries
         3. Entry IDs are monotonic (no gaps or duplicates)
+        4. The log ends at the signed chain head (no truncation)
+
+        Segments are verified independently in worker processes and then
+        stitched together, which checks exactly what a single sequential
+        pass would.
+
+        Args:
+            workers: Worker processes for sealed segments (default: one per
+                     CPU, capped at the number of segments)
 
         Returns:
             Tuple of (is_valid, list_of_issues)
             - is_valid: True if log is intact, False if tampered
             - list_of_issues: List of integrity issues found
         """
-        if not self.log_file.exists():
+        with self._lock:
+            segments = self._segment_paths()
+            if self.log_file.exists():
+                segments.append(self.log_file)
+            head = self._read_head_file()
+        if not segments:
             return (True, [])  # Empty log is valid
 
+        labels = [
+            "Line " if path == self.log_file else f"{path.name} line "
+            for path in segments
+        ]
+        results = self._verify_segments(segments, labels, workers)
+
         issues = []
         prev_signature = "GENESIS"
         prev_entry_id = 0
+        for label, result in zip(labels, results):
+            issues.extend(result["issues"])
+            if not result["count"]:
+                continue
+
+            line_num = result["first_line"]
+            if result["first_prev_signature"] != prev_signature:
+                issues.append(
+                    f"{label}{line_num}: Broken signature chain at entry {result['first_entry_id']}. "
+                    f"Expected prev_signature: {prev_signature[:16]}..., "
+                    f"Got: {str(result['first_prev_signature'])[:16]}..."
+                )
+            if result["first_entry_id"] != prev_entry_id + 1:
+                issues.append(
+                    f"{label}{line_num}: Non-monotonic entry ID. "
+                    f"Expected: {prev_entry_id + 1}, Got: {result['first_entry_id']}"
+                )
+            prev_signature = result["last_signature"]
+            prev_entry_id = result["last_entry_id"]
 
-        try:
-            with open(self.log_file, "r", encoding="utf-8") as f:
-                for line_num, line in enumerate(f, start=1):
-                    if not line.strip():
-                        continue
-
-                    entry_dict = json.loads(line)
-                    entry = AuditEntry(**entry_dict)
-
-                    # Check 1: Verify signature
-                    expected_signature = self._compute_signature(entry)
-                    if entry.signature != expected_signature:
-                        issues.append(
-                            f"Line {line_num}: Signature mismatch for entry {entry.entry_id}. "
-                            f"Expected: {expected_signature[:16]}..., "
-                            f"Got: {entry.signature[:16]}..."
-                        )
-
-                    # Check 2: Verify signature chain
-                    if entry.prev_signature != prev_signature:
-                        issues.append(
-                            f"Line {line_num}: Broken signature chain at entry {entry.entry_id}. "
-                            f"Expected prev_signature: {prev_signature[:16]}..., "
-                            f"Got: {entry.prev_signature[:16]}..."
-                        )
-
-                    # Check 3: Verify monotonic entry IDs
-                    if entry.entry_id != prev_entry_id + 1:
-                        issues.append(
-                            f"Line {line_num}: Non-monotonic entry ID. "
-                            f"Expected: {prev_entry_id + 1}, Got: {entry.entry_id}"
-                        )
-
-                    prev_signature = entry.signature
-                    prev_entry_id = entry.entry_id
-
-        except Exception as e:
-            issues.append(f"Error reading log file: {e}")
+        # Check 4: the signed head must point at the last entry
+        if head and (head["entry_id"], head["signature"]) != (prev_entry_id, prev_signature):
+            issues.append(
+                f"Chain head mismatch: head records entry {head['entry_id']}, "
+                f"log ends at entry {prev_entry_id}"
+            )
 
         is_valid = len(issues) == 0
         return (is_valid, issues)
 
+    def _verify_segments(
+        self, segments: List[Path], labels: List[str], workers: Optional[int]
+    ) -> List[Dict[str, Any]]:
+        workers = min(workers or os.cpu_count() or 1, len(segments))
+        if workers > 1:
+            try:
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [
+                        pool.submit(_verify_segment, str(path), self.secret_key, label)
+                        for path, label in zip(segments, labels)
+                    ]
+                    return [future.result() for future in futures]
+            except (OSError, BrokenProcessPool) as e:
+                print(f"[AuditLog] Parallel verification unavailable, verifying serially: {e}")
+
+        return [
+            _verify_segment(str(path), self.secret_key, label)
+            for path, label in zip(segments, labels)
+        ]
+
     def get_stats(self) -> Dict[str, Any]:
         """
         Get audit log statistics.
 
+        Computed from the segment indexes without reading entries.
+
         Returns:
             Dict with stats: total_entries, users, actions, date_range
         """
-        if not self.log_file.exists():
+        indexes = [index for _, index in self._indexed_segments() if index.count]
+        if not indexes:
             return {
                 "total_entries": 0,
                 "unique_users": 0,
@@ -414,21 +889,22 @@ class AuditLogger:
                 "date_range": None,
             }
 
-        entries = self.query_logs()
-        users = set(e.user_id for e in entries)
-        actions = set(e.action for e in entries)
-
-        date_range = None
-        if entries:
-            timestamps = sorted(e.timestamp for e in entries)
-            date_range = {"start": timestamps[0], "end": timestamps[-1]}
+        users = set()
+        actions_by_type: Dict[str, int] = {}
+        for index in indexes:
+            users.update(index.postings["user_id"])
+            for action, offsets in index.postings["action"].items():
+                actions_by_type[action] = actions_by_type.get(action, 0) + len(offsets)
 
         return {
-            "total_entries": len(entries),
+            "total_entries": sum(index.count for index in indexes),
             "unique_users": len(users),
-            "unique_actions": len(actions),
-            "date_range": date_range,
-            "actions_by_type": {action: sum(1 for e in entries if e.action == action) for action in actions},
+            "unique_actions": len(actions_by_type),
+            "date_range": {
+                "start": min(index.first_timestamp for index in indexes),
+                "end": max(index.last_timestamp for index in indexes),
+            },
+            "actions_by_type": actions_by_type,
         }
 
 
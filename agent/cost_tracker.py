@@ -15,13 +15,18 @@ Kill Switch Features:
 
 from __future__ import annotations
 
+import atexit
 import functools
 import json
 import os
+import threading
+import time
+import uuid
+from collections import deque
 from dataclasses import dataclass, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional, TypeVar
+from typing import Any, Callable, Deque, Dict, List, Optional, Tuple, TypeVar
 
 from agent.core_logging import log_event
 
@@ -123,13 +128,66 @@ class CallRecord:
     input_cost_usd: float
     output_cost_usd: float
     total_cost_usd: float
+    timestamp: float = field(default_factory=time.time)
+
+
+# Number of individual CallRecords kept for drill-down; totals are unaffected
+RECENT_CALLS_LIMIT = int(os.getenv("JARVIS_COST_RECENT_CALLS", "1000"))
+
+# Rolling-window counters are kept per minute for this long
+WINDOW_BUCKET_SECONDS = 60
+WINDOW_RETENTION_SECONDS = 24 * 60 * 60
+
+
+@dataclass
+class CostCounter:
+    """Incrementally maintained token/cost totals."""
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    total_usd: float = 0.0
+    num_calls: int = 0
+
+    def add(self, record: CallRecord) -> None:
+        self.prompt_tokens += record.prompt_tokens
+        self.completion_tokens += record.completion_tokens
+        self.total_usd += record.total_cost_usd
+        self.num_calls += 1
+
+    def merge(self, other: "CostCounter") -> None:
+        self.prompt_tokens += other.prompt_tokens
+        self.completion_tokens += other.completion_tokens
+        self.total_usd += other.total_usd
+        self.num_calls += other.num_calls
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "prompt_tokens": self.prompt_tokens,
+            "completion_tokens": self.completion_tokens,
+            "total_usd": round(self.total_usd, 6),
+            "num_calls": self.num_calls,
+        }
 
 
 @dataclass
 class CostState:
-    calls: List[CallRecord] = field(default_factory=list)
+    """
+    Running cost totals for the current run.
 
-    def add_call(self, role: str, model: str, prompt_tokens: int, completion_tokens: int) -> None:
+    Totals per role, per model and per minute are updated on every call, so
+    summary() and get_total_cost_usd() cost O(roles + models) regardless of
+    how many calls have been made. Only the most recent RECENT_CALLS_LIMIT
+    CallRecords are retained. All updates happen under ``lock``; no update
+    awaits, so the same lock is safe for asyncio tasks.
+    """
+    calls: Deque[CallRecord] = field(default_factory=lambda: deque(maxlen=RECENT_CALLS_LIMIT))
+    totals: CostCounter = field(default_factory=CostCounter)
+    by_role: Dict[str, CostCounter] = field(default_factory=dict)
+    by_model: Dict[str, CostCounter] = field(default_factory=dict)
+    # (bucket start epoch seconds, counter), oldest first
+    windows: Deque[Tuple[int, CostCounter]] = field(default_factory=deque)
+    lock: threading.RLock = field(default_factory=threading.RLock, repr=False)
+
+    def add_call(self, role: str, model: str, prompt_tokens: int, completion_tokens: int) -> CallRecord:
         model_key = model or FALLBACK_MODEL
 
         # PHASE 1.7: Use registry-based pricing with fallback
@@ -139,95 +197,119 @@ class CostState:
         output_cost = completion_tokens * price_cfg["output"]
         total_cost = input_cost + output_cost
 
-        self.calls.append(
-            CallRecord(
-                role=role,
-                model=model_key,
-                prompt_tokens=prompt_tokens,
-                completion_tokens=completion_tokens,
-                input_cost_usd=input_cost,
-                output_cost_usd=output_cost,
-                total_cost_usd=total_cost,
-            )
+        record = CallRecord(
+            role=role,
+            model=model_key,
+            prompt_tokens=prompt_tokens,
+            completion_tokens=completion_tokens,
+            input_cost_usd=input_cost,
+            output_cost_usd=output_cost,
+            total_cost_usd=total_cost,
         )
 
+        with self.lock:
+            self.calls.append(record)
+            self.totals.add(record)
+            self.by_role.setdefault(role, CostCounter()).add(record)
+            self.by_model.setdefault(model_key, CostCounter()).add(record)
+            self._window_bucket(record.timestamp).add(record)
+
+        return record
+
+    def _window_bucket(self, timestamp: float) -> CostCounter:
+        """Return the per-minute counter for ``timestamp`` (lock held)."""
+        bucket_start = int(timestamp) - int(timestamp) % WINDOW_BUCKET_SECONDS
+        if self.windows and self.windows[-1][0] == bucket_start:
+            return self.windows[-1][1]
+
+        counter = CostCounter()
+        self.windows.append((bucket_start, counter))
+        cutoff = bucket_start - WINDOW_RETENTION_SECONDS
+        while self.windows and self.windows[0][0] <= cutoff:
+            self.windows.popleft()
+        return counter
+
+    def clear(self) -> None:
+        with self.lock:
+            self.calls.clear()
+            self.totals = CostCounter()
+            self.by_role.clear()
+            self.by_model.clear()
+            self.windows.clear()
+
+    def total_usd(self) -> float:
+        with self.lock:
+            return round(self.totals.total_usd, 6)
+
+    def window(self, seconds: float, now: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Totals for calls made in the last ``seconds`` (minute granularity,
+        up to WINDOW_RETENTION_SECONDS).
+        """
+        now = time.time() if now is None else now
+        cutoff = now - seconds
+        counter = CostCounter()
+        with self.lock:
+            for bucket_start, bucket in reversed(self.windows):
+                if bucket_start + WINDOW_BUCKET_SECONDS <= cutoff:
+                    break
+                counter.merge(bucket)
+        return {"window_seconds": seconds, **counter.to_dict()}
+
+    def recent_calls(self, limit: Optional[int] = None) -> List[CallRecord]:
+        """Most recent CallRecords, oldest first."""
+        with self.lock:
+            records = list(self.calls)
+        return records[-limit:] if limit else records
+
     def summary(self) -> Dict[str, Any]:
-        total_input_tokens = 0
-        total_output_tokens = 0
-        total_cost = 0.0
-
-        by_role: Dict[str, Dict[str, Any]] = {}
-        by_model: Dict[str, Dict[str, Any]] = {}
-
-        for c in self.calls:
-            total_input_tokens += c.prompt_tokens
-            total_output_tokens += c.completion_tokens
-            total_cost += c.total_cost_usd
-
-            # by_role
-            r = by_role.setdefault(
-                c.role,
-                {
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "total_usd": 0.0,
-                    "num_calls": 0,
+        with self.lock:
+            return {
+                "num_calls": self.totals.num_calls,
+                "total_input_tokens": self.totals.prompt_tokens,
+                "total_output_tokens": self.totals.completion_tokens,
+                "total_usd": round(self.totals.total_usd, 6),
+                "by_role": {
+                    role: {
+                        "prompt_tokens": c.prompt_tokens,
+                        "completion_tokens": c.completion_tokens,
+                        "total_usd": round(c.total_usd, 6),
+                        "num_calls": c.num_calls,
+                    }
+                    for role, c in self.by_role.items()
                 },
-            )
-            r["prompt_tokens"] += c.prompt_tokens
-            r["completion_tokens"] += c.completion_tokens
-            r["total_usd"] += c.total_cost_usd
-            r["num_calls"] += 1
-
-            # by_model
-            m = by_model.setdefault(
-                c.model,
-                {
-                    "prompt_tokens": 0,
-                    "completion_tokens": 0,
-                    "total_usd": 0.0,
-                    "num_calls": 0,
+                "by_model": {
+                    model: {
+                        "prompt_tokens": c.prompt_tokens,
+                        "completion_tokens": c.completion_tokens,
+                        "total_usd": round(c.total_usd, 6),
+                        "num_calls": c.num_calls,
+                    }
+                    for model, c in self.by_model.items()
                 },
-            )
-            m["prompt_tokens"] += c.prompt_tokens
-            m["completion_tokens"] += c.completion_tokens
-            m["total_usd"] += c.total_cost_usd
-            m["num_calls"] += 1
-
-        return {
-            "num_calls": len(self.calls),
-            "total_input_tokens": total_input_tokens,
-            "total_output_tokens": total_output_tokens,
-            "total_usd": round(total_cost, 6),
-            "by_role": {
-                role: {
-                    **vals,
-                    "total_usd": round(vals["total_usd"], 6),
-                }
-                for role, vals in by_role.items()
-            },
-            "by_model": {
-                model: {
-                    **vals,
-                    "total_usd": round(vals["total_usd"], 6),
-                }
-                for model, vals in by_model.items()
-            },
-        }
+            }
 
 
 _GLOBAL_STATE = CostState()
 
+# Estimated cost held by in-flight calls (reservation id -> USD). Guarded by
+# _STATE_LOCK together with _GLOBAL_STATE so check-and-reserve is atomic.
+_RESERVATIONS: Dict[str, float] = {}
+_STATE_LOCK = threading.RLock()
+
 
 def reset() -> None:
     """Reset the global cost tracking state for a new run."""
-    _GLOBAL_STATE.calls.clear()
+    with _STATE_LOCK:
+        _GLOBAL_STATE.clear()
+        _RESERVATIONS.clear()
 
 
 def register_call(role: str, model: str, prompt_tokens: int, completion_tokens: int) -> None:
     """Register a single API call for cost accounting."""
     try:
-        _GLOBAL_STATE.add_call(role, model, prompt_tokens, completion_tokens)
+        with _STATE_LOCK:
+            _GLOBAL_STATE.add_call(role, model, prompt_tokens, completion_tokens)
     except Exception as e:  # noqa: BLE001
         # We don't want cost-tracking errors to kill the main flow
         print(f"[CostTracker] Failed to register call: {e}")
@@ -241,11 +323,21 @@ def get_summary() -> Dict[str, Any]:
 def get_total_cost_usd() -> float:
     """Return the estimated total cost in USD for the current run."""
     try:
-        return _GLOBAL_STATE.summary()["total_usd"]
+        return _GLOBAL_STATE.total_usd()
     except Exception:
         return 0.0
 
 
+def get_window_summary(seconds: float) -> Dict[str, Any]:
+    """Get token/cost totals for calls made in the last ``seconds``."""
+    return _GLOBAL_STATE.window(seconds)
+
+
+def get_recent_calls(limit: Optional[int] = None) -> List[CallRecord]:
+    """Get the most recent individual calls (bounded by RECENT_CALLS_LIMIT)."""
+    return _GLOBAL_STATE.recent_calls(limit)
+
+
 def check_cost_cap(
     max_cost_usd: float,
     estimated_tokens: int = 5000,
@@ -269,7 +361,9 @@ def check_cost_cap(
         # No cap set
         return (False, 0.0, "No cost cap configured")
 
-    current_cost = get_total_cost_usd()
+    with _STATE_LOCK:
+        current_cost = get_total_cost_usd()
+        reserved = get_reserved_cost_usd()
 
     # Estimate cost of next call
     # Use a conservative estimate: assume all tokens are output tokens (more expensive)
@@ -278,28 +372,128 @@ def check_cost_cap(
     # Conservative: assume all tokens are output (more expensive)
     estimated_call_cost = estimated_tokens * price_cfg["output"]
 
-    projected_cost = current_cost + estimated_call_cost
+    return _evaluate_cap(max_cost_usd, current_cost, reserved, estimated_call_cost)
+
+
+def _evaluate_cap(
+    max_cost_usd: float,
+    current_cost: float,
+    reserved: float,
+    estimated_call_cost: float,
+) -> tuple[bool, float, str]:
+    """Compare spent + in-flight + next call against the cap."""
+    projected_cost = current_cost + reserved + estimated_call_cost
+    in_flight = f", in-flight=${reserved:.4f}" if reserved else ""
 
     if projected_cost > max_cost_usd:
         message = (
-            f"Cost cap would be exceeded: current=${current_cost:.4f}, "
+            f"Cost cap would be exceeded: current=${current_cost:.4f}{in_flight}, "
             f"estimated next call=${estimated_call_cost:.4f}, "
             f"projected total=${projected_cost:.4f}, "
             f"cap=${max_cost_usd:.4f}"
         )
         return (True, current_cost, message)
 
-    remaining = max_cost_usd - current_cost
+    remaining = max_cost_usd - current_cost - reserved
     message = (
-        f"Within budget: current=${current_cost:.4f}, "
+        f"Within budget: current=${current_cost:.4f}{in_flight}, "
         f"remaining=${remaining:.4f}, "
         f"cap=${max_cost_usd:.4f}"
     )
     return (False, current_cost, message)
 
 
-def load_history() -> list[dict[str, Any]]:
-    """Load the shared history from HISTORY_FILE. Best-effort and safe on errors."""
+# ============================================================================
+# Cost Reservations
+# ============================================================================
+#
+# check_cost_cap() alone is racy: N concurrent callers can all pass the check
+# before any of them registers its spend. reserve_cost_cap() performs the
+# check and holds the estimated cost in one step; the holder then either
+# commits the actual usage or releases the hold.
+
+
+def get_reserved_cost_usd() -> float:
+    """Return the estimated cost currently held by in-flight calls."""
+    with _STATE_LOCK:
+        return round(sum(_RESERVATIONS.values()), 6)
+
+
+def reserve_cost_cap(
+    max_cost_usd: float,
+    estimated_tokens: int = 5000,
+    model: str = "gpt-4o-mini",
+) -> tuple[bool, Optional[str], float, str]:
+    """
+    Atomically check the cost cap and reserve the estimated cost of a call.
+
+    Args:
+        max_cost_usd: Maximum allowed cost in USD
+        estimated_tokens: Rough estimate of tokens for next call (input + output)
+        model: Model that will be used for the call
+
+    Returns:
+        Tuple of (would_exceed, reservation_id, current_cost, message)
+        - reservation_id is None when the cap would be exceeded or no cap is set
+    """
+    if max_cost_usd <= 0:
+        return (False, None, 0.0, "No cost cap configured")
+
+    price_cfg = _get_pricing_fallback(model or FALLBACK_MODEL)
+    estimated_call_cost = estimated_tokens * price_cfg["output"]
+
+    with _STATE_LOCK:
+        current_cost = get_total_cost_usd()
+        would_exceed, current_cost, message = _evaluate_cap(
+            max_cost_usd, current_cost, get_reserved_cost_usd(), estimated_call_cost
+        )
+        if would_exceed:
+            return (True, None, current_cost, message)
+
+        reservation_id = uuid.uuid4().hex
+        _RESERVATIONS[reservation_id] = estimated_call_cost
+
+    return (False, reservation_id, current_cost, message)
+
+
+def commit_cost_reservation(
+    reservation_id: Optional[str],
+    role: str,
+    model: str,
+    prompt_tokens: int,
+    completion_tokens: int,
+) -> None:
+    """Replace a reservation with the call's actual usage."""
+    with _STATE_LOCK:
+        if reservation_id:
+            _RESERVATIONS.pop(reservation_id, None)
+        register_call(role, model, prompt_tokens, completion_tokens)
+
+
+def release_cost_reservation(reservation_id: Optional[str]) -> bool:
+    """
+    Drop a reservation without recording spend (e.g. the call failed).
+
+    Returns:
+        True if the reservation was still held
+    """
+    if not reservation_id:
+        return False
+    with _STATE_LOCK:
+        return _RESERVATIONS.pop(reservation_id, None) is not None
+
+
+# Runtime history records are buffered and written in batches: one
+# read-modify-write of HISTORY_FILE per batch instead of per call.
+HISTORY_BATCH_SIZE = int(os.getenv("JARVIS_COST_HISTORY_BATCH", "25"))
+HISTORY_FLUSH_INTERVAL_SECONDS = 5.0
+
+_HISTORY_BUFFER: List[Dict[str, Any]] = []
+_HISTORY_LOCK = threading.Lock()
+_HISTORY_LAST_FLUSH = time.monotonic()
+
+
+def _read_history_file() -> list[dict[str, Any]]:
     if not HISTORY_FILE.exists():
         return []
     try:
@@ -309,11 +503,58 @@ def load_history() -> list[dict[str, Any]]:
         return []
 
 
+def load_history() -> list[dict[str, Any]]:
+    """Load the shared history from HISTORY_FILE. Best-effort and safe on errors."""
+    flush_history()
+    return _read_history_file()
+
+
 def save_history(history: list[dict[str, Any]]) -> None:
     """Persist the shared history to HISTORY_FILE."""
     HISTORY_FILE.write_text(json.dumps(history, indent=2), encoding="utf-8")
 
 
+def flush_history() -> int:
+    """
+    Write buffered runtime history records to HISTORY_FILE.
+
+    Returns:
+        Number of records written
+    """
+    global _HISTORY_LAST_FLUSH
+
+    with _HISTORY_LOCK:
+        _HISTORY_LAST_FLUSH = time.monotonic()
+        if not _HISTORY_BUFFER:
+            return 0
+        pending = list(_HISTORY_BUFFER)
+
+        try:
+            history = _read_history_file()
+            history.extend(pending)
+            save_history(history)
+        except Exception as e:  # noqa: BLE001
+            # Keep the records buffered so the next flush retries them
+            print(f"[CostTracker] Failed to flush history: {e}")
+            return 0
+        _HISTORY_BUFFER.clear()
+        return len(pending)
+
+
+def _buffer_history(record: Dict[str, Any]) -> None:
+    with _HISTORY_LOCK:
+        _HISTORY_BUFFER.append(record)
+        due = (
+            len(_HISTORY_BUFFER) >= HISTORY_BATCH_SIZE
+            or time.monotonic() - _HISTORY_LAST_FLUSH >= HISTORY_FLUSH_INTERVAL_SECONDS
+        )
+    if due:
+        flush_history()
+
+
+atexit.register(flush_history)
+
+
 def append_history(
     log_file: Path | None = None,
     project_name: str | None = None,
@@ -337,8 +578,8 @@ def append_history(
 
     2) Runtime usage logging from llm.chat_json() passes cost-related
        fields (total_usd, prompt_tokens, completion_tokens, model) with
-       log_file=None. We append to the default history file via
-       load_history/save_history.
+       log_file=None. Records are buffered and appended to the default
+       history file in batches (see flush_history()).
     """
 
     record: Dict[str, Any] = {
@@ -362,10 +603,8 @@ def append_history(
         with log_file.open("a", encoding="utf-8") as f:
             f.write(json.dumps(record) + "\n")
     else:
-        # Default runtime mode: use the shared cost history file
-        history = load_history()
-        history.append(record)
-        save_history(history)
+        # Default runtime mode: batch into the shared cost history file
+        _buffer_history(record)
 
 
 # ============================================================================
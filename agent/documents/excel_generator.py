@@ -10,7 +10,9 @@ Features:
 - Freeze panes
 - Formulas (SUM, AVERAGE, etc.)
 - Cell alignment and styling
-- Read data from existing Excel files
+- Charts
+- Streaming (write-only) generation from row iterables
+- Lazy row-by-row reading of large files
 
 Usage:
     generator = ExcelGenerator()
@@ -24,16 +26,88 @@ Usage:
     }
 
     generator.create_workbook(sheets, Path("output/grades.xlsx"))
+
+    # Large reports: rows are written as they are produced, and formulas,
+    # styles and charts come in the same spec so the file is saved once
+    generator.write_workbook({
+        "Ledger": {
+            "header": ["Date", "Account", "Amount"],
+            "rows": ledger_rows(),  # Any iterable, e.g. a generator
+            "number_formats": {"C": "#,##0.00"},
+            "totals": {"C": "SUM"},
+            "charts": [{"type": "line", "data": "C1:C{last_row}"}],
+        }
+    }, Path("output/ledger.xlsx"))
+
+    for row in generator.iter_rows(Path("output/ledger.xlsx"), "Ledger"):
+        ...
 """
 
 from __future__ import annotations
 
 import logging
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
+# Styling shared by every generated header row
+HEADER_FONT = {"bold": True, "color": "FFFFFF"}
+HEADER_FILL = "4472C4"
+
+
+def _openpyxl_required() -> ImportError:
+    return ImportError(
+        "openpyxl is required for Excel generation. "
+        "Install with: pip install openpyxl"
+    )
+
+
+def _reference(ws, range_: str):
+    """Chart reference for an A1-style range on ``ws`` (or on the sheet named in "Sheet1!A1:B10")."""
+    from openpyxl.chart import Reference
+    from openpyxl.utils.cell import range_boundaries, range_to_tuple
+
+    if "!" in range_:
+        sheet_name, (min_col, min_row, max_col, max_row) = range_to_tuple(range_)
+        ws = ws.parent[sheet_name]
+    else:
+        min_col, min_row, max_col, max_row = range_boundaries(range_)
+    return Reference(ws, min_col=min_col, min_row=min_row, max_col=max_col, max_row=max_row)
+
+
+def _build_chart(ws, spec: Dict[str, Any], last_row: int):
+    """
+    Create a chart from a chart spec.
+
+    Spec keys:
+        type: "bar", "line" or "pie"
+        data: Data range including the title row (e.g. "B1:C{last_row}")
+        categories: Optional category labels range (e.g. "A2:A{last_row}")
+        title: Optional chart title
+        position: Anchor cell (default "E2")
+
+    ``{last_row}`` in a range is replaced with the sheet's last data row.
+    """
+    from openpyxl.chart import BarChart, LineChart, PieChart
+
+    chart_type = spec.get("type", "bar")
+    if chart_type == "bar":
+        chart = BarChart()
+    elif chart_type == "line":
+        chart = LineChart()
+    elif chart_type == "pie":
+        chart = PieChart()
+    else:
+        raise ValueError(f"Unsupported chart type: {chart_type}")
+
+    chart.add_data(_reference(ws, spec["data"].format(last_row=last_row)), titles_from_data=True)
+    if spec.get("categories"):
+        chart.set_categories(_reference(ws, spec["categories"].format(last_row=last_row)))
+    if spec.get("title"):
+        chart.title = spec["title"]
+    return chart
+
 
 class ExcelGenerator:
     """
@@ -45,6 +119,8 @@ class ExcelGenerator:
     - Column widths
     - Freeze panes
     - Formulas
+    - Charts
+    - Streaming generation and lazy reading of large sheets
     - Reading existing files
     """
 
@@ -54,18 +130,22 @@ class ExcelGenerator:
 
     def create_workbook(
         self,
-        sheets: Dict[str, List[List[Any]]],
+        sheets: Dict[str, Iterable[List[Any]]],
         output_path: Path,
         formatting: Optional[Dict[str, Dict]] = None
     ) -> Path:
         """
         Create Excel workbook with multiple sheets.
 
+        Sheets are streamed through ``write_workbook``, so each sheet's data
+        may be any iterable of rows.
+
         Args:
             sheets: Dictionary of sheet_name -> data
                    Data format: [["Header1", "Header2"], ["Value1", "Value2"], ...]
             output_path: Path to save workbook
-            formatting: Optional formatting per sheet
+            formatting: Optional formatting per sheet (any sheet spec key
+                        accepted by ``write_workbook`` except ``rows``)
 
         Returns:
             Path to created workbook
@@ -97,28 +177,65 @@ class ExcelGenerator:
 
             generator.create_workbook(sheets, Path("employees.xlsx"), formatting)
         """
-        try:
-            from openpyxl import Workbook
+        formatting = formatting or {}
+        spec = {
+            sheet_name: {**formatting.get(sheet_name, {}), "rows": data}
+            for sheet_name, data in sheets.items()
+        }
+        return self.write_workbook(spec, output_path)
+
+    def write_workbook(
+        self,
+        spec: Dict[str, Dict[str, Any]],
+        output_path: Path
+    ) -> Path:
+        """
+        Stream a workbook to disk in write-only mode.
 
-            output_path = Path(output_path)
-            self.wb = Workbook()
+        Rows are written as they are pulled from each sheet's iterable, so
+        memory stays flat however many rows a sheet has. Everything about
+        a sheet (styles, formulas, charts) is given up front and the file
+        is saved exactly once.
 
-            # Remove default sheet
-            if self.wb.active:
-                self.wb.remove(self.wb.active)
+        Args:
+            spec: Dictionary of sheet_name -> sheet spec
+            output_path: Path to save workbook
 
-            # Create sheets
-            for sheet_name, data in sheets.items():
-                ws = self.wb.create_sheet(title=sheet_name)
+        Sheet spec keys:
+            rows: Iterable of row lists (a generator keeps memory constant)
+            header: Optional header row written before ``rows``
+            header_row: Row number to style as a header (default 1 when
+                        ``header`` is given)
+            freeze_panes: Cell to freeze panes at (e.g., "A2")
+            column_widths: Dict of column letter -> width
+            auto_filter: Filter range, ``{last_row}`` is substituted
+            number_formats: Dict of column letter -> number format
+            formulas: Dict of column letter -> formula appended to every
+                      data row; ``{row}`` is the current row number
+                      (e.g. {"D": "=B{row}*C{row}"})
+            totals: Dict of column letter -> function ("SUM", "AVERAGE",
+                    ...) for a bold totals row after the data
+            charts: List of chart specs (see ``_build_chart``)
 
-                # Write data
-                for row_idx, row_data in enumerate(data, start=1):
-                    for col_idx, cell_value in enumerate(row_data, start=1):
-                        cell = ws.cell(row=row_idx, column=col_idx, value=cell_value)
+        Returns:
+            Path to created workbook
 
-                # Apply formatting if provided
-                if formatting and sheet_name in formatting:
-                    self._apply_sheet_formatting(ws, formatting[sheet_name])
+        Raises:
+            ImportError: If openpyxl not installed
+            Exception: If creation fails
+        """
+        try:
+            from openpyxl import Workbook
+        except ImportError:
+            raise _openpyxl_required()
+
+        try:
+            output_path = Path(output_path)
+            self.wb = Workbook(write_only=True)
+
+            for sheet_name, sheet_spec in spec.items():
+                rows_written = self._write_sheet(self.wb.create_sheet(title=sheet_name), sheet_spec)
+                logger.debug(f"Streamed {rows_written} rows to {sheet_name}")
 
             # Ensure output directory exists
             output_path.parent.mkdir(parents=True, exist_ok=True)
@@ -126,57 +243,115 @@ class ExcelGenerator:
             # Save workbook
             self.wb.save(str(output_path))
 
-            logger.info(f"Generated Excel workbook with {len(sheets)} sheet(s): {output_path}")
+            logger.info(f"Generated Excel workbook with {len(spec)} sheet(s): {output_path}")
             return output_path
 
-        except ImportError:
-            raise ImportError(
-                "openpyxl is required for Excel generation. "
-                "Install with: pip install openpyxl"
-            )
         except Exception as e:
             logger.error(f"Failed to generate Excel workbook: {e}")
             raise
 
-    def _apply_sheet_formatting(self, ws, fmt: Dict[str, Any]) -> None:
+    def _write_sheet(self, ws, spec: Dict[str, Any]) -> int:
         """
-        Apply formatting to worksheet.
+        Write one sheet spec to a write-only worksheet.
 
-        Args:
-            ws: Worksheet object
-            fmt: Formatting dictionary
-
-        Format options:
-            header_row: Row number for header (1-indexed)
-            freeze_panes: Cell to freeze panes at (e.g., "A2")
-            column_widths: Dict of column letter -> width (e.g., {"A": 20})
+        Returns:
+            Number of rows written
         """
-        from openpyxl.styles import Font, PatternFill, Alignment
-
-        # Header row styling
-        if fmt.get("header_row"):
-            header_row = fmt["header_row"]
-            for cell in ws[header_row]:
-                cell.font = Font(bold=True, color="FFFFFF")
-                cell.fill = PatternFill(
-                    start_color="4472C4",
-                    end_color="4472C4",
-                    fill_type="solid"
+        from openpyxl.cell import WriteOnlyCell
+        from openpyxl.styles import Alignment, Font, PatternFill
+        from openpyxl.utils.cell import column_index_from_string, get_column_letter
+
+        # Sheet-level settings must be in place before the first row
+        if spec.get("freeze_panes"):
+            ws.freeze_panes = spec["freeze_panes"]
+        for col, width in (spec.get("column_widths") or {}).items():
+            ws.column_dimensions[col].width = width
+
+        header = spec.get("header")
+        header_row = spec.get("header_row", 1 if header else None)
+        header_font = Font(**HEADER_FONT)
+        header_fill = PatternFill(start_color=HEADER_FILL, end_color=HEADER_FILL, fill_type="solid")
+        header_alignment = Alignment(horizontal="center", vertical="center")
+
+        formats: Dict[int, str] = {
+            column_index_from_string(col) - 1: fmt
+            for col, fmt in (spec.get("number_formats") or {}).items()
+        }
+        formulas: List[Tuple[int, str]] = sorted(
+            (column_index_from_string(col) - 1, formula)
+            for col, formula in (spec.get("formulas") or {}).items()
+        )
+
+        def header_cells(values: Iterable[Any]) -> List[Any]:
+            cells = []
+            for value in values:
+                cell = WriteOnlyCell(ws, value=value)
+                cell.font = header_font
+                cell.fill = header_fill
+                cell.alignment = header_alignment
+                cells.append(cell)
+            return cells
+
+        def data_cells(values: List[Any], row_number: int) -> List[Any]:
+            if formulas:
+                values = list(values)
+                for index, formula in formulas:
+                    if index >= len(values):
+                        values.extend([None] * (index - len(values) + 1))
+                    values[index] = formula.format(row=row_number)
+            if not formats:
+                return values
+            cells = list(values)
+            for index, fmt in formats.items():
+                if index < len(cells) and cells[index] is not None:
+                    cell = WriteOnlyCell(ws, value=cells[index])
+                    cell.number_format = fmt
+                    cells[index] = cell
+            return cells
+
+        row_number = 0
+        first_data_row = None
+        if header:
+            row_number += 1
+            ws.append(header_cells(header) if header_row == 1 else header)
+
+        for values in spec.get("rows") or []:
+            row_number += 1
+            if row_number == header_row:
+                ws.append(header_cells(values))
+                continue
+            if first_data_row is None:
+                first_data_row = row_number
+            ws.append(data_cells(values, row_number))
+        last_data_row = row_number
+
+        if spec.get("totals") and first_data_row is not None:
+            total_font = Font(bold=True)
+            totals = {column_index_from_string(col) - 1: func for col, func in spec["totals"].items()}
+            cells: List[Any] = [None] * (max(totals) + 1)
+            for index, func in totals.items():
+                col = get_column_letter(index + 1)
+                cell = WriteOnlyCell(
+                    ws, value=f"={func.upper()}({col}{first_data_row}:{col}{last_data_row})"
                 )
-                cell.alignment = Alignment(horizontal="center", vertical="center")
+                cell.font = total_font
+                if index in formats:
+                    cell.number_format = formats[index]
+                cells[index] = cell
+            if cells[0] is None:
+                label = WriteOnlyCell(ws, value="Total")
+                label.font = total_font
+                cells[0] = label
+            ws.append(cells)
+            row_number += 1
 
-        # Freeze panes
-        if fmt.get("freeze_panes"):
-            ws.freeze_panes = fmt["freeze_panes"]
+        if spec.get("auto_filter"):
+            ws.auto_filter.ref = spec["auto_filter"].format(last_row=last_data_row)
 
-        # Column widths
-        if fmt.get("column_widths"):
-            for col, width in fmt["column_widths"].items():
-                ws.column_dimensions[col].width = width
+        for chart_spec in spec.get("charts") or []:
+            ws.add_chart(_build_chart(ws, chart_spec, last_data_row), chart_spec.get("position", "E2"))
 
-        # Auto-filter
-        if fmt.get("auto_filter"):
-            ws.auto_filter.ref = fmt["auto_filter"]
+        return row_number
 
     def add_formula(
         self,
@@ -188,6 +363,10 @@ class ExcelGenerator:
         """
         Add formula to cell in existing file.
 
+        Each call loads and re-saves the whole workbook; use
+        ``add_formulas`` for several cells, or the ``formulas``/``totals``
+        keys of a ``write_workbook`` spec for new files.
+
         Args:
             file_path: Path to Excel file
             sheet_name: Sheet name
@@ -208,17 +387,7 @@ class ExcelGenerator:
         try:
             from openpyxl import load_workbook
 
-            # Load workbook
-            wb = load_workbook(str(file_path))
-            ws = wb[sheet_name]
-
-            # Add formula
-            ws[cell] = formula
-
-            # Save
-            wb.save(str(file_path))
-
-            logger.debug(f"Added formula to {sheet_name}!{cell}: {formula}")
+            self.add_formulas(file_path, sheet_name, {cell: formula})
 
             # Try to get calculated value
             try:
@@ -231,6 +400,46 @@ class ExcelGenerator:
             logger.error(f"Failed to add formula: {e}")
             raise
 
+    def add_formulas(
+        self,
+        file_path: Path,
+        sheet_name: str,
+        formulas: Dict[str, str]
+    ) -> None:
+        """
+        Add several formulas to an existing file with a single save.
+
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Sheet name
+            formulas: Dict of cell reference -> formula
+
+        Example:
+            generator.add_formulas(
+                Path("grades.xlsx"),
+                "Sheet1",
+                {"D2": "=SUM(B2:C2)", "D3": "=SUM(B3:C3)"}
+            )
+        """
+        try:
+            from openpyxl import load_workbook
+
+            # Load workbook
+            wb = load_workbook(str(file_path))
+            ws = wb[sheet_name]
+
+            for cell, formula in formulas.items():
+                ws[cell] = formula
+
+            # Save
+            wb.save(str(file_path))
+
+            logger.debug(f"Added {len(formulas)} formula(s) to {sheet_name}")
+
+        except Exception as e:
+            logger.error(f"Failed to add formulas: {e}")
+            raise
+
     def read_data(
         self,
         file_path: Path,
@@ -255,36 +464,51 @@ class ExcelGenerator:
                 "A1:C10"
             )
         """
+        data = [list(row) for row in self.iter_rows(file_path, sheet_name, range_)]
+        logger.debug(f"Read {len(data)} rows from {sheet_name}")
+        return data
+
+    def iter_rows(
+        self,
+        file_path: Path,
+        sheet_name: str,
+        range_: Optional[str] = None
+    ) -> Iterator[Tuple[Any, ...]]:
+        """
+        Lazily read rows from an Excel file.
+
+        Opens the workbook in read-only mode, which parses the sheet as it
+        is iterated instead of loading every cell first.
+
+        Args:
+            file_path: Path to Excel file
+            sheet_name: Sheet name to read
+            range_: Optional cell range (e.g., "A1:C10"), None reads all
+
+        Yields:
+            Tuple of cell values per row
+
+        Example:
+            for name, amount in generator.iter_rows(Path("ledger.xlsx"), "Ledger", "A2:B100000"):
+                ...
+        """
         try:
             from openpyxl import load_workbook
+            from openpyxl.utils.cell import range_boundaries
+        except ImportError:
+            raise _openpyxl_required()
 
-            # Load with data_only to get calculated values
-            wb = load_workbook(str(file_path), data_only=True)
+        # Load with data_only to get calculated values
+        wb = load_workbook(str(file_path), read_only=True, data_only=True)
+        try:
             ws = wb[sheet_name]
-
-            data = []
-
+            bounds = {}
             if range_:
-                # Read specific range
-                cells = ws[range_]
-                for row in cells:
-                    if not isinstance(row, tuple):
-                        # Single cell
-                        row = (row,)
-                    row_data = [cell.value for cell in row]
-                    data.append(row_data)
-            else:
-                # Read all rows
-                for row in ws.iter_rows():
-                    row_data = [cell.value for cell in row]
-                    data.append(row_data)
-
-            logger.debug(f"Read {len(data)} rows from {sheet_name}")
-            return data
-
-        except Exception as e:
-            logger.error(f"Failed to read Excel data: {e}")
-            raise
+                min_col, min_row, max_col, max_row = range_boundaries(range_)
+                bounds = dict(min_col=min_col, min_row=min_row, max_col=max_col, max_row=max_row)
+            yield from ws.iter_rows(values_only=True, **bounds)
+        finally:
+            wb.close()
 
     def add_chart(
         self,
@@ -295,13 +519,16 @@ class ExcelGenerator:
         position: str = "E2"
     ) -> None:
         """
-        Add chart to worksheet.
+        Add chart to worksheet in an existing file.
+
+        For new files, pass charts in the ``write_workbook`` spec instead so
+        the workbook is only written once.
 
         Args:
             file_path: Path to Excel file
             sheet_name: Sheet name
             chart_type: Chart type ("bar", "line", "pie")
-            data_range: Data range for chart (e.g., "A1:C10")
+            data_range: Data range for chart (e.g., "A1:C10" or "Sheet1!A1:C10")
             position: Position to place chart (e.g., "E2")
 
         Example:
@@ -315,26 +542,12 @@ class ExcelGenerator:
         """
         try:
             from openpyxl import load_workbook
-            from openpyxl.chart import BarChart, LineChart, PieChart, Reference
 
             wb = load_workbook(str(file_path))
             ws = wb[sheet_name]
 
-            # Create chart based on type
-            if chart_type == "bar":
-                chart = BarChart()
-            elif chart_type == "line":
-                chart = LineChart()
-            elif chart_type == "pie":
-                chart = PieChart()
-            else:
-                raise ValueError(f"Unsupported chart type: {chart_type}")
-
-            # Parse data range
-            data = Reference(ws, range_string=data_range)
-            chart.add_data(data, titles_from_data=True)
-
             # Add chart to sheet
+            chart = _build_chart(ws, {"type": chart_type, "data": data_range}, ws.max_row)
             ws.add_chart(chart, position)
 
             # Save
@@ -6,6 +6,9 @@ Allows users to:
 - Attach files to conversation
 - Search for files by name
 - Maintain file context across messages
+
+File lookups and text search go through the shared workspace index
+(see workspace_index), so they don't walk the tree or read every file.
 """
 
 import os
@@ -14,6 +17,8 @@ from dataclasses import dataclass
 from pathlib import Path
 from typing import Dict, List, Optional
 
+from workspace_index import fold, index_for, notify_changed
+
 
 @dataclass
 class AttachedFile:
@@ -120,19 +125,7 @@ class FileContextManager:
         Returns:
             List of matching file paths
         """
-        search_root = search_path or self.workspace_root
-
-        if not search_root.exists():
-            return []
-
-        matches = []
-
-        # Search recursively
-        for file in search_root.rglob(filename):
-            if file.is_file():
-                matches.append(file)
-
-        return matches
+        return self._indexed_files(filename, search_path or self.workspace_root)
 
     def find_files_by_pattern(
         self,
@@ -149,13 +142,23 @@ class FileContextManager:
         Returns:
             List of matching file paths
         """
-        search_root = search_path or self.workspace_root
+        return self._indexed_files(pattern, search_path or self.workspace_root)
 
-        if not search_root.exists():
+    def _indexed_files(self, pattern: str, search_root: Path) -> List[Path]:
+        """Files under search_root matching pattern at any depth (like rglob)"""
+        if not search_root.is_dir():
             return []
 
-        matches = list(search_root.rglob(pattern))
-        return [m for m in matches if m.is_file()]
+        index = index_for(search_root, self.workspace_root)
+        return [
+            self._under(search_root, index.root / entry.path)
+            for entry in index.glob(pattern, base=search_root, include_dirs=False)
+        ]
+
+    @staticmethod
+    def _under(search_root: Path, path: Path) -> Path:
+        """Express an indexed (absolute) path in terms of search_root"""
+        return search_root / path.relative_to(search_root.resolve())
 
     def get_attached_files(self, session_id: str) -> List[AttachedFile]:
         """Get all files attached to a session"""
@@ -186,6 +189,7 @@ class FileContextManager:
 
         with open(resolved_path, 'w', encoding='utf-8') as f:
             f.write(content)
+        notify_changed(resolved_path)
 
     def list_files(
         self,
@@ -261,7 +265,13 @@ class FileContextManager:
         search_root = search_path or self.workspace_root
         matches = []
 
-        files = self.find_files_by_pattern(file_pattern, search_root)
+        if not search_root.is_dir():
+            return matches
+
+        # Only read files whose trigrams contain the query's
+        index = index_for(search_root, self.workspace_root)
+        candidates, _ = index.candidates([fold(query)], file_pattern, base=search_root)
+        files = [self._under(search_root, index.root / entry.path) for entry in candidates]
 
         for file in files:
             try:
@@ -11,18 +11,15 @@ from .spreadsheet_engine import (
     SpreadsheetEngine,
     SpreadsheetData,
     QueryResult,
-    ChartConfig,
 )
 
 from .document_intelligence import (
     DocumentIntelligence,
     ContractAnalysis,
     ContractClause,
-    RiskAssessment,
+    RiskLevel,
     InvoiceData,
-    LineItem,
     FinancialStatementData,
-    FinancialRatios,
 )
 
 from .financial_templates import (
@@ -36,16 +33,13 @@ __all__ = [
     "SpreadsheetEngine",
     "SpreadsheetData",
     "QueryResult",
-    "ChartConfig",
     # Document Intelligence
     "DocumentIntelligence",
     "ContractAnalysis",
     "ContractClause",
-    "RiskAssessment",
+    "RiskLevel",
     "InvoiceData",
-    "LineItem",
     "FinancialStatementData",
-    "FinancialRatios",
     # Financial Templates
     "FinancialTemplateEngine",
     "FinancialTemplate",
@@ -3,16 +3,29 @@ Spreadsheet Integration Engine for JARVIS.
 
 Provides natural language queries on spreadsheet data,
 auto-generation of charts and reports, and data analysis.
+
+Data is held column by column in typed NumPy arrays, so aggregations,
+group-by, filters and sorts are vectorized over the whole sheet.
+
+Requires numpy (listed in requirements.txt).
 """
 
 import re
 import json
 import csv
 import io
-from typing import Dict, List, Optional, Any, Tuple
+from typing import Dict, IO, Iterable, List, Optional, Any, Sequence, Tuple, Union
 from dataclasses import dataclass, field
 from enum import Enum
 from datetime import datetime
+from functools import lru_cache
+from pathlib import Path
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
 
 
 class ChartType(Enum):
@@ -36,13 +49,280 @@ class AggregationType(Enum):
     MEDIAN = "median"
 
 
+NUMERIC_SAMPLE_SIZE = 10  # Non-empty values inspected to infer a column's type
+CSV_CHUNK_ROWS = 50_000    # Rows parsed before being packed into arrays
+CONVERT_CACHE_SIZE = 65_536  # Distinct CSV cell strings remembered while loading
+
+
+def _is_numeric(value: Any) -> bool:
+    """Check if value is numeric."""
+    if isinstance(value, (int, float)):
+        return True
+    if isinstance(value, str):
+        try:
+            float(value.replace(',', '').replace('$', '').replace('%', ''))
+            return True
+        except ValueError:
+            return False
+    return False
+
+
+def _is_date(value: Any) -> bool:
+    """Check if value looks like a date."""
+    if isinstance(value, datetime):
+        return True
+    if isinstance(value, str):
+        date_patterns = [
+            r'\d{4}-\d{2}-\d{2}',
+            r'\d{2}/\d{2}/\d{4}',
+            r'\d{2}-\d{2}-\d{4}',
+        ]
+        return any(re.match(p, value) for p in date_patterns)
+    return False
+
+
+def _sort_key(value: Any) -> Tuple[int, Any]:
+    """Order numbers before everything else, which sorts as text."""
+    if isinstance(value, (int, float)):
+        return (0, value)
+    return (1, str(value))
+
+
 @dataclass
+class Column:
+    """
+    One column stored as a typed NumPy array.
+
+    Number columns hold float64 values (NaN where empty) plus a mask of
+    which cells were ints. Text and date columns are dictionary-encoded:
+    ``data`` holds int32 codes into ``categories`` (-1 where empty), so
+    group-by and equality filters work on small integer arrays.
+    """
+    name: str
+    kind: str  # "number", "date" or "text"
+    data: "np.ndarray"
+    categories: List[Any] = field(default_factory=list)
+    int_mask: Optional["np.ndarray"] = None
+    # Cells of a number column that aren't numbers (kept for display)
+    other: Dict[int, Any] = field(default_factory=dict)
+    _numbers: Optional["np.ndarray"] = field(default=None, init=False, repr=False)
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    @property
+    def is_coded(self) -> bool:
+        return self.kind != "number"
+
+    def numbers(self) -> "np.ndarray":
+        """Numeric view of the column (NaN where a cell isn't a number)."""
+        if self._numbers is None:
+            if not self.is_coded:
+                self._numbers = self.data
+            else:
+                lookup = np.array(
+                    [float(c) if isinstance(c, (int, float)) else np.nan for c in self.categories]
+                    + [np.nan]
+                )
+                self._numbers = lookup[self.data]  # Code -1 picks the trailing NaN
+        return self._numbers
+
+    def integral(self) -> bool:
+        """True if every numeric cell was an int."""
+        if not self.is_coded:
+            values = ~np.isnan(self.data)
+            return bool(np.all(self.int_mask[values]))
+        return all(isinstance(c, int) for c in self.categories if isinstance(c, (int, float)))
+
+    def non_null_mask(self) -> "np.ndarray":
+        if self.is_coded:
+            return self.data >= 0
+        mask = ~np.isnan(self.data)
+        if self.other:
+            mask[list(self.other)] = True
+        return mask
+
+    def value(self, index: int) -> Any:
+        """Original cell value."""
+        if self.is_coded:
+            code = self.data[index]
+            return self.categories[code] if code >= 0 else None
+        if index in self.other:
+            return self.other[index]
+        number = self.data[index]
+        if np.isnan(number):
+            return None
+        return int(number) if self.int_mask[index] else float(number)
+
+    def take(self, indices: Sequence[int]) -> List[Any]:
+        """Original cell values at the given row indices."""
+        return [self.value(int(i)) for i in indices]
+
+    def tolist(self) -> List[Any]:
+        """All original cell values."""
+        if self.is_coded:
+            lookup = self.categories + [None]
+            return [lookup[code] for code in self.data.tolist()]
+        values = [
+            int(v) if is_int else v
+            for v, is_int in zip(self.data.tolist(), self.int_mask.tolist())
+        ]
+        values = [None if v != v else v for v in values]  # NaN -> None
+        for index, original in self.other.items():
+            values[index] = original
+        return values
+
+    def sort_keys(self) -> "np.ndarray":
+        """Array whose order matches sorting the column's values."""
+        if not self.is_coded:
+            return np.nan_to_num(self.data, nan=0.0)  # Empty cells sort as 0
+        order = sorted(range(len(self.categories)), key=lambda c: _sort_key(self.categories[c]))
+        ranks = np.empty(len(self.categories) + 1, dtype=np.int64)
+        ranks[order] = np.arange(len(order))
+        ranks[-1] = -1  # Empty cells sort first
+        return ranks[self.data]
+
+
+class _ColumnBuilder:
+    """Packs a column's values into typed arrays chunk by chunk."""
+
+    def __init__(self, name: str):
+        self.name = name
+        self.kind: Optional[str] = None
+        self.length = 0
+        self._pending: List[Any] = []
+        self._sample: List[Any] = []
+        self._chunks: List["np.ndarray"] = []
+        self._int_chunks: List["np.ndarray"] = []
+        self._categories: List[Any] = []
+        self._codes: Dict[Any, int] = {}
+        self._other: Dict[int, Any] = {}
+
+    def extend(self, values: List[Any]):
+        if self.kind is None:
+            self._pending.extend(values)
+            for value in values:
+                if value is not None and len(self._sample) < NUMERIC_SAMPLE_SIZE:
+                    self._sample.append(value)
+            if len(self._sample) < NUMERIC_SAMPLE_SIZE:
+                return
+            self._decide()
+            values, self._pending = self._pending, []
+        self._pack(values)
+
+    def finish(self) -> Column:
+        if self.kind is None:
+            self._decide()
+            self._pack(self._pending)
+            self._pending = []
+
+        if self.kind == "number":
+            data = np.concatenate(self._chunks) if self._chunks else np.empty(0)
+            int_mask = (
+                np.concatenate(self._int_chunks) if self._int_chunks
+                else np.empty(0, dtype=bool)
+            )
+            return Column(self.name, "number", data, int_mask=int_mask, other=self._other)
+
+        data = np.concatenate(self._chunks) if self._chunks else np.empty(0, dtype=np.int32)
+        return Column(self.name, self.kind, data, categories=self._categories)
+
+    def _decide(self):
+        # Same rule the row-based engine used: judge by the first values
+        if self._sample and all(_is_numeric(v) for v in self._sample):
+            self.kind = "number"
+        elif self._sample and all(_is_date(v) for v in self._sample):
+            self.kind = "date"
+        else:
+            self.kind = "text"
+
+    def _pack(self, values: List[Any]):
+        if not values:
+            return
+        offset = self.length
+        self.length += len(values)
+
+        if self.kind == "number":
+            numbers = np.full(len(values), np.nan)
+            ints = np.zeros(len(values), dtype=bool)
+            for i, value in enumerate(values):
+                if isinstance(value, (int, float)):
+                    numbers[i] = value
+                    ints[i] = isinstance(value, int)
+                elif value is not None:
+                    self._other[offset + i] = value
+            self._chunks.append(numbers)
+            self._int_chunks.append(ints)
+            return
+
+        codes = np.empty(len(values), dtype=np.int32)
+        for i, value in enumerate(values):
+            if value is None:
+                codes[i] = -1
+                continue
+            try:
+                code = self._codes.get(value)
+            except TypeError:  # Unhashable (e.g. nested JSON)
+                code = None
+                self._categories.append(value)
+                codes[i] = len(self._categories) - 1
+                continue
+            if code is None:
+                code = self._codes[value] = len(self._categories)
+                self._categories.append(value)
+            codes[i] = code
+        self._chunks.append(codes)
+
+
+def _build_columns(headers: List[str], rows: Iterable[List[Any]],
+                   chunk_rows: int = CSV_CHUNK_ROWS) -> List[Column]:
+    """Pack rows into columns, holding at most ``chunk_rows`` rows as lists."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError("numpy not installed. Run: pip install numpy")
+
+    builders = [_ColumnBuilder(h) for h in headers]
+    width = len(headers)
+    chunk: List[List[Any]] = []
+
+    def flush():
+        for i, builder in enumerate(builders):
+            builder.extend([row[i] if i < len(row) else None for row in chunk])
+        chunk.clear()
+
+    for row in rows:
+        chunk.append(row[:width] if len(row) > width else row)
+        if len(chunk) >= chunk_rows:
+            flush()
+    flush()
+
+    return [b.finish() for b in builders]
+
+
 class SpreadsheetData:
-    """Represents spreadsheet data."""
-    headers: List[str]
-    rows: List[List[Any]]
-    sheet_name: str = "Sheet1"
-    metadata: Dict[str, Any] = field(default_factory=dict)
+    """
+    Represents spreadsheet data.
+
+    Stored column by column as typed NumPy arrays with each column's type
+    inferred once at load; ``rows`` and ``get_column`` rebuild Python
+    lists on demand for callers that need them.
+    """
+
+    def __init__(
+        self,
+        headers: List[str],
+        rows: Optional[List[List[Any]]] = None,
+        sheet_name: str = "Sheet1",
+        metadata: Optional[Dict[str, Any]] = None,
+        columns: Optional[List[Column]] = None,
+    ):
+        self.headers = list(headers)
+        self.sheet_name = sheet_name
+        self.metadata = metadata or {}
+        self._rows = rows
+        self.columns = columns if columns is not None else _build_columns(self.headers, rows or [])
+        self._by_name: Dict[str, Column] = {}
+        for column in self.columns:
+            self._by_name.setdefault(column.name, column)
 
     @property
     def column_count(self) -> int:
@@ -50,59 +330,46 @@ class SpreadsheetData:
 
     @property
     def row_count(self) -> int:
-        return len(self.rows)
+        if self._rows is not None:
+            return len(self._rows)
+        return len(self.columns[0]) if self.columns else 0
 
-    def get_column(self, name: str) -> List[Any]:
-        """Get all values in a column by name."""
-        if name not in self.headers:
+    @property
+    def rows(self) -> List[List[Any]]:
+        """All rows as lists (built on first access)."""
+        if self._rows is None:
+            values = [c.tolist() for c in self.columns]
+            self._rows = [list(row) for row in zip(*values)]
+        return self._rows
+
+    def column(self, name: str) -> Column:
+        """Typed column by name."""
+        if name not in self._by_name:
             raise ValueError(f"Column '{name}' not found")
-        idx = self.headers.index(name)
-        return [row[idx] if idx < len(row) else None for row in self.rows]
+        return self._by_name[name]
+
+    def get_column(self, name: str, limit: Optional[int] = None) -> List[Any]:
+        """Get all values (or the first ``limit``) in a column by name."""
+        column = self.column(name)
+        if limit is not None:
+            return column.take(range(min(limit, len(column))))
+        return column.tolist()
+
+    def take(self, indices: Sequence[int]) -> List[List[Any]]:
+        """Rows at the given indices."""
+        values = [c.take(indices) for c in self.columns]
+        return [list(row) for row in zip(*values)]
 
     def get_numeric_columns(self) -> List[str]:
         """Get names of columns that contain numeric data."""
-        numeric_cols = []
-        for i, header in enumerate(self.headers):
-            values = [row[i] for row in self.rows if i < len(row) and row[i] is not None]
-            if values and all(self._is_numeric(v) for v in values[:10]):  # Check first 10
-                numeric_cols.append(header)
-        return numeric_cols
+        return [c.name for c in self.columns if c.kind == "number"]
 
     def get_date_columns(self) -> List[str]:
         """Get names of columns that contain date data."""
-        date_cols = []
-        for i, header in enumerate(self.headers):
-            values = [row[i] for row in self.rows if i < len(row) and row[i] is not None]
-            if values and all(self._is_date(v) for v in values[:10]):
-                date_cols.append(header)
-        return date_cols
-
-    @staticmethod
-    def _is_numeric(value: Any) -> bool:
-        """Check if value is numeric."""
-        if isinstance(value, (int, float)):
-            return True
-        if isinstance(value, str):
-            try:
-                float(value.replace(',', '').replace('$', '').replace('%', ''))
-                return True
-            except ValueError:
-                return False
-        return False
+        return [c.name for c in self.columns if c.kind == "date"]
 
-    @staticmethod
-    def _is_date(value: Any) -> bool:
-        """Check if value looks like a date."""
-        if isinstance(value, datetime):
-            return True
-        if isinstance(value, str):
-            date_patterns = [
-                r'\d{4}-\d{2}-\d{2}',
-                r'\d{2}/\d{2}/\d{4}',
-                r'\d{2}-\d{2}-\d{4}',
-            ]
-            return any(re.match(p, value) for p in date_patterns)
-        return False
+    _is_numeric = staticmethod(_is_numeric)
+    _is_date = staticmethod(_is_date)
 
     def to_dict(self) -> Dict:
         """Convert to dictionary."""
@@ -115,6 +382,92 @@ class SpreadsheetData:
         }
 
 
+def _python_number(value: Any, integral: bool) -> Any:
+    return int(value) if integral else float(value)
+
+
+def _numeric_stats(column: Column) -> Optional[Dict[str, Any]]:
+    """Count, sum, min, max and average of a column's numeric cells."""
+    numbers = column.numbers()
+    values = numbers[~np.isnan(numbers)]
+    if not len(values):
+        return None
+
+    integral = column.integral()
+    total = values.sum()
+    return {
+        "count": len(values),
+        "sum": _python_number(total, integral),
+        # The extreme cells themselves, so an int stays an int in a mixed column
+        "min": column.value(int(np.nanargmin(numbers))),
+        "max": column.value(int(np.nanargmax(numbers))),
+        "average": float(total / len(values)),
+    }
+
+
+def _filter_mask(column: Column, op: str, value: Any) -> "np.ndarray":
+    """Boolean mask of rows where ``column <op> value``."""
+    if op == 'eq':
+        target = str(value).lower()
+        if not column.is_coded:
+            matches = np.zeros(len(column), dtype=bool)
+            if isinstance(value, float):
+                matches = column.data == value
+            for index, original in column.other.items():
+                matches[index] = str(original).lower() == target
+            return matches
+        codes = [
+            code for code, category in enumerate(column.categories)
+            if str(category).lower() == target
+            or (isinstance(value, float) and isinstance(category, (int, float)) and category == value)
+        ]
+        return np.isin(column.data, codes)
+
+    if not isinstance(value, float):
+        return np.zeros(len(column), dtype=bool)
+
+    numbers = column.numbers()
+    with np.errstate(invalid="ignore"):  # NaN compares False
+        if op == 'gt':
+            return numbers > value
+        if op == 'gte':
+            return numbers >= value
+        if op == 'lt':
+            return numbers < value
+        if op == 'lte':
+            return numbers <= value
+    return np.zeros(len(column), dtype=bool)
+
+
+def _group_sums(group: Column, values: Column) -> Dict[str, Any]:
+    """Sum ``values`` per distinct value of ``group``, in first-seen order."""
+    numbers = values.numbers()
+    valid = ~np.isnan(numbers)
+
+    if group.is_coded:
+        codes = group.data[valid]
+        labels = [str(c) for c in group.categories] + ["None"]
+        codes = np.where(codes < 0, len(group.categories), codes)
+    else:
+        labels, codes = np.unique(group.data[valid], return_inverse=True)
+        labels = [str(v) for v in group.take(
+            np.flatnonzero(valid)[np.unique(codes, return_index=True)[1]]
+        )]
+    if not len(codes):
+        return {}
+
+    sums = np.bincount(codes, weights=numbers[valid], minlength=len(labels))
+    present, first_seen = np.unique(codes, return_index=True)
+    integral = values.integral()
+
+    result: Dict[str, Any] = {}
+    for code in present[np.argsort(first_seen)]:
+        key = labels[code]
+        # Distinct values with the same text (1 and "1") share a group
+        result[key] = result.get(key, 0) + _python_number(sums[code], integral)
+    return result
+
+
 @dataclass
 class QueryResult:
     """Result of a spreadsheet query."""
@@ -142,31 +495,47 @@ class SpreadsheetEngine:
     def __init__(self):
         self.current_data: Optional[SpreadsheetData] = None
 
-    def load_csv(self, content: str, sheet_name: str = "Sheet1") -> SpreadsheetData:
-        """Load data from CSV content."""
-        reader = csv.reader(io.StringIO(content))
-        rows = list(reader)
+    def load_csv(self, content: Union[str, IO[str], Iterable[str]],
+                 sheet_name: str = "Sheet1",
+                 chunk_rows: int = CSV_CHUNK_ROWS) -> SpreadsheetData:
+        """
+        Load data from CSV content.
 
-        if not rows:
-            raise ValueError("Empty CSV data")
+        Args:
+            content: CSV text, an open text file, or any iterable of lines.
+                     Files and iterables are parsed as they are read.
+            sheet_name: Name for the loaded sheet
+            chunk_rows: Rows converted per batch before being packed into
+                        column arrays
+
+        Returns:
+            The loaded data (also kept as ``current_data``)
+        """
+        if isinstance(content, str):
+            content = io.StringIO(content)
+        reader = csv.reader(content)
 
-        headers = rows[0]
-        data_rows = []
+        headers = next(reader, None)
+        if headers is None:
+            raise ValueError("Empty CSV data")
 
-        for row in rows[1:]:
-            # Convert numeric strings to numbers
-            converted_row = []
-            for val in row:
-                converted_row.append(self._convert_value(val))
-            data_rows.append(converted_row)
+        # Dates, categories and memo text repeat heavily in ledgers
+        convert = lru_cache(maxsize=CONVERT_CACHE_SIZE)(self._convert_value)
+        rows = ([convert(val) for val in row] for row in reader)
 
         self.current_data = SpreadsheetData(
             headers=headers,
-            rows=data_rows,
-            sheet_name=sheet_name
+            sheet_name=sheet_name,
+            columns=_build_columns(headers, rows, chunk_rows)
         )
         return self.current_data
 
+    def load_csv_file(self, path: str, sheet_name: Optional[str] = None,
+                      encoding: str = "utf-8-sig") -> SpreadsheetData:
+        """Stream a CSV file from disk without reading it into memory first."""
+        with open(path, newline="", encoding=encoding) as f:
+            return self.load_csv(f, sheet_name or Path(path).stem)
+
     def load_json(self, content: str, sheet_name: str = "Sheet1") -> SpreadsheetData:
         """Load data from JSON content (array of objects)."""
         data = json.loads(content)
@@ -178,15 +547,12 @@ class SpreadsheetEngine:
         headers = list(data[0].keys())
 
         # Convert to rows
-        rows = []
-        for item in data:
-            row = [self._convert_value(item.get(h)) for h in headers]
-            rows.append(row)
+        rows = ([self._convert_value(item.get(h)) for h in headers] for item in data)
 
         self.current_data = SpreadsheetData(
             headers=headers,
-            rows=rows,
-            sheet_name=sheet_name
+            sheet_name=sheet_name,
+            columns=_build_columns(headers, rows)
         )
         return self.current_data
 
@@ -288,38 +654,38 @@ class SpreadsheetEngine:
                 error="Could not identify which column to aggregate"
             )
 
-        values = [v for v in data.get_column(column) if isinstance(v, (int, float))]
+        stats = _numeric_stats(data.column(column))
 
-        if not values:
+        if not stats:
             return QueryResult(
                 success=False,
                 error=f"No numeric values found in column '{column}'"
             )
 
         if agg_type == AggregationType.SUM:
-            result = sum(values)
+            result = stats["sum"]
             summary = f"The sum of {column} is {result:,.2f}"
             sql = f"SELECT SUM({column}) FROM {data.sheet_name}"
         elif agg_type == AggregationType.AVERAGE:
-            result = sum(values) / len(values)
+            result = stats["average"]
             summary = f"The average of {column} is {result:,.2f}"
             sql = f"SELECT AVG({column}) FROM {data.sheet_name}"
         elif agg_type == AggregationType.MAX:
-            result = max(values)
+            result = stats["max"]
             summary = f"The maximum value in {column} is {result:,.2f}"
             sql = f"SELECT MAX({column}) FROM {data.sheet_name}"
         elif agg_type == AggregationType.MIN:
-            result = min(values)
+            result = stats["min"]
             summary = f"The minimum value in {column} is {result:,.2f}"
             sql = f"SELECT MIN({column}) FROM {data.sheet_name}"
         else:
-            result = sum(values)
+            result = stats["sum"]
             summary = f"Result: {result:,.2f}"
             sql = ""
 
         return QueryResult(
             success=True,
-            data={"column": column, "result": result, "count": len(values)},
+            data={"column": column, "result": result, "count": stats["count"]},
             summary=summary,
             sql_equivalent=sql
         )
@@ -330,8 +696,7 @@ class SpreadsheetEngine:
         column = self._find_column(query, data)
 
         if column:
-            values = [v for v in data.get_column(column) if v is not None]
-            count = len(values)
+            count = int(np.count_nonzero(data.column(column).non_null_mask()))
             summary = f"There are {count} values in {column}"
             sql = f"SELECT COUNT({column}) FROM {data.sheet_name}"
         else:
@@ -384,8 +749,8 @@ class SpreadsheetEngine:
             y_col = numeric_cols[0]
 
         # Build chart data
-        labels = data.get_column(x_col) if x_col else list(range(data.row_count))
-        values = data.get_column(y_col) if y_col else []
+        labels = data.get_column(x_col, limit=50) if x_col else list(range(min(data.row_count, 50)))
+        values = data.get_column(y_col, limit=50) if y_col else []
 
         chart_config = {
             "type": chart_type.value,
@@ -434,37 +799,22 @@ class SpreadsheetEngine:
     def _apply_filter(self, data: SpreadsheetData, column: str,
                      op: str, value: Any) -> QueryResult:
         """Apply filter to data."""
-        col_idx = data.headers.index(column)
-
         try:
             value = float(value)
         except ValueError:
             pass
 
-        filtered_rows = []
-        for row in data.rows:
-            cell_value = row[col_idx] if col_idx < len(row) else None
-
-            if cell_value is None:
-                continue
-
-            if op == 'eq' and str(cell_value).lower() == str(value).lower():
-                filtered_rows.append(row)
-            elif op == 'gt' and isinstance(cell_value, (int, float)) and cell_value > value:
-                filtered_rows.append(row)
-            elif op == 'gte' and isinstance(cell_value, (int, float)) and cell_value >= value:
-                filtered_rows.append(row)
-            elif op == 'lt' and isinstance(cell_value, (int, float)) and cell_value < value:
-                filtered_rows.append(row)
+        mask = _filter_mask(data.column(column), op, value)
+        matches = np.flatnonzero(mask)
 
         return QueryResult(
             success=True,
             data={
                 "headers": data.headers,
-                "rows": filtered_rows[:100],  # Limit results
-                "total_matches": len(filtered_rows)
+                "rows": data.take(matches[:100]),  # Limit results
+                "total_matches": len(matches)
             },
-            summary=f"Found {len(filtered_rows)} rows where {column} {op} {value}",
+            summary=f"Found {len(matches)} rows where {column} {op} {value}",
             sql_equivalent=f"SELECT * FROM {data.sheet_name} WHERE {column} {self._op_to_sql(op)} {value}"
         )
 
@@ -480,23 +830,20 @@ class SpreadsheetEngine:
 
         descending = any(kw in query.lower() for kw in ['desc', 'descending', 'highest', 'largest'])
 
-        col_idx = data.headers.index(column)
-        sorted_rows = sorted(
-            data.rows,
-            key=lambda r: (r[col_idx] if col_idx < len(r) and r[col_idx] is not None else 0),
-            reverse=descending
-        )
+        keys = data.column(column).sort_keys()
+        # Stable on -keys keeps ties in their original order, as sorted(reverse=True) does
+        order = np.argsort(-keys if descending else keys, kind="stable")
 
-        order = "DESC" if descending else "ASC"
+        direction = "DESC" if descending else "ASC"
 
         return QueryResult(
             success=True,
             data={
                 "headers": data.headers,
-                "rows": sorted_rows[:100]
+                "rows": data.take(order[:100])
             },
-            summary=f"Data sorted by {column} ({order})",
-            sql_equivalent=f"SELECT * FROM {data.sheet_name} ORDER BY {column} {order}"
+            summary=f"Data sorted by {column} ({direction})",
+            sql_equivalent=f"SELECT * FROM {data.sheet_name} ORDER BY {column} {direction}"
         )
 
     def _handle_groupby(self, query: str, data: SpreadsheetData) -> QueryResult:
@@ -528,22 +875,7 @@ class SpreadsheetEngine:
         if not agg_col:
             return QueryResult(success=False, error="No numeric column found for aggregation")
 
-        # Perform grouping
-        groups: Dict[str, List[float]] = {}
-        group_idx = data.headers.index(group_col)
-        agg_idx = data.headers.index(agg_col)
-
-        for row in data.rows:
-            key = str(row[group_idx]) if group_idx < len(row) else "Unknown"
-            value = row[agg_idx] if agg_idx < len(row) else None
-
-            if isinstance(value, (int, float)):
-                if key not in groups:
-                    groups[key] = []
-                groups[key].append(value)
-
-        # Calculate sums
-        result = {k: sum(v) for k, v in groups.items()}
+        result = _group_sums(data.column(group_col), data.column(agg_col))
 
         return QueryResult(
             success=True,
@@ -570,26 +902,25 @@ class SpreadsheetEngine:
             "columns": {}
         }
 
-        for col in data.headers:
-            values = data.get_column(col)
-            non_null = [v for v in values if v is not None]
+        for column in data.columns:
+            non_null = int(np.count_nonzero(column.non_null_mask()))
 
             col_stats = {
-                "non_null_count": len(non_null),
-                "null_count": len(values) - len(non_null)
+                "non_null_count": non_null,
+                "null_count": len(column) - non_null
             }
 
             # Add numeric stats if applicable
-            numeric_values = [v for v in non_null if isinstance(v, (int, float))]
-            if numeric_values:
+            numeric = _numeric_stats(column)
+            if numeric:
                 col_stats.update({
-                    "min": min(numeric_values),
-                    "max": max(numeric_values),
-                    "sum": sum(numeric_values),
-                    "average": sum(numeric_values) / len(numeric_values)
+                    "min": numeric["min"],
+                    "max": numeric["max"],
+                    "sum": numeric["sum"],
+                    "average": numeric["average"]
                 })
 
-            stats["columns"][col] = col_stats
+            stats["columns"].setdefault(column.name, col_stats)
 
         summary_lines = [
             f"Dataset: {data.sheet_name}",
@@ -16,9 +16,13 @@ import hashlib
 import json
 import os
 import secrets
+import tempfile
+import threading
+import time
 from cryptography.fernet import Fernet
 from cryptography.hazmat.primitives import hashes
 from cryptography.hazmat.primitives.kdf.pbkdf2 import PBKDF2HMAC as PBKDF2
+from contextlib import contextmanager, suppress
 from dataclasses import dataclass, asdict
 from datetime import datetime, timedelta
 from pathlib import Path
@@ -123,18 +127,111 @@ class Credential:
         return asdict(self)
 
 
+class _ReadWriteLock:
+    """
+    Lock allowing many concurrent readers or a single writer.
+
+    Writers are preferred: once a writer is waiting, new readers block so a
+    steady stream of lookups cannot starve store/delete.
+    """
+
+    def __init__(self):
+        self._cond = threading.Condition(threading.Lock())
+        self._readers = 0
+        self._writer = False
+        self._writers_waiting = 0
+
+    @contextmanager
+    def read(self):
+        with self._cond:
+            while self._writer or self._writers_waiting:
+                self._cond.wait()
+            self._readers += 1
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._readers -= 1
+                if not self._readers:
+                    self._cond.notify_all()
+
+    @contextmanager
+    def write(self):
+        with self._cond:
+            self._writers_waiting += 1
+            while self._writer or self._readers:
+                self._cond.wait()
+            self._writers_waiting -= 1
+            self._writer = True
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._writer = False
+                self._cond.notify_all()
+
+
+class _DecryptedEntry:
+    """
+    Decrypted credential values held in mutable buffers.
+
+    Values are kept as bytearrays so they can be overwritten in place when
+    the entry is evicted. Strings handed out by get() are immutable copies
+    and cannot be wiped; the cache only bounds how long the store itself
+    keeps plaintext around.
+    """
+
+    __slots__ = ('values', 'expires_at')
+
+    def __init__(self, values: Dict[str, Optional[str]], expires_at: float):
+        self.values = {
+            key: bytearray(value.encode()) if value is not None else None
+            for key, value in values.items()
+        }
+        self.expires_at = expires_at
+
+    def decode(self) -> Dict[str, Optional[str]]:
+        return {
+            key: value.decode() if value is not None else None
+            for key, value in self.values.items()
+        }
+
+    def zeroize(self):
+        for value in self.values.values():
+            if value is not None:
+                value[:] = bytes(len(value))
+        self.values.clear()
+
+
 class CredentialStore:
     """
     Manages secure storage of credentials.
 
-    Credentials are encrypted and stored in data/integrations.json
+    Credentials are encrypted and stored in data/integrations.json. The file
+    is read once into an in-memory index of encrypted records; store() and
+    delete() update the index and atomically replace the file. Decrypted
+    values are cached for cache_ttl seconds and zeroized on eviction.
     """
 
-    def __init__(self, storage_path: str = "data/integrations.json"):
+    def __init__(
+        self,
+        storage_path: str = "data/integrations.json",
+        cache_ttl: float = 300.0,
+        encryption: Optional[CredentialEncryption] = None
+    ):
         self.storage_path = Path(storage_path)
         self.storage_path.parent.mkdir(parents=True, exist_ok=True)
-        self.encryption = get_encryption()
+        self.encryption = encryption or get_encryption()
+        self.cache_ttl = cache_ttl
+
+        self._lock = _ReadWriteLock()
+        self._records: Dict[str, Dict] = {}
+        self._cache: Dict[str, _DecryptedEntry] = {}
+        self._stats = {'hits': 0, 'misses': 0, 'evictions': 0, 'writes': 0}
+        self._stats_lock = threading.Lock()  # hits are counted under the shared read lock
+
         self._ensure_file()
+        self._records = self._load_data()
 
     def _ensure_file(self):
         """Ensure storage file exists"""
@@ -150,63 +247,158 @@ class CredentialStore:
             return {}
 
     def _save_data(self, data: Dict):
-        """Save data to file"""
-        with open(self.storage_path, 'w') as f:
-            json.dump(data, f, indent=2)
-        self.storage_path.chmod(0o600)  # Secure permissions
+        """Atomically replace the storage file with data"""
+        # mkstemp creates the file 0o600, so secrets are never world-readable
+        fd, tmp_path = tempfile.mkstemp(
+            dir=self.storage_path.parent, prefix=f".{self.storage_path.name}.", suffix=".tmp"
+        )
+        try:
+            with os.fdopen(fd, 'w') as f:
+                json.dump(data, f, indent=2)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_path, self.storage_path)
+        except BaseException:
+            with suppress(FileNotFoundError):
+                os.unlink(tmp_path)
+            raise
+
+    # ------------------------------------------------------------------------
+    # Decrypted cache
+    # ------------------------------------------------------------------------
+
+    def _cached(self, connector_id: str) -> Optional[_DecryptedEntry]:
+        entry = self._cache.get(connector_id)
+        if entry is not None and entry.expires_at > time.monotonic():
+            return entry
+        return None
+
+    def _cache_put(self, connector_id: str, values: Dict[str, Optional[str]]):
+        """Cache decrypted values. Caller must hold the write lock."""
+        self._evict(connector_id)
+        if self.cache_ttl > 0 and None not in values.values():
+            self._cache[connector_id] = _DecryptedEntry(values, time.monotonic() + self.cache_ttl)
+
+    def _evict(self, connector_id: str):
+        """Drop and zeroize a cached entry. Caller must hold the write lock."""
+        entry = self._cache.pop(connector_id, None)
+        if entry is not None:
+            entry.zeroize()
+            self._stats['evictions'] += 1
+
+    def _evict_expired(self):
+        """Drop and zeroize entries past their TTL. Caller must hold the write lock."""
+        now = time.monotonic()
+        for connector_id in [k for k, e in self._cache.items() if e.expires_at <= now]:
+            self._evict(connector_id)
+
+    def clear_cache(self):
+        """Zeroize and drop all decrypted credentials"""
+        with self._lock.write():
+            for connector_id in list(self._cache):
+                self._evict(connector_id)
+
+    def reload(self):
+        """Re-read the storage file, e.g. after it was edited externally"""
+        records = self._load_data()
+        with self._lock.write():
+            self._records = records
+            for connector_id in list(self._cache):
+                self._evict(connector_id)
+
+    # ------------------------------------------------------------------------
+    # Public API
+    # ------------------------------------------------------------------------
 
     def store(self, credential: Credential):
         """Store a credential (encrypted)"""
-        data = self._load_data()
+        plaintext = dict(credential.credentials)
 
         # Encrypt sensitive fields
         encrypted_creds = {}
-        for key, value in credential.credentials.items():
+        for key, value in plaintext.items():
             encrypted_creds[key] = self.encryption.encrypt(value)
 
         credential.credentials = encrypted_creds
         credential.updated_at = datetime.utcnow().isoformat()
+        record = credential.to_dict()
+
+        with self._lock.write():
+            records = dict(self._records)
+            records[credential.connector_id] = record
+            self._save_data(records)
+            self._records = records
+            self._stats['writes'] += 1
+            self._evict_expired()
+            # We already hold the plaintext, so the next get() needs no decrypt
+            self._cache_put(credential.connector_id, plaintext)
 
-        data[credential.connector_id] = credential.to_dict()
-        self._save_data(data)
         logger.info(f"Stored credentials for connector: {credential.connector_id}")
 
     def get(self, connector_id: str) -> Optional[Credential]:
         """Get and decrypt a credential"""
-        data = self._load_data()
-
-        if connector_id not in data:
+        with self._lock.read():
+            record = self._records.get(connector_id)
+            entry = self._cached(connector_id) if record is not None else None
+            if entry is not None:
+                with self._stats_lock:
+                    self._stats['hits'] += 1
+                return self._to_credential(record, entry.decode())
+
+        if record is None:
+            with self._lock.write():
+                self._evict_expired()
             return None
 
-        cred_data = data[connector_id]
-
-        # Decrypt credentials
+        # Decrypt outside the lock so readers of other connectors never wait on Fernet
         decrypted_creds = {}
-        for key, encrypted_value in cred_data['credentials'].items():
+        for key, encrypted_value in record['credentials'].items():
             try:
                 decrypted_creds[key] = self.encryption.decrypt(encrypted_value)
             except Exception as e:
                 logger.error(f"Failed to decrypt credential {key}: {e}")
                 decrypted_creds[key] = None
 
-        cred_data['credentials'] = decrypted_creds
-        return Credential(**cred_data)
+        with self._lock.write():
+            self._stats['misses'] += 1
+            # Zeroize lapsed plaintext now rather than on the next store()
+            self._evict_expired()
+            # Only cache if the record was not replaced while we were decrypting
+            if self._records.get(connector_id) is record:
+                self._cache_put(connector_id, decrypted_creds)
+
+        return self._to_credential(record, decrypted_creds)
+
+    @staticmethod
+    def _to_credential(record: Dict, credentials: Dict[str, Optional[str]]) -> Credential:
+        """Build a Credential that shares no mutable state with the index"""
+        metadata = record.get('metadata')
+        return Credential(**{
+            **record,
+            'credentials': dict(credentials),
+            'metadata': dict(metadata) if metadata is not None else None,
+        })
 
     def delete(self, connector_id: str) -> bool:
         """Delete a credential"""
-        data = self._load_data()
+        with self._lock.write():
+            if connector_id not in self._records:
+                return False
 
-        if connector_id in data:
-            del data[connector_id]
-            self._save_data(data)
-            logger.info(f"Deleted credentials for connector: {connector_id}")
-            return True
+            records = dict(self._records)
+            del records[connector_id]
+            self._save_data(records)
+            self._records = records
+            self._stats['writes'] += 1
+            self._evict(connector_id)
 
-        return False
+        logger.info(f"Deleted credentials for connector: {connector_id}")
+        return True
 
     def list_all(self) -> Dict[str, Dict]:
         """List all stored credentials (without decrypting)"""
-        data = self._load_data()
+        with self._lock.read():
+            records = self._records
         return {
             k: {
                 'connector_id': v['connector_id'],
@@ -214,9 +406,19 @@ class CredentialStore:
                 'created_at': v['created_at'],
                 'updated_at': v['updated_at']
             }
-            for k, v in data.items()
+            for k, v in records.items()
         }
 
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache and write statistics"""
+        now = time.monotonic()
+        with self._lock.read(), self._stats_lock:
+            return {
+                **self._stats,
+                'records': len(self._records),
+                'cached': sum(1 for e in self._cache.values() if e.expires_at > now),
+            }
+
 
 # ============================================================================
 # OAUTH2 CLIENT
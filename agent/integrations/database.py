@@ -8,43 +8,25 @@ Supports multiple database engines:
 - SQL Server
 
 Features:
-- Query execution with parameter binding
-- Connection pooling
-- Transaction support
+- Query execution with parameter binding ($1 or :name placeholders)
+- Connection pooling (see db_pool)
+- Prepared-statement caching
+- Batched result streaming
 - Schema introspection
-- Prepared statements
 
 Author: AI Agent System
 Created: Phase 3.2 - Integration Framework
 """
 
 import asyncio
-import sqlite3
 from datetime import datetime
 from enum import Enum
-from typing import Dict, List, Optional, Any, Union
+from typing import Any, AsyncIterator, Dict, List, Optional, Union
 import logging
 
-try:
-    import asyncpg  # PostgreSQL
-    HAS_ASYNCPG = True
-except ImportError:
-    HAS_ASYNCPG = False
-
-try:
-    import aiomysql  # MySQL
-    HAS_AIOMYSQL = True
-except ImportError:
-    HAS_AIOMYSQL = False
-
-try:
-    import aiosqlite  # SQLite
-    HAS_AIOSQLITE = True
-except ImportError:
-    HAS_AIOSQLITE = False
-
 from .base import Connector, ConnectionStatus
 from .auth import get_credential_store, create_credential
+from .db_pool import ConnectionPool, Params, PoolConfig, aclosing, create_pool
 
 logger = logging.getLogger(__name__)
 
@@ -86,6 +68,10 @@ class DatabaseConnector(Connector):
                     - pool_size: Connection pool size (default: 10)
                 For SQLite:
                     - database: Path to database file
+                Pooling (all engines, see PoolConfig):
+                    - pool_min_size, pool_timeout, pool_max_idle_time,
+                      health_check_interval, statement_cache_size,
+                      stream_batch_size
         """
         # Validate engine
         try:
@@ -96,7 +82,7 @@ class DatabaseConnector(Connector):
         # Set up configuration
         base_config = {
             'engine': engine,
-            'auth_type': 'basic' if engine != 'sqlite' else 'none',
+            'auth_type': 'basic' if engine != 'sqlite' else 'custom',
             'rate_limit_requests': 1000,  # High limit for databases
             'rate_limit_window': 60,
             'max_retries': 3,
@@ -111,9 +97,8 @@ class DatabaseConnector(Connector):
             config=base_config
         )
 
-        # Engine-specific setup
-        self.pool = None
-        self.connection = None
+        self.pool_config = PoolConfig.from_config(self.config)
+        self.pool: Optional[ConnectionPool] = None
 
         # Store credentials
         if engine != 'sqlite':
@@ -151,104 +136,47 @@ class DatabaseConnector(Connector):
             True if authentication successful
         """
         try:
-            if self.engine == DatabaseEngine.POSTGRESQL:
-                return await self._connect_postgresql()
-            elif self.engine == DatabaseEngine.MYSQL:
-                return await self._connect_mysql()
-            elif self.engine == DatabaseEngine.SQLITE:
-                return await self._connect_sqlite()
-            elif self.engine == DatabaseEngine.SQLSERVER:
-                return await self._connect_sqlserver()
-            else:
-                logger.error(f"Unsupported engine: {self.engine}")
-                return False
-
-        except Exception as e:
-            logger.error(f"Database authentication failed: {e}")
-            return False
-
-    async def _connect_postgresql(self) -> bool:
-        """Connect to PostgreSQL"""
-        if not HAS_ASYNCPG:
-            raise ImportError("asyncpg not installed. Install with: pip install asyncpg")
-
-        self.pool = await asyncpg.create_pool(
-            host=self.config['host'],
-            port=self.config.get('port', 5432),
-            database=self.config['database'],
-            user=self.config['username'],
-            password=self.config['password'],
-            min_size=1,
-            max_size=self.config['pool_size']
-        )
-
-        # Test connection
-        async with self.pool.acquire() as conn:
-            await conn.fetchval('SELECT 1')
-
-        logger.info(f"Connected to PostgreSQL: {self.config['database']}")
-        return True
-
-    async def _connect_mysql(self) -> bool:
-        """Connect to MySQL"""
-        if not HAS_AIOMYSQL:
-            raise ImportError("aiomysql not installed. Install with: pip install aiomysql")
-
-        self.pool = await aiomysql.create_pool(
-            host=self.config['host'],
-            port=self.config.get('port', 3306),
-            user=self.config['username'],
-            password=self.config['password'],
-            db=self.config['database'],
-            minsize=1,
-            maxsize=self.config['pool_size']
-        )
-
-        # Test connection
-        async with self.pool.acquire() as conn:
-            async with conn.cursor() as cursor:
-                await cursor.execute('SELECT 1')
+            if self.engine == DatabaseEngine.SQLSERVER:
+                raise NotImplementedError("SQL Server support not yet implemented")
 
-        logger.info(f"Connected to MySQL: {self.config['database']}")
-        return True
+            if self.pool is not None:
+                await self.pool.close()
 
-    async def _connect_sqlite(self) -> bool:
-        """Connect to SQLite"""
-        if not HAS_AIOSQLITE:
-            raise ImportError("aiosqlite not installed. Install with: pip install aiosqlite")
+            pool = create_pool(self.engine, self.config, self.pool_config)
+            await pool.open()
+            self.pool = pool
 
-        self.connection = await aiosqlite.connect(self.config['database'])
+            health = await pool.health_check()
+            if not health['healthy']:
+                raise ConnectionError(health['error'])
 
-        # Test connection
-        await self.connection.execute('SELECT 1')
-
-        logger.info(f"Connected to SQLite: {self.config['database']}")
-        return True
+            logger.info(
+                f"Connected to {self.engine.value}: {self.config.get('database')} "
+                f"(pool {self.pool_config.min_size}-{self.pool_config.max_size})"
+            )
+            return True
 
-    async def _connect_sqlserver(self) -> bool:
-        """Connect to SQL Server"""
-        raise NotImplementedError("SQL Server support not yet implemented")
+        except Exception as e:
+            logger.error(f"Database authentication failed: {e}")
+            return False
 
     async def disconnect(self):
         """Disconnect from database"""
         try:
             if self.pool:
-                if self.engine == DatabaseEngine.POSTGRESQL:
-                    await self.pool.close()
-                elif self.engine == DatabaseEngine.MYSQL:
-                    self.pool.close()
-                    await self.pool.wait_closed()
+                await self.pool.close()
                 self.pool = None
 
-            if self.connection:
-                await self.connection.close()
-                self.connection = None
-
             await super().disconnect()
 
         except Exception as e:
             logger.error(f"Error disconnecting from database: {e}")
 
+    def _require_pool(self) -> ConnectionPool:
+        if self.pool is None:
+            raise ConnectionError(f"Database connector {self.connector_id} is not connected")
+        return self.pool
+
     async def test_connection(self) -> Dict[str, Any]:
         """
         Test database connection.
@@ -256,38 +184,46 @@ class DatabaseConnector(Connector):
         Returns:
             Test results
         """
-        start_time = asyncio.get_event_loop().time()
-
-        try:
-            # Execute a simple query
-            result = await self.query("SELECT 1 as test")
-            latency = (asyncio.get_event_loop().time() - start_time) * 1000
+        if self.pool is None:
+            return {
+                'success': False,
+                'latency_ms': 0.0,
+                'message': 'Not connected',
+                'details': {'error': 'Not connected'}
+            }
 
+        health = await self.pool.health_check()
+        details = {
+            'engine': self.engine.value,
+            'database': self.config.get('database'),
+            'pool_size': self.pool_config.max_size,
+            'pool': health['pool']
+        }
+        if health['healthy']:
             return {
                 'success': True,
-                'latency_ms': round(latency, 2),
+                'latency_ms': health['latency_ms'],
                 'message': 'Connection successful',
-                'details': {
-                    'engine': self.engine.value,
-                    'database': self.config.get('database'),
-                    'pool_size': self.config.get('pool_size')
-                }
+                'details': details
             }
+        return {
+            'success': False,
+            'latency_ms': health['latency_ms'],
+            'message': health['error'],
+            'details': {**details, 'error': health['error']}
+        }
 
-        except Exception as e:
-            latency = (asyncio.get_event_loop().time() - start_time) * 1000
-            return {
-                'success': False,
-                'latency_ms': round(latency, 2),
-                'message': str(e),
-                'details': {'error': str(e)}
-            }
+    def get_health(self) -> Dict[str, Any]:
+        """Get connector health information, including pool statistics"""
+        health = super().get_health()
+        health['pool'] = self.pool.get_stats() if self.pool else None
+        return health
 
     # ========================================================================
     # QUERY OPERATIONS
     # ========================================================================
 
-    async def query(self, query: str, params: Optional[Dict] = None) -> List[Dict]:
+    async def query(self, query: str, params: Params = None) -> List[Dict]:
         """
         Execute a SELECT query.
 
@@ -298,48 +234,50 @@ class DatabaseConnector(Connector):
         Returns:
             List of result rows as dictionaries
         """
+        pool = self._require_pool()
+
         async def _execute():
-            if self.engine == DatabaseEngine.POSTGRESQL:
-                return await self._query_postgresql(query, params)
-            elif self.engine == DatabaseEngine.MYSQL:
-                return await self._query_mysql(query, params)
-            elif self.engine == DatabaseEngine.SQLITE:
-                return await self._query_sqlite(query, params)
-            else:
-                raise NotImplementedError(f"Query not implemented for {self.engine}")
+            return await pool.fetch(query, params)
 
         return await self.execute_with_rate_limit(_execute)
 
-    async def _query_postgresql(self, query: str, params: Optional[Dict]) -> List[Dict]:
-        """Execute PostgreSQL query"""
-        async with self.pool.acquire() as conn:
-            if params:
-                # Convert dict params to positional
-                param_list = [params.get(k) for k in sorted(params.keys())]
-                rows = await conn.fetch(query, *param_list)
-            else:
-                rows = await conn.fetch(query)
-
-            return [dict(row) for row in rows]
-
-    async def _query_mysql(self, query: str, params: Optional[Dict]) -> List[Dict]:
-        """Execute MySQL query"""
-        async with self.pool.acquire() as conn:
-            async with conn.cursor(aiomysql.DictCursor) as cursor:
-                await cursor.execute(query, params or ())
-                rows = await cursor.fetchall()
-                return list(rows)
-
-    async def _query_sqlite(self, query: str, params: Optional[Dict]) -> List[Dict]:
-        """Execute SQLite query"""
-        self.connection.row_factory = aiosqlite.Row
-        async with self.connection.execute(query, params or ()) as cursor:
-            rows = await cursor.fetchall()
-            return [dict(row) for row in rows]
-
-    async def execute(self, query: str, params: Optional[Dict] = None) -> int:
+    async def stream(
+        self,
+        query: str,
+        params: Params = None,
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Execute a SELECT query and yield rows in batches.
+
+        Use instead of query() for large result sets: at most batch_size
+        rows are in memory at once. The query is not retried, since rows
+        may already have been consumed.
+
+        Args:
+            query: SQL query string
+            params: Query parameters (for parameter binding)
+            batch_size: Rows per batch (default: stream_batch_size config)
+
+        Yields:
+            Lists of result rows as dictionaries
         """
-        Execute a non-SELECT query (INSERT, UPDATE, DELETE).
+        pool = self._require_pool()
+        await self.rate_limiter.wait(timeout=30)
+
+        start_time = asyncio.get_running_loop().time()
+        try:
+            async with aclosing(pool.stream(query, params, batch_size)) as batches:
+                async for batch in batches:
+                    yield batch
+        except Exception as e:
+            self.metrics.record_request(False, asyncio.get_running_loop().time() - start_time, str(e))
+            raise
+        self.metrics.record_request(True, asyncio.get_running_loop().time() - start_time)
+
+    async def execute(self, query: str, params: Params = None) -> int:
+        """
+        Execute an INSERT/UPDATE/DELETE query.
 
         Args:
             query: SQL query string
@@ -348,26 +286,10 @@ class DatabaseConnector(Connector):
         Returns:
             Number of affected rows
         """
+        pool = self._require_pool()
+
         async def _execute():
-            if self.engine == DatabaseEngine.POSTGRESQL:
-                async with self.pool.acquire() as conn:
-                    result = await conn.execute(query, *(params or ()))
-                    return int(result.split()[-1])  # Extract row count
-
-            elif self.engine == DatabaseEngine.MYSQL:
-                async with self.pool.acquire() as conn:
-                    async with conn.cursor() as cursor:
-                        await cursor.execute(query, params or ())
-                        await conn.commit()
-                        return cursor.rowcount
-
-            elif self.engine == DatabaseEngine.SQLITE:
-                await self.connection.execute(query, params or ())
-                await self.connection.commit()
-                return self.connection.total_changes
-
-            else:
-                raise NotImplementedError(f"Execute not implemented for {self.engine}")
+            return await pool.execute(query, params)
 
         return await self.execute_with_rate_limit(_execute)
 
@@ -0,0 +1,807 @@
+"""
+Connection Pools for the Database Connector
+
+DatabaseConnector used to hold a single connection for SQLite, so concurrent
+tool calls queued on it, and every query materialized its full result set.
+This module puts one pool abstraction in front of each engine:
+
+- Min/max pool sizes, acquire timeouts and idle-connection pruning
+- A prepared-statement cache that translates the connector's placeholder
+  styles ($1 / :name) to each driver once per distinct query, on top of
+  the drivers' own per-connection statement caches
+- Async row streaming in bounded batches (server-side cursors where the
+  engine has them)
+- Health checks: idle connections are pinged before reuse and
+  health_check() reports latency and pool state
+
+PostgreSQL and MySQL wrap the native asyncpg/aiomysql pools; SQLite has no
+driver-level pool, so SQLitePool manages its own aiosqlite connections.
+
+Usage:
+    pool = create_pool(DatabaseEngine.SQLITE, {'database': 'hr.db'}, PoolConfig(max_size=4))
+    await pool.open()
+
+    rows = await pool.fetch("SELECT * FROM employees WHERE dept = :dept", {'dept': 'HR'})
+    async for batch in pool.stream("SELECT * FROM payroll", batch_size=5000):
+        process(batch)
+
+    await pool.close()
+
+Author: AI Agent System
+Created: Phase 3.2 - Integration Framework
+"""
+
+import asyncio
+import re
+import time
+from abc import ABC, abstractmethod
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager
+from dataclasses import asdict, dataclass
+from typing import Any, AsyncIterator, Deque, Dict, List, Mapping, Optional, Sequence, Tuple, Union
+import logging
+
+try:
+    import asyncpg  # PostgreSQL
+    HAS_ASYNCPG = True
+except ImportError:
+    HAS_ASYNCPG = False
+
+try:
+    import aiomysql  # MySQL
+    HAS_AIOMYSQL = True
+except ImportError:
+    HAS_AIOMYSQL = False
+
+try:
+    import aiosqlite  # SQLite
+    HAS_AIOSQLITE = True
+except ImportError:
+    HAS_AIOSQLITE = False
+
+logger = logging.getLogger(__name__)
+
+Params = Optional[Union[Mapping[str, Any], Sequence[Any]]]
+
+
+@asynccontextmanager
+async def aclosing(agen: AsyncIterator) -> AsyncIterator:
+    """Close an async generator on exit (contextlib.aclosing needs Python 3.10)"""
+    try:
+        yield agen
+    finally:
+        await agen.aclose()
+
+
+# ============================================================================
+# CONFIGURATION
+# ============================================================================
+
+@dataclass
+class PoolConfig:
+    """Connection pool configuration"""
+    min_size: int = 1
+    max_size: int = 10
+    acquire_timeout: float = 30.0
+    max_idle_time: float = 300.0  # Idle connections above min_size are closed after this
+    health_check_interval: float = 30.0  # Idle connections older than this are pinged before reuse
+    statement_cache_size: int = 256
+    stream_batch_size: int = 1000
+
+    @classmethod
+    def from_config(cls, config: Dict[str, Any]) -> "PoolConfig":
+        """Build from connector config keys (pool_size, pool_min_size, ...)"""
+        defaults = cls()
+        max_size = int(config.get('pool_size', defaults.max_size))
+        return cls(
+            min_size=min(int(config.get('pool_min_size', defaults.min_size)), max_size),
+            max_size=max_size,
+            acquire_timeout=float(config.get('pool_timeout', defaults.acquire_timeout)),
+            max_idle_time=float(config.get('pool_max_idle_time', defaults.max_idle_time)),
+            health_check_interval=float(
+                config.get('health_check_interval', defaults.health_check_interval)
+            ),
+            statement_cache_size=int(
+                config.get('statement_cache_size', defaults.statement_cache_size)
+            ),
+            stream_batch_size=int(config.get('stream_batch_size', defaults.stream_batch_size)),
+        )
+
+
+@dataclass
+class PoolStats:
+    """Pool counters"""
+    acquires: int = 0
+    waits: int = 0  # Acquires that found no free connection
+    timeouts: int = 0
+    connections_opened: int = 0
+    connections_closed: int = 0
+    health_checks: int = 0
+    health_check_failures: int = 0
+    rows_streamed: int = 0
+
+
+class PoolTimeoutError(TimeoutError):
+    """No connection became available within acquire_timeout"""
+
+
+# ============================================================================
+# PREPARED STATEMENTS
+# ============================================================================
+
+# Placeholders are only recognized outside string literals, quoted
+# identifiers and comments; '::' is a PostgreSQL cast, not a named parameter.
+_SQL_TOKEN = re.compile(
+    r"""
+      (?P<skip>'(?:[^']|'')*' | "(?:[^"]|"")*" | --[^\n]* | /\*.*?\*/ | ::)
+    | \$(?P<number>\d+)
+    | :(?P<name>[A-Za-z_]\w*)
+    | (?P<percent>%)
+    """,
+    re.VERBOSE | re.DOTALL,
+)
+
+
+@dataclass(frozen=True)
+class PreparedStatement:
+    """
+    A query rewritten for one driver's parameter style.
+
+    order lists, per driver placeholder, which parameter it binds: an int
+    is a 0-based position ($1 -> 0), a str is a name. It is None when the
+    query has no $n/:name placeholders; the query and parameters are then
+    handed to the driver unchanged, so native placeholders (?, %s) work.
+    """
+    sql: str
+    order: Optional[Tuple[Union[int, str], ...]]
+
+    def bind(self, params: Params) -> Params:
+        """
+        Turn connector parameters into the driver's arguments.
+
+        Args:
+            params: A mapping or sequence. With $n placeholders a mapping
+                binds by insertion order ($1 is its first value).
+
+        Returns:
+            Positional arguments for the driver, or params unchanged
+            (None if empty) for a query without $n/:name placeholders
+        """
+        if self.order is None:
+            return params or None
+        if isinstance(params, Mapping):
+            values = list(params.values())
+            return tuple(params[k] if isinstance(k, str) else values[k] for k in self.order)
+        values = tuple(params or ())
+        if any(isinstance(k, str) for k in self.order):
+            raise TypeError("Named placeholders require a mapping of parameters")
+        return tuple(values[k] for k in self.order)
+
+
+class StatementCache:
+    """
+    LRU cache of PreparedStatement translations, shared by a pool.
+
+    Args:
+        style: Driver placeholder style: 'numeric' ($1, asyncpg),
+            'qmark' (?, sqlite3) or 'format' (%s, aiomysql)
+        max_size: Number of distinct queries kept
+    """
+
+    def __init__(self, style: str, max_size: int = 256):
+        if style not in ('numeric', 'qmark', 'format'):
+            raise ValueError(f"Unknown parameter style: {style}")
+        self.style = style
+        self.max_size = max_size
+        self._statements: "OrderedDict[str, PreparedStatement]" = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def prepare(self, query: str) -> PreparedStatement:
+        """Get the translated statement for a query"""
+        statement = self._statements.get(query)
+        if statement is not None:
+            self._statements.move_to_end(query)
+            self.hits += 1
+            return statement
+
+        self.misses += 1
+        statement = self._translate(query)
+        if self.max_size > 0:
+            self._statements[query] = statement
+            if len(self._statements) > self.max_size:
+                self._statements.popitem(last=False)
+        return statement
+
+    def _translate(self, query: str) -> PreparedStatement:
+        order: List[Union[int, str]] = []
+        names: Dict[str, int] = {}
+        numbered = False
+        escape_percent = self.style == 'format'
+
+        def replace(match: "re.Match") -> str:
+            nonlocal numbered
+            if match.group('skip') is not None:
+                text = match.group('skip')
+                return text.replace('%', '%%') if escape_percent else text
+            if match.group('percent') is not None:
+                return '%%' if escape_percent else '%'
+
+            number = match.group('number')
+            if number is not None:
+                if names:
+                    raise ValueError("Cannot mix $n and :name placeholders")
+                numbered = True
+                index = int(number) - 1
+                if index < 0:
+                    raise ValueError("Placeholders are numbered from $1")
+                if self.style == 'numeric':
+                    order.extend(range(len(order), index + 1))
+                    return match.group(0)
+                order.append(index)
+                return '?' if self.style == 'qmark' else '%s'
+
+            name = match.group('name')
+            if numbered:
+                raise ValueError("Cannot mix $n and :name placeholders")
+            if self.style == 'numeric':
+                # PostgreSQL can reference one argument several times
+                if name not in names:
+                    names[name] = len(order)
+                    order.append(name)
+                return f'${names[name] + 1}'
+            names.setdefault(name, len(names))
+            order.append(name)
+            return '?' if self.style == 'qmark' else '%s'
+
+        sql = _SQL_TOKEN.sub(replace, query)
+        if not order:
+            return PreparedStatement(sql=query, order=None)
+        return PreparedStatement(sql=sql, order=tuple(order))
+
+    def get_stats(self) -> Dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            'size': len(self._statements),
+            'hits': self.hits,
+            'misses': self.misses,
+            'hit_rate': round(self.hits / total, 3) if total else 0.0,
+        }
+
+
+# ============================================================================
+# POOL INTERFACE
+# ============================================================================
+
+class ConnectionPool(ABC):
+    """
+    Engine-independent connection pool.
+
+    Subclasses provide connection handling and the per-engine fetch,
+    execute and stream primitives; parameter translation, statistics and
+    health checks live here.
+    """
+
+    param_style = 'numeric'
+
+    def __init__(self, config: Dict[str, Any], pool_config: Optional[PoolConfig] = None):
+        self.config = config
+        self.pool_config = pool_config or PoolConfig.from_config(config)
+        self.statements = StatementCache(self.param_style, self.pool_config.statement_cache_size)
+        self.stats = PoolStats()
+        self.closed = True
+
+    @abstractmethod
+    async def open(self):
+        """Open min_size connections"""
+        pass
+
+    @abstractmethod
+    async def close(self):
+        """Close all connections"""
+        pass
+
+    @abstractmethod
+    def acquire(self):
+        """Async context manager yielding a connection"""
+        pass
+
+    @abstractmethod
+    def size(self) -> Tuple[int, int]:
+        """(open connections, idle connections)"""
+        pass
+
+    @abstractmethod
+    async def _fetch(self, conn, sql: str, args: Params) -> List[Dict]:
+        pass
+
+    @abstractmethod
+    async def _execute(self, conn, sql: str, args: Params) -> int:
+        pass
+
+    @abstractmethod
+    def _stream(self, conn, sql: str, args: Params, batch_size: int) -> AsyncIterator[List[Dict]]:
+        pass
+
+    @abstractmethod
+    async def _ping(self, conn):
+        pass
+
+    # ------------------------------------------------------------------------
+    # Query API
+    # ------------------------------------------------------------------------
+
+    def _prepare(self, query: str, params: Params) -> Tuple[str, Params]:
+        statement = self.statements.prepare(query)
+        return statement.sql, statement.bind(params)
+
+    async def fetch(self, query: str, params: Params = None) -> List[Dict]:
+        """Run a query and return all rows as dictionaries"""
+        sql, args = self._prepare(query, params)
+        async with self.acquire() as conn:
+            return await self._fetch(conn, sql, args)
+
+    async def execute(self, query: str, params: Params = None) -> int:
+        """Run a statement and return the number of affected rows"""
+        sql, args = self._prepare(query, params)
+        async with self.acquire() as conn:
+            return await self._execute(conn, sql, args)
+
+    async def stream(
+        self,
+        query: str,
+        params: Params = None,
+        batch_size: Optional[int] = None
+    ) -> AsyncIterator[List[Dict]]:
+        """
+        Run a query and yield rows in batches.
+
+        At most batch_size rows are held in memory at a time. The connection
+        stays checked out until the iterator is exhausted or closed, so
+        consumers that stop early should close it (e.g. with
+        db_pool.aclosing).
+
+        Args:
+            query: SQL query string
+            params: Query parameters
+            batch_size: Rows per batch (default: pool_config.stream_batch_size)
+
+        Yields:
+            Lists of result rows as dictionaries
+        """
+        batch_size = batch_size or self.pool_config.stream_batch_size
+        if batch_size < 1:
+            raise ValueError("batch_size must be positive")
+
+        sql, args = self._prepare(query, params)
+        async with self.acquire() as conn:
+            async with aclosing(self._stream(conn, sql, args, batch_size)) as batches:
+                async for batch in batches:
+                    self.stats.rows_streamed += len(batch)
+                    yield batch
+
+    # ------------------------------------------------------------------------
+    # Health and statistics
+    # ------------------------------------------------------------------------
+
+    async def health_check(self) -> Dict[str, Any]:
+        """
+        Check out a connection and ping it.
+
+        Returns:
+            {'healthy': bool, 'latency_ms': float, 'error': str|None, 'pool': stats}
+        """
+        start = time.monotonic()
+        error = None
+        self.stats.health_checks += 1
+        try:
+            async with self.acquire() as conn:
+                await self._ping(conn)
+        except Exception as e:
+            self.stats.health_check_failures += 1
+            error = str(e)
+
+        return {
+            'healthy': error is None,
+            'latency_ms': round((time.monotonic() - start) * 1000, 2),
+            'error': error,
+            'pool': self.get_stats(),
+        }
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get pool and statement cache statistics"""
+        open_count, idle = self.size()
+        return {
+            **asdict(self.stats),
+            'min_size': self.pool_config.min_size,
+            'max_size': self.pool_config.max_size,
+            'open': open_count,
+            'idle': idle,
+            'in_use': open_count - idle,
+            'statements': self.statements.get_stats(),
+        }
+
+
+# ============================================================================
+# SQLITE
+# ============================================================================
+
+class SQLitePool(ConnectionPool):
+    """
+    Pool of aiosqlite connections.
+
+    Connections run in autocommit mode (explicit BEGIN for transactions)
+    and file databases use WAL so readers don't block on a writer. Each
+    connection keeps sqlite3's own cache of compiled statements.
+
+    A ':memory:' database exists per connection, so it is limited to a
+    single pooled connection.
+    """
+
+    param_style = 'qmark'
+
+    def __init__(self, config: Dict[str, Any], pool_config: Optional[PoolConfig] = None):
+        if not HAS_AIOSQLITE:
+            raise ImportError("aiosqlite not installed. Install with: pip install aiosqlite")
+        super().__init__(config, pool_config)
+
+        self.database = str(config['database'])
+        if self.database == ':memory:':
+            self.pool_config.min_size = self.pool_config.max_size = 1
+        self.journal_mode = config.get('sqlite_journal_mode', 'wal')
+        self.busy_timeout_ms = int(config.get('sqlite_busy_timeout_ms', 5000))
+
+        self._idle: Deque[Tuple[Any, float]] = deque()  # (connection, last used)
+        self._open_count = 0
+        self._slots: Optional[asyncio.Semaphore] = None
+
+    def size(self) -> Tuple[int, int]:
+        return self._open_count, len(self._idle)
+
+    async def open(self):
+        self._slots = asyncio.Semaphore(self.pool_config.max_size)
+        self.closed = False
+        for _ in range(self.pool_config.min_size):
+            self._idle.append((await self._connect(), time.monotonic()))
+
+    async def close(self):
+        self.closed = True
+        while self._idle:
+            conn, _ = self._idle.popleft()
+            await self._disconnect(conn)
+
+    async def _connect(self):
+        conn = await aiosqlite.connect(
+            self.database,
+            isolation_level=None,
+            cached_statements=self.pool_config.statement_cache_size,
+        )
+        try:
+            pragmas = [f'PRAGMA busy_timeout = {self.busy_timeout_ms}']
+            if self.journal_mode and self.database != ':memory:':
+                pragmas.append(f'PRAGMA journal_mode = {self.journal_mode}')
+            for pragma in pragmas:
+                # Close each cursor so no statement keeps holding a lock
+                async with conn.execute(pragma) as cursor:
+                    await cursor.fetchall()
+        except BaseException:
+            await conn.close()
+            raise
+        self._open_count += 1
+        self.stats.connections_opened += 1
+        return conn
+
+    async def _disconnect(self, conn):
+        self._open_count -= 1
+        self.stats.connections_closed += 1
+        try:
+            await conn.close()
+        except Exception as e:
+            logger.debug(f"Error closing SQLite connection: {e}")
+
+    async def _checkout(self):
+        """Reuse the most recently used idle connection, or open one"""
+        now = time.monotonic()
+        while self._idle:
+            conn, last_used = self._idle.pop()
+            if now - last_used < self.pool_config.health_check_interval:
+                return conn
+            try:
+                await self._ping(conn)
+                return conn
+            except Exception as e:
+                self.stats.health_check_failures += 1
+                logger.warning(f"Discarding unhealthy SQLite connection: {e}")
+                await self._disconnect(conn)
+        return await self._connect()
+
+    async def _checkin(self, conn):
+        """Return a connection, rolling back anything left open"""
+        if self.closed:
+            await self._disconnect(conn)
+            return
+        if conn.in_transaction:
+            try:
+                await conn.rollback()
+            except Exception as e:
+                logger.warning(f"Discarding SQLite connection after failed rollback: {e}")
+                await self._disconnect(conn)
+                return
+
+        now = time.monotonic()
+        self._idle.append((conn, now))
+
+        # The least recently used connections sit at the left
+        while (self._open_count > self.pool_config.min_size and self._idle
+               and now - self._idle[0][1] > self.pool_config.max_idle_time):
+            stale, _ = self._idle.popleft()
+            await self._disconnect(stale)
+
+    @asynccontextmanager
+    async def acquire(self):
+        if self.closed:
+            raise ConnectionError("Connection pool is closed")
+
+        self.stats.acquires += 1
+        if self._slots.locked():
+            self.stats.waits += 1
+        try:
+            await asyncio.wait_for(self._slots.acquire(), self.pool_config.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.stats.timeouts += 1
+            raise PoolTimeoutError(
+                f"No SQLite connection available within {self.pool_config.acquire_timeout}s"
+            ) from None
+
+        try:
+            conn = await self._checkout()
+            try:
+                yield conn
+            finally:
+                await self._checkin(conn)
+        finally:
+            self._slots.release()
+
+    async def _fetch(self, conn, sql: str, args: Params) -> List[Dict]:
+        async with conn.execute(sql, args or ()) as cursor:
+            rows = await cursor.fetchall()
+            if cursor.description is None:
+                return []
+            columns = [d[0] for d in cursor.description]
+            return [dict(zip(columns, row)) for row in rows]
+
+    async def _execute(self, conn, sql: str, args: Params) -> int:
+        async with conn.execute(sql, args or ()) as cursor:
+            return max(cursor.rowcount, 0)
+
+    async def _stream(self, conn, sql: str, args: Params, batch_size: int) -> AsyncIterator[List[Dict]]:
+        async with conn.execute(sql, args or ()) as cursor:
+            if cursor.description is None:
+                return
+            columns = [d[0] for d in cursor.description]
+            while True:
+                rows = await cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield [dict(zip(columns, row)) for row in rows]
+
+    async def _ping(self, conn):
+        async with conn.execute('SELECT 1') as cursor:
+            await cursor.fetchone()
+
+
+# ============================================================================
+# POSTGRESQL
+# ============================================================================
+
+def _positional(args: Params) -> Tuple:
+    """asyncpg only takes positional arguments"""
+    if isinstance(args, Mapping):
+        return tuple(args.values())
+    return tuple(args or ())
+
+
+class PostgreSQLPool(ConnectionPool):
+    """
+    asyncpg pool. asyncpg prepares and caches statements per connection
+    (statement_cache_size) and streams through server-side cursors.
+    """
+
+    param_style = 'numeric'
+
+    def __init__(self, config: Dict[str, Any], pool_config: Optional[PoolConfig] = None):
+        if not HAS_ASYNCPG:
+            raise ImportError("asyncpg not installed. Install with: pip install asyncpg")
+        super().__init__(config, pool_config)
+        self._pool = None
+
+    def size(self) -> Tuple[int, int]:
+        if self._pool is None:
+            return 0, 0
+        return self._pool.get_size(), self._pool.get_idle_size()
+
+    async def open(self):
+        self._pool = await asyncpg.create_pool(
+            host=self.config['host'],
+            port=self.config.get('port', 5432),
+            database=self.config['database'],
+            user=self.config['username'],
+            password=self.config['password'],
+            min_size=self.pool_config.min_size,
+            max_size=self.pool_config.max_size,
+            statement_cache_size=self.pool_config.statement_cache_size,
+            max_inactive_connection_lifetime=self.pool_config.max_idle_time,
+        )
+        self.stats.connections_opened += self.pool_config.min_size
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+        if self._pool is not None:
+            self.stats.connections_closed += self._pool.get_size()
+            await self._pool.close()
+            self._pool = None
+
+    @asynccontextmanager
+    async def acquire(self):
+        if self._pool is None:
+            raise ConnectionError("Connection pool is closed")
+
+        self.stats.acquires += 1
+        if self._pool.get_idle_size() == 0:
+            self.stats.waits += 1
+        try:
+            conn = await self._pool.acquire(timeout=self.pool_config.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.stats.timeouts += 1
+            raise PoolTimeoutError(
+                f"No PostgreSQL connection available within {self.pool_config.acquire_timeout}s"
+            ) from None
+        try:
+            yield conn
+        finally:
+            await self._pool.release(conn)
+
+    async def _fetch(self, conn, sql: str, args: Params) -> List[Dict]:
+        return [dict(row) for row in await conn.fetch(sql, *_positional(args))]
+
+    async def _execute(self, conn, sql: str, args: Params) -> int:
+        status = await conn.execute(sql, *_positional(args))
+        count = status.split()[-1] if status else ''
+        return int(count) if count.isdigit() else 0
+
+    async def _stream(self, conn, sql: str, args: Params, batch_size: int) -> AsyncIterator[List[Dict]]:
+        # Server-side cursors only exist inside a transaction
+        async with conn.transaction():
+            cursor = await conn.cursor(sql, *_positional(args))
+            while True:
+                rows = await cursor.fetch(batch_size)
+                if not rows:
+                    break
+                yield [dict(row) for row in rows]
+
+    async def _ping(self, conn):
+        await conn.fetchval('SELECT 1')
+
+
+# ============================================================================
+# MYSQL
+# ============================================================================
+
+class MySQLPool(ConnectionPool):
+    """
+    aiomysql pool in autocommit mode. Streaming uses an unbuffered
+    server-side cursor so rows are read from the socket batch by batch.
+    """
+
+    param_style = 'format'
+
+    def __init__(self, config: Dict[str, Any], pool_config: Optional[PoolConfig] = None):
+        if not HAS_AIOMYSQL:
+            raise ImportError("aiomysql not installed. Install with: pip install aiomysql")
+        super().__init__(config, pool_config)
+        self._pool = None
+
+    def size(self) -> Tuple[int, int]:
+        if self._pool is None:
+            return 0, 0
+        return self._pool.size, self._pool.freesize
+
+    async def open(self):
+        self._pool = await aiomysql.create_pool(
+            host=self.config['host'],
+            port=self.config.get('port', 3306),
+            user=self.config['username'],
+            password=self.config['password'],
+            db=self.config['database'],
+            minsize=self.pool_config.min_size,
+            maxsize=self.pool_config.max_size,
+            pool_recycle=int(self.pool_config.max_idle_time),
+            autocommit=True,
+        )
+        self.stats.connections_opened += self.pool_config.min_size
+        self.closed = False
+
+    async def close(self):
+        self.closed = True
+        if self._pool is not None:
+            self.stats.connections_closed += self._pool.size
+            self._pool.close()
+            await self._pool.wait_closed()
+            self._pool = None
+
+    @asynccontextmanager
+    async def acquire(self):
+        if self._pool is None:
+            raise ConnectionError("Connection pool is closed")
+
+        self.stats.acquires += 1
+        if self._pool.freesize == 0:
+            self.stats.waits += 1
+        try:
+            conn = await asyncio.wait_for(self._pool.acquire(), self.pool_config.acquire_timeout)
+        except asyncio.TimeoutError:
+            self.stats.timeouts += 1
+            raise PoolTimeoutError(
+                f"No MySQL connection available within {self.pool_config.acquire_timeout}s"
+            ) from None
+        try:
+            yield conn
+        finally:
+            self._pool.release(conn)
+
+    async def _fetch(self, conn, sql: str, args: Params) -> List[Dict]:
+        async with conn.cursor(aiomysql.DictCursor) as cursor:
+            await cursor.execute(sql, args)
+            return list(await cursor.fetchall())
+
+    async def _execute(self, conn, sql: str, args: Params) -> int:
+        async with conn.cursor() as cursor:
+            await cursor.execute(sql, args)
+            return cursor.rowcount
+
+    async def _stream(self, conn, sql: str, args: Params, batch_size: int) -> AsyncIterator[List[Dict]]:
+        async with conn.cursor(aiomysql.SSDictCursor) as cursor:
+            await cursor.execute(sql, args)
+            while True:
+                rows = await cursor.fetchmany(batch_size)
+                if not rows:
+                    break
+                yield list(rows)
+
+    async def _ping(self, conn):
+        await conn.ping(reconnect=False)
+
+
+# ============================================================================
+# FACTORY
+# ============================================================================
+
+_POOL_CLASSES = {
+    'postgresql': PostgreSQLPool,
+    'mysql': MySQLPool,
+    'sqlite': SQLitePool,
+}
+
+
+def create_pool(
+    engine: Any,
+    config: Dict[str, Any],
+    pool_config: Optional[PoolConfig] = None
+) -> ConnectionPool:
+    """
+    Create an (unopened) pool for an engine.
+
+    Args:
+        engine: DatabaseEngine or its value ('postgresql', 'mysql', 'sqlite')
+        config: Connector configuration
+        pool_config: Pool sizing (default: derived from config)
+
+    Returns:
+        ConnectionPool; call open() before use
+    """
+    name = getattr(engine, 'value', engine)
+    pool_class = _POOL_CLASSES.get(name)
+    if pool_class is None:
+        raise NotImplementedError(f"Connection pooling not implemented for {name}")
+    return pool_class(config, pool_config)
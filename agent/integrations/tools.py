@@ -12,12 +12,13 @@ Created: Phase 3.2 - Integration Framework
 """
 
 import asyncio
-from typing import Dict, List, Optional, Any
+from typing import Any, AsyncIterator, Dict, List, Optional
 import logging
 
 from .base import get_registry, Connector
 from .hris.bamboohr import BambooHRConnector
 from .database import DatabaseConnector
+from .db_pool import aclosing
 
 logger = logging.getLogger(__name__)
 
@@ -29,7 +30,8 @@ logger = logging.getLogger(__name__)
 async def query_database(
     connector_id: str,
     query: str,
-    params: Optional[Dict] = None
+    params: Optional[Dict] = None,
+    max_rows: Optional[int] = None
 ) -> List[Dict]:
     """
     Query a database integration.
@@ -40,6 +42,8 @@ async def query_database(
         connector_id: ID of the database connector
         query: SQL query string
         params: Query parameters for binding
+        max_rows: Stop reading after this many rows. The result is
+            streamed in batches, so only max_rows rows are ever loaded.
 
     Returns:
         List of result rows
@@ -51,6 +55,53 @@ async def query_database(
             {"department": "Engineering"}
         )
     """
+    connector = _get_database_connector(connector_id)
+
+    if max_rows is None:
+        return await connector.query(query, params)
+
+    rows: List[Dict] = []
+    batch_size = min(max_rows, connector.pool_config.stream_batch_size) or 1
+    async with aclosing(connector.stream(query, params, batch_size)) as batches:
+        async for batch in batches:
+            rows.extend(batch[:max_rows - len(rows)])
+            if len(rows) >= max_rows:
+                break
+    return rows
+
+
+async def stream_database(
+    connector_id: str,
+    query: str,
+    params: Optional[Dict] = None,
+    batch_size: Optional[int] = None
+) -> AsyncIterator[List[Dict]]:
+    """
+    Stream a large database query in batches.
+
+    An async iterator rather than a coroutine, so it is not in
+    INTEGRATION_TOOLS; tool callers use query_database(max_rows=...).
+
+    Args:
+        connector_id: ID of the database connector
+        query: SQL query string
+        params: Query parameters for binding
+        batch_size: Rows per batch (default: connector's stream_batch_size)
+
+    Yields:
+        Lists of result rows
+
+    Example:
+        async for batch in stream_database("db_123", "SELECT * FROM payroll"):
+            totals.update(batch)
+    """
+    connector = _get_database_connector(connector_id)
+    async with aclosing(connector.stream(query, params, batch_size)) as batches:
+        async for batch in batches:
+            yield batch
+
+
+def _get_database_connector(connector_id: str) -> DatabaseConnector:
     registry = get_registry()
     connector = registry.get(connector_id)
 
@@ -60,7 +111,7 @@ async def query_database(
     if not isinstance(connector, DatabaseConnector):
         raise TypeError(f"Connector {connector_id} is not a database connector")
 
-    return await connector.query(query, params)
+    return connector
 
 
 async def query_hris(
@@ -269,7 +320,8 @@ INTEGRATION_TOOLS = {
         'parameters': {
             'connector_id': 'ID of database connector',
             'query': 'SQL query string',
-            'params': 'Query parameters (optional)'
+            'params': 'Query parameters (optional)',
+            'max_rows': 'Maximum rows to return (optional, streams the result)'
         }
     },
     'query_hris': {
@@ -10,24 +10,36 @@ This module provides a safe, structured system for horizontal communication betw
 - Supervisor → Employee targeted fix requests
 
 KEY FEATURES:
-- In-memory message queue (no threading/async complexity)
+- In-memory message store with indexed inboxes and conversation threads
+- Bounded retention: the oldest messages spill to a JSON-lines file
+- Awaitable per-agent delivery (receive) and subscription callbacks
 - All messages logged to core_logging for debugging
 - Type-safe message structure
 - Support for request/response patterns
 - Prevents dependency on Prompt Master for micro-interactions
 
 MESSAGE FLOW:
-  Agent A --[send_message]--> Bus --[get_messages_for]--> Agent B
+  Agent A --[send_message]--> Bus --[get_messages_for / receive]--> Agent B
   Agent B --[respond_to_message]--> Bus --[get_response]--> Agent A
 """
 
 from __future__ import annotations
 
+import asyncio
+import json
+import os
+import tempfile
+import threading
 import time
 import uuid
+from collections import OrderedDict, deque
 from dataclasses import asdict, dataclass, field
 from enum import Enum
-from typing import Any, Dict, List, Optional
+from pathlib import Path
+from typing import Any, Callable, Deque, Dict, List, Optional
+
+# Messages kept in memory before the oldest are spilled to disk
+DEFAULT_MAX_MESSAGES = 10000
 
 # ══════════════════════════════════════════════════════════════════════
 # Message Types
@@ -120,6 +132,113 @@ class Message:
 # ══════════════════════════════════════════════════════════════════════
 
 
+class _Inbox:
+    """
+    One agent's inbox with secondary indexes.
+
+    Each index is a dict used as an insertion-ordered set of message ids,
+    so filtering reads only the matching ids and removal is O(1).
+    """
+
+    def __init__(self):
+        self.ids: Dict[str, None] = {}
+        self.by_type: Dict[MessageType, Dict[str, None]] = {}
+        self.by_sender: Dict[str, Dict[str, None]] = {}
+        self.unread: Dict[str, None] = {}  # Messages without a response
+
+    def add(self, message: Message):
+        self.ids[message.id] = None
+        self.by_type.setdefault(message.message_type, {})[message.id] = None
+        self.by_sender.setdefault(message.from_agent, {})[message.id] = None
+        if message.response_id is None:
+            self.unread[message.id] = None
+
+    def discard(self, message: Message):
+        self.ids.pop(message.id, None)
+        self.by_type.get(message.message_type, {}).pop(message.id, None)
+        self.by_sender.get(message.from_agent, {}).pop(message.id, None)
+        self.unread.pop(message.id, None)
+
+    def candidates(
+        self,
+        message_type: Optional[MessageType],
+        from_agent: Optional[str],
+        unread_only: bool,
+    ) -> List[Dict[str, None]]:
+        """Index sets matching each given filter (all ids if none given)."""
+        sets = []
+        if message_type:
+            sets.append(self.by_type.get(message_type, {}))
+        if from_agent:
+            sets.append(self.by_sender.get(from_agent, {}))
+        if unread_only:
+            sets.append(self.unread)
+        return sets or [self.ids]
+
+
+class _SpillStore:
+    """
+    Append-only JSON-lines store for messages evicted from memory.
+
+    Each record holds the message plus its thread root (and, for a root,
+    the ids in its thread). Keeps only a message id -> file offset map in
+    memory; an updated record is appended again and its offset moved.
+    Bodies are stored with json.dumps(default=str), so non-JSON values
+    come back as strings.
+    """
+
+    def __init__(self, path: Optional[Path] = None):
+        self.path = path
+        self._file = None
+        self._offsets: Dict[str, int] = {}
+
+    def __contains__(self, message_id: str) -> bool:
+        return message_id in self._offsets
+
+    def __len__(self) -> int:
+        return len(self._offsets)
+
+    def _open(self):
+        if self._file is None:
+            if self.path is None:
+                # Anonymous file, removed by the OS when closed
+                self._file = tempfile.TemporaryFile(mode="w+b")
+            else:
+                self.path.parent.mkdir(parents=True, exist_ok=True)
+                self._file = open(self.path, "a+b")
+        return self._file
+
+    def write(self, message: Message, thread_root: str, thread: Optional[List[str]] = None):
+        record: Dict[str, Any] = {"message": message.to_dict(), "thread_root": thread_root}
+        if thread is not None:
+            record["thread"] = thread
+        self.write_record(message.id, record)
+
+    def write_record(self, message_id: str, record: Dict[str, Any]):
+        handle = self._open()
+        handle.seek(0, os.SEEK_END)
+        self._offsets[message_id] = handle.tell()
+        handle.write(json.dumps(record, default=str).encode("utf-8") + b"\n")
+
+    def read_record(self, message_id: str) -> Optional[Dict[str, Any]]:
+        offset = self._offsets.get(message_id)
+        if offset is None:
+            return None
+        handle = self._open()
+        handle.flush()
+        handle.seek(offset)
+        return json.loads(handle.readline())
+
+    def read(self, message_id: str) -> Optional[Message]:
+        record = self.read_record(message_id)
+        return Message.from_dict(record["message"]) if record else None
+
+    def close(self):
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+
+
 class InterAgentBus:
     """
     Manages message passing between agents.
@@ -129,13 +248,59 @@ class InterAgentBus:
     - Request/response patterns
     - Message filtering by type/agent
     - Message history for debugging
+    - Awaitable per-agent delivery (receive) and subscriptions
+
+    Inboxes are indexed by type, sender and unread status, and replies
+    are indexed by conversation thread, so lookups cost the size of the
+    result rather than the size of the history. At most ``max_messages``
+    are kept in memory; older ones are spilled to disk and still
+    available by id and in conversations. Messages awaiting a response
+    are never spilled.
     """
 
-    def __init__(self):
-        """Initialize the message bus."""
-        self._messages: Dict[str, Message] = {}  # message_id -> Message
-        self._agent_inboxes: Dict[str, List[str]] = {}  # agent -> [message_ids]
+    def __init__(
+        self,
+        max_messages: Optional[int] = None,
+        spill_path: Optional[Path] = None,
+    ):
+        """
+        Initialize the message bus.
+
+        Args:
+            max_messages: Messages kept in memory (default: env
+                          INTER_AGENT_BUS_MAX_MESSAGES or 10000; 0 = unbounded)
+            spill_path: JSON-lines file for evicted messages
+                        (default: anonymous temporary file)
+        """
+        if max_messages is None:
+            max_messages = int(os.getenv("INTER_AGENT_BUS_MAX_MESSAGES", str(DEFAULT_MAX_MESSAGES)))
+        self.max_messages = max_messages
+
+        self._messages: Dict[str, Message] = {}  # message_id -> Message (oldest first)
+        self._agent_inboxes: Dict[str, _Inbox] = {}  # agent -> indexed inbox
         self._message_log_callback: Optional[callable] = None
+        self._spill = _SpillStore(spill_path)
+        self._lock = threading.RLock()
+
+        # In-memory messages that may be spilled, oldest first. Messages
+        # awaiting a response join once they are answered.
+        self._evictable: OrderedDict[str, None] = OrderedDict()
+
+        # Conversation threads for messages held in memory: message_id ->
+        # root id, root id -> [message_ids]. Spilled messages carry this
+        # in their spill record.
+        self._thread_roots: Dict[str, str] = {}
+        self._threads: Dict[str, List[str]] = {}
+
+        # Running totals (include spilled messages)
+        self._total_messages = 0
+        self._type_counts: Dict[str, int] = {}
+        self._pending_responses = 0
+
+        # Push delivery
+        self._subscribers: Dict[str, List[Callable[[Message], Any]]] = {}
+        self._queues: Dict[str, Deque[str]] = {}  # agent -> ids not yet received
+        self._waiters: Dict[str, List[asyncio.Future]] = {}
 
     def set_log_callback(self, callback: callable):
         """
@@ -192,13 +357,29 @@ class InterAgentBus:
             requires_response=requires_response,
         )
 
-        # Store message
-        self._messages[message_id] = message
+        with self._lock:
+            # Store message
+            self._messages[message_id] = message
+
+            # Add to recipient's inbox
+            if to_agent not in self._agent_inboxes:
+                self._agent_inboxes[to_agent] = _Inbox()
+            self._agent_inboxes[to_agent].add(message)
+
+            # Index the conversation thread
+            root_id = (self._thread_root_of(in_reply_to) if in_reply_to else None) or message_id
+            self._thread_roots[message_id] = root_id
+            self._add_to_thread(root_id, message_id)
 
-        # Add to recipient's inbox
-        if to_agent not in self._agent_inboxes:
-            self._agent_inboxes[to_agent] = []
-        self._agent_inboxes[to_agent].append(message_id)
+            self._total_messages += 1
+            self._type_counts[message_type.value] = self._type_counts.get(message_type.value, 0) + 1
+            if requires_response:
+                self._pending_responses += 1
+            else:
+                self._evictable[message_id] = None
+
+            self._queues.setdefault(to_agent, deque(maxlen=self.max_messages or None)).append(message_id)
+            self._enforce_retention()
 
         # Log message if callback set
         if self._message_log_callback:
@@ -207,6 +388,7 @@ class InterAgentBus:
             except Exception:
                 pass  # Best effort logging
 
+        self._deliver(message)
         return message_id
 
     def get_messages_for(
@@ -219,6 +401,8 @@ class InterAgentBus:
         """
         Get messages for an agent.
 
+        Only messages still held in memory are returned (see max_messages).
+
         Args:
             agent: Agent name
             message_type: Filter by message type (if provided)
@@ -228,28 +412,19 @@ class InterAgentBus:
         Returns:
             List of Message objects
         """
-        if agent not in self._agent_inboxes:
-            return []
-
-        message_ids = self._agent_inboxes[agent]
-        messages = []
-
-        for msg_id in message_ids:
-            msg = self._messages.get(msg_id)
-            if msg is None:
-                continue
-
-            # Apply filters
-            if message_type and msg.message_type != message_type:
-                continue
-            if from_agent and msg.from_agent != from_agent:
-                continue
-            if unread_only and msg.response_id is not None:
-                continue
-
-            messages.append(msg)
-
-        return messages
+        with self._lock:
+            inbox = self._agent_inboxes.get(agent)
+            if inbox is None:
+                return []
+
+            # Walk the smallest matching index, check membership in the rest
+            sets = sorted(inbox.candidates(message_type, from_agent, unread_only), key=len)
+            smallest, others = sets[0], sets[1:]
+            return [
+                self._messages[msg_id]
+                for msg_id in smallest
+                if all(msg_id in other for other in others)
+            ]
 
     def respond_to_message(
         self,
@@ -275,7 +450,7 @@ class InterAgentBus:
         Raises:
             ValueError: If original message not found
         """
-        original_msg = self._messages.get(original_message_id)
+        original_msg = self.get_message(original_message_id)
         if original_msg is None:
             raise ValueError(f"Message not found: {original_message_id}")
 
@@ -292,7 +467,17 @@ class InterAgentBus:
         )
 
         # Mark original as responded
-        original_msg.response_id = response_id
+        with self._lock:
+            if original_msg.requires_response and original_msg.response_id is None:
+                self._pending_responses -= 1
+            original_msg.response_id = response_id
+            if original_message_id in self._messages:
+                self._agent_inboxes[original_msg.to_agent].unread.pop(original_message_id, None)
+                self._evictable[original_message_id] = None
+            else:
+                record = self._spill.read_record(original_message_id)
+                record["message"]["response_id"] = response_id
+                self._spill.write_record(original_message_id, record)
 
         return response_id
 
@@ -306,11 +491,149 @@ class InterAgentBus:
         Returns:
             Response Message, or None if not yet responded
         """
-        original_msg = self._messages.get(message_id)
+        original_msg = self.get_message(message_id)
         if original_msg is None or original_msg.response_id is None:
             return None
 
-        return self._messages.get(original_msg.response_id)
+        return self.get_message(original_msg.response_id)
+
+    # ──────────────────────────────────────────────────────────────────
+    # Push Delivery
+    # ──────────────────────────────────────────────────────────────────
+
+    def subscribe(self, agent: str, callback: Callable[[Message], Any]):
+        """
+        Call ``callback`` with every new message for ``agent``.
+
+        Coroutine functions are scheduled on the running event loop (or
+        skipped with no loop running); plain functions run inline on the
+        sending thread.
+
+        Args:
+            agent: Recipient agent name
+            callback: Function(message: Message) -> None, or async equivalent
+        """
+        with self._lock:
+            callbacks = self._subscribers.setdefault(agent, [])
+            if callback not in callbacks:
+                callbacks.append(callback)
+
+    def unsubscribe(self, agent: str, callback: Callable[[Message], Any]):
+        """Stop calling ``callback`` for ``agent``'s messages."""
+        with self._lock:
+            callbacks = self._subscribers.get(agent, [])
+            if callback in callbacks:
+                callbacks.remove(callback)
+
+    async def receive(self, agent: str, timeout: Optional[float] = None) -> Optional[Message]:
+        """
+        Wait for the next message delivered to ``agent``.
+
+        Messages are handed out once each, in send order. Replaces polling
+        get_messages_for() for agents that process their inbox as a stream.
+
+        Args:
+            agent: Recipient agent name
+            timeout: Seconds to wait (None = wait indefinitely)
+
+        Returns:
+            Next Message, or None on timeout
+        """
+        loop = asyncio.get_running_loop()
+        deadline = None if timeout is None else loop.time() + timeout
+        while True:
+            with self._lock:
+                queue = self._queues.get(agent)
+                if queue:
+                    return self.get_message(queue.popleft())
+                waiter = loop.create_future()
+                self._waiters.setdefault(agent, []).append(waiter)
+
+            remaining = None if deadline is None else max(0.0, deadline - loop.time())
+            try:
+                await asyncio.wait_for(waiter, remaining)
+            except asyncio.TimeoutError:
+                return None
+            finally:
+                with self._lock:
+                    waiters = self._waiters.get(agent, [])
+                    if waiter in waiters:
+                        waiters.remove(waiter)
+
+    def _deliver(self, message: Message):
+        """Wake receive() waiters and run subscription callbacks."""
+        with self._lock:
+            waiters = self._waiters.pop(message.to_agent, [])
+            callbacks = list(self._subscribers.get(message.to_agent, ()))
+
+        for waiter in waiters:
+            waiter_loop = waiter.get_loop()
+            if not waiter_loop.is_closed():
+                waiter_loop.call_soon_threadsafe(_wake, waiter)
+
+        for callback in callbacks:
+            try:
+                if asyncio.iscoroutinefunction(callback):
+                    try:
+                        asyncio.get_running_loop().create_task(callback(message))
+                    except RuntimeError:
+                        pass  # No loop to run it on
+                else:
+                    callback(message)
+            except Exception:
+                pass  # Subscribers must not break the sender
+
+    # ──────────────────────────────────────────────────────────────────
+    # Retention
+    # ──────────────────────────────────────────────────────────────────
+
+    def _enforce_retention(self):
+        """Spill the oldest messages beyond max_messages to disk."""
+        if not self.max_messages:
+            return
+
+        if len(self._messages) <= self.max_messages:
+            return
+
+        # Evict down to 90%. Messages awaiting a response are never in
+        # _evictable, so this costs O(1) per spilled message however many
+        # of them are held.
+        target = self.max_messages - self.max_messages // 10
+        while len(self._messages) > target and self._evictable:
+            msg_id, _ = self._evictable.popitem(last=False)
+            message = self._messages.pop(msg_id)
+            root_id = self._thread_roots.pop(msg_id)
+            # A root takes its thread index to disk with it
+            thread = self._threads.pop(msg_id) if root_id == msg_id else None
+            self._spill.write(message, root_id, thread)
+            self._agent_inboxes[message.to_agent].discard(message)
+
+    def _thread_root_of(self, message_id: str) -> Optional[str]:
+        """Thread root of a message held in memory or spilled."""
+        root_id = self._thread_roots.get(message_id)
+        if root_id is None:
+            record = self._spill.read_record(message_id)
+            if record is not None:
+                root_id = record["thread_root"]
+        return root_id
+
+    def _add_to_thread(self, root_id: str, message_id: str):
+        """Append a message to its thread, on disk if the root was spilled."""
+        thread = self._threads.get(root_id)
+        if thread is not None:
+            thread.append(message_id)
+            return
+
+        record = self._spill.read_record(root_id)
+        if record is not None:
+            record.setdefault("thread", [root_id]).append(message_id)
+            self._spill.write_record(root_id, record)
+        else:
+            self._threads[root_id] = [message_id]
+
+    def close(self):
+        """Release the spill file."""
+        self._spill.close()
 
     # ──────────────────────────────────────────────────────────────────
     # Query Operations
@@ -326,7 +649,11 @@ class InterAgentBus:
         Returns:
             Message object, or None if not found
         """
-        return self._messages.get(message_id)
+        with self._lock:
+            message = self._messages.get(message_id)
+            if message is None and message_id in self._spill:
+                message = self._spill.read(message_id)
+            return message
 
     def get_conversation(self, message_id: str) -> List[Message]:
         """
@@ -338,31 +665,16 @@ class InterAgentBus:
         Returns:
             List of messages in thread, ordered by timestamp
         """
-        # Find root message
-        current = self._messages.get(message_id)
-        if current is None:
-            return []
-
-        while current.in_reply_to:
-            parent = self._messages.get(current.in_reply_to)
-            if parent is None:
-                break
-            current = parent
-
-        root_id = current.id
-
-        # Collect all messages in thread
-        thread = [current]
-        to_check = [root_id]
-        checked = {root_id}
+        with self._lock:
+            root_id = self._thread_root_of(message_id)
+            if root_id is None:
+                return []
 
-        while to_check:
-            parent_id = to_check.pop(0)
-            for msg in self._messages.values():
-                if msg.in_reply_to == parent_id and msg.id not in checked:
-                    thread.append(msg)
-                    to_check.append(msg.id)
-                    checked.add(msg.id)
+            thread_ids = self._threads.get(root_id)
+            if thread_ids is None:
+                record = self._spill.read_record(root_id)
+                thread_ids = record.get("thread", [root_id]) if record else []
+            thread = [self.get_message(msg_id) for msg_id in thread_ids]
 
         # Sort by timestamp
         thread.sort(key=lambda m: m.timestamp)
@@ -370,12 +682,13 @@ class InterAgentBus:
 
     def get_all_messages(self) -> List[Message]:
         """
-        Get all messages in the bus.
+        Get all messages held in memory.
 
         Returns:
             List of all Message objects
         """
-        return list(self._messages.values())
+        with self._lock:
+            return list(self._messages.values())
 
     def get_pending_requests(self, agent: str) -> List[Message]:
         """
@@ -401,22 +714,15 @@ class InterAgentBus:
         Returns:
             Dict with statistics
         """
-        total_messages = len(self._messages)
-        messages_by_type = {}
-        pending_responses = 0
-
-        for msg in self._messages.values():
-            msg_type = msg.message_type.value
-            messages_by_type[msg_type] = messages_by_type.get(msg_type, 0) + 1
-            if msg.requires_response and msg.response_id is None:
-                pending_responses += 1
-
-        return {
-            "total_messages": total_messages,
-            "messages_by_type": messages_by_type,
-            "pending_responses": pending_responses,
-            "agents_with_messages": len(self._agent_inboxes),
-        }
+        with self._lock:
+            return {
+                "total_messages": self._total_messages,
+                "messages_by_type": dict(self._type_counts),
+                "pending_responses": self._pending_responses,
+                "agents_with_messages": len(self._agent_inboxes),
+                "messages_in_memory": len(self._messages),
+                "messages_spilled": len(self._spill),
+            }
 
     # ──────────────────────────────────────────────────────────────────
     # Helper Methods for Common Patterns
@@ -538,6 +844,11 @@ class InterAgentBus:
         )
 
 
+def _wake(waiter: asyncio.Future):
+    if not waiter.done():
+        waiter.set_result(None)
+
+
 # ══════════════════════════════════════════════════════════════════════
 # Global Bus Instance
 # ══════════════════════════════════════════════════════════════════════
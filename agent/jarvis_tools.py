@@ -6,7 +6,7 @@ Claude Code-like capabilities for JARVIS:
 - Edit: Make targeted string replacements in files
 - Write: Create new files
 - Bash: Run shell commands
-- Grep: Search for patterns in code
+- Grep: Search for patterns in code (trigram-indexed, see workspace_index)
 - Glob: Find files by pattern
 - Todo: Track tasks visibly
 - WebSearch/WebFetch: Look up documentation
@@ -38,6 +38,8 @@ try:
 except ImportError:
     BS4_AVAILABLE = False
 
+from workspace_index import index_for, notify_changed
+
 
 class ToolType(Enum):
     """Available tool types"""
@@ -281,6 +283,7 @@ class JarvisTools:
 
             # Write back
             path.write_text(new_content, encoding='utf-8')
+            notify_changed(path)
 
             return ToolResult(
                 success=True,
@@ -346,6 +349,7 @@ class JarvisTools:
 
             # Write file
             path.write_text(content, encoding='utf-8')
+            notify_changed(path)
 
             return ToolResult(
                 success=True,
@@ -523,52 +527,32 @@ class JarvisTools:
                     execution_time=time.time() - start_time
                 )
 
-            results = []
-            files_searched = 0
-
-            # Search files
             if search_path.is_file():
-                files_to_search = [search_path]
+                results, files_searched = await asyncio.to_thread(
+                    self._grep_file, search_path, regex, context_lines, max_results
+                )
             else:
-                files_to_search = list(search_path.rglob(file_pattern))
-
-            for file_path in files_to_search:
-                if not file_path.is_file():
-                    continue
-                if file_path.suffix not in self.allowed_extensions:
-                    continue
-
-                files_searched += 1
-
-                try:
-                    content = file_path.read_text(encoding='utf-8', errors='ignore')
-                    lines = content.splitlines()
-
-                    for i, line in enumerate(lines):
-                        if regex.search(line):
-                            # Get context
-                            start = max(0, i - context_lines)
-                            end = min(len(lines), i + context_lines + 1)
-
-                            match_info = {
-                                "file": str(file_path.relative_to(self.working_dir) if file_path.is_relative_to(self.working_dir) else file_path),
-                                "line": i + 1,
-                                "content": line.strip(),
-                            }
-
-                            if context_lines > 0:
-                                match_info["context"] = lines[start:end]
-
-                            results.append(match_info)
-
-                            if len(results) >= max_results:
-                                break
-
-                    if len(results) >= max_results:
-                        break
-
-                except Exception:
-                    continue
+                # Indexed search in the worker pool; only files containing the
+                # pattern's literal text are read
+                index = index_for(search_path, self.working_dir)
+                matches, files_searched = await index.grep_async(
+                    regex,
+                    base=search_path,
+                    file_pattern=file_pattern,
+                    path_filter=lambda rel: Path(rel).suffix in self.allowed_extensions,
+                    context_lines=context_lines,
+                    max_results=max_results,
+                )
+                results = []
+                for m in matches:
+                    match_info = {
+                        "file": self._display_path(index.root / m["path"]),
+                        "line": m["line"],
+                        "content": m["content"].strip(),
+                    }
+                    if context_lines > 0:
+                        match_info["context"] = m["context"]
+                    results.append(match_info)
 
             # Format output
             output_lines = []
@@ -597,6 +581,40 @@ class JarvisTools:
                 execution_time=time.time() - start_time
             )
 
+    def _grep_file(
+        self,
+        file_path: Path,
+        regex: "re.Pattern",
+        context_lines: int,
+        max_results: int
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """Search a single file (grep on a file path bypasses the index)"""
+        if file_path.suffix not in self.allowed_extensions:
+            return [], 0
+
+        results = []
+        lines = file_path.read_text(encoding='utf-8', errors='ignore').splitlines()
+        for i, line in enumerate(lines):
+            if regex.search(line):
+                match_info = {
+                    "file": self._display_path(file_path),
+                    "line": i + 1,
+                    "content": line.strip(),
+                }
+                if context_lines > 0:
+                    match_info["context"] = lines[max(0, i - context_lines):i + context_lines + 1]
+                results.append(match_info)
+                if len(results) >= max_results:
+                    break
+        return results, 1
+
+    def _display_path(self, file_path: Path) -> str:
+        """Path relative to working_dir when inside it"""
+        working_dir = self.working_dir.resolve()
+        if file_path.is_relative_to(working_dir):
+            return str(file_path.relative_to(working_dir))
+        return str(file_path)
+
     # ═══════════════════════════════════════════════════════════════════════
     # GLOB TOOL - Find files by pattern
     # ═══════════════════════════════════════════════════════════════════════
@@ -633,31 +651,23 @@ class JarvisTools:
                     execution_time=time.time() - start_time
                 )
 
-            # Find matching files
-            matches = []
-            for file_path in search_path.rglob(pattern):
-                # Skip hidden files unless requested
-                if not include_hidden and any(part.startswith('.') for part in file_path.parts):
-                    continue
-
-                try:
-                    rel_path = file_path.relative_to(self.working_dir) if file_path.is_relative_to(self.working_dir) else file_path
-                    stat = file_path.stat()
-
-                    matches.append({
-                        "path": str(rel_path),
-                        "type": "file" if file_path.is_file() else "directory",
-                        "size": stat.st_size if file_path.is_file() else None,
-                        "modified": stat.st_mtime
-                    })
-
-                    if len(matches) >= max_results:
-                        break
-                except Exception:
-                    continue
+            # Find matching files from the workspace index (no walk or stat)
+            index = index_for(search_path, self.working_dir)
+            entries = await index.glob_async(pattern, base=search_path, include_hidden=include_hidden)
+
+            matches = [
+                {
+                    "path": self._display_path(index.root / entry.path),
+                    "type": "directory" if entry.is_dir else "file",
+                    "size": None if entry.is_dir else entry.size,
+                    "modified": entry.mtime
+                }
+                for entry in entries
+            ]
 
             # Sort by modification time (newest first)
             matches.sort(key=lambda x: x.get("modified", 0), reverse=True)
+            matches = matches[:max_results]
 
             # Format output
             output_lines = []
@@ -107,6 +107,9 @@ PYTHON USAGE
     # Save to file
     await voice.synthesize_to_file("Hello sir", "greeting.mp3")
 
+    # Speak text as it streams in: sentence N plays while N+1 synthesizes
+    await voice.speak_stream(llm_text_deltas)
+
 ================================================================================
 
 TTS Providers:
@@ -131,14 +134,16 @@ import base64
 import hashlib
 import io
 import os
+import re
 import tempfile
 import wave
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass
 from datetime import datetime
 from enum import Enum
 from pathlib import Path
-from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Union
+from typing import Any, AsyncIterable, AsyncIterator, Callable, Dict, List, Optional, Union
 
 try:
     import core_logging
@@ -210,6 +215,10 @@ class VoiceConfig:
     # Caching
     cache_enabled: bool = True
     cache_dir: str = "data/voice_cache"
+    cache_memory_items: int = 64  # Phrases kept in memory (acknowledgements etc.)
+
+    # Streaming: sentences synthesized ahead of the one being played
+    tts_lookahead: int = 1
 
     @classmethod
     def from_env(cls) -> "VoiceConfig":
@@ -800,24 +809,44 @@ class MicrophoneInput:
 class VoiceCache:
     """
     Cache synthesized audio to avoid repeated API calls.
+
+    Short, frequently repeated phrases (acknowledgements, greetings) are
+    also kept in a small in-memory LRU so they play without touching disk.
     """
 
-    def __init__(self, cache_dir: str = "data/voice_cache"):
+    def __init__(self, cache_dir: str = "data/voice_cache", memory_items: int = 64):
         self.cache_dir = Path(cache_dir)
         self.cache_dir.mkdir(parents=True, exist_ok=True)
+        self.memory_items = memory_items
+        self._memory: "OrderedDict[str, bytes]" = OrderedDict()
 
     def _get_cache_key(self, text: str, voice_id: str) -> str:
         """Generate cache key from text and voice"""
-        content = f"{voice_id}:{text}"
+        content = f"{voice_id}:{' '.join(text.split())}"
         return hashlib.sha256(content.encode()).hexdigest()[:16]
 
+    def _remember(self, cache_key: str, audio_bytes: bytes):
+        if self.memory_items <= 0:
+            return
+        self._memory[cache_key] = audio_bytes
+        self._memory.move_to_end(cache_key)
+        while len(self._memory) > self.memory_items:
+            self._memory.popitem(last=False)
+
     def get(self, text: str, voice_id: str) -> Optional[bytes]:
         """Get cached audio if exists"""
         cache_key = self._get_cache_key(text, voice_id)
-        cache_path = self.cache_dir / f"{cache_key}.mp3"
 
+        audio_bytes = self._memory.get(cache_key)
+        if audio_bytes is not None:
+            self._memory.move_to_end(cache_key)
+            return audio_bytes
+
+        cache_path = self.cache_dir / f"{cache_key}.mp3"
         if cache_path.exists():
-            return cache_path.read_bytes()
+            audio_bytes = cache_path.read_bytes()
+            self._remember(cache_key, audio_bytes)
+            return audio_bytes
         return None
 
     def set(self, text: str, voice_id: str, audio_bytes: bytes):
@@ -825,13 +854,206 @@ class VoiceCache:
         cache_key = self._get_cache_key(text, voice_id)
         cache_path = self.cache_dir / f"{cache_key}.mp3"
         cache_path.write_bytes(audio_bytes)
+        self._remember(cache_key, audio_bytes)
 
     def clear(self):
         """Clear all cached audio"""
+        self._memory.clear()
         for file in self.cache_dir.glob("*.mp3"):
             file.unlink()
 
 
+# =============================================================================
+# Sentence Pipelining
+# =============================================================================
+
+# Words ending in "." that don't end a sentence
+_ABBREVIATIONS = {
+    "mr", "mrs", "ms", "dr", "prof", "sr", "jr", "st", "vs", "etc",
+    "e.g", "i.e", "inc", "ltd", "no", "approx", "dept", "fig",
+}
+
+_SENTENCE_END = re.compile(r"[.!?…]+[\"')\]]*(?=\s)|\n\s*\n|\n(?=\s*[-*•\d])")
+
+
+class SentenceSplitter:
+    """
+    Incrementally splits streamed text into speakable sentences.
+
+    Text arrives in arbitrary deltas (LLM tokens); complete sentences are
+    returned as soon as the whitespace after their terminator arrives.
+    Fragments shorter than ``min_chars`` are held back and joined with
+    the following sentence so TTS isn't called for "Yes." on its own,
+    except for the very first sentence, which is released immediately to
+    get audio started.
+
+    Example:
+        splitter = SentenceSplitter()
+        splitter.feed("Good morning, sir. The")     # ["Good morning, sir."]
+        splitter.feed(" weather is fine. ")          # ["The weather is fine."]
+        splitter.flush()                             # None
+    """
+
+    def __init__(self, min_chars: int = 20):
+        self.min_chars = min_chars
+        self._buffer = ""
+        self._held = ""
+        self._emitted = 0
+
+    def feed(self, delta: str) -> List[str]:
+        """Add text; returns sentences completed by it"""
+        self._buffer += delta
+        sentences = []
+        start = 0
+
+        for match in _SENTENCE_END.finditer(self._buffer):
+            candidate = self._buffer[start:match.end()]
+            if self._is_abbreviation(candidate):
+                continue
+            start = match.end()
+            sentence = self._release(candidate)
+            if sentence:
+                sentences.append(sentence)
+
+        self._buffer = self._buffer[start:]
+        return sentences
+
+    def flush(self) -> Optional[str]:
+        """Return whatever remains at end of stream"""
+        text = " ".join(part for part in (self._held, self._buffer.strip()) if part)
+        self._held = ""
+        self._buffer = ""
+        if text:
+            self._emitted += 1
+        return text or None
+
+    def _release(self, candidate: str) -> Optional[str]:
+        text = " ".join(part for part in (self._held, candidate.strip()) if part)
+        if not text:
+            return None
+        if self._emitted and len(text) < self.min_chars:
+            self._held = text
+            return None
+        self._held = ""
+        self._emitted += 1
+        return text
+
+    @staticmethod
+    def _is_abbreviation(candidate: str) -> bool:
+        stripped = candidate.rstrip()
+        if not stripped.endswith("."):
+            return False
+        words = stripped[:-1].split()
+        if not words:
+            return False
+        last = words[-1].lower().lstrip("(\"'")
+        # Abbreviations, initials ("J. Smith") and list numbers ("1. Buy milk")
+        if last in _ABBREVIATIONS or (len(last) == 1 and last.isalpha()):
+            return True
+        return len(words) == 1 and last.isdigit()
+
+
+async def split_sentences(
+    text: Union[str, AsyncIterable[str]],
+    min_chars: int = 20,
+) -> AsyncIterator[str]:
+    """
+    Yield sentences from a complete string or a stream of text deltas.
+
+    Args:
+        text: Full text or async iterable of deltas (e.g. LLM tokens)
+        min_chars: See SentenceSplitter
+
+    Yields:
+        Sentences in order, as soon as each is complete
+    """
+    splitter = SentenceSplitter(min_chars=min_chars)
+
+    if isinstance(text, str):
+        for sentence in splitter.feed(text + " "):
+            yield sentence
+    else:
+        async for delta in text:
+            for sentence in splitter.feed(delta):
+                yield sentence
+
+    tail = splitter.flush()
+    if tail:
+        yield tail
+
+
+@dataclass
+class SpeechChunk:
+    """A piece of synthesized audio for one sentence of a response"""
+    index: int          # Sentence number within the response
+    text: str           # Sentence the audio belongs to
+    audio: bytes        # Audio bytes (MP3)
+    final: bool         # Last chunk of this sentence
+    cached: bool = False
+
+
+_SENTENCE_DONE = object()
+
+
+class _SentenceSynthesis:
+    """Synthesizes one sentence in the background, buffering its chunks"""
+
+    def __init__(self, index: int, text: str, voice: "JarvisVoice"):
+        self.index = index
+        self.text = text
+        self.voice = voice
+        self.chunks: asyncio.Queue = asyncio.Queue()
+        self.cached = False
+        self.task = asyncio.create_task(self._run())
+
+    async def _run(self):
+        voice_id = self.voice._voice_id()
+        try:
+            if self.voice.cache:
+                cached = self.voice.cache.get(self.text, voice_id)
+                if cached:
+                    self.cached = True
+                    await self.chunks.put(cached)
+                    return
+
+            parts = []
+            async for chunk in self.voice.tts_engine.stream_synthesize(self.text):
+                if chunk:
+                    parts.append(chunk)
+                    await self.chunks.put(chunk)
+
+            if self.voice.cache and parts:
+                self.voice.cache.set(self.text, voice_id, b"".join(parts))
+
+        except Exception as e:
+            core_logging.log_event("sentence_synthesis_error", {
+                "index": self.index,
+                "error": str(e)
+            })
+            await self.chunks.put(e)
+
+        finally:
+            await self.chunks.put(_SENTENCE_DONE)
+
+    async def __aiter__(self) -> AsyncIterator[SpeechChunk]:
+        pending = await self.chunks.get()
+        while pending is not _SENTENCE_DONE:
+            if isinstance(pending, Exception):
+                raise pending
+            following = await self.chunks.get()
+            yield SpeechChunk(
+                index=self.index,
+                text=self.text,
+                audio=pending,
+                final=following is _SENTENCE_DONE,
+                cached=self.cached,
+            )
+            pending = following
+
+    def cancel(self):
+        self.task.cancel()
+
+
 # =============================================================================
 # Main JARVIS Voice Class
 # =============================================================================
@@ -873,7 +1095,10 @@ class JarvisVoice:
         self.microphone: Optional[MicrophoneInput] = None
 
         # Voice cache
-        self.cache = VoiceCache(self.config.cache_dir) if self.config.cache_enabled else None
+        self.cache = (
+            VoiceCache(self.config.cache_dir, self.config.cache_memory_items)
+            if self.config.cache_enabled else None
+        )
 
         # State
         self.is_speaking = False
@@ -920,6 +1145,150 @@ class JarvisVoice:
             self.microphone = MicrophoneInput()
         return self.microphone
 
+    def _voice_id(self) -> str:
+        return getattr(self.tts_engine, 'voice_id', 'default')
+
+    async def stream_speech(
+        self,
+        text: Union[str, AsyncIterable[str]],
+        lookahead: Optional[int] = None,
+    ) -> AsyncIterator[SpeechChunk]:
+        """
+        Synthesize a response sentence by sentence, streaming audio chunks.
+
+        Sentences are split off as the text streams in. While the chunks
+        of sentence N are being consumed (played or sent to a client),
+        up to ``lookahead`` following sentences are already synthesizing.
+        Repeated sentences come straight from the voice cache.
+
+        Args:
+            text: Full text or async iterable of text deltas (LLM tokens)
+            lookahead: Sentences synthesized ahead (default: config.tts_lookahead)
+
+        Yields:
+            SpeechChunk objects in sentence order
+        """
+        if not self.tts_engine:
+            core_logging.log_event("tts_unavailable", {})
+            return
+
+        lookahead = self.config.tts_lookahead if lookahead is None else lookahead
+        slots = asyncio.Semaphore(max(0, lookahead) + 1)
+        ready: asyncio.Queue = asyncio.Queue()
+        started: List[_SentenceSynthesis] = []
+
+        async def produce():
+            try:
+                index = 0
+                async for sentence in split_sentences(text):
+                    await slots.acquire()
+                    synthesis = _SentenceSynthesis(index, sentence, self)
+                    started.append(synthesis)
+                    await ready.put(synthesis)
+                    index += 1
+            except Exception as e:
+                await ready.put(e)
+            finally:
+                await ready.put(_SENTENCE_DONE)
+
+        producer = asyncio.create_task(produce())
+        try:
+            while True:
+                synthesis = await ready.get()
+                if synthesis is _SENTENCE_DONE:
+                    break
+                if isinstance(synthesis, Exception):
+                    raise synthesis
+                try:
+                    async for chunk in synthesis:
+                        yield chunk
+                finally:
+                    slots.release()
+        finally:
+            producer.cancel()
+            for synthesis in started:
+                synthesis.cancel()
+
+    async def speak_stream(
+        self,
+        text: Union[str, AsyncIterable[str]],
+        lookahead: Optional[int] = None,
+    ) -> bytes:
+        """
+        Speak text as it streams in, playing each sentence as soon as it
+        is synthesized while the next ones synthesize in the background.
+
+        Args:
+            text: Full text or async iterable of text deltas (LLM tokens)
+            lookahead: Sentences synthesized ahead of playback
+
+        Returns:
+            All audio that was played
+        """
+        self.is_speaking = True
+        played = []
+        sentence = []
+
+        try:
+            async for chunk in self.stream_speech(text, lookahead):
+                sentence.append(chunk.audio)
+                if not chunk.final:
+                    continue
+
+                audio_bytes = b''.join(sentence)
+                sentence = []
+                played.append(audio_bytes)
+                try:
+                    player = self._get_player()
+                    await player.play_audio(audio_bytes, "mp3")
+                except Exception as e:
+                    core_logging.log_event("playback_error", {"error": str(e)})
+
+            return b''.join(played)
+
+        finally:
+            self.is_speaking = False
+
+    async def synthesize(self, text: str) -> bytes:
+        """
+        Synthesize text to a single audio blob.
+
+        Whole-text cache hits return immediately; otherwise sentences are
+        synthesized concurrently (and cached individually) and joined.
+        """
+        voice_id = self._voice_id()
+        if self.cache:
+            cached = self.cache.get(text, voice_id)
+            if cached:
+                return cached
+
+        audio_bytes = b''.join([
+            chunk.audio async for chunk in self.stream_speech(text, lookahead=4)
+        ])
+
+        if self.cache and audio_bytes:
+            self.cache.set(text, voice_id, audio_bytes)
+        return audio_bytes
+
+    async def warm_cache(self, phrases: List[str]):
+        """
+        Pre-synthesize phrases that are spoken often (acknowledgements,
+        greetings) so they play from the in-memory cache.
+        """
+        if not self.cache or not self.tts_engine:
+            return
+
+        voice_id = self._voice_id()
+
+        async def warm(phrase: str):
+            if self.cache.get(phrase, voice_id) is None:
+                try:
+                    self.cache.set(phrase, voice_id, await self.tts_engine.synthesize(phrase))
+                except Exception as e:
+                    core_logging.log_event("voice_cache_warm_error", {"error": str(e)})
+
+        await asyncio.gather(*(warm(phrase) for phrase in phrases))
+
     async def speak(self, text: str, stream: bool = False) -> Optional[bytes]:
         """
         Have JARVIS speak the given text.
@@ -958,13 +1327,11 @@ class JarvisVoice:
                     return cached
 
             if stream:
-                # Stream audio for real-time playback
-                audio_chunks = []
-                async for chunk in self.tts_engine.stream_synthesize(text):
-                    audio_chunks.append(chunk)
-                    # Could play chunks here for real streaming
-
-                audio_bytes = b''.join(audio_chunks)
+                # Play sentence by sentence while the rest synthesizes
+                audio_bytes = await self.speak_stream(text)
+                if self.cache and audio_bytes:
+                    self.cache.set(text, voice_id, audio_bytes)
+                return audio_bytes
             else:
                 # Get full audio
                 audio_bytes = await self.tts_engine.synthesize(text)
@@ -1064,19 +1431,7 @@ class JarvisVoice:
             return None
 
         try:
-            # Check cache
-            voice_id = getattr(self.tts_engine, 'voice_id', 'default')
-
-            if self.cache:
-                cached = self.cache.get(text, voice_id)
-                if cached:
-                    return base64.b64encode(cached).decode('utf-8')
-
-            audio_bytes = await self.tts_engine.synthesize(text)
-
-            # Cache it
-            if self.cache:
-                self.cache.set(text, voice_id, audio_bytes)
+            audio_bytes = await self.synthesize(text)
 
             return base64.b64encode(audio_bytes).decode('utf-8')
 
@@ -1203,5 +1558,9 @@ __all__ = [
     'WhisperSTT',
     'AudioPlayer',
     'MicrophoneInput',
+    'VoiceCache',
+    'SentenceSplitter',
+    'SpeechChunk',
+    'split_sentences',
     'setup_jarvis_voice',
 ]
@@ -382,7 +382,7 @@ class JarvisVoiceChat:
                     self.on_speaking_start()
 
                 self.session.is_speaking = True
-                await self.voice.speak(jarvis_text)
+                await self.voice.speak(jarvis_text, stream=True)
                 self.session.is_speaking = False
 
                 if self.on_speaking_stop:
@@ -484,6 +484,10 @@ class VoiceWebSocketHandler:
     - Client sends: {"type": "audio", "data": "<base64 audio>"}
     - Server sends: {"type": "transcription", "text": "..."}
     - Server sends: {"type": "response", "text": "...", "audio": "<base64>"}
+
+    Text messages may set "stream_audio": true to receive the response
+    text first and then one {"type": "audio", "index": n, "audio": ...}
+    message per sentence, so playback starts after the first sentence.
     """
 
     def __init__(self, voice_chat: JarvisVoiceChat):
@@ -536,6 +540,20 @@ class VoiceWebSocketHandler:
         except Exception:
             pass  # Best effort - don't fail if acknowledgment fails
 
+    async def _stream_audio(self, websocket: Any, text: str):
+        """Send a response's audio one sentence at a time"""
+        sentence = []
+        async for chunk in self.voice_chat.voice.stream_speech(text):
+            sentence.append(chunk.audio)
+            if chunk.final:
+                await websocket.send_json({
+                    "type": "audio",
+                    "index": chunk.index,
+                    "text": chunk.text,
+                    "audio": base64.b64encode(b"".join(sentence)).decode("utf-8")
+                })
+                sentence = []
+
     async def handle_connection(
         self,
         websocket: Any,
@@ -621,6 +639,15 @@ class VoiceWebSocketHandler:
                     user_text = message.get("text", "")
                     jarvis_text = await self.voice_chat._get_chat_response(user_text)
 
+                    if message.get("stream_audio"):
+                        await websocket.send_json({
+                            "type": "response",
+                            "text": jarvis_text,
+                            "audio": None
+                        })
+                        await self._stream_audio(websocket, jarvis_text)
+                        continue
+
                     response = {
                         "type": "response",
                         "text": jarvis_text,
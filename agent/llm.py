@@ -480,13 +480,16 @@ def chat_json(
         except Exception as e:
             print(f"[LLMCache] Cache lookup error (will proceed with API call): {e}")
 
-    # STAGE 5.2: Check cost cap before making the call
+    # STAGE 5.2: Check cost cap before making the call. The estimate is held
+    # as a reservation until usage is recorded so concurrent calls can't all
+    # pass the check and overshoot the cap together.
+    reservation_id = None
     if max_cost_usd > 0:
         # Estimate prompt size (rough heuristic: 4 chars per token)
         prompt_chars = len(effective_system) + len(user_content)
         estimated_tokens = (prompt_chars // 4) + 2000  # Add buffer for output
 
-        would_exceed, current_cost, cap_message = cost_tracker.check_cost_cap(
+        would_exceed, reservation_id, current_cost, cap_message = cost_tracker.reserve_cost_cap(
             max_cost_usd=max_cost_usd,
             estimated_tokens=estimated_tokens,
             model=chosen_model,
@@ -520,42 +523,47 @@ def chat_json(
         "temperature": temperature,
     }
 
-    data = _post(payload)
-
-    # PHASE 4.3 (R3): LLM Timeout Fallback to Cheaper Model
-    # If the primary model times out, try once with a cheaper/faster model
-    if data.get("timeout") and data.get("is_timeout"):
-        # Get fallback model from config or use hardcoded fallback
-        fallback_model = None
-        if CONFIG_AVAILABLE:
-            cfg = config_module.get_config()
-            fallback_model = cfg.models.llm_fallback_model if hasattr(cfg.models, 'llm_fallback_model') else None
-
-        # Default fallback: use cheaper model based on role
-        if not fallback_model:
-            if "gpt-4o" in chosen_model and "mini" not in chosen_model:
-                fallback_model = "gpt-4o-mini"
-            elif "gpt-4" in chosen_model:
-                fallback_model = "gpt-3.5-turbo"
-            else:
-                fallback_model = None  # Already using cheapest model
+    try:
+        data = _post(payload)
+
+        # PHASE 4.3 (R3): LLM Timeout Fallback to Cheaper Model
+        # If the primary model times out, try once with a cheaper/faster model
+        if data.get("timeout") and data.get("is_timeout"):
+            # Get fallback model from config or use hardcoded fallback
+            fallback_model = None
+            if CONFIG_AVAILABLE:
+                cfg = config_module.get_config()
+                fallback_model = cfg.models.llm_fallback_model if hasattr(cfg.models, 'llm_fallback_model') else None
+
+            # Default fallback: use cheaper model based on role
+            if not fallback_model:
+                if "gpt-4o" in chosen_model and "mini" not in chosen_model:
+                    fallback_model = "gpt-4o-mini"
+                elif "gpt-4" in chosen_model:
+                    fallback_model = "gpt-3.5-turbo"
+                else:
+                    fallback_model = None  # Already using cheapest model
 
-        if fallback_model and fallback_model != chosen_model:
-            print(f"[LLM] Timeout detected - retrying with fallback model: {fallback_model}")
+            if fallback_model and fallback_model != chosen_model:
+                print(f"[LLM] Timeout detected - retrying with fallback model: {fallback_model}")
 
-            # Log fallback attempt
-            if run_id:
-                core_logging.log_event(run_id, "llm_fallback", {
-                    "original_model": chosen_model,
-                    "fallback_model": fallback_model,
-                    "reason": "timeout",
-                })
+                # Log fallback attempt
+                if run_id:
+                    core_logging.log_event(run_id, "llm_fallback", {
+                        "original_model": chosen_model,
+                        "fallback_model": fallback_model,
+                        "reason": "timeout",
+                    })
 
-            # Retry with fallback model
-            fallback_payload = payload.copy()
-            fallback_payload["model"] = fallback_model
-            data = _post(fallback_payload)
-            chosen_model = fallback_model  # Update for cost tracking
+                # Retry with fallback model
+                fallback_payload = payload.copy()
+                fallback_payload["model"] = fallback_model
+                data = _post(fallback_payload)
+                chosen_model = fallback_model  # Update for cost tracking
+    except BaseException:
+        # Call never completed; free the held estimate
+        cost_tracker.release_cost_reservation(reservation_id)
+        raise
 
     # Cost tracking – best-effort, non-fatal on failure.
     try:
@@ -564,13 +572,16 @@ def chat_json(
             prompt_tokens = int(usage.get("prompt_tokens", 0))
             completion_tokens = int(usage.get("completion_tokens", 0))
 
-            # Register this call in the in-memory cost state.
-            cost_tracker.register_call(
+            # Register this call in the in-memory cost state, settling the
+            # reservation taken by the cost-cap check.
+            cost_tracker.commit_cost_reservation(
+                reservation_id,
                 role=role,
                 model=chosen_model,
                 prompt_tokens=prompt_tokens,
                 completion_tokens=completion_tokens,
             )
+            reservation_id = None
 
             # Optional: persist a simple history record to disk.
             cost_tracker.append_history(
@@ -582,6 +593,9 @@ def chat_json(
 
     except Exception as e:  # noqa: BLE001
         print(f"[CostTracker] Failed to record usage: {e}")
+    finally:
+        # No usage reported (stub/failure) - nothing was spent
+        cost_tracker.release_cost_reservation(reservation_id)
 
     # STAGE 3.3: SAFE FALLBACK - If _post() returned a stub due to timeout/error,
     # try fallback model if configured and not already tried.
@@ -12,6 +12,7 @@ Components:
 - llm_router: Intelligent model selection and routing
 - performance_tracker: Metrics tracking for all LLM calls
 - hybrid_strategy: Cost-optimized hybrid cloud/local execution
+- http_pool: Process-wide keep-alive HTTP clients shared by all providers
 
 Re-exports from llm.py (for backward compatibility):
 - chat_json: Main LLM chat function with JSON response parsing
@@ -24,6 +25,15 @@ from .llm_router import LLMRouter, ModelTier
 from .performance_tracker import PerformanceTracker
 from .hybrid_strategy import HybridStrategy, TaskComplexity
 
+# Shared HTTP connection pool
+from .http_pool import (
+    HTTPClientPool,
+    HTTPPoolConfig,
+    HostLimits,
+    get_http_pool,
+    reset_http_pool,
+)
+
 # Enhanced multi-provider support
 from .providers import (
     LLMProvider,
@@ -33,6 +43,7 @@ from .providers import (
     DeepSeekProvider,
     QwenProvider,
     ChatResponse,
+    StreamChunk,
     ModelInfo,
     ProviderStatus,
     ProviderHealth,
@@ -41,6 +52,7 @@ from .providers import (
 from .enhanced_router import (
     EnhancedModelRouter,
     FallbackChain,
+    FirstTokenTimeout,
     RouterConfig,
     CostTracker,
     RoutingStrategy,
@@ -94,6 +106,12 @@ __all__ = [
     "chat_json",
     "chat",
     "validate_api_connectivity",
+    # Shared HTTP pool
+    "HTTPClientPool",
+    "HTTPPoolConfig",
+    "HostLimits",
+    "get_http_pool",
+    "reset_http_pool",
     # Enhanced providers
     "LLMProvider",
     "OpenAIProvider",
@@ -102,12 +120,14 @@ __all__ = [
     "DeepSeekProvider",
     "QwenProvider",
     "ChatResponse",
+    "StreamChunk",
     "ModelInfo",
     "ProviderStatus",
     "ProviderHealth",
     # Enhanced router
     "EnhancedModelRouter",
     "FallbackChain",
+    "FirstTokenTimeout",
     "RouterConfig",
     "CostTracker",
     "RoutingStrategy",
@@ -12,14 +12,16 @@ Features:
 - Task-based model selection
 """
 
-from typing import List, Dict, Optional, Any, Tuple
+from typing import List, Dict, Optional, Any, AsyncIterator, Tuple
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 import asyncio
+import time
 
 # Handle both relative and absolute imports
 try:
+    from .http_pool import HAS_HTTPX, HostLimits, get_http_pool
     from .providers import (
         LLMProvider,
         OpenAIProvider,
@@ -28,11 +30,14 @@ try:
         DeepSeekProvider,
         QwenProvider,
         ChatResponse,
+        StreamChunk,
         ProviderStatus,
         ProviderHealth,
         ModelInfo,
+        estimate_message_tokens,
     )
 except ImportError:
+    from http_pool import HAS_HTTPX, HostLimits, get_http_pool
     from providers import (
         LLMProvider,
         OpenAIProvider,
@@ -41,10 +46,12 @@ except ImportError:
         DeepSeekProvider,
         QwenProvider,
         ChatResponse,
+        StreamChunk,
         ProviderStatus,
         ProviderHealth,
-    ModelInfo,
-)
+        ModelInfo,
+        estimate_message_tokens,
+    )
 
 
 # =============================================================================
@@ -88,6 +95,9 @@ class RouterConfig:
     max_retries: int = 3  # Max retries on failure
     fallback_enabled: bool = True  # Enable automatic fallback
     timeout: float = 60.0  # Default timeout
+    chain_timeout: Optional[float] = None  # Deadline for a whole fallback chain
+    first_token_timeout: Optional[float] = 15.0  # Fail over a stream that hasn't started by then
+    ollama_max_connections: int = 4  # Local inference serializes; more sockets don't help
 
     # Provider API keys (if not in environment)
     openai_api_key: Optional[str] = None
@@ -173,18 +183,25 @@ class CostTracker:
 # Fallback Chain
 # =============================================================================
 
+class FirstTokenTimeout(TimeoutError):
+    """A provider produced no output before the first-token deadline"""
+
+
 class FallbackChain:
     """
     Chain of providers with automatic fallback on failure.
 
-    Tries providers in order until one succeeds.
+    Tries providers in order until one succeeds. Providers share the
+    process-wide HTTP pool, so retries and fallbacks reuse open connections
+    instead of paying for a new TCP/TLS handshake per attempt.
     """
 
     def __init__(
         self,
         primary: LLMProvider,
         fallbacks: List[LLMProvider],
-        max_retries: int = 2
+        max_retries: int = 2,
+        timeout: Optional[float] = None
     ):
         """
         Initialize fallback chain.
@@ -193,9 +210,12 @@ class FallbackChain:
             primary: Primary provider to try first
             fallbacks: List of fallback providers
             max_retries: Max retries per provider
+            timeout: Overall deadline in seconds across every attempt
+                     (None = each attempt only bounded by its provider)
         """
         self.chain = [primary] + fallbacks
         self.max_retries = max_retries
+        self.timeout = timeout
         self._last_successful: Optional[str] = None
 
     async def chat_with_fallback(
@@ -222,25 +242,141 @@ class FallbackChain:
         """
         last_error = None
         errors = []
+        deadline = time.monotonic() + self.timeout if self.timeout else None
 
         for provider in self.chain:
             for attempt in range(self.max_retries):
+                remaining = deadline - time.monotonic() if deadline else None
+                if remaining is not None and remaining <= 0:
+                    errors.append(f"{provider.name}: chain deadline of {self.timeout}s reached")
+                    break
                 try:
-                    response = await provider.chat(messages, model, **kwargs)
+                    response = await asyncio.wait_for(
+                        provider.chat(messages, model, **kwargs), timeout=remaining
+                    )
                     self._last_successful = provider.name
                     return response
                 except Exception as e:
                     last_error = e
-                    errors.append(f"{provider.name} (attempt {attempt + 1}): {str(e)}")
+                    errors.append(f"{provider.name} (attempt {attempt + 1}): {str(e) or type(e).__name__}")
 
                     # Wait briefly before retry
                     if attempt < self.max_retries - 1:
-                        await asyncio.sleep(0.5 * (attempt + 1))
+                        await self._backoff(attempt, deadline)
 
         # All providers failed
         error_summary = "\n".join(errors)
         raise RuntimeError(f"All providers failed:\n{error_summary}") from last_error
 
+    async def stream_with_fallback(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        first_token_timeout: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Stream chat with automatic fallback.
+
+        A provider that errors or sends no text within
+        ``first_token_timeout`` is abandoned for the next attempt. Once
+        text has been yielded the stream is committed: a later failure is
+        raised instead of splicing another provider's answer onto it.
+
+        Args:
+            messages: Chat messages
+            model: Model to use (provider default if None)
+            first_token_timeout: Seconds to wait for the first text chunk
+            **kwargs: Additional parameters
+
+        Yields:
+            StreamChunk pieces; the last one has ``done=True``, usage, and
+            ``attempts`` / ``first_token_ms`` in its metadata
+
+        Raises:
+            Exception: If all providers fail before streaming any text
+        """
+        last_error = None
+        errors = []
+        attempts = 0
+        deadline = time.monotonic() + self.timeout if self.timeout else None
+
+        for provider in self.chain:
+            for attempt in range(self.max_retries):
+                if deadline and deadline - time.monotonic() <= 0:
+                    errors.append(f"{provider.name}: chain deadline of {self.timeout}s reached")
+                    break
+
+                attempts += 1
+                started = time.monotonic()
+                first_token_ms = None
+                stream = provider.stream_chat(messages, model, **kwargs)
+                try:
+                    while True:
+                        chunk = await self._next_chunk(
+                            stream, provider, deadline,
+                            None if first_token_ms is not None else first_token_timeout,
+                            started
+                        )
+                        if chunk is None:
+                            break
+                        if chunk.done:
+                            chunk.metadata.update(
+                                attempts=attempts,
+                                first_token_ms=first_token_ms,
+                                fallback_errors=errors
+                            )
+                        elif first_token_ms is None:
+                            first_token_ms = round((time.monotonic() - started) * 1000, 1)
+                        yield chunk
+                    self._last_successful = provider.name
+                    return
+                except Exception as e:
+                    if first_token_ms is not None:
+                        raise
+                    last_error = e
+                    errors.append(f"{provider.name} (attempt {attempt + 1}): {str(e) or type(e).__name__}")
+
+                    if attempt < self.max_retries - 1 and not isinstance(e, FirstTokenTimeout):
+                        await self._backoff(attempt, deadline)
+                finally:
+                    await stream.aclose()
+
+        error_summary = "\n".join(errors)
+        raise RuntimeError(f"All providers failed:\n{error_summary}") from last_error
+
+    @staticmethod
+    async def _backoff(attempt: int, deadline: Optional[float]) -> None:
+        """Sleep before a retry, never past the chain deadline"""
+        delay = 0.5 * (attempt + 1)
+        if deadline:
+            delay = min(delay, deadline - time.monotonic())
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+    async def _next_chunk(
+        self,
+        stream: AsyncIterator[StreamChunk],
+        provider: LLMProvider,
+        deadline: Optional[float],
+        first_token_timeout: Optional[float],
+        started: float
+    ) -> Optional[StreamChunk]:
+        """Next chunk of ``stream`` (None at the end) within the active deadlines"""
+        first_deadline = started + first_token_timeout if first_token_timeout else None
+        limits = [d for d in (deadline, first_deadline) if d]
+        remaining = min(limits) - time.monotonic() if limits else None
+        try:
+            return await asyncio.wait_for(stream.__anext__(), timeout=remaining)
+        except StopAsyncIteration:
+            return None
+        except asyncio.TimeoutError:
+            if first_deadline and (deadline is None or first_deadline <= deadline):
+                raise FirstTokenTimeout(
+                    f"no output within first-token deadline of {first_token_timeout}s"
+                ) from None
+            raise TimeoutError(f"chain deadline of {self.timeout}s reached") from None
+
     @property
     def providers(self) -> List[LLMProvider]:
         """Get all providers in chain"""
@@ -334,6 +470,12 @@ class EnhancedModelRouter:
         self._round_robin_index = 0
 
         self._init_providers()
+        if HAS_HTTPX:
+            get_http_pool().set_host_limits(
+                self.config.ollama_host,
+                HostLimits(max_connections=self.config.ollama_max_connections,
+                           max_keepalive_connections=self.config.ollama_max_connections)
+            )
 
     def _init_providers(self):
         """Initialize all configured providers"""
@@ -607,7 +749,7 @@ class EnhancedModelRouter:
                 p for name, p in self.providers.items()
                 if name != provider.name and (p.is_healthy or p._health.status == ProviderStatus.UNKNOWN)
             ]
-            chain = FallbackChain(provider, fallbacks, self.config.max_retries)
+            chain = FallbackChain(provider, fallbacks, self.config.max_retries, self.config.chain_timeout)
 
             response = await chain.chat_with_fallback(messages, model, **kwargs)
         else:
@@ -623,6 +765,113 @@ class EnhancedModelRouter:
 
         return response
 
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        task_type: str = "simple",
+        complexity: str = "medium",
+        model: Optional[str] = None,
+        use_fallback: bool = True,
+        first_token_timeout: Optional[float] = None,
+        **kwargs
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Stream chat with intelligent routing.
+
+        Usage is accounted as text arrives: if the running cost estimate
+        passes ``cost_budget`` the stream is cut short with
+        ``finish_reason="cost_budget"``, and a stream the caller abandons
+        is still charged for what it produced.
+
+        Args:
+            messages: Chat messages
+            task_type: Type of task
+            complexity: Task complexity
+            model: Specific model to use (overrides routing)
+            use_fallback: Whether to fail over to other providers
+            first_token_timeout: Seconds to wait for a provider's first text
+                                 (defaults to config.first_token_timeout)
+            **kwargs: Additional parameters
+
+        Yields:
+            StreamChunk pieces, ending with a ``done`` chunk carrying usage
+        """
+        if self.config.daily_budget and self.cost_tracker.daily_cost >= self.config.daily_budget:
+            raise RuntimeError(f"Daily budget of ${self.config.daily_budget} exceeded")
+
+        provider, selected_model = self.select_model(
+            task_type=task_type,
+            complexity=complexity,
+            cost_budget=self.config.cost_budget
+        )
+        model = model or selected_model
+
+        fallbacks = []
+        if use_fallback and self.config.fallback_enabled:
+            fallbacks = [
+                p for name, p in self.providers.items()
+                if name != provider.name and (p.is_healthy or p._health.status == ProviderStatus.UNKNOWN)
+            ]
+        chain = FallbackChain(
+            provider, fallbacks, self.config.max_retries if fallbacks else 1, self.config.chain_timeout
+        )
+
+        input_tokens = estimate_message_tokens(messages)
+        streamed_chars = 0
+        current: Optional[LLMProvider] = None
+        current_model = model
+        final: Optional[StreamChunk] = None
+        stream = chain.stream_with_fallback(
+            messages, model,
+            self.config.first_token_timeout if first_token_timeout is None else first_token_timeout,
+            **kwargs
+        )
+
+        try:
+            async for chunk in stream:
+                if chunk.done:
+                    final = chunk
+                    yield chunk
+                    break
+
+                if current is None or current.name != chunk.provider:
+                    current = self.providers.get(chunk.provider, provider)
+                    current_model = chunk.model or model
+                streamed_chars += len(chunk.content)
+                yield chunk
+
+                if self.config.cost_budget:
+                    running = current.calculate_cost(
+                        input_tokens, (streamed_chars + 3) // 4, current_model
+                    )
+                    if running > self.config.cost_budget:
+                        output_tokens = (streamed_chars + 3) // 4
+                        final = StreamChunk(
+                            provider=current.name,
+                            model=current_model,
+                            done=True,
+                            input_tokens=input_tokens,
+                            output_tokens=output_tokens,
+                            cost=running,
+                            finish_reason="cost_budget",
+                            metadata={"estimated_usage": True}
+                        )
+                        yield final
+                        break
+        finally:
+            await stream.aclose()
+            if final is not None:
+                self.cost_tracker.add_cost(final.provider, final.model, final.cost, final.total_tokens)
+            elif current is not None:
+                # Abandoned or failed mid-stream: charge for the text produced so far
+                output_tokens = (streamed_chars + 3) // 4
+                self.cost_tracker.add_cost(
+                    current.name,
+                    current_model,
+                    current.calculate_cost(input_tokens, output_tokens, current_model),
+                    input_tokens + output_tokens
+                )
+
     def create_fallback_chain(
         self,
         primary_provider: str,
@@ -654,7 +903,7 @@ class EnhancedModelRouter:
                 if name != primary_provider
             ]
 
-        return FallbackChain(primary, fallbacks, self.config.max_retries)
+        return FallbackChain(primary, fallbacks, self.config.max_retries, self.config.chain_timeout)
 
     def get_provider(self, name: str) -> Optional[LLMProvider]:
         """Get a specific provider by name"""
@@ -675,6 +924,10 @@ class EnhancedModelRouter:
         """Get cost tracking summary"""
         return self.cost_tracker.get_summary()
 
+    def get_connection_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Requests, new connections and reuse per host from the shared HTTP pool"""
+        return get_http_pool().get_stats()
+
     def reset_session_costs(self):
         """Reset session cost tracking"""
         self.cost_tracker.reset_session()
@@ -728,6 +981,7 @@ __all__ = [
 
     # Main classes
     'FallbackChain',
+    'FirstTokenTimeout',
     'EnhancedModelRouter',
 
     # Convenience
@@ -0,0 +1,303 @@
+"""
+Shared async HTTP client pool for LLM providers.
+
+Every provider used to open its own ``httpx.AsyncClient`` per request, so
+fanning out to several providers (or retrying through a fallback chain)
+paid for a fresh TCP connection and TLS handshake every time. This module
+keeps one keep-alive client per origin for the whole process:
+
+- Per-host connection limits (with overrides, e.g. for local Ollama)
+- HTTP/2 multiplexing when the ``h2`` package is installed
+- Coordinated timeouts derived from one request deadline
+- Shared metrics on requests, new connections and connection reuse
+
+Usage:
+    from agent.llm.http_pool import get_http_pool
+
+    pool = get_http_pool()
+    client = pool.client("https://api.openai.com/v1")
+    response = await client.post(url, json=payload, timeout=pool.timeout(60))
+
+    pool.get_stats()["api.openai.com:443"]["reuse_rate"]
+
+Environment:
+    LLM_HTTP_MAX_CONNECTIONS: Connections per host (default: 20)
+    LLM_HTTP_MAX_KEEPALIVE: Idle connections kept per host (default: 10)
+    LLM_HTTP_KEEPALIVE_EXPIRY: Seconds an idle connection is kept (default: 60)
+    LLM_HTTP2: Set to "0" to disable HTTP/2 (default: enabled if h2 installed)
+"""
+
+from __future__ import annotations
+
+import asyncio
+import os
+import threading
+from dataclasses import dataclass, field
+from typing import Any, Dict, Optional, Tuple
+
+try:
+    import httpx
+    HAS_HTTPX = True
+except ImportError:
+    HAS_HTTPX = False
+    httpx = None  # type: ignore
+
+try:
+    import h2  # noqa: F401
+    HAS_H2 = True
+except ImportError:
+    HAS_H2 = False
+
+
+# =============================================================================
+# Configuration
+# =============================================================================
+
+@dataclass
+class HostLimits:
+    """Connection limits for one host"""
+    max_connections: int = 20
+    max_keepalive_connections: int = 10
+    keepalive_expiry: float = 60.0
+
+
+@dataclass
+class HTTPPoolConfig:
+    """Configuration for the shared HTTP client pool"""
+    limits: HostLimits = field(default_factory=HostLimits)
+    host_limits: Dict[str, HostLimits] = field(default_factory=dict)  # "host:port" -> limits
+    http2: bool = True  # Only takes effect when h2 is installed
+
+    # Timeout components; the read timeout comes from each request's deadline
+    connect_timeout: float = 10.0
+    write_timeout: float = 30.0
+    pool_timeout: float = 10.0
+    default_timeout: float = 60.0
+
+    @classmethod
+    def from_env(cls) -> "HTTPPoolConfig":
+        """Build configuration from LLM_HTTP_* environment variables"""
+        return cls(
+            limits=HostLimits(
+                max_connections=int(os.getenv("LLM_HTTP_MAX_CONNECTIONS", "20")),
+                max_keepalive_connections=int(os.getenv("LLM_HTTP_MAX_KEEPALIVE", "10")),
+                keepalive_expiry=float(os.getenv("LLM_HTTP_KEEPALIVE_EXPIRY", "60")),
+            ),
+            http2=os.getenv("LLM_HTTP2", "1").lower() not in ("0", "false", "no"),
+        )
+
+
+@dataclass
+class HostStats:
+    """Traffic counters for one host"""
+    requests: int = 0
+    errors: int = 0
+    connections_opened: int = 0
+    tls_handshakes: int = 0
+    http2_requests: int = 0
+
+    @property
+    def reused(self) -> int:
+        """Requests served on an already-open connection"""
+        return max(0, self.requests - self.connections_opened)
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "requests": self.requests,
+            "errors": self.errors,
+            "connections_opened": self.connections_opened,
+            "tls_handshakes": self.tls_handshakes,
+            "http2_requests": self.http2_requests,
+            "reused": self.reused,
+            "reuse_rate": round(self.reused / self.requests, 3) if self.requests else 0.0,
+        }
+
+
+def _origin(url: str) -> Tuple[str, str]:
+    """(scheme, "host:port") for a URL"""
+    parsed = httpx.URL(url)
+    port = parsed.port or (443 if parsed.scheme == "https" else 80)
+    return parsed.scheme, f"{parsed.host}:{port}"
+
+
+# =============================================================================
+# Client Pool
+# =============================================================================
+
+class HTTPClientPool:
+    """
+    Process-wide registry of keep-alive ``httpx.AsyncClient`` instances.
+
+    One client per (origin, event loop): httpx clients can't be shared
+    across event loops, so a loop that is closed has its clients dropped
+    the next time the pool is used.
+    """
+
+    def __init__(self, config: Optional[HTTPPoolConfig] = None):
+        if not HAS_HTTPX:
+            raise RuntimeError("httpx is required for the HTTP pool. Install with: pip install httpx")
+
+        self.config = config or HTTPPoolConfig.from_env()
+        self._clients: Dict[Tuple[str, str, int], Tuple[asyncio.AbstractEventLoop, "httpx.AsyncClient"]] = {}
+        self._stats: Dict[str, HostStats] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def http2_enabled(self) -> bool:
+        return self.config.http2 and HAS_H2
+
+    def limits_for(self, host: str) -> HostLimits:
+        """Limits for a "host:port" key"""
+        return self.config.host_limits.get(host, self.config.limits)
+
+    def set_host_limits(self, url: str, limits: HostLimits):
+        """Override limits for the host of ``url`` (applies to new clients)"""
+        self.config.host_limits[_origin(url)[1]] = limits
+
+    def timeout(self, total: Optional[float] = None) -> "httpx.Timeout":
+        """
+        Timeout for a request that must finish within ``total`` seconds.
+
+        Connect, write and pool waits are capped at the deadline so no
+        single phase can outlast the request as a whole.
+        """
+        total = total or self.config.default_timeout
+        return httpx.Timeout(
+            total,
+            connect=min(self.config.connect_timeout, total),
+            write=min(self.config.write_timeout, total),
+            pool=min(self.config.pool_timeout, total),
+        )
+
+    def client(self, url: str) -> "httpx.AsyncClient":
+        """
+        Shared client for the origin of ``url``.
+
+        Must be called from a running event loop. Callers must not close
+        the returned client.
+        """
+        scheme, host = _origin(url)
+        loop = asyncio.get_running_loop()
+        key = (scheme, host, id(loop))
+
+        with self._lock:
+            self._drop_closed_loops()
+            entry = self._clients.get(key)
+            if entry and entry[0] is loop and not entry[1].is_closed:
+                return entry[1]
+
+            limits = self.limits_for(host)
+            client = httpx.AsyncClient(
+                http2=self.http2_enabled,
+                timeout=self.timeout(),
+                limits=httpx.Limits(
+                    max_connections=limits.max_connections,
+                    max_keepalive_connections=limits.max_keepalive_connections,
+                    keepalive_expiry=limits.keepalive_expiry,
+                ),
+                event_hooks={
+                    "request": [self._request_hook(host)],
+                    "response": [self._response_hook(host)],
+                },
+            )
+            self._clients[key] = (loop, client)
+            self._stats.setdefault(host, HostStats())
+            return client
+
+    def _drop_closed_loops(self):
+        for key in [k for k, (loop, _) in self._clients.items() if loop.is_closed()]:
+            del self._clients[key]
+
+    # -------------------------------------------------------------------------
+    # Metrics
+    # -------------------------------------------------------------------------
+
+    def _request_hook(self, host: str):
+        stats = self._stats.setdefault(host, HostStats())
+
+        async def trace(event: str, info: Dict[str, Any]):
+            if event == "connection.connect_tcp.complete":
+                stats.connections_opened += 1
+            elif event == "connection.start_tls.complete":
+                stats.tls_handshakes += 1
+            elif event == "http2.send_request_headers.started":
+                stats.http2_requests += 1
+
+        async def on_request(request: "httpx.Request"):
+            stats.requests += 1
+            request.extensions["trace"] = trace
+
+        return on_request
+
+    def _response_hook(self, host: str):
+        stats = self._stats.setdefault(host, HostStats())
+
+        async def on_response(response: "httpx.Response"):
+            if response.status_code >= 500:
+                stats.errors += 1
+
+        return on_response
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-host counters plus totals under "_total" """
+        result = {host: stats.to_dict() for host, stats in self._stats.items()}
+        total = HostStats(
+            requests=sum(s.requests for s in self._stats.values()),
+            errors=sum(s.errors for s in self._stats.values()),
+            connections_opened=sum(s.connections_opened for s in self._stats.values()),
+            tls_handshakes=sum(s.tls_handshakes for s in self._stats.values()),
+            http2_requests=sum(s.http2_requests for s in self._stats.values()),
+        )
+        result["_total"] = total.to_dict()
+        result["_total"]["open_clients"] = len(self._clients)
+        result["_total"]["http2_enabled"] = self.http2_enabled
+        return result
+
+    def reset_stats(self):
+        for stats in self._stats.values():
+            stats.__init__()
+
+    async def aclose(self):
+        """Close clients that belong to the running event loop"""
+        loop = asyncio.get_running_loop()
+        with self._lock:
+            owned = [k for k, (owner, _) in self._clients.items() if owner is loop]
+            clients = [self._clients.pop(k)[1] for k in owned]
+        for client in clients:
+            await client.aclose()
+
+
+# =============================================================================
+# Singleton
+# =============================================================================
+
+_pool: Optional[HTTPClientPool] = None
+_pool_lock = threading.Lock()
+
+
+def get_http_pool() -> HTTPClientPool:
+    """Get the process-wide HTTP client pool"""
+    global _pool
+    if _pool is None:
+        with _pool_lock:
+            if _pool is None:
+                _pool = HTTPClientPool()
+    return _pool
+
+
+def reset_http_pool(config: Optional[HTTPPoolConfig] = None):
+    """Replace the pool (tests). Open clients are left to garbage collection."""
+    global _pool
+    with _pool_lock:
+        _pool = HTTPClientPool(config) if config else None
+
+
+__all__ = [
+    "HTTPClientPool",
+    "HTTPPoolConfig",
+    "HostLimits",
+    "HostStats",
+    "get_http_pool",
+    "reset_http_pool",
+    "HAS_H2",
+]
@@ -23,6 +23,12 @@ from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 
+# Handle both relative and absolute imports
+try:
+    from .http_pool import get_http_pool
+except ImportError:
+    from http_pool import get_http_pool
+
 
 @dataclass
 class OllamaModel:
@@ -103,9 +109,16 @@ class OllamaClient:
         self.base_url = base_url or os.getenv("OLLAMA_BASE_URL", "http://localhost:11434")
         self.timeout = timeout
         self.max_retries = max_retries
-        self.client = httpx.AsyncClient(timeout=timeout)
         self._is_available: Optional[bool] = None
 
+    @property
+    def client(self) -> httpx.AsyncClient:
+        """Shared keep-alive client for the Ollama host"""
+        return get_http_pool().client(self.base_url)
+
+    def _timeout(self, seconds: Optional[float] = None) -> httpx.Timeout:
+        return get_http_pool().timeout(seconds or self.timeout)
+
     async def __aenter__(self):
         """Async context manager entry."""
         return self
@@ -115,8 +128,7 @@ class OllamaClient:
         await self.close()
 
     async def close(self):
-        """Close HTTP client."""
-        await self.client.aclose()
+        """Release the client (connections stay pooled for other callers)."""
 
     async def is_available(self) -> bool:
         """
@@ -129,7 +141,7 @@ class OllamaClient:
             return self._is_available
 
         try:
-            response = await self.client.get(f"{self.base_url}/api/tags", timeout=5.0)
+            response = await self.client.get(f"{self.base_url}/api/tags", timeout=self._timeout(5.0))
             self._is_available = response.status_code == 200
             return self._is_available
         except Exception as e:
@@ -147,7 +159,7 @@ class OllamaClient:
         Raises:
             httpx.HTTPError: If request fails
         """
-        response = await self.client.get(f"{self.base_url}/api/tags")
+        response = await self.client.get(f"{self.base_url}/api/tags", timeout=self._timeout())
         response.raise_for_status()
 
         data = response.json()
@@ -171,7 +183,7 @@ class OllamaClient:
                 "POST",
                 f"{self.base_url}/api/pull",
                 json={"name": model},
-                timeout=600.0,  # 10 minutes for model download
+                timeout=self._timeout(600.0),  # 10 minutes for model download
             ) as response:
                 response.raise_for_status()
 
@@ -205,9 +217,12 @@ class OllamaClient:
             True if successful, False otherwise
         """
         try:
-            response = await self.client.delete(
+            # AsyncClient.delete() takes no body
+            response = await self.client.request(
+                "DELETE",
                 f"{self.base_url}/api/delete",
-                json={"name": model}
+                json={"name": model},
+                timeout=self._timeout()
             )
             response.raise_for_status()
             print(f"[Ollama] Deleted model: {model}")
@@ -269,6 +284,7 @@ class OllamaClient:
                 response = await self.client.post(
                     f"{self.base_url}/api/generate",
                     json=request_data,
+                    timeout=self._timeout(),
                 )
                 response.raise_for_status()
 
@@ -347,6 +363,7 @@ class OllamaClient:
             "POST",
             f"{self.base_url}/api/generate",
             json=request_data,
+            timeout=self._timeout(),
         ) as response:
             response.raise_for_status()
 
@@ -372,7 +389,8 @@ class OllamaClient:
         """
         response = await self.client.post(
             f"{self.base_url}/api/embeddings",
-            json={"model": model, "prompt": text}
+            json={"model": model, "prompt": text},
+            timeout=self._timeout()
         )
         response.raise_for_status()
 
@@ -10,7 +10,10 @@ Tracks performance metrics for all LLM calls:
 
 Features:
 - Real-time metrics collection
-- Persistent storage to disk
+- Compact SQLite storage: all-time totals and hourly buckets per model,
+  raw samples kept for a retention window
+- Latency quantile sketches (p50/p95/p99) without storing every sample
+- Bounded in-memory ring of recent calls
 - Analytics and reporting
 - Performance-based routing optimization
 """
@@ -18,12 +21,29 @@ Features:
 from __future__ import annotations
 
 import json
+import math
+import sqlite3
+import struct
+import threading
 import time
-from collections import defaultdict
-from dataclasses import dataclass, asdict
+from collections import deque
+from dataclasses import dataclass, asdict, field
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Deque, Dict, Iterator, List, Optional, Tuple
+
+
+# Hourly aggregates per model
+BUCKET_SECONDS = 3600
+
+# Calls kept in memory for get_recent_metrics()
+RAW_SAMPLE_LIMIT = 1000
+
+# Raw samples are kept on disk for this long; hourly buckets much longer
+RAW_RETENTION_DAYS = 7
+BUCKET_RETENTION_DAYS = 90
+
+PRUNE_INTERVAL_SECONDS = 3600
 
 
 @dataclass
@@ -49,6 +69,75 @@ class PerformanceMetric:
         return cls(**data)
 
 
+class LatencySketch:
+    """
+    Mergeable quantile sketch for latencies.
+
+    Values are counted in logarithmic buckets, so any quantile is
+    returned within ``relative_accuracy`` of the true value while the
+    sketch stays a few hundred counters regardless of how many calls it
+    has seen (1ms to 10min spans ~650 buckets at 1%).
+    """
+
+    MIN_VALUE = 1e-3  # Anything faster counts as zero
+
+    def __init__(self, relative_accuracy: float = 0.01):
+        self.relative_accuracy = relative_accuracy
+        self._gamma = (1 + relative_accuracy) / (1 - relative_accuracy)
+        self._log_gamma = math.log(self._gamma)
+        self.counts: Dict[int, int] = {}
+        self.zero_count = 0
+
+    @property
+    def count(self) -> int:
+        return self.zero_count + sum(self.counts.values())
+
+    def add(self, value: float, count: int = 1):
+        if value < self.MIN_VALUE:
+            self.zero_count += count
+            return
+        key = math.ceil(math.log(value) / self._log_gamma)
+        self.counts[key] = self.counts.get(key, 0) + count
+
+    def merge(self, other: "LatencySketch"):
+        self.zero_count += other.zero_count
+        for key, count in other.counts.items():
+            self.counts[key] = self.counts.get(key, 0) + count
+
+    def quantile(self, q: float) -> Optional[float]:
+        """Value at quantile ``q`` (0.0-1.0), or None when empty"""
+        total = self.count
+        if total == 0:
+            return None
+
+        rank = q * (total - 1)
+        seen = self.zero_count
+        if rank < seen:
+            return 0.0
+        for key in sorted(self.counts):
+            seen += self.counts[key]
+            if seen > rank:
+                # Midpoint of the bucket (gamma^(k-1), gamma^k]
+                return 2 * self._gamma ** key / (self._gamma + 1)
+        return 2 * self._gamma ** max(self.counts) / (self._gamma + 1)
+
+    def to_bytes(self) -> bytes:
+        header = struct.pack("<dI", self.relative_accuracy, self.zero_count)
+        pairs = [v for item in sorted(self.counts.items()) for v in item]
+        return header + struct.pack(f"<{len(pairs)}i", *pairs)
+
+    @classmethod
+    def from_bytes(cls, data: Optional[bytes]) -> "LatencySketch":
+        if not data:
+            return cls()
+        accuracy, zero_count = struct.unpack_from("<dI", data)
+        sketch = cls(accuracy)
+        sketch.zero_count = zero_count
+        pairs = struct.unpack_from(f"<{(len(data) - 12) // 4}i", data, 12)
+        sketch.counts = dict(zip(pairs[::2], pairs[1::2]))
+        return sketch
+
+
 @dataclass
 class ModelStats:
     """Aggregated statistics for a model."""
@@ -59,6 +148,42 @@ class ModelStats:
     total_latency_ms: float
     total_cost_usd: float
     total_tokens: int
+    quality_sum: float = 0.0
+    quality_count: int = 0
+    latency_sketch: LatencySketch = field(default_factory=LatencySketch, repr=False)
+
+    @classmethod
+    def empty(cls, model: str) -> ModelStats:
+        return cls(model, 0, 0, 0, 0.0, 0.0, 0)
+
+    def add(self, metric: PerformanceMetric):
+        """Fold one call into the aggregate."""
+        self.total_calls += 1
+
+        if metric.success:
+            self.successful_calls += 1
+            self.total_latency_ms += metric.latency_ms
+            self.latency_sketch.add(metric.latency_ms)
+        else:
+            self.failed_calls += 1
+
+        self.total_cost_usd += metric.cost_usd
+        self.total_tokens += metric.prompt_tokens + metric.completion_tokens
+        if metric.quality_score is not None:
+            self.quality_sum += metric.quality_score
+            self.quality_count += 1
+
+    def merge(self, other: ModelStats):
+        """Fold another aggregate (e.g. another time bucket) into this one."""
+        self.total_calls += other.total_calls
+        self.successful_calls += other.successful_calls
+        self.failed_calls += other.failed_calls
+        self.total_latency_ms += other.total_latency_ms
+        self.total_cost_usd += other.total_cost_usd
+        self.total_tokens += other.total_tokens
+        self.quality_sum += other.quality_sum
+        self.quality_count += other.quality_count
+        self.latency_sketch.merge(other.latency_sketch)
 
     @property
     def success_rate(self) -> float:
@@ -81,6 +206,16 @@ class ModelStats:
             return 0.0
         return self.total_cost_usd / self.total_calls
 
+    @property
+    def avg_quality_score(self) -> Optional[float]:
+        if self.quality_count == 0:
+            return None
+        return self.quality_sum / self.quality_count
+
+    def latency_percentile(self, q: float) -> Optional[float]:
+        """Approximate latency at quantile ``q`` (0.0-1.0) of successful calls."""
+        return self.latency_sketch.quantile(q)
+
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary."""
         return {
@@ -90,92 +225,253 @@ class ModelStats:
             "failed_calls": self.failed_calls,
             "success_rate": self.success_rate,
             "avg_latency_ms": self.avg_latency_ms,
+            "p50_latency_ms": self.latency_percentile(0.5),
+            "p95_latency_ms": self.latency_percentile(0.95),
+            "p99_latency_ms": self.latency_percentile(0.99),
             "avg_cost_per_call": self.avg_cost_per_call,
             "total_cost_usd": self.total_cost_usd,
             "total_tokens": self.total_tokens,
+            "avg_quality_score": self.avg_quality_score,
         }
 
 
+# =============================================================================
+# Storage
+# =============================================================================
+
+_AGGREGATE_COLUMNS = (
+    "total_calls, successful_calls, failed_calls, total_latency_ms, "
+    "total_cost_usd, total_tokens, quality_sum, quality_count, latency_sketch"
+)
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS samples (
+    timestamp REAL NOT NULL,
+    model TEXT NOT NULL,
+    latency_ms REAL NOT NULL,
+    cost_usd REAL NOT NULL,
+    success INTEGER NOT NULL,
+    quality_score REAL,
+    prompt_tokens INTEGER NOT NULL,
+    completion_tokens INTEGER NOT NULL,
+    task_type TEXT
+);
+CREATE INDEX IF NOT EXISTS idx_samples_timestamp ON samples(timestamp);
+
+CREATE TABLE IF NOT EXISTS model_totals (
+    model TEXT PRIMARY KEY,
+    total_calls INTEGER, successful_calls INTEGER, failed_calls INTEGER,
+    total_latency_ms REAL, total_cost_usd REAL, total_tokens INTEGER,
+    quality_sum REAL, quality_count INTEGER, latency_sketch BLOB
+);
+
+CREATE TABLE IF NOT EXISTS model_buckets (
+    model TEXT NOT NULL,
+    bucket_start INTEGER NOT NULL,
+    total_calls INTEGER, successful_calls INTEGER, failed_calls INTEGER,
+    total_latency_ms REAL, total_cost_usd REAL, total_tokens INTEGER,
+    quality_sum REAL, quality_count INTEGER, latency_sketch BLOB,
+    PRIMARY KEY (model, bucket_start)
+);
+CREATE INDEX IF NOT EXISTS idx_buckets_start ON model_buckets(bucket_start);
+"""
+
+
+def _stats_from_row(model: str, row: Tuple) -> ModelStats:
+    return ModelStats(
+        model=model,
+        total_calls=row[0],
+        successful_calls=row[1],
+        failed_calls=row[2],
+        total_latency_ms=row[3],
+        total_cost_usd=row[4],
+        total_tokens=row[5],
+        quality_sum=row[6],
+        quality_count=row[7],
+        latency_sketch=LatencySketch.from_bytes(row[8]),
+    )
+
+
+def _stats_values(stats: ModelStats) -> Tuple:
+    return (
+        stats.total_calls, stats.successful_calls, stats.failed_calls,
+        stats.total_latency_ms, stats.total_cost_usd, stats.total_tokens,
+        stats.quality_sum, stats.quality_count, stats.latency_sketch.to_bytes(),
+    )
+
+
+def _metric_from_row(row: Tuple) -> PerformanceMetric:
+    return PerformanceMetric(
+        timestamp=row[0],
+        model=row[1],
+        latency_ms=row[2],
+        cost_usd=row[3],
+        success=bool(row[4]),
+        quality_score=row[5],
+        prompt_tokens=row[6],
+        completion_tokens=row[7],
+        task_type=row[8],
+    )
+
+
 class PerformanceTracker:
     """
     Performance tracker for LLM calls.
 
     Tracks metrics across all models and provides analytics.
-    Persists data to disk for historical analysis.
+
+    Startup only reads per-model totals and the most recent calls, so it
+    costs the same no matter how much history exists. Best-model lookups
+    are cached between calls to ``record_call``.
     """
 
-    def __init__(self, storage_path: Optional[Path] = None):
+    def __init__(
+        self,
+        storage_path: Optional[Path] = None,
+        raw_sample_limit: int = RAW_SAMPLE_LIMIT,
+        raw_retention_days: float = RAW_RETENTION_DAYS,
+        bucket_retention_days: float = BUCKET_RETENTION_DAYS,
+    ):
         """
         Initialize performance tracker.
 
         Args:
-            storage_path: Path to store metrics (default: ./llm_performance.jsonl)
+            storage_path: Path to store metrics (default: ./llm_performance.db).
+                          A ``.jsonl`` path from older versions is imported
+                          once into a SQLite file next to it.
+            raw_sample_limit: Recent calls kept in memory
+            raw_retention_days: Days raw samples are kept on disk
+            bucket_retention_days: Days hourly aggregates are kept on disk
         """
         if storage_path is None:
-            storage_path = Path("llm_performance.jsonl")
+            storage_path = Path("llm_performance.db")
 
-        self.storage_path = storage_path
-        self.metrics: List[PerformanceMetric] = []
+        self.storage_path = Path(storage_path)
+        self.db_path = (
+            self.storage_path.with_suffix(".db")
+            if self.storage_path.suffix == ".jsonl" else self.storage_path
+        )
+        self.raw_retention_days = raw_retention_days
+        self.bucket_retention_days = bucket_retention_days
+
+        # Recent calls only; older ones are queried from disk
+        self.metrics: Deque[PerformanceMetric] = deque(maxlen=raw_sample_limit)
 
-        # In-memory aggregated stats per model
+        # All-time aggregated stats per model
         self._stats: Dict[str, ModelStats] = {}
 
-        # Load existing metrics if available
+        # Open hourly buckets, keyed by (model, bucket_start)
+        self._buckets: Dict[Tuple[str, int], ModelStats] = {}
+
+        self._best_cache: Dict[Any, Optional[str]] = {}
+        self._last_prune = 0.0
+        self._lock = threading.Lock()
+
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SCHEMA)
+
+        self._migrate_jsonl()
         self._load_metrics()
 
     def _load_metrics(self):
-        """Load metrics from disk."""
-        if not self.storage_path.exists():
+        """Load per-model totals and the most recent calls from disk."""
+        for row in self._conn.execute(f"SELECT model, {_AGGREGATE_COLUMNS} FROM model_totals"):
+            self._stats[row[0]] = _stats_from_row(row[0], row[1:])
+
+        if self.metrics.maxlen:
+            rows = self._conn.execute(
+                "SELECT * FROM samples ORDER BY timestamp DESC LIMIT ?", (self.metrics.maxlen,)
+            ).fetchall()
+            self.metrics.extend(_metric_from_row(row) for row in reversed(rows))
+
+        self.prune()
+
+    def _migrate_jsonl(self):
+        """Import a legacy JSONL metrics file once (the file is left in place)."""
+        legacy = self.storage_path.with_suffix(".jsonl")
+        if legacy == self.db_path or not legacy.exists():
+            return
+        if self._conn.execute("SELECT 1 FROM model_totals LIMIT 1").fetchone():
             return
 
         try:
-            with open(self.storage_path, "r") as f:
+            metrics = []
+            with open(legacy, "r") as f:
                 for line in f:
                     if line.strip():
-                        data = json.loads(line)
-                        metric = PerformanceMetric.from_dict(data)
-                        self.metrics.append(metric)
-                        self._update_stats(metric)
-
-            print(f"[PerformanceTracker] Loaded {len(self.metrics)} historical metrics")
-
+                        metrics.append(PerformanceMetric.from_dict(json.loads(line)))
         except Exception as e:
-            print(f"[PerformanceTracker] Error loading metrics: {e}")
+            print(f"[PerformanceTracker] Error loading legacy metrics: {e}")
+            return
 
-    def _save_metric(self, metric: PerformanceMetric):
-        """Append metric to disk storage."""
-        try:
-            with open(self.storage_path, "a") as f:
-                f.write(json.dumps(metric.to_dict()) + "\n")
-        except Exception as e:
-            print(f"[PerformanceTracker] Error saving metric: {e}")
+        if metrics:
+            self._store(metrics)
+            print(f"[PerformanceTracker] Imported {len(metrics)} metrics from {legacy}")
+
+    # -------------------------------------------------------------------------
+    # Writes
+    # -------------------------------------------------------------------------
+
+    def _bucket(self, model: str, bucket_start: int) -> ModelStats:
+        """Open bucket for ``model``, seeded from disk after a restart."""
+        key = (model, bucket_start)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            row = self._conn.execute(
+                f"SELECT {_AGGREGATE_COLUMNS} FROM model_buckets WHERE model = ? AND bucket_start = ?",
+                key,
+            ).fetchone()
+            bucket = _stats_from_row(model, row) if row else ModelStats.empty(model)
+            self._buckets[key] = bucket
+        return bucket
+
+    def _store(self, metrics: List[PerformanceMetric]):
+        """Fold metrics into memory and persist them in one transaction."""
+        with self._lock:
+            touched_models = set()
+            touched_buckets = set()
+            for metric in metrics:
+                self._update_stats(metric)
+                bucket_start = int(metric.timestamp // BUCKET_SECONDS * BUCKET_SECONDS)
+                self._bucket(metric.model, bucket_start).add(metric)
+                touched_models.add(metric.model)
+                touched_buckets.add((metric.model, bucket_start))
+
+            with self._conn:
+                self._conn.executemany(
+                    "INSERT INTO samples VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [
+                        (m.timestamp, m.model, m.latency_ms, m.cost_usd, int(m.success),
+                         m.quality_score, m.prompt_tokens, m.completion_tokens, m.task_type)
+                        for m in metrics
+                    ],
+                )
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO model_totals (model, {_AGGREGATE_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(model, *_stats_values(self._stats[model])) for model in touched_models],
+                )
+                self._conn.executemany(
+                    f"INSERT OR REPLACE INTO model_buckets (model, bucket_start, {_AGGREGATE_COLUMNS}) "
+                    "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                    [(*key, *_stats_values(self._buckets[key])) for key in touched_buckets],
+                )
+
+            # Buckets of earlier hours are final once written; stop holding them
+            latest: Dict[str, int] = {}
+            for model, start in self._buckets:
+                latest[model] = max(start, latest.get(model, start))
+            for key in [k for k in self._buckets if k[1] < latest[k[0]]]:
+                del self._buckets[key]
 
     def _update_stats(self, metric: PerformanceMetric):
         """Update aggregated statistics."""
-        model = metric.model
-
-        if model not in self._stats:
-            self._stats[model] = ModelStats(
-                model=model,
-                total_calls=0,
-                successful_calls=0,
-                failed_calls=0,
-                total_latency_ms=0.0,
-                total_cost_usd=0.0,
-                total_tokens=0,
-            )
-
-        stats = self._stats[model]
-        stats.total_calls += 1
-
-        if metric.success:
-            stats.successful_calls += 1
-            stats.total_latency_ms += metric.latency_ms
-        else:
-            stats.failed_calls += 1
-
-        stats.total_cost_usd += metric.cost_usd
-        stats.total_tokens += metric.prompt_tokens + metric.completion_tokens
+        if metric.model not in self._stats:
+            self._stats[metric.model] = ModelStats.empty(metric.model)
+        self._stats[metric.model].add(metric)
+        self._best_cache.clear()
 
     async def record_call(
         self,
@@ -214,8 +510,43 @@ class PerformanceTracker:
         )
 
         self.metrics.append(metric)
-        self._update_stats(metric)
-        self._save_metric(metric)
+        try:
+            self._store([metric])
+        except Exception as e:
+            print(f"[PerformanceTracker] Error saving metric: {e}")
+
+        if metric.timestamp - self._last_prune > PRUNE_INTERVAL_SECONDS:
+            self.prune()
+
+    def prune(self, now: Optional[float] = None) -> Dict[str, int]:
+        """
+        Drop raw samples and hourly buckets past their retention.
+
+        All-time per-model totals are never pruned.
+
+        Returns:
+            Number of deleted samples and buckets
+        """
+        now = now or time.time()
+        self._last_prune = now
+        with self._lock, self._conn:
+            samples = self._conn.execute(
+                "DELETE FROM samples WHERE timestamp < ?",
+                (now - self.raw_retention_days * 86400,),
+            ).rowcount
+            buckets = self._conn.execute(
+                "DELETE FROM model_buckets WHERE bucket_start < ?",
+                (now - self.bucket_retention_days * 86400,),
+            ).rowcount
+        return {"samples": samples, "buckets": buckets}
+
+    def close(self):
+        """Close the metrics database."""
+        self._conn.close()
+
+    # -------------------------------------------------------------------------
+    # Queries
+    # -------------------------------------------------------------------------
 
     def get_model_stats(self, model: str) -> Optional[ModelStats]:
         """
@@ -233,55 +564,59 @@ class PerformanceTracker:
         """Get statistics for all models."""
         return self._stats.copy()
 
-    def get_best_model_for_latency(self) -> Optional[str]:
-        """Get model with best (lowest) average latency."""
-        if not self._stats:
-            return None
-
-        best_model = None
-        best_latency = float("inf")
+    def _best(self, key: Any, score, eligible) -> Optional[str]:
+        """Model with the lowest ``score`` among ``eligible`` ones (cached)."""
+        if key not in self._best_cache:
+            candidates = [s for s in self._stats.values() if eligible(s)]
+            self._best_cache[key] = (
+                min(candidates, key=score).model if candidates else None
+            )
+        return self._best_cache[key]
 
-        for model, stats in self._stats.items():
-            if stats.successful_calls > 0:
-                avg_latency = stats.avg_latency_ms
-                if avg_latency < best_latency:
-                    best_latency = avg_latency
-                    best_model = model
+    def get_best_model_for_latency(self, percentile: Optional[float] = None) -> Optional[str]:
+        """
+        Get model with best (lowest) latency.
 
-        return best_model
+        Args:
+            percentile: Compare this latency quantile (e.g. 0.95) instead
+                        of the average
+        """
+        if percentile is None:
+            return self._best("latency", lambda s: s.avg_latency_ms, lambda s: s.successful_calls > 0)
+        return self._best(
+            ("latency", percentile),
+            lambda s: s.latency_percentile(percentile),
+            lambda s: s.successful_calls > 0,
+        )
 
     def get_best_model_for_cost(self) -> Optional[str]:
         """Get model with best (lowest) average cost."""
-        if not self._stats:
-            return None
-
-        best_model = None
-        best_cost = float("inf")
-
-        for model, stats in self._stats.items():
-            if stats.total_calls > 0:
-                avg_cost = stats.avg_cost_per_call
-                if avg_cost < best_cost:
-                    best_cost = avg_cost
-                    best_model = model
-
-        return best_model
+        return self._best("cost", lambda s: s.avg_cost_per_call, lambda s: s.total_calls > 0)
 
     def get_best_model_for_reliability(self) -> Optional[str]:
         """Get model with highest success rate."""
-        if not self._stats:
-            return None
-
-        best_model = None
-        best_rate = 0.0
-
-        for model, stats in self._stats.items():
-            if stats.total_calls >= 5:  # Require minimum 5 calls
-                if stats.success_rate > best_rate:
-                    best_rate = stats.success_rate
-                    best_model = model
+        # Require minimum 5 calls
+        return self._best(
+            "reliability",
+            lambda s: -s.success_rate,
+            lambda s: s.total_calls >= 5 and s.success_rate > 0,
+        )
 
-        return best_model
+    def iter_metrics(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        model: Optional[str] = None,
+    ) -> Iterator[PerformanceMetric]:
+        """Stream raw samples in time order (within raw retention)."""
+        query = "SELECT * FROM samples WHERE timestamp BETWEEN ? AND ?"
+        params: List[Any] = [start_time or 0, end_time or time.time()]
+        if model:
+            query += " AND model = ?"
+            params.append(model)
+
+        for row in self._conn.execute(query + " ORDER BY timestamp", params):
+            yield _metric_from_row(row)
 
     def get_metrics_by_time_range(
         self,
@@ -291,6 +626,9 @@ class PerformanceTracker:
         """
         Get metrics within a time range.
 
+        Raw samples are kept for ``raw_retention_days``; use
+        ``get_bucketed_stats`` for longer ranges.
+
         Args:
             start_time: Start timestamp (default: 0)
             end_time: End timestamp (default: now)
@@ -298,12 +636,52 @@ class PerformanceTracker:
         Returns:
             List of metrics in range
         """
-        start = start_time or 0
-        end = end_time or time.time()
+        return list(self.iter_metrics(start_time, end_time))
+
+    def get_bucketed_stats(
+        self,
+        start_time: Optional[float] = None,
+        end_time: Optional[float] = None,
+        model: Optional[str] = None,
+        bucket_seconds: int = BUCKET_SECONDS,
+    ) -> List[Dict[str, Any]]:
+        """
+        Per-model aggregates over time, from the hourly buckets.
+
+        Args:
+            start_time: Start timestamp (default: 0)
+            end_time: End timestamp (default: now)
+            model: Only this model
+            bucket_seconds: Output resolution, a multiple of one hour
+
+        Returns:
+            One dict per (bucket_start, model), ordered by time
+        """
+        query = (
+            f"SELECT model, bucket_start, {_AGGREGATE_COLUMNS} FROM model_buckets "
+            "WHERE bucket_start BETWEEN ? AND ?"
+        )
+        params: List[Any] = [
+            (start_time or 0) // BUCKET_SECONDS * BUCKET_SECONDS,
+            end_time or time.time(),
+        ]
+        if model:
+            query += " AND model = ?"
+            params.append(model)
+
+        merged: Dict[Tuple[int, str], ModelStats] = {}
+        with self._lock:
+            for row in self._conn.execute(query + " ORDER BY bucket_start", params):
+                key = (row[1] // bucket_seconds * bucket_seconds, row[0])
+                stats = _stats_from_row(row[0], row[2:])
+                if key in merged:
+                    merged[key].merge(stats)
+                else:
+                    merged[key] = stats
 
         return [
-            m for m in self.metrics
-            if start <= m.timestamp <= end
+            {"bucket_start": start, **stats.to_dict()}
+            for (start, _), stats in merged.items()
         ]
 
     def get_recent_metrics(self, count: int = 100) -> List[PerformanceMetric]:
@@ -316,7 +694,9 @@ class PerformanceTracker:
         Returns:
             List of recent metrics
         """
-        return self.metrics[-count:] if self.metrics else []
+        if count <= 0:
+            return []
+        return list(self.metrics)[-count:]
 
     def get_summary_report(self) -> Dict[str, Any]:
         """
@@ -325,7 +705,7 @@ class PerformanceTracker:
         Returns:
             Dict with overall statistics and per-model breakdown
         """
-        if not self.metrics:
+        if not self._stats:
             return {
                 "total_calls": 0,
                 "models": {},
@@ -333,14 +713,17 @@ class PerformanceTracker:
             }
 
         # Overall statistics
-        total_calls = len(self.metrics)
-        successful_calls = sum(1 for m in self.metrics if m.success)
-        total_cost = sum(m.cost_usd for m in self.metrics)
-        total_tokens = sum(m.prompt_tokens + m.completion_tokens for m in self.metrics)
+        total_calls = sum(s.total_calls for s in self._stats.values())
+        successful_calls = sum(s.successful_calls for s in self._stats.values())
+        total_cost = sum(s.total_cost_usd for s in self._stats.values())
+        total_tokens = sum(s.total_tokens for s in self._stats.values())
 
         # Quality scores (if any)
-        quality_scores = [m.quality_score for m in self.metrics if m.quality_score is not None]
-        avg_quality = sum(quality_scores) / len(quality_scores) if quality_scores else None
+        quality_count = sum(s.quality_count for s in self._stats.values())
+        avg_quality = (
+            sum(s.quality_sum for s in self._stats.values()) / quality_count
+            if quality_count else None
+        )
 
         # Per-model breakdown
         model_breakdown = {
@@ -368,17 +751,14 @@ class PerformanceTracker:
 
     def export_to_csv(self, output_path: Path):
         """
-        Export metrics to CSV format.
+        Export retained raw metrics to CSV format.
 
         Args:
             output_path: Output file path
         """
         import csv
 
-        if not self.metrics:
-            print("[PerformanceTracker] No metrics to export")
-            return
-
+        exported = 0
         with open(output_path, "w", newline="") as f:
             writer = csv.writer(f)
 
@@ -390,7 +770,7 @@ class PerformanceTracker:
             ])
 
             # Data rows
-            for metric in self.metrics:
+            for metric in self.iter_metrics():
                 dt = datetime.fromtimestamp(metric.timestamp).isoformat()
                 total_tokens = metric.prompt_tokens + metric.completion_tokens
 
@@ -407,5 +787,11 @@ class PerformanceTracker:
                     total_tokens,
                     metric.task_type or "",
                 ])
+                exported += 1
+
+        if not exported:
+            Path(output_path).unlink()
+            print("[PerformanceTracker] No metrics to export")
+            return
 
-        print(f"[PerformanceTracker] Exported {len(self.metrics)} metrics to {output_path}")
+        print(f"[PerformanceTracker] Exported {exported} metrics to {output_path}")
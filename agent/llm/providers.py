@@ -35,6 +35,12 @@ except ImportError:
     HAS_AIOHTTP = False
     aiohttp = None  # type: ignore
 
+# Handle both relative and absolute imports
+try:
+    from .http_pool import get_http_pool
+except ImportError:
+    from http_pool import get_http_pool
+
 
 # =============================================================================
 # Data Models
@@ -92,6 +98,64 @@ class ChatResponse:
         }
 
 
+@dataclass
+class StreamChunk:
+    """
+    One piece of a streamed response.
+
+    Content chunks carry text only. The last chunk has ``done=True`` and
+    carries usage; providers that don't report usage while streaming get
+    an estimate from the streamed text.
+    """
+    content: str = ""
+    provider: str = ""
+    model: str = ""
+    done: bool = False
+    input_tokens: int = 0
+    output_tokens: int = 0
+    cost: float = 0.0
+    finish_reason: Optional[str] = None
+    metadata: Dict[str, Any] = field(default_factory=dict)
+
+    @property
+    def total_tokens(self) -> int:
+        return self.input_tokens + self.output_tokens
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "content": self.content,
+            "provider": self.provider,
+            "model": self.model,
+            "done": self.done,
+            "input_tokens": self.input_tokens,
+            "output_tokens": self.output_tokens,
+            "total_tokens": self.total_tokens,
+            "cost": self.cost,
+            "finish_reason": self.finish_reason,
+            "metadata": self.metadata
+        }
+
+
+def estimate_tokens(text: str) -> int:
+    """Rough token count (~4 characters per token) for unreported usage"""
+    return (len(text) + 3) // 4 if text else 0
+
+
+def estimate_message_tokens(messages: List[Dict[str, str]]) -> int:
+    return sum(estimate_tokens(str(m.get("content", ""))) for m in messages)
+
+
+async def _iter_sse_data(response: "httpx.Response") -> AsyncIterator[Dict[str, Any]]:
+    """JSON payloads of the ``data:`` lines of a server-sent-events response"""
+    async for line in response.aiter_lines():
+        if not line.startswith("data:"):
+            continue
+        data = line[5:].strip()
+        if not data or data == "[DONE]":
+            continue
+        yield json.loads(data)
+
+
 @dataclass
 class ProviderHealth:
     """Health status of a provider"""
@@ -202,6 +266,126 @@ class LLMProvider(ABC):
         input_cost, output_cost = self.get_cost_per_token(model)
         return (input_tokens * input_cost / 1000) + (output_tokens * output_cost / 1000)
 
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[StreamChunk]:
+        """
+        Stream a response as it is generated.
+
+        Providers without a streaming API fall back to one chunk holding
+        the whole response.
+
+        Args:
+            messages: List of message dicts with 'role' and 'content'
+            model: Model to use (provider-specific default if None)
+            temperature: Sampling temperature
+            max_tokens: Maximum tokens in response
+            **kwargs: Additional provider-specific parameters
+
+        Yields:
+            StreamChunk content pieces, then a final chunk with usage
+        """
+        response = await self.chat(messages, model, temperature, max_tokens, **kwargs)
+        if response.content:
+            yield StreamChunk(content=response.content, provider=self.name, model=response.model)
+        yield StreamChunk(
+            provider=self.name,
+            model=response.model,
+            done=True,
+            input_tokens=response.input_tokens,
+            output_tokens=response.output_tokens,
+            cost=response.cost,
+            finish_reason=response.finish_reason,
+            metadata=dict(response.metadata)
+        )
+
+    def _final_chunk(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        text: str,
+        input_tokens: int,
+        output_tokens: int,
+        finish_reason: Optional[str],
+        start_time: datetime
+    ) -> StreamChunk:
+        """Closing chunk of a stream; also records the provider as healthy"""
+        estimated = not (input_tokens and output_tokens)
+        input_tokens = input_tokens or estimate_message_tokens(messages)
+        output_tokens = output_tokens or estimate_tokens(text)
+
+        self._health.status = ProviderStatus.HEALTHY
+        self._health.latency_ms = (datetime.now() - start_time).total_seconds() * 1000
+        self._health.consecutive_failures = 0
+
+        return StreamChunk(
+            provider=self.name,
+            model=model,
+            done=True,
+            input_tokens=input_tokens,
+            output_tokens=output_tokens,
+            cost=self.calculate_cost(input_tokens, output_tokens, model),
+            finish_reason=finish_reason or "stop",
+            metadata={"estimated_usage": estimated}
+        )
+
+    def _record_failure(self, error: Exception):
+        self._health.consecutive_failures += 1
+        self._health.last_error = str(error)
+        if self._health.consecutive_failures >= 3:
+            self._health.status = ProviderStatus.UNHEALTHY
+
+    async def _stream_openai_compatible(
+        self,
+        url: str,
+        headers: Dict[str, str],
+        payload: Dict[str, Any],
+        messages: List[Dict[str, str]]
+    ) -> AsyncIterator[StreamChunk]:
+        """Stream an OpenAI-style ``/chat/completions`` request"""
+        model = payload["model"]
+        start_time = datetime.now()
+        payload = {**payload, "stream": True, "stream_options": {"include_usage": True}}
+        parts: List[str] = []
+        input_tokens = output_tokens = 0
+        finish_reason = None
+
+        try:
+            async with self._http(url).stream(
+                "POST", url, headers=headers, json=payload, timeout=self._timeout()
+            ) as response:
+                response.raise_for_status()
+                async for event in _iter_sse_data(response):
+                    usage = event.get("usage") or {}
+                    input_tokens = usage.get("prompt_tokens", input_tokens)
+                    output_tokens = usage.get("completion_tokens", output_tokens)
+                    for choice in event.get("choices") or []:
+                        finish_reason = choice.get("finish_reason") or finish_reason
+                        text = (choice.get("delta") or {}).get("content")
+                        if text:
+                            parts.append(text)
+                            yield StreamChunk(content=text, provider=self.name, model=model)
+        except Exception as e:
+            self._record_failure(e)
+            raise
+
+        yield self._final_chunk(
+            model, messages, "".join(parts), input_tokens, output_tokens, finish_reason, start_time
+        )
+
+    def _http(self, url: str) -> "httpx.AsyncClient":
+        """Shared keep-alive client for the host of ``url`` (don't close it)"""
+        return get_http_pool().client(url)
+
+    def _timeout(self, seconds: Optional[float] = None) -> "httpx.Timeout":
+        """Request timeout with connect/pool waits capped at the deadline"""
+        return get_http_pool().timeout(seconds or getattr(self, "timeout", None))
+
 
 # =============================================================================
 # OpenAI Provider
@@ -275,14 +459,14 @@ class OpenAIProvider(LLMProvider):
                 payload[key] = value
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._http(self.base_url).post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self._timeout()
+            )
+            response.raise_for_status()
+            data = response.json()
 
             latency = (datetime.now() - start_time).total_seconds() * 1000
 
@@ -316,6 +500,38 @@ class OpenAIProvider(LLMProvider):
                 self._health.status = ProviderStatus.UNHEALTHY
             raise
 
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[StreamChunk]:
+        if not HAS_HTTPX:
+            raise RuntimeError(
+                "httpx is required for OpenAI provider. Install with: pip install httpx"
+            )
+
+        payload = {
+            "model": model or self.default_model,
+            "messages": messages,
+            "temperature": temperature
+        }
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+        for key, value in kwargs.items():
+            if key not in payload:
+                payload[key] = value
+
+        async for chunk in self._stream_openai_compatible(
+            f"{self.base_url}/chat/completions",
+            {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
+            payload,
+            messages
+        ):
+            yield chunk
+
     def get_cost_per_token(self, model: Optional[str] = None) -> Tuple[float, float]:
         model = model or self.default_model
         return self.MODEL_COSTS.get(model, (0.01, 0.03))
@@ -334,12 +550,12 @@ class OpenAIProvider(LLMProvider):
         try:
             # Test actual API connectivity with a lightweight request
             start_time = datetime.now()
-            async with httpx.AsyncClient(timeout=10) as client:
-                response = await client.get(
-                    f"{self.base_url}/models",
-                    headers={"Authorization": f"Bearer {self.api_key}"}
-                )
-                response.raise_for_status()
+            response = await self._http(self.base_url).get(
+                f"{self.base_url}/models",
+                headers={"Authorization": f"Bearer {self.api_key}"},
+                timeout=self._timeout(10)
+            )
+            response.raise_for_status()
 
             latency = (datetime.now() - start_time).total_seconds() * 1000
             self._health.status = ProviderStatus.HEALTHY
@@ -441,14 +657,14 @@ class AnthropicProvider(LLMProvider):
             payload["system"] = system_message
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/messages",
-                    headers=headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._http(self.base_url).post(
+                f"{self.base_url}/messages",
+                headers=headers,
+                json=payload,
+                timeout=self._timeout()
+            )
+            response.raise_for_status()
+            data = response.json()
 
             latency = (datetime.now() - start_time).total_seconds() * 1000
 
@@ -485,6 +701,80 @@ class AnthropicProvider(LLMProvider):
                 self._health.status = ProviderStatus.UNHEALTHY
             raise
 
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[StreamChunk]:
+        if not HAS_HTTPX:
+            raise RuntimeError(
+                "httpx is required for Anthropic provider. Install with: pip install httpx"
+            )
+
+        model = model or self.default_model
+        start_time = datetime.now()
+
+        system_message = None
+        chat_messages = []
+        for msg in messages:
+            if msg["role"] == "system":
+                system_message = msg["content"]
+            else:
+                chat_messages.append(msg)
+
+        headers = {
+            "x-api-key": self.api_key,
+            "Content-Type": "application/json",
+            "anthropic-version": "2023-06-01"
+        }
+        payload = {
+            "model": model,
+            "messages": chat_messages,
+            "max_tokens": max_tokens or 4096,
+            "temperature": temperature,
+            "stream": True
+        }
+        if system_message:
+            payload["system"] = system_message
+
+        parts: List[str] = []
+        input_tokens = output_tokens = 0
+        stop_reason = None
+        url = f"{self.base_url}/messages"
+
+        try:
+            async with self._http(url).stream(
+                "POST", url, headers=headers, json=payload, timeout=self._timeout()
+            ) as response:
+                response.raise_for_status()
+                async for event in _iter_sse_data(response):
+                    kind = event.get("type")
+                    if kind == "content_block_delta":
+                        text = event.get("delta", {}).get("text")
+                        if text:
+                            parts.append(text)
+                            yield StreamChunk(content=text, provider=self.name, model=model)
+                    elif kind == "message_start":
+                        usage = event.get("message", {}).get("usage", {})
+                        input_tokens = usage.get("input_tokens", 0)
+                        output_tokens = usage.get("output_tokens", 0)
+                    elif kind == "message_delta":
+                        output_tokens = event.get("usage", {}).get("output_tokens", output_tokens)
+                        stop_reason = event.get("delta", {}).get("stop_reason") or stop_reason
+                    elif kind == "error":
+                        raise RuntimeError(event.get("error", {}).get("message", "stream error"))
+        except Exception as e:
+            self._record_failure(e)
+            raise
+
+        yield self._final_chunk(
+            model, messages, "".join(parts), input_tokens, output_tokens,
+            stop_reason or "end_turn", start_time
+        )
+
     def get_cost_per_token(self, model: Optional[str] = None) -> Tuple[float, float]:
         model = model or self.default_model
         return self.MODEL_COSTS.get(model, (0.003, 0.015))
@@ -553,13 +843,13 @@ class OllamaProvider(LLMProvider):
             payload["options"]["num_predict"] = max_tokens
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.host}/api/chat",
-                    json=payload
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._http(self.host).post(
+                f"{self.host}/api/chat",
+                json=payload,
+                timeout=self._timeout()
+            )
+            response.raise_for_status()
+            data = response.json()
 
             latency = (datetime.now() - start_time).total_seconds() * 1000
 
@@ -592,14 +882,67 @@ class OllamaProvider(LLMProvider):
                 self._health.status = ProviderStatus.UNHEALTHY
             raise
 
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[StreamChunk]:
+        model = model or self.default_model
+        start_time = datetime.now()
+
+        payload = {
+            "model": model,
+            "messages": messages,
+            "stream": True,
+            "options": {
+                "temperature": temperature
+            }
+        }
+        if max_tokens:
+            payload["options"]["num_predict"] = max_tokens
+
+        parts: List[str] = []
+        last: Dict[str, Any] = {}
+        url = f"{self.host}/api/chat"
+
+        try:
+            # Ollama streams newline-delimited JSON objects
+            async with self._http(self.host).stream(
+                "POST", url, json=payload, timeout=self._timeout()
+            ) as response:
+                response.raise_for_status()
+                async for line in response.aiter_lines():
+                    if not line.strip():
+                        continue
+                    last = json.loads(line)
+                    if last.get("error"):
+                        raise RuntimeError(last["error"])
+                    text = last.get("message", {}).get("content")
+                    if text:
+                        parts.append(text)
+                        yield StreamChunk(content=text, provider=self.name, model=model)
+        except Exception as e:
+            self._record_failure(e)
+            raise
+
+        yield self._final_chunk(
+            model, messages, "".join(parts), last.get("prompt_eval_count", 0),
+            last.get("eval_count", 0), last.get("done_reason"), start_time
+        )
+
     def get_cost_per_token(self, model: Optional[str] = None) -> Tuple[float, float]:
         return (0.0, 0.0)  # Local models are free
 
     async def health_check(self) -> ProviderHealth:
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(f"{self.host}/api/tags")
-                response.raise_for_status()
+            response = await self._http(self.host).get(
+                f"{self.host}/api/tags",
+                timeout=self._timeout(5)
+            )
+            response.raise_for_status()
 
             self._health.status = ProviderStatus.HEALTHY
             self._health.last_check = datetime.now()
@@ -615,11 +958,13 @@ class OllamaProvider(LLMProvider):
     async def list_local_models(self) -> List[str]:
         """Get list of models available locally"""
         try:
-            async with httpx.AsyncClient(timeout=5) as client:
-                response = await client.get(f"{self.host}/api/tags")
-                response.raise_for_status()
-                data = response.json()
-                return [m["name"] for m in data.get("models", [])]
+            response = await self._http(self.host).get(
+                f"{self.host}/api/tags",
+                timeout=self._timeout(5)
+            )
+            response.raise_for_status()
+            data = response.json()
+            return [m["name"] for m in data.get("models", [])]
         except Exception:
             return []
 
@@ -693,14 +1038,14 @@ class DeepSeekProvider(LLMProvider):
             payload["max_tokens"] = max_tokens
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/chat/completions",
-                    headers=headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._http(self.base_url).post(
+                f"{self.base_url}/chat/completions",
+                headers=headers,
+                json=payload,
+                timeout=self._timeout()
+            )
+            response.raise_for_status()
+            data = response.json()
 
             latency = (datetime.now() - start_time).total_seconds() * 1000
 
@@ -731,6 +1076,30 @@ class DeepSeekProvider(LLMProvider):
                 self._health.status = ProviderStatus.UNHEALTHY
             raise
 
+    async def stream_chat(
+        self,
+        messages: List[Dict[str, str]],
+        model: Optional[str] = None,
+        temperature: float = 0.7,
+        max_tokens: Optional[int] = None,
+        **kwargs
+    ) -> AsyncIterator[StreamChunk]:
+        payload = {
+            "model": model or self.default_model,
+            "messages": messages,
+            "temperature": temperature
+        }
+        if max_tokens:
+            payload["max_tokens"] = max_tokens
+
+        async for chunk in self._stream_openai_compatible(
+            f"{self.base_url}/chat/completions",
+            {"Authorization": f"Bearer {self.api_key}", "Content-Type": "application/json"},
+            payload,
+            messages
+        ):
+            yield chunk
+
     def get_cost_per_token(self, model: Optional[str] = None) -> Tuple[float, float]:
         model = model or self.default_model
         return self.MODEL_COSTS.get(model, (0.00014, 0.00028))
@@ -809,14 +1178,14 @@ class QwenProvider(LLMProvider):
             payload["parameters"]["max_tokens"] = max_tokens
 
         try:
-            async with httpx.AsyncClient(timeout=self.timeout) as client:
-                response = await client.post(
-                    f"{self.base_url}/services/aigc/text-generation/generation",
-                    headers=headers,
-                    json=payload
-                )
-                response.raise_for_status()
-                data = response.json()
+            response = await self._http(self.base_url).post(
+                f"{self.base_url}/services/aigc/text-generation/generation",
+                headers=headers,
+                json=payload,
+                timeout=self._timeout()
+            )
+            response.raise_for_status()
+            data = response.json()
 
             latency = (datetime.now() - start_time).total_seconds() * 1000
 
@@ -876,6 +1245,7 @@ __all__ = [
     # Data classes
     'ModelInfo',
     'ChatResponse',
+    'StreamChunk',
     'ProviderHealth',
 
     # Base class
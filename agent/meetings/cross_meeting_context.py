@@ -29,12 +29,17 @@ Usage:
 
 from __future__ import annotations
 
+import heapq
 import json
-from collections import defaultdict
+import sqlite3
+import threading
+from bisect import insort
+from collections import OrderedDict, defaultdict
+from collections.abc import Mapping
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Set
+from typing import Any, Dict, Iterator, List, Optional, Set, Tuple
 
 try:
     from .intelligence.meeting_analyzer import ActionItem
@@ -122,6 +127,254 @@ class MeetingSeries:
     action_items_over_time: List[int] = field(default_factory=list)
 
 
+# =============================================================================
+# Indexed Store
+# =============================================================================
+
+@dataclass
+class MeetingIndexEntry:
+    """Fields needed for indexing and scoring, kept in memory for every meeting"""
+
+    meeting_id: str
+    title: str
+    started_at: datetime
+    ended_at: Optional[datetime]
+    participants: Tuple[str, ...]
+    topics: Tuple[str, ...]
+    project: Optional[str]
+    series_id: Optional[str]
+    meeting_type: str
+    num_action_items: int
+    # (assignee, status) per action item
+    assignments: Tuple[Tuple[Optional[str], str], ...] = ()
+
+    @classmethod
+    def from_meeting(cls, meeting: MeetingRecord) -> "MeetingIndexEntry":
+        return cls(
+            meeting_id=meeting.meeting_id,
+            title=meeting.title,
+            started_at=meeting.started_at,
+            ended_at=meeting.ended_at,
+            participants=tuple(dict.fromkeys(meeting.participants)),
+            topics=tuple(dict.fromkeys(meeting.topics)),
+            project=meeting.project,
+            series_id=meeting.series_id,
+            meeting_type=meeting.meeting_type,
+            num_action_items=len(meeting.action_items),
+            assignments=tuple(
+                (item.assignee, _action_item_status(item)) for item in meeting.action_items
+            ),
+        )
+
+
+def _action_item_status(item: Any) -> str:
+    return getattr(item, "status", None) or "pending"
+
+
+def _meeting_to_dict(meeting: MeetingRecord) -> Dict[str, Any]:
+    return {
+        "meeting_id": meeting.meeting_id,
+        "title": meeting.title,
+        "started_at": meeting.started_at.isoformat(),
+        "ended_at": meeting.ended_at.isoformat() if meeting.ended_at else None,
+        "participants": meeting.participants,
+        "organizer": meeting.organizer,
+        "key_points": meeting.key_points,
+        "decisions": meeting.decisions,
+        "questions": meeting.questions,
+        "meeting_type": meeting.meeting_type,
+        "project": meeting.project,
+        "series_id": meeting.series_id,
+        "parent_meeting_id": meeting.parent_meeting_id,
+        "topics": meeting.topics,
+        "tags": meeting.tags,
+        # Action items simplified
+        "action_items": [
+            {
+                "id": item.id,
+                "description": item.description,
+                "assignee": item.assignee,
+                "priority": item.priority,
+                "status": _action_item_status(item),
+            }
+            for item in meeting.action_items
+        ],
+    }
+
+
+def _meeting_from_dict(data: Dict[str, Any]) -> MeetingRecord:
+    meeting = MeetingRecord(
+        meeting_id=data["meeting_id"],
+        title=data["title"],
+        started_at=datetime.fromisoformat(data["started_at"]),
+        ended_at=datetime.fromisoformat(data["ended_at"]) if data.get("ended_at") else None,
+        participants=data.get("participants", []),
+        organizer=data.get("organizer"),
+        key_points=data.get("key_points", []),
+        decisions=data.get("decisions", []),
+        questions=data.get("questions", []),
+        meeting_type=data.get("meeting_type", "general"),
+        project=data.get("project"),
+        series_id=data.get("series_id"),
+        parent_meeting_id=data.get("parent_meeting_id"),
+        topics=data.get("topics", []),
+        tags=data.get("tags", []),
+    )
+
+    # Reconstruct action items
+    for item_data in data.get("action_items", []):
+        action_item = ActionItem(
+            id=item_data["id"],
+            description=item_data["description"],
+            assignee=item_data.get("assignee"),
+            priority=item_data.get("priority", "normal"),
+        )
+        if "status" in item_data:
+            action_item.status = item_data["status"]
+        meeting.action_items.append(action_item)
+
+    return meeting
+
+
+class MeetingStore:
+    """
+    Single SQLite store for all meetings.
+
+    Index columns (participants, topics, project, ...) are read at startup;
+    the full meeting body is only parsed when a meeting is actually needed.
+    """
+
+    def __init__(self, db_path: Path):
+        self.db_path = db_path
+        self._lock = threading.Lock()
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute("""
+            CREATE TABLE IF NOT EXISTS meetings (
+                meeting_id TEXT PRIMARY KEY,
+                title TEXT NOT NULL,
+                started_at TEXT NOT NULL,
+                ended_at TEXT,
+                participants TEXT NOT NULL,
+                topics TEXT NOT NULL,
+                project TEXT,
+                series_id TEXT,
+                meeting_type TEXT,
+                assignments TEXT NOT NULL,
+                body TEXT NOT NULL
+            )
+        """)
+        self._conn.commit()
+
+    def upsert(self, meeting: MeetingRecord):
+        entry = MeetingIndexEntry.from_meeting(meeting)
+        with self._lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO meetings VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (
+                    entry.meeting_id,
+                    entry.title,
+                    entry.started_at.isoformat(),
+                    entry.ended_at.isoformat() if entry.ended_at else None,
+                    json.dumps(entry.participants),
+                    json.dumps(entry.topics),
+                    entry.project,
+                    entry.series_id,
+                    entry.meeting_type,
+                    json.dumps(entry.assignments),
+                    json.dumps(_meeting_to_dict(meeting)),
+                ),
+            )
+            self._conn.commit()
+
+    def contains(self, meeting_id: str) -> bool:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT 1 FROM meetings WHERE meeting_id = ?", (meeting_id,)
+            ).fetchone()
+        return row is not None
+
+    def iter_index(self) -> Iterator[MeetingIndexEntry]:
+        """Yield index entries for every meeting, oldest first"""
+        with self._lock:
+            rows = self._conn.execute(
+                "SELECT meeting_id, title, started_at, ended_at, participants, topics, "
+                "project, series_id, meeting_type, assignments "
+                "FROM meetings ORDER BY started_at"
+            ).fetchall()
+
+        for row in rows:
+            assignments = tuple(tuple(a) for a in json.loads(row[9]))
+            yield MeetingIndexEntry(
+                meeting_id=row[0],
+                title=row[1],
+                started_at=datetime.fromisoformat(row[2]),
+                ended_at=datetime.fromisoformat(row[3]) if row[3] else None,
+                participants=tuple(json.loads(row[4])),
+                topics=tuple(json.loads(row[5])),
+                project=row[6],
+                series_id=row[7],
+                meeting_type=row[8] or "general",
+                num_action_items=len(assignments),
+                assignments=assignments,
+            )
+
+    def load(self, meeting_id: str) -> Optional[MeetingRecord]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT body FROM meetings WHERE meeting_id = ?", (meeting_id,)
+            ).fetchone()
+        return _meeting_from_dict(json.loads(row[0])) if row else None
+
+    def close(self):
+        with self._lock:
+            self._conn.close()
+
+
+class _MeetingView(Mapping):
+    """
+    Read-only mapping of meeting_id -> MeetingRecord.
+
+    Membership and iteration use the in-memory index; records are hydrated
+    from the store on access and kept in a bounded LRU cache.
+    """
+
+    def __init__(self, context: "CrossMeetingContext", cache_size: int):
+        self._context = context
+        self._cache: "OrderedDict[str, MeetingRecord]" = OrderedDict()
+        self._cache_size = cache_size
+
+    def __getitem__(self, meeting_id: str) -> MeetingRecord:
+        if meeting_id not in self._context._index:
+            raise KeyError(meeting_id)
+
+        meeting = self._cache.get(meeting_id)
+        if meeting is None:
+            meeting = self._context._store.load(meeting_id)
+            if meeting is None:
+                raise KeyError(meeting_id)
+            self._put(meeting)
+        else:
+            self._cache.move_to_end(meeting_id)
+        return meeting
+
+    def _put(self, meeting: MeetingRecord):
+        self._cache[meeting.meeting_id] = meeting
+        self._cache.move_to_end(meeting.meeting_id)
+        while len(self._cache) > self._cache_size:
+            self._cache.popitem(last=False)
+
+    def __contains__(self, meeting_id: object) -> bool:
+        return meeting_id in self._context._index
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self._context._index)
+
+    def __len__(self) -> int:
+        return len(self._context._index)
+
+
 # =============================================================================
 # Cross-Meeting Context System
 # =============================================================================
@@ -156,18 +409,22 @@ class CrossMeetingContext:
     def __init__(
         self,
         storage_path: Optional[Path] = None,
+        body_cache_size: int = 256,
     ):
         """
         Initialize cross-meeting context system.
 
         Args:
             storage_path: Path to store context data
+            body_cache_size: Number of hydrated meeting records kept in memory
         """
         self.storage_path = storage_path or Path(".jarvis/meeting_context")
         self.storage_path.mkdir(parents=True, exist_ok=True)
+        self._store = MeetingStore(self.storage_path / "meetings.db")
 
-        # In-memory storage
-        self.meetings: Dict[str, MeetingRecord] = {}
+        # In-memory storage: index entries for every meeting, bodies on demand
+        self._index: Dict[str, MeetingIndexEntry] = {}
+        self.meetings: Mapping[str, MeetingRecord] = _MeetingView(self, body_cache_size)
         self.participant_contexts: Dict[str, ParticipantContext] = {}
         self.meeting_series: Dict[str, MeetingSeries] = {}
 
@@ -175,7 +432,14 @@ class CrossMeetingContext:
         self.meetings_by_participant: Dict[str, List[str]] = defaultdict(list)
         self.meetings_by_project: Dict[str, List[str]] = defaultdict(list)
         self.meetings_by_type: Dict[str, List[str]] = defaultdict(list)
-        self.meetings_by_date: List[tuple[datetime, str]] = []  # (date, meeting_id)
+        self.meetings_by_date: List[Tuple[float, str]] = []  # (-timestamp, meeting_id), newest first
+
+        # Inverted index: topic -> meeting IDs
+        self.meetings_by_topic: Dict[str, Set[str]] = defaultdict(set)
+
+        # Meetings whose pending action items haven't been hydrated yet,
+        # per participant (filled on first get_participant_context)
+        self._unhydrated_pending: Dict[str, Set[str]] = defaultdict(set)
 
         # Load existing data
         self._load_context()
@@ -193,31 +457,58 @@ class CrossMeetingContext:
         Args:
             meeting: Meeting record to add
         """
-        self.meetings[meeting.meeting_id] = meeting
+        if meeting.meeting_id in self._index:
+            self._unindex_meeting(meeting.meeting_id)
 
-        # Update indexes
-        for participant in meeting.participants:
-            self.meetings_by_participant[participant].append(meeting.meeting_id)
-            self._update_participant_context(participant, meeting)
-
-        if meeting.project:
-            self.meetings_by_project[meeting.project].append(meeting.meeting_id)
+        entry = MeetingIndexEntry.from_meeting(meeting)
+        self._index_meeting(entry)
+        self.meetings._put(meeting)
 
-        if meeting.meeting_type:
-            self.meetings_by_type[meeting.meeting_type].append(meeting.meeting_id)
-
-        self.meetings_by_date.append((meeting.started_at, meeting.meeting_id))
-        self.meetings_by_date.sort(key=lambda x: x[0], reverse=True)
+        for participant in entry.participants:
+            self._update_participant_context(participant, meeting)
 
         # Update series if applicable
         if meeting.series_id:
-            self._update_meeting_series(meeting)
+            self._update_meeting_series(entry)
 
         # Persist
         self._save_meeting(meeting)
 
         print(f"[CrossMeetingContext] Added meeting: {meeting.title}")
 
+    def _index_meeting(self, entry: MeetingIndexEntry):
+        """Add a meeting to the in-memory indexes"""
+        meeting_id = entry.meeting_id
+        self._index[meeting_id] = entry
+
+        for participant in entry.participants:
+            self.meetings_by_participant[participant].append(meeting_id)
+
+        for topic in entry.topics:
+            self.meetings_by_topic[topic].add(meeting_id)
+
+        if entry.project:
+            self.meetings_by_project[entry.project].append(meeting_id)
+
+        if entry.meeting_type:
+            self.meetings_by_type[entry.meeting_type].append(meeting_id)
+
+        insort(self.meetings_by_date, (-entry.started_at.timestamp(), meeting_id))
+
+    def _unindex_meeting(self, meeting_id: str):
+        """Remove a meeting's postings before it is re-indexed"""
+        entry = self._index.pop(meeting_id)
+
+        for participant in entry.participants:
+            self.meetings_by_participant[participant].remove(meeting_id)
+        for topic in entry.topics:
+            self.meetings_by_topic[topic].discard(meeting_id)
+        if entry.project:
+            self.meetings_by_project[entry.project].remove(meeting_id)
+        if entry.meeting_type:
+            self.meetings_by_type[entry.meeting_type].remove(meeting_id)
+        self.meetings_by_date.remove((-entry.started_at.timestamp(), meeting_id))
+
     def get_meeting(self, meeting_id: str) -> Optional[MeetingRecord]:
         """Get meeting by ID"""
         return self.meetings.get(meeting_id)
@@ -246,7 +537,18 @@ class CrossMeetingContext:
                 participant_email=participant_email
             )
 
-        return self.participant_contexts[participant_email]
+        context = self.participant_contexts[participant_email]
+
+        # Pending items of meetings loaded from the store are hydrated lazily
+        pending_meetings = self._unhydrated_pending.pop(participant_email, None)
+        if pending_meetings:
+            for meeting_id in sorted(pending_meetings, key=lambda m: self._index[m].started_at):
+                for action_item in self.meetings[meeting_id].action_items:
+                    if (action_item.assignee == participant_email
+                            and _action_item_status(action_item) == "pending"):
+                        context.pending_action_items.append(action_item)
+
+        return context
 
     def _update_participant_context(
         self,
@@ -255,31 +557,42 @@ class CrossMeetingContext:
     ):
         """Update participant context with new meeting"""
         context = self.get_participant_context(participant_email)
+        self._count_participant_meeting(context, MeetingIndexEntry.from_meeting(meeting))
+
+        # Update action items for this participant
+        for action_item in meeting.action_items:
+            if (action_item.assignee == participant_email
+                    and _action_item_status(action_item) == "pending"):
+                context.pending_action_items.append(action_item)
 
+    def _count_participant_meeting(
+        self,
+        context: ParticipantContext,
+        entry: MeetingIndexEntry,
+    ):
+        """Update participant counters from a meeting's index entry"""
         # Update meeting count
         context.meetings_attended += 1
-        context.last_meeting = meeting.started_at
+        context.last_meeting = entry.started_at
 
         # Update topics
-        for topic in meeting.topics:
+        for topic in entry.topics:
             context.frequent_topics[topic] = context.frequent_topics.get(topic, 0) + 1
 
         # Update projects
-        if meeting.project:
-            context.projects.add(meeting.project)
+        if entry.project:
+            context.projects.add(entry.project)
 
         # Update meeting types
-        if meeting.meeting_type:
-            context.meeting_types[meeting.meeting_type] = \
-                context.meeting_types.get(meeting.meeting_type, 0) + 1
+        if entry.meeting_type:
+            context.meeting_types[entry.meeting_type] = \
+                context.meeting_types.get(entry.meeting_type, 0) + 1
 
-        # Update action items for this participant
-        for action_item in meeting.action_items:
-            if action_item.assignee == participant_email:
+        # Update action item counts for this participant
+        for assignee, status in entry.assignments:
+            if assignee == context.participant_email:
                 context.total_action_items += 1
-                if action_item.status == "pending":
-                    context.pending_action_items.append(action_item)
-                elif action_item.status == "completed":
+                if status == "completed":
                     context.completed_action_items += 1
 
     def get_participant_action_items(
@@ -299,14 +612,16 @@ class CrossMeetingContext:
         """
         action_items = []
 
-        for meeting_id in self.meetings_by_participant[participant_email]:
-            meeting = self.meetings.get(meeting_id)
-            if not meeting:
+        for meeting_id in self.meetings_by_participant.get(participant_email, []):
+            entry = self._index.get(meeting_id)
+            # Skip meetings without items for this participant (no hydration)
+            if not entry or not any(a == participant_email for a, _ in entry.assignments):
                 continue
+            meeting = self.meetings[meeting_id]
 
             for action_item in meeting.action_items:
                 if action_item.assignee == participant_email:
-                    if status is None or action_item.status == status:
+                    if status is None or _action_item_status(action_item) == status:
                         action_items.append(action_item)
 
         return action_items
@@ -336,71 +651,55 @@ class CrossMeetingContext:
         Returns:
             List of related meetings, sorted by relevance
         """
-        meeting = self.meetings.get(meeting_id)
+        meeting = self._index.get(meeting_id)
         if not meeting:
             return []
 
-        # Calculate relevance scores
-        related_scores: Dict[str, float] = {}
+        # Calculate relevance scores, touching only postings of the
+        # meeting's own series, project, participants and topics
+        related_scores: Dict[str, float] = defaultdict(float)
 
         # Same series (highest priority)
         if meeting.series_id and meeting.series_id in self.meeting_series:
             series = self.meeting_series[meeting.series_id]
             for series_meeting_id in series.meetings:
-                if series_meeting_id != meeting_id:
-                    related_scores[series_meeting_id] = \
-                        related_scores.get(series_meeting_id, 0) + 10.0
+                related_scores[series_meeting_id] += 10.0
 
         # Same project
         if meeting.project:
             for project_meeting_id in self.meetings_by_project[meeting.project]:
-                if project_meeting_id != meeting_id:
-                    related_scores[project_meeting_id] = \
-                        related_scores.get(project_meeting_id, 0) + 5.0
+                related_scores[project_meeting_id] += 5.0
+
+        # Overlapping participants: each shared participant adds
+        # overlap / len(participants) * 3
+        if meeting.participants:
+            overlap: Dict[str, int] = defaultdict(int)
+            for participant in meeting.participants:
+                for participant_meeting_id in self.meetings_by_participant[participant]:
+                    overlap[participant_meeting_id] += 1
+            participant_weight = 3.0 / len(meeting.participants)
+            for other_id, shared in overlap.items():
+                related_scores[other_id] += shared * shared * participant_weight
+
+        # Similar topics: common / len(topics) * 2
+        if meeting.topics:
+            topic_weight = 2.0 / len(meeting.topics)
+            for topic in meeting.topics:
+                for other_id in self.meetings_by_topic.get(topic, ()):
+                    related_scores[other_id] += topic_weight
 
-        # Overlapping participants
-        for participant in meeting.participants:
-            for participant_meeting_id in self.meetings_by_participant[participant]:
-                if participant_meeting_id != meeting_id:
-                    # More overlap = higher score
-                    other_meeting = self.meetings[participant_meeting_id]
-                    overlap = len(set(meeting.participants) & set(other_meeting.participants))
-                    score = overlap / len(meeting.participants) * 3.0
-                    related_scores[participant_meeting_id] = \
-                        related_scores.get(participant_meeting_id, 0) + score
-
-        # Similar topics
-        meeting_topics = set(meeting.topics)
-        for other_id, other_meeting in self.meetings.items():
-            if other_id != meeting_id:
-                other_topics = set(other_meeting.topics)
-                common_topics = meeting_topics & other_topics
-                if common_topics:
-                    score = len(common_topics) / len(meeting_topics) * 2.0
-                    related_scores[other_id] = \
-                        related_scores.get(other_id, 0) + score
-
-        # Sort by relevance
-        sorted_related = sorted(
-            related_scores.items(),
-            key=lambda x: x[1],
-            reverse=True
-        )
+        related_scores.pop(meeting_id, None)
 
-        # Return top results
-        result = []
-        for related_id, _ in sorted_related[:max_results]:
-            related_meeting = self.meetings.get(related_id)
-            if related_meeting:
-                result.append(related_meeting)
+        # Top results by relevance (ties keep discovery order)
+        top = heapq.nlargest(max_results, related_scores.items(), key=lambda x: x[1])
 
-        return result
+        return [self.meetings[related_id] for related_id, _ in top if related_id in self._index]
 
     # =========================================================================
     # Meeting Series
     # =========================================================================
 
-    def _update_meeting_series(self, meeting: MeetingRecord):
+    def _update_meeting_series(self, meeting: MeetingIndexEntry):
         """Update meeting series with new meeting"""
         if not meeting.series_id:
             return
@@ -412,6 +711,8 @@ class CrossMeetingContext:
             )
 
         series = self.meeting_series[meeting.series_id]
+        if meeting.meeting_id in series.meetings:
+            return
         series.meetings.append(meeting.meeting_id)
         series.total_meetings += 1
 
@@ -449,7 +750,7 @@ class CrossMeetingContext:
         Returns:
             List of recommendation strings
         """
-        meeting = self.meetings.get(meeting_id)
+        meeting = self._index.get(meeting_id)
         if not meeting:
             return []
 
@@ -477,10 +778,7 @@ class CrossMeetingContext:
         if meeting.topics:
             for topic in meeting.topics:
                 # Find how many times this topic was discussed
-                topic_count = sum(
-                    1 for m in self.meetings.values()
-                    if topic in m.topics
-                )
+                topic_count = len(self.meetings_by_topic.get(topic, ()))
                 if topic_count > 3:
                     recommendations.append(
                         f"Topic '{topic}' has been discussed in {topic_count} previous meetings"
@@ -510,6 +808,7 @@ class CrossMeetingContext:
         participant_counts = {
             email: len(meetings)
             for email, meetings in self.meetings_by_participant.items()
+            if meetings
         }
         patterns["most_active_participants"] = sorted(
             participant_counts.items(),
@@ -518,10 +817,11 @@ class CrossMeetingContext:
         )[:10]
 
         # Most common topics
-        topic_counts: Dict[str, int] = defaultdict(int)
-        for meeting in self.meetings.values():
-            for topic in meeting.topics:
-                topic_counts[topic] += 1
+        topic_counts = {
+            topic: len(meeting_ids)
+            for topic, meeting_ids in self.meetings_by_topic.items()
+            if meeting_ids
+        }
 
         patterns["most_common_topics"] = sorted(
             topic_counts.items(),
@@ -531,8 +831,8 @@ class CrossMeetingContext:
 
         # Most productive meeting types (by action items generated)
         type_productivity: Dict[str, int] = defaultdict(int)
-        for meeting in self.meetings.values():
-            type_productivity[meeting.meeting_type] += len(meeting.action_items)
+        for entry in self._index.values():
+            type_productivity[entry.meeting_type] += entry.num_action_items
 
         patterns["most_productive_meeting_types"] = sorted(
             type_productivity.items(),
@@ -557,84 +857,45 @@ class CrossMeetingContext:
     # =========================================================================
 
     def _save_meeting(self, meeting: MeetingRecord):
-        """Save meeting to disk"""
+        """Save meeting to the store"""
         try:
-            meeting_file = self.storage_path / f"{meeting.meeting_id}.json"
-
-            meeting_dict = {
-                "meeting_id": meeting.meeting_id,
-                "title": meeting.title,
-                "started_at": meeting.started_at.isoformat(),
-                "ended_at": meeting.ended_at.isoformat() if meeting.ended_at else None,
-                "participants": meeting.participants,
-                "organizer": meeting.organizer,
-                "key_points": meeting.key_points,
-                "decisions": meeting.decisions,
-                "questions": meeting.questions,
-                "meeting_type": meeting.meeting_type,
-                "project": meeting.project,
-                "series_id": meeting.series_id,
-                "parent_meeting_id": meeting.parent_meeting_id,
-                "topics": meeting.topics,
-                "tags": meeting.tags,
-                # Action items simplified
-                "action_items": [
-                    {
-                        "id": item.id,
-                        "description": item.description,
-                        "assignee": item.assignee,
-                        "priority": item.priority,
-                    }
-                    for item in meeting.action_items
-                ],
-            }
-
-            with meeting_file.open("w") as f:
-                json.dump(meeting_dict, f, indent=2)
-
+            self._store.upsert(meeting)
         except Exception as e:
             print(f"[CrossMeetingContext] Error saving meeting: {e}")
 
     def _load_context(self):
-        """Load context from disk"""
+        """Build indexes from the store without hydrating meeting bodies"""
         try:
-            for meeting_file in self.storage_path.glob("*.json"):
-                with meeting_file.open("r") as f:
-                    data = json.load(f)
-
-                meeting = MeetingRecord(
-                    meeting_id=data["meeting_id"],
-                    title=data["title"],
-                    started_at=datetime.fromisoformat(data["started_at"]),
-                    ended_at=datetime.fromisoformat(data["ended_at"]) if data.get("ended_at") else None,
-                    participants=data.get("participants", []),
-                    organizer=data.get("organizer"),
-                    key_points=data.get("key_points", []),
-                    decisions=data.get("decisions", []),
-                    questions=data.get("questions", []),
-                    meeting_type=data.get("meeting_type", "general"),
-                    project=data.get("project"),
-                    series_id=data.get("series_id"),
-                    parent_meeting_id=data.get("parent_meeting_id"),
-                    topics=data.get("topics", []),
-                    tags=data.get("tags", []),
-                )
-
-                # Reconstruct action items
-                for item_data in data.get("action_items", []):
-                    action_item = ActionItem(
-                        id=item_data["id"],
-                        description=item_data["description"],
-                        assignee=item_data.get("assignee"),
-                        priority=item_data.get("priority", "normal"),
+            self._import_legacy_files()
+
+            for entry in self._store.iter_index():
+                self._index_meeting(entry)
+
+                for participant in entry.participants:
+                    context = self.participant_contexts.setdefault(
+                        participant, ParticipantContext(participant_email=participant)
                     )
-                    meeting.action_items.append(action_item)
+                    self._count_participant_meeting(context, entry)
+                    if any(a == participant and st == "pending" for a, st in entry.assignments):
+                        self._unhydrated_pending[participant].add(entry.meeting_id)
 
-                self.add_meeting(meeting)
+                if entry.series_id:
+                    self._update_meeting_series(entry)
 
         except Exception as e:
             print(f"[CrossMeetingContext] Error loading context: {e}")
 
+    def _import_legacy_files(self):
+        """Move meetings saved as one JSON file each into the store (once)"""
+        for meeting_file in self.storage_path.glob("*.json"):
+            if self._store.contains(meeting_file.stem):
+                continue
+            try:
+                with meeting_file.open("r") as f:
+                    self._store.upsert(_meeting_from_dict(json.load(f)))
+            except Exception as e:
+                print(f"[CrossMeetingContext] Error importing {meeting_file.name}: {e}")
+
 
 # =============================================================================
 # Convenience Functions
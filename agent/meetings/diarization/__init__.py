@@ -16,6 +16,7 @@ from agent.meetings.diarization.base import (
     Speaker,
     SpeakerSegment,
 )
+from agent.meetings.diarization.profiles import VoiceProfileIndex
 from agent.meetings.diarization.speaker_manager import SpeakerManager
 
 # Import Pyannote engine with graceful fallback
@@ -31,6 +32,7 @@ __all__ = [
     "SpeakerSegment",
     # Manager
     "SpeakerManager",
+    "VoiceProfileIndex",
     # Engines (may be None if dependencies not installed)
     "PyannoteEngine",
 ]
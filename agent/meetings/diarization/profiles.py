@@ -0,0 +1,259 @@
+"""
+Voice profile matrix for batched speaker matching.
+
+Keeps voice embeddings as rows of a single L2-normalized NumPy matrix so
+a whole batch of unknown voices can be scored against every registered
+speaker with one matrix product instead of one cosine similarity per
+pair. Rows hold running centroids that can be refined incrementally as
+more speech is attributed to a speaker.
+
+Requires: pip install numpy
+"""
+
+from __future__ import annotations
+
+from typing import Iterable, List, Optional, Sequence, Tuple
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+# Cosine similarity above which a voice is attributed to a known speaker.
+# 0.75 = reasonably confident match; higher means fewer false positives
+# but more missed matches.
+SIMILARITY_THRESHOLD = 0.75
+
+
+def normalize_rows(matrix: "np.ndarray") -> "np.ndarray":
+    """L2-normalize each row; all-zero rows stay zero"""
+    norms = np.linalg.norm(matrix, axis=-1, keepdims=True)
+    norms[norms == 0] = 1.0
+    return matrix / norms
+
+
+class VoiceProfileIndex:
+    """
+    Registered voice profiles as one normalized embedding matrix.
+
+    Embeddings are normalized before they are averaged, so each profile's
+    centroid is the mean voice direction regardless of embedding scale.
+    The profile also keeps the number of embeddings folded into it, and
+    its unit-length copy used for scoring is updated alongside, so
+    matching never renormalizes the whole matrix.
+
+    Example:
+        index = VoiceProfileIndex()
+        index.add("SPEAKER_001", alice_embedding)
+        index.add("SPEAKER_002", bob_embedding)
+
+        # Score every diarized voice at once
+        matches = index.best_matches([voice_a, voice_b])
+        # [("SPEAKER_001", 0.91), None]
+    """
+
+    def __init__(self, max_weight: Optional[int] = None):
+        """
+        Args:
+            max_weight: Cap on the number of embeddings a centroid
+                        remembers. Once reached, each update moves the
+                        centroid by 1/max_weight so profiles keep adapting.
+                        None averages over everything seen.
+        """
+        if not NUMPY_AVAILABLE:
+            raise ImportError("numpy not installed. Run: pip install numpy")
+
+        self.max_weight = max_weight
+        self.ids: List[str] = []
+        self._rows: dict = {}
+        self._centroids: Optional[np.ndarray] = None
+        self._normalized: Optional[np.ndarray] = None
+        self._counts: Optional[np.ndarray] = None
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def __contains__(self, speaker_id: str) -> bool:
+        return speaker_id in self._rows
+
+    @property
+    def dim(self) -> Optional[int]:
+        """Embedding dimension, or None while empty"""
+        return None if self._centroids is None else self._centroids.shape[1]
+
+    @property
+    def matrix(self) -> "np.ndarray":
+        """Normalized profiles, one row per entry of ``ids``"""
+        if self._normalized is None:
+            return np.zeros((0, 0), dtype=np.float32)
+        return self._normalized
+
+    def _vector(self, embedding: Sequence[float]) -> "np.ndarray":
+        vector = np.asarray(embedding, dtype=np.float32).reshape(-1)
+        if self.dim is not None and vector.shape[0] != self.dim:
+            raise ValueError(
+                f"Embedding has {vector.shape[0]} dimensions, profiles have {self.dim}"
+            )
+        return normalize_rows(vector)
+
+    # ------------------------------------------------------------------
+    # Profiles
+    # ------------------------------------------------------------------
+
+    def add(self, speaker_id: str, embedding: Sequence[float], count: int = 1):
+        """
+        Add or replace a profile.
+
+        Args:
+            speaker_id: Profile key
+            embedding: Voice embedding (becomes the initial centroid)
+            count: Number of embeddings the centroid already represents
+        """
+        self.remove(speaker_id)
+
+        vector = self._vector(embedding)
+        row = vector[np.newaxis, :]
+        if self._centroids is None:
+            self._centroids = row.copy()
+            self._normalized = normalize_rows(row)
+            self._counts = np.array([count], dtype=np.int64)
+        else:
+            self._centroids = np.vstack([self._centroids, row])
+            self._normalized = np.vstack([self._normalized, normalize_rows(row)])
+            self._counts = np.append(self._counts, count)
+
+        self._rows[speaker_id] = len(self.ids)
+        self.ids.append(speaker_id)
+
+    def remove(self, speaker_id: str):
+        """Drop a profile (no-op if unknown)"""
+        row = self._rows.pop(speaker_id, None)
+        if row is None:
+            return
+
+        self.ids.pop(row)
+        if not self.ids:
+            self.clear()
+            return
+
+        self._centroids = np.delete(self._centroids, row, axis=0)
+        self._normalized = np.delete(self._normalized, row, axis=0)
+        self._counts = np.delete(self._counts, row)
+        for shifted in self.ids[row:]:
+            self._rows[shifted] -= 1
+
+    def clear(self):
+        """Drop every profile"""
+        self.ids = []
+        self._rows = {}
+        self._centroids = None
+        self._normalized = None
+        self._counts = None
+
+    def update(self, speaker_id: str, embedding: Sequence[float], weight: int = 1) -> List[float]:
+        """
+        Fold new speech into a profile's centroid.
+
+        Creates the profile if it doesn't exist yet.
+
+        Args:
+            speaker_id: Profile key
+            embedding: Embedding of newly attributed speech
+            weight: How many embeddings ``embedding`` stands for
+                    (e.g. when it is itself an average)
+
+        Returns:
+            The updated centroid
+        """
+        if speaker_id not in self._rows:
+            self.add(speaker_id, embedding, count=weight)
+            return self.centroid(speaker_id)
+
+        vector = self._vector(embedding)
+        row = self._rows[speaker_id]
+        total = int(self._counts[row]) + weight
+        if self.max_weight is not None:
+            total = min(total, self.max_weight)
+
+        # Running mean: c += (x - c) * w / n
+        self._centroids[row] += (vector - self._centroids[row]) * (min(weight, total) / total)
+        self._normalized[row] = normalize_rows(self._centroids[row])
+        self._counts[row] = total
+        return self.centroid(speaker_id)
+
+    def centroid(self, speaker_id: str) -> List[float]:
+        """Current centroid (mean of normalized embeddings) of a profile"""
+        return self._centroids[self._rows[speaker_id]].tolist()
+
+    def vectors(self, speaker_ids: Iterable[str]) -> "np.ndarray":
+        """Normalized rows for the given profiles, in order"""
+        return self._normalized[[self._rows[s] for s in speaker_ids]]
+
+    # ------------------------------------------------------------------
+    # Matching
+    # ------------------------------------------------------------------
+
+    def similarities(
+        self,
+        queries,
+        candidates: Optional[Sequence[str]] = None,
+    ) -> Tuple["np.ndarray", List[str]]:
+        """
+        Cosine similarity of every query against every (candidate) profile.
+
+        Args:
+            queries: One embedding or a (num_queries, dim) array
+            candidates: Restrict scoring to these profile ids
+
+        Returns:
+            (num_queries, num_profiles) similarity matrix and the profile
+            id for each column
+        """
+        queries = np.atleast_2d(np.asarray(queries, dtype=np.float32))
+        if not self.ids:
+            return np.zeros((queries.shape[0], 0), dtype=np.float32), []
+
+        if queries.shape[1] != self.dim:
+            raise ValueError(
+                f"Embedding has {queries.shape[1]} dimensions, profiles have {self.dim}"
+            )
+
+        if candidates is None:
+            columns, profiles = self.ids, self._normalized
+        else:
+            columns = [c for c in candidates if c in self._rows]
+            profiles = self.vectors(columns)
+
+        return normalize_rows(queries) @ profiles.T, list(columns)
+
+    def best_matches(
+        self,
+        queries,
+        threshold: float = SIMILARITY_THRESHOLD,
+        candidates: Optional[Sequence[str]] = None,
+    ) -> List[Optional[Tuple[str, float]]]:
+        """
+        Best profile for each query.
+
+        Args:
+            queries: One embedding or a (num_queries, dim) array
+            threshold: Minimum cosine similarity for a match
+            candidates: Restrict matching to these profile ids
+
+        Returns:
+            (speaker_id, similarity) per query, or None where the best
+            score doesn't exceed ``threshold``
+        """
+        scores, columns = self.similarities(queries, candidates)
+        if not columns:
+            return [None] * scores.shape[0]
+
+        best = scores.argmax(axis=1)
+        results: List[Optional[Tuple[str, float]]] = []
+        for query, column in enumerate(best):
+            similarity = float(scores[query, column])
+            results.append((columns[column], similarity) if similarity > threshold else None)
+        return results
@@ -23,9 +23,9 @@ from agent.meetings.diarization.base import (
     Speaker,
     SpeakerSegment,
 )
+from agent.meetings.diarization.profiles import SIMILARITY_THRESHOLD, VoiceProfileIndex
 
 try:
-    import numpy as np
     import torch
     from scipy.io import wavfile
 
@@ -325,31 +325,19 @@ class PyannoteEngine(DiarizationEngine):
             if not unknown_embedding:
                 return None
 
-            # Compare with known speakers using cosine similarity
-            best_match = None
-            best_similarity = -1.0
-
-            unknown_vec = np.array(unknown_embedding)
-
+            # Compare with all known speakers in one cosine-similarity pass
+            profiles = VoiceProfileIndex()
             for speaker in known_speakers:
-                if not speaker.voice_embedding:
-                    continue
-
-                known_vec = np.array(speaker.voice_embedding)
+                if speaker.voice_embedding:
+                    profiles.add(speaker.speaker_id, speaker.voice_embedding)
 
-                # Cosine similarity: dot product / (norm1 * norm2)
-                similarity = np.dot(unknown_vec, known_vec) / (
-                    np.linalg.norm(unknown_vec) * np.linalg.norm(known_vec)
-                )
-
-                if similarity > best_similarity:
-                    best_similarity = similarity
-                    best_match = speaker.speaker_id
+            if not len(profiles):
+                return None
 
-            # Threshold for positive identification
-            # 0.75 = reasonably confident match
-            # Higher threshold = fewer false positives but may miss some matches
-            SIMILARITY_THRESHOLD = 0.75
+            scores, columns = profiles.similarities(unknown_embedding)
+            best = int(scores[0].argmax())
+            best_match = columns[best]
+            best_similarity = float(scores[0, best])
 
             if best_similarity > SIMILARITY_THRESHOLD:
                 core_logging.log_event("pyannote_speaker_identified", {
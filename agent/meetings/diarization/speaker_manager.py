@@ -10,12 +10,17 @@ This manager:
 - Maps anonymous speaker IDs to real people
 - Combines transcripts with speaker information
 - Integrates with meeting platform participant lists
+
+Registered voice profiles live in a normalized embedding matrix
+(VoiceProfileIndex), so every diarized speaker in a meeting is matched
+with one batched similarity computation. Without numpy, matching falls
+back to the engine's per-segment identify_speaker.
 """
 
 from __future__ import annotations
 
 import asyncio
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple
 
 import agent.core_logging as core_logging
 from agent.meetings.diarization.base import (
@@ -23,6 +28,11 @@ from agent.meetings.diarization.base import (
     Speaker,
     SpeakerSegment,
 )
+from agent.meetings.diarization.profiles import (
+    NUMPY_AVAILABLE,
+    SIMILARITY_THRESHOLD,
+    VoiceProfileIndex,
+)
 
 
 class SpeakerManager:
@@ -61,13 +71,23 @@ class SpeakerManager:
             print(f"{name} spoke from {seg.start_time}s to {seg.end_time}s")
     """
 
-    def __init__(self, diarization_engine: Optional[DiarizationEngine] = None):
+    def __init__(
+        self,
+        diarization_engine: Optional[DiarizationEngine] = None,
+        similarity_threshold: float = SIMILARITY_THRESHOLD,
+        max_profile_weight: int = 50,
+    ):
         """
         Initialize speaker manager.
 
         Args:
             diarization_engine: Custom diarization engine
                               (defaults to PyannoteEngine if None)
+            similarity_threshold: Minimum cosine similarity to attribute
+                                  a voice to a known speaker
+            max_profile_weight: Embeddings a known speaker's centroid
+                                remembers before new speech starts to
+                                outweigh old samples
         """
         # Initialize diarization engine
         if diarization_engine is None:
@@ -92,6 +112,27 @@ class SpeakerManager:
         # e.g., {"SPEAKER_00": "SPEAKER_001"}  # SPEAKER_00 (Pyannote) → Alice
         self.speaker_mapping: Dict[str, str] = {}
 
+        self.similarity_threshold = similarity_threshold
+
+        # Known speakers' voice profiles as one normalized matrix, and the
+        # embedding list each row was built from (to spot edits made
+        # directly on known_speakers)
+        self.profiles: Optional[VoiceProfileIndex] = None
+        self._profile_sources: Dict[str, List[float]] = {}
+
+        # Per-meeting embedding cache: running centroid of every
+        # diarization label, plus the segments already embedded
+        self.participant_profiles: Optional[VoiceProfileIndex] = None
+        self._embedded_segments: Set[Tuple[str, float, float]] = set()
+
+        if NUMPY_AVAILABLE:
+            self.profiles = VoiceProfileIndex(max_weight=max_profile_weight)
+            self.participant_profiles = VoiceProfileIndex()
+
+        # Known speakers who are in the current meeting (None = unknown)
+        self._candidate_ids: Optional[List[str]] = None
+        self._candidates_stale = True
+
     async def register_speaker(
         self,
         name: str,
@@ -144,6 +185,7 @@ class SpeakerManager:
         )
 
         self.known_speakers[speaker_id] = speaker
+        self._sync_profiles()
 
         core_logging.log_event("speaker_registered", {
             "speaker_id": speaker_id,
@@ -170,6 +212,7 @@ class SpeakerManager:
             manager.set_meeting_participants(zoom_participants)
         """
         self.current_participants = participants
+        self._candidates_stale = True
 
         core_logging.log_event("meeting_participants_set", {
             "num_participants": len(participants),
@@ -211,28 +254,215 @@ class SpeakerManager:
             speaker = self.known_speakers.get(mapped_id)
             return speaker.name if speaker else None
 
-        # Try to identify from voice
+        names = await self.identify_speakers([
+            (SpeakerSegment(diarization_id, 0.0, 0.0), audio_segment)
+        ])
+        return names.get(diarization_id)
+
+    async def identify_speakers(
+        self,
+        segment_audio: Iterable[Tuple[SpeakerSegment, bytes]],
+        max_samples_per_speaker: int = 5,
+    ) -> Dict[str, Optional[str]]:
+        """
+        Identify every diarized speaker in a meeting in one batch.
+
+        Embeds up to ``max_samples_per_speaker`` of each label's longest
+        segments, averages them into a per-label centroid (cached for the
+        meeting), and scores all labels against all known profiles with a
+        single matrix product. Platform participants are tried first,
+        then everyone else. A matched speaker's profile absorbs the new
+        speech.
+
+        Args:
+            segment_audio: (diarization segment, audio) pairs
+            max_samples_per_speaker: Segments embedded per diarization label
+
+        Returns:
+            Mapping of diarization ID to speaker name (None if unidentified)
+
+        Example:
+            segments = await manager.diarize_meeting_audio(meeting_audio)
+            names = await manager.identify_speakers(
+                (seg, extract_audio(seg.start_time, seg.end_time)) for seg in segments
+            )
+            # {"SPEAKER_00": "Alice", "SPEAKER_01": None}
+        """
+        results: Dict[str, Optional[str]] = {}
+        pending: Dict[str, List[Tuple[SpeakerSegment, bytes]]] = {}
+
+        for segment, audio in segment_audio:
+            label = segment.speaker_id
+            if label in self.speaker_mapping:
+                speaker = self.known_speakers.get(self.speaker_mapping[label])
+                results[label] = speaker.name if speaker else None
+            else:
+                pending.setdefault(label, []).append((segment, audio))
+
+        if not pending or not self.engine:
+            results.update({label: None for label in pending})
+            return results
+
+        if self.profiles is None:
+            for label, samples in pending.items():
+                results[label] = await self._identify_with_engine(label, samples)
+            return results
+
+        self._sync_profiles()
+        if not len(self.profiles):
+            results.update({label: None for label in pending})
+            return results
+
+        await self._embed_labels(pending, max_samples_per_speaker)
+
+        labels = [label for label in pending if label in self.participant_profiles]
+        results.update({label: None for label in pending})
+        if not labels:
+            return results
+
+        queries = self.participant_profiles.vectors(labels)
+        matches = self._best_matches(queries)
+
+        for label, match in zip(labels, matches):
+            if match is None:
+                core_logging.log_event("speaker_not_identified", {
+                    "diarization_id": label
+                })
+                continue
+            speaker_id, similarity = match
+            results[label] = self._map_speaker(label, speaker_id, similarity)
+
+        return results
+
+    async def _identify_with_engine(
+        self,
+        label: str,
+        samples: List[Tuple[SpeakerSegment, bytes]],
+    ) -> Optional[str]:
+        """Per-segment engine matching (used when numpy is unavailable)"""
+        segment, audio = max(samples, key=lambda s: s[0].duration)
         speaker_id = await self.engine.identify_speaker(
-            audio_segment,
+            audio,
             list(self.known_speakers.values())
         )
+        if not speaker_id or speaker_id not in self.known_speakers:
+            return None
+        return self._map_speaker(label, speaker_id)
 
-        if speaker_id:
-            # Create mapping
-            self.speaker_mapping[diarization_id] = speaker_id
-            speaker = self.known_speakers[speaker_id]
+    async def _embed_labels(
+        self,
+        pending: Dict[str, List[Tuple[SpeakerSegment, bytes]]],
+        max_samples_per_speaker: int,
+    ):
+        """Embed each label's longest unseen segments into its centroid"""
+        jobs = []
+        for label, samples in pending.items():
+            samples.sort(key=lambda s: s[0].duration, reverse=True)
+            for segment, audio in samples[:max_samples_per_speaker]:
+                # Zero-length segments carry no timing to dedupe on
+                if segment.end_time > segment.start_time:
+                    key = (label, segment.start_time, segment.end_time)
+                    if key in self._embedded_segments:
+                        continue
+                    self._embedded_segments.add(key)
+                jobs.append((label, audio))
+
+        embeddings = await asyncio.gather(
+            *(self.engine.create_voice_embedding(audio) for _, audio in jobs)
+        )
 
-            core_logging.log_event("speaker_mapped", {
-                "diarization_id": diarization_id,
-                "speaker_id": speaker_id,
-                "speaker_name": speaker.name
-            })
+        for (label, _), embedding in zip(jobs, embeddings):
+            if embedding:
+                self.participant_profiles.update(label, embedding)
 
-            return speaker.name
+    def _best_matches(self, queries) -> List[Optional[Tuple[str, float]]]:
+        """Match against meeting participants first, then all known speakers"""
+        candidates = self._meeting_candidates()
+        matches = self.profiles.best_matches(
+            queries, self.similarity_threshold, candidates=candidates
+        )
 
-        # Not identified - try to match by name from participants
-        # This is a fallback if voice matching fails
-        return None
+        retry = [i for i, match in enumerate(matches) if match is None]
+        if candidates is not None and retry:
+            for i, match in zip(retry, self.profiles.best_matches(
+                queries[retry], self.similarity_threshold
+            )):
+                matches[i] = match
+        return matches
+
+    def _map_speaker(
+        self,
+        label: str,
+        speaker_id: str,
+        similarity: Optional[float] = None,
+    ) -> Optional[str]:
+        """Record a label → speaker mapping and refine the speaker's profile"""
+        self.speaker_mapping[label] = speaker_id
+        speaker = self.known_speakers[speaker_id]
+
+        if self.profiles is not None and label in self.participant_profiles:
+            centroid = self.profiles.update(
+                speaker_id,
+                self.participant_profiles.centroid(label),
+            )
+            speaker.voice_embedding = centroid
+            self._profile_sources[speaker_id] = centroid
+
+        core_logging.log_event("speaker_mapped", {
+            "diarization_id": label,
+            "speaker_id": speaker_id,
+            "speaker_name": speaker.name,
+            "similarity": similarity,
+        })
+
+        return speaker.name
+
+    def _sync_profiles(self):
+        """Bring the profile matrix in line with known_speakers"""
+        if self.profiles is None:
+            return
+
+        for speaker_id in list(self._profile_sources):
+            speaker = self.known_speakers.get(speaker_id)
+            if speaker is None or not speaker.has_voice_profile():
+                self.profiles.remove(speaker_id)
+                del self._profile_sources[speaker_id]
+                self._candidates_stale = True
+
+        for speaker_id, speaker in self.known_speakers.items():
+            if not speaker.has_voice_profile():
+                continue
+            if self._profile_sources.get(speaker_id) is speaker.voice_embedding:
+                continue
+            try:
+                self.profiles.add(speaker_id, speaker.voice_embedding)
+            except ValueError as e:
+                core_logging.log_event("speaker_profile_skipped", {
+                    "speaker_id": speaker_id,
+                    "error": str(e)
+                })
+                continue
+            self._profile_sources[speaker_id] = speaker.voice_embedding
+            self._candidates_stale = True
+
+    def _meeting_candidates(self) -> Optional[List[str]]:
+        """Known speakers on the platform participant list (None if none)"""
+        if not self._candidates_stale:
+            return self._candidate_ids
+
+        emails = {p["email"].lower() for p in self.current_participants if p.get("email")}
+        names = {p["name"].lower() for p in self.current_participants if p.get("name")}
+
+        candidates = [
+            speaker_id for speaker_id, speaker in self.known_speakers.items()
+            if speaker_id in self.profiles and (
+                (speaker.email and speaker.email.lower() in emails) or
+                (speaker.name and speaker.name.lower() in names)
+            )
+        ]
+        self._candidate_ids = candidates or None
+        self._candidates_stale = False
+        return self._candidate_ids
 
     async def diarize_meeting_audio(
         self,
@@ -0,0 +1,377 @@
+"""
+Staged live-meeting pipeline.
+
+Decouples the stages of live meeting participation so a slow stage never
+stalls the ones upstream of it:
+
+    audio capture → transcription → windowed analysis → action execution
+
+Stages run as separate asyncio tasks connected by bounded queues. Audio
+capture and transcription never wait on the LLM: when analysis falls
+behind, pending analysis windows are merged (or the oldest dropped)
+instead of piling up. Each stage reports its latency and throughput.
+"""
+
+import asyncio
+import logging
+import time
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import Any, AsyncIterator, Awaitable, Callable, Deque, Dict, List, Optional
+
+from agent.meetings.transcription.base import TranscriptSegment
+
+logger = logging.getLogger(__name__)
+
+
+class BackpressurePolicy(Enum):
+    """What to do with a new analysis window when the analysis queue is full"""
+    MERGE = "merge"              # Fold it into the newest pending window
+    DROP_OLDEST = "drop_oldest"  # Discard the oldest pending window
+    BLOCK = "block"              # Wait for space (stalls windowing only)
+
+
+@dataclass
+class StageStats:
+    """Latency and throughput counters for one pipeline stage"""
+    name: str
+    processed: int = 0
+    dropped: int = 0
+    merged: int = 0
+    errors: int = 0
+    last_latency_ms: float = 0.0
+    max_latency_ms: float = 0.0
+    total_latency_ms: float = 0.0
+
+    def record(self, latency_ms: float):
+        self.processed += 1
+        self.last_latency_ms = latency_ms
+        self.max_latency_ms = max(self.max_latency_ms, latency_ms)
+        self.total_latency_ms += latency_ms
+
+    @property
+    def avg_latency_ms(self) -> float:
+        return self.total_latency_ms / self.processed if self.processed else 0.0
+
+    def to_dict(self) -> Dict[str, Any]:
+        return {
+            "processed": self.processed,
+            "dropped": self.dropped,
+            "merged": self.merged,
+            "errors": self.errors,
+            "avg_latency_ms": round(self.avg_latency_ms, 2),
+            "last_latency_ms": round(self.last_latency_ms, 2),
+            "max_latency_ms": round(self.max_latency_ms, 2),
+        }
+
+
+@dataclass
+class AnalysisWindow:
+    """A span of final transcript segments handed to analysis as one unit"""
+    index: int
+    segments: List[TranscriptSegment]
+    created_at: float = field(default_factory=time.monotonic)
+    merged_count: int = 0
+
+    @property
+    def text(self) -> str:
+        return " ".join(s.text for s in self.segments if s.text)
+
+    @property
+    def start_time(self) -> datetime:
+        return self.segments[0].start_time
+
+    @property
+    def end_time(self) -> datetime:
+        return self.segments[-1].end_time
+
+    @property
+    def speaker(self) -> Optional[str]:
+        speakers = {s.speaker_id for s in self.segments if s.speaker_id}
+        return speakers.pop() if len(speakers) == 1 else None
+
+    def merge(self, other: "AnalysisWindow"):
+        """Absorb a later window, skipping segments shared through overlap"""
+        seen = {id(s) for s in self.segments}
+        self.segments.extend(s for s in other.segments if id(s) not in seen)
+        self.merged_count += other.merged_count + 1
+
+
+class TranscriptWindower:
+    """
+    Groups final transcript segments into overlapping analysis windows.
+
+    A window is emitted once it spans ``window_seconds`` of speech; the
+    segments in its last ``overlap_seconds`` are carried into the next
+    window so statements crossing a boundary keep their context.
+    """
+
+    def __init__(self, window_seconds: float = 30.0, overlap_seconds: float = 5.0):
+        self.window = timedelta(seconds=window_seconds)
+        self.overlap = timedelta(seconds=min(overlap_seconds, window_seconds))
+        self._segments: List[TranscriptSegment] = []
+        self._fresh = 0  # Segments not yet part of any emitted window
+        self._next_index = 0
+
+    def add(self, segment: TranscriptSegment) -> Optional[AnalysisWindow]:
+        """Add a final segment; returns a window when one is complete"""
+        self._segments.append(segment)
+        self._fresh += 1
+
+        if segment.end_time - self._segments[0].start_time < self.window:
+            return None
+        return self._emit()
+
+    def flush(self) -> Optional[AnalysisWindow]:
+        """Emit whatever remains (end of meeting)"""
+        if not self._fresh:
+            return None
+        return self._emit()
+
+    def _emit(self) -> AnalysisWindow:
+        window = AnalysisWindow(index=self._next_index, segments=list(self._segments))
+        self._next_index += 1
+
+        carry_from = window.end_time - self.overlap
+        self._segments = [s for s in self._segments if s.end_time > carry_from]
+        # Never carry the whole window forward, or it would repeat forever
+        if len(self._segments) == len(window.segments):
+            self._segments = []
+        self._fresh = 0
+        return window
+
+
+class WindowQueue:
+    """Bounded queue of analysis windows with a backpressure policy"""
+
+    def __init__(self, maxsize: int, policy: BackpressurePolicy, stats: StageStats):
+        self.maxsize = max(1, maxsize)
+        self.policy = policy
+        self.stats = stats
+        self._items: Deque[AnalysisWindow] = deque()
+        self._closed = False
+        self._changed = asyncio.Condition()
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    async def put(self, window: AnalysisWindow):
+        async with self._changed:
+            if len(self._items) >= self.maxsize:
+                if self.policy == BackpressurePolicy.MERGE:
+                    self._items[-1].merge(window)
+                    self.stats.merged += 1
+                    return
+                if self.policy == BackpressurePolicy.DROP_OLDEST:
+                    self._items.popleft()
+                    self.stats.dropped += 1
+                else:
+                    await self._changed.wait_for(lambda: len(self._items) < self.maxsize)
+            self._items.append(window)
+            self._changed.notify_all()
+
+    async def close(self):
+        """No more windows will be added; get() returns None once drained"""
+        async with self._changed:
+            self._closed = True
+            self._changed.notify_all()
+
+    async def get(self) -> Optional[AnalysisWindow]:
+        async with self._changed:
+            await self._changed.wait_for(lambda: self._items or self._closed)
+            if not self._items:
+                return None
+            window = self._items.popleft()
+            self._changed.notify_all()
+            return window
+
+
+_DONE = object()
+
+
+class MeetingPipeline:
+    """
+    Runs capture, transcription, analysis and action stages concurrently.
+
+    Example:
+        pipeline = MeetingPipeline(analyze=analyze_window, act=execute)
+        stats = await pipeline.run(bot.get_audio_stream(), manager.start_transcription)
+    """
+
+    def __init__(
+        self,
+        analyze: Callable[[AnalysisWindow], Awaitable[Any]],
+        act: Optional[Callable[[Any], Awaitable[Any]]] = None,
+        on_segment: Optional[Callable[[TranscriptSegment], None]] = None,
+        window_seconds: float = 30.0,
+        overlap_seconds: float = 5.0,
+        audio_queue_size: int = 64,
+        segment_queue_size: int = 256,
+        max_pending_windows: int = 2,
+        max_pending_actions: int = 16,
+        backpressure: BackpressurePolicy = BackpressurePolicy.MERGE,
+    ):
+        """
+        Args:
+            analyze: Coroutine turning a window into an understanding
+            act: Coroutine executing actions for an understanding
+            on_segment: Called for every transcript segment (interim and final)
+            window_seconds: Span of speech per analysis window
+            overlap_seconds: Speech shared between consecutive windows
+            audio_queue_size: Audio chunks buffered ahead of transcription
+                (oldest chunks are dropped if transcription stalls)
+            segment_queue_size: Segments buffered ahead of windowing
+            max_pending_windows: Windows waiting for analysis before
+                backpressure applies
+            max_pending_actions: Understandings waiting for action execution
+            backpressure: Policy when analysis is behind
+        """
+        self.analyze = analyze
+        self.act = act
+        self.on_segment = on_segment
+        self.windower = TranscriptWindower(window_seconds, overlap_seconds)
+
+        self.stats: Dict[str, StageStats] = {
+            name: StageStats(name)
+            for name in ("capture", "transcription", "analysis", "action")
+        }
+
+        self._audio_queue: asyncio.Queue = asyncio.Queue(maxsize=audio_queue_size)
+        self._segment_queue: asyncio.Queue = asyncio.Queue(maxsize=segment_queue_size)
+        self._window_queue = WindowQueue(
+            max_pending_windows, backpressure, self.stats["analysis"]
+        )
+        self._action_queue: asyncio.Queue = asyncio.Queue(maxsize=max_pending_actions)
+        self._last_audio_at: Optional[float] = None
+
+    # ------------------------------------------------------------------
+    # Stages
+    # ------------------------------------------------------------------
+
+    async def _capture(self, audio_stream: AsyncIterator[Any]):
+        """Read audio as fast as it arrives; never blocks on transcription"""
+        stats = self.stats["capture"]
+        try:
+            async for chunk in audio_stream:
+                started = time.monotonic()
+                if self._audio_queue.full():
+                    self._audio_queue.get_nowait()
+                    stats.dropped += 1
+                self._audio_queue.put_nowait((started, chunk))
+                stats.record((time.monotonic() - started) * 1000)
+        finally:
+            if self._audio_queue.full():
+                self._audio_queue.get_nowait()
+                stats.dropped += 1
+            self._audio_queue.put_nowait((time.monotonic(), _DONE))
+
+    async def _queued_audio(self) -> AsyncIterator[Any]:
+        while True:
+            _, chunk = await self._audio_queue.get()
+            if chunk is _DONE:
+                return
+            self._last_audio_at = time.monotonic()
+            yield chunk
+
+    async def _transcribe(self, transcribe: Callable[[AsyncIterator[Any]], AsyncIterator[TranscriptSegment]]):
+        """Feed queued audio to the transcriber and fan segments out"""
+        stats = self.stats["transcription"]
+        try:
+            async for segment in transcribe(self._queued_audio()):
+                if self._last_audio_at is not None:
+                    stats.record((time.monotonic() - self._last_audio_at) * 1000)
+                if self.on_segment:
+                    self.on_segment(segment)
+                if segment.is_final:
+                    await self._segment_queue.put(segment)
+        finally:
+            await self._segment_queue.put(_DONE)
+
+    async def _window(self):
+        """Group final segments into overlapping windows"""
+        while True:
+            segment = await self._segment_queue.get()
+            if segment is _DONE:
+                break
+            window = self.windower.add(segment)
+            if window:
+                await self._window_queue.put(window)
+
+        window = self.windower.flush()
+        if window:
+            await self._window_queue.put(window)
+        await self._window_queue.close()
+
+    async def _analyze(self):
+        stats = self.stats["analysis"]
+        while True:
+            window = await self._window_queue.get()
+            if window is None:
+                break
+            try:
+                understanding = await self.analyze(window)
+            except Exception:
+                logger.exception("Meeting analysis failed")
+                stats.errors += 1
+                continue
+            stats.record((time.monotonic() - window.created_at) * 1000)
+            if understanding is not None and self.act:
+                await self._action_queue.put((time.monotonic(), understanding))
+        await self._action_queue.put((time.monotonic(), _DONE))
+
+    async def _execute(self):
+        stats = self.stats["action"]
+        while True:
+            queued_at, understanding = await self._action_queue.get()
+            if understanding is _DONE:
+                break
+            try:
+                await self.act(understanding)
+            except Exception:
+                logger.exception("Meeting action execution failed")
+                stats.errors += 1
+                continue
+            stats.record((time.monotonic() - queued_at) * 1000)
+
+    # ------------------------------------------------------------------
+    # Control
+    # ------------------------------------------------------------------
+
+    async def run(
+        self,
+        audio_stream: AsyncIterator[Any],
+        transcribe: Callable[[AsyncIterator[Any]], AsyncIterator[TranscriptSegment]],
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Run all stages until the audio stream ends and queued work drains.
+
+        Returns:
+            Per-stage statistics (see get_stats)
+        """
+        tasks = [
+            asyncio.create_task(self._capture(audio_stream)),
+            asyncio.create_task(self._transcribe(transcribe)),
+            asyncio.create_task(self._window()),
+            asyncio.create_task(self._analyze()),
+        ]
+        if self.act:
+            tasks.append(asyncio.create_task(self._execute()))
+
+        try:
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                task.cancel()
+
+        return self.get_stats()
+
+    def get_stats(self) -> Dict[str, Dict[str, Any]]:
+        """Per-stage latency/throughput plus current queue depths"""
+        stats = {name: s.to_dict() for name, s in self.stats.items()}
+        stats["capture"]["queue_depth"] = self._audio_queue.qsize()
+        stats["transcription"]["queue_depth"] = self._segment_queue.qsize()
+        stats["analysis"]["queue_depth"] = len(self._window_queue)
+        stats["action"]["queue_depth"] = self._action_queue.qsize()
+        return stats
@@ -10,7 +10,9 @@ Orchestrates entire meeting flow:
 """
 
 import asyncio
-from typing import Optional, Dict, List
+import json
+from dataclasses import replace
+from typing import Optional, Dict, List, Set, Tuple
 from datetime import datetime
 
 from agent.meetings.factory import create_meeting_bot
@@ -19,6 +21,7 @@ from agent.meetings.transcription.manager import TranscriptionManager
 from agent.meetings.diarization.speaker_manager import SpeakerManager
 from agent.meetings.intelligence.meeting_analyzer import MeetingAnalyzer
 from agent.meetings.intelligence.action_executor import MeetingActionExecutor
+from agent.meetings.pipeline import AnalysisWindow, MeetingPipeline
 from agent.llm_client import LLMClient
 from agent.core_logging import log_event
 
@@ -53,6 +56,12 @@ class MeetingSession:
         self.all_action_items = []
         self.all_decisions = []
         self.all_questions = []
+        self._executed_action_keys: Set[Tuple[str, str, str]] = set()
+
+        # Live analysis pipeline
+        self.pipeline: Optional[MeetingPipeline] = None
+        self.analysis_window_seconds = 30.0
+        self.analysis_overlap_seconds = 5.0
 
     async def join_and_participate(self):
         """
@@ -132,60 +141,87 @@ class MeetingSession:
         """
         Main loop: Listen → Transcribe → Understand → Act
 
-        Runs throughout the meeting.
+        Runs throughout the meeting. Each stage runs concurrently behind a
+        bounded queue (see MeetingPipeline), so slow LLM analysis or action
+        execution never holds up audio capture or transcription.
         """
-        audio_stream = self.bot.get_audio_stream()
+        self.pipeline = MeetingPipeline(
+            analyze=self._analyze_window,
+            act=self._act_on_understanding,
+            on_segment=self._record_segment,
+            window_seconds=self.analysis_window_seconds,
+            overlap_seconds=self.analysis_overlap_seconds,
+        )
 
-        # Start transcription
-        transcript_stream = self.transcription_manager.start_transcription(
-            audio_stream
+        stats = await self.pipeline.run(
+            self.bot.get_audio_stream(),
+            self.transcription_manager.start_transcription,
         )
 
-        # Buffer for accumulating transcript
-        transcript_buffer = []
-        last_analysis_time = datetime.now()
-
-        async for transcript_segment in transcript_stream:
-            # Add to buffer
-            transcript_buffer.append(transcript_segment.text)
-            self.full_transcript.append({
-                "text": transcript_segment.text,
-                "timestamp": datetime.now(),
-                "is_final": transcript_segment.is_final
-            })
+        log_event("meeting_pipeline_stats", stats)
+
+    def _record_segment(self, transcript_segment):
+        """Keep every segment in the full transcript"""
+        self.full_transcript.append({
+            "text": transcript_segment.text,
+            "timestamp": datetime.now(),
+            "is_final": transcript_segment.is_final
+        })
+
+    async def _analyze_window(self, window: AnalysisWindow):
+        """Analyze one transcript window and store what it found"""
+        understanding = await self.meeting_analyzer.analyze_transcript_segment(
+            transcript=window.text,
+            speaker=window.speaker,
+            timestamp=window.end_time
+        )
+
+        # Windows overlap, so the same item can be reported twice
+        self._extend_unique(self.all_action_items, understanding.action_items,
+                            lambda a: (a.task.lower(), a.assignee))
+        self._extend_unique(self.all_decisions, understanding.decisions,
+                            lambda d: d.decision.lower())
+        self._extend_unique(self.all_questions, understanding.questions,
+                            lambda q: q.question.lower())
+
+        return understanding
+
+    async def _act_on_understanding(self, understanding):
+        """Execute actions if needed and announce them in the meeting"""
+        # Overlapping windows suggest the same action again; run each once
+        new_actions = []
+        for action in understanding.suggested_actions:
+            key = self._action_key(action)
+            if key not in self._executed_action_keys:
+                self._executed_action_keys.add(key)
+                new_actions.append(action)
+
+        if not new_actions:
+            return
+
+        actions_taken = await self.action_executor.process_understanding(
+            replace(understanding, suggested_actions=new_actions)
+        )
+
+        if actions_taken:
+            for action in actions_taken:
+                await self._announce_action(action)
+
+    @staticmethod
+    def _action_key(action: Dict) -> Tuple[str, str, str]:
+        return (
+            str(action.get("action_type", "")),
+            " ".join(str(action.get("description", "")).lower().split()),
+            json.dumps(action.get("parameters", {}), sort_keys=True, default=str),
+        )
 
-            # Analyze every 30 seconds or when final segment
-            time_since_analysis = (datetime.now() - last_analysis_time).total_seconds()
-
-            if transcript_segment.is_final and time_since_analysis > 30:
-                # Combine buffered transcript
-                combined_transcript = " ".join(transcript_buffer)
-
-                # Analyze
-                understanding = await self.meeting_analyzer.analyze_transcript_segment(
-                    transcript=combined_transcript,
-                    speaker=None,  # Would be from diarization
-                    timestamp=datetime.now()
-                )
-
-                # Execute actions if needed
-                actions_taken = await self.action_executor.process_understanding(
-                    understanding
-                )
-
-                # Store extracted information
-                self.all_action_items.extend(understanding.action_items)
-                self.all_decisions.extend(understanding.decisions)
-                self.all_questions.extend(understanding.questions)
-
-                # Announce actions in meeting
-                if actions_taken:
-                    for action in actions_taken:
-                        await self._announce_action(action)
-
-                # Clear buffer and reset timer
-                transcript_buffer = []
-                last_analysis_time = datetime.now()
+    @staticmethod
+    def _extend_unique(existing: List, new_items: List, key):
+        seen = {key(item) for item in existing}
+        for item in new_items:
+            if key(item) not in seen:
+                seen.add(key(item))
+                existing.append(item)
 
     async def _announce_action(self, action: Dict):
         """Announce action taken in meeting chat"""
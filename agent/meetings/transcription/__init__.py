@@ -16,6 +16,12 @@ from agent.meetings.transcription.base import (
     TranscriptSegment,
     TranscriptionProvider,
 )
+from agent.meetings.transcription.chunking import (
+    ChunkAggregator,
+    PCMBufferPool,
+    SpeechSegment,
+    transcribe_segments,
+)
 from agent.meetings.transcription.manager import TranscriptionManager
 
 # Import engines with graceful fallback if dependencies not installed
@@ -36,6 +42,11 @@ __all__ = [
     "TranscriptionProvider",
     # Manager
     "TranscriptionManager",
+    # Chunk aggregation
+    "ChunkAggregator",
+    "PCMBufferPool",
+    "SpeechSegment",
+    "transcribe_segments",
     # Engines (may be None if dependencies not installed)
     "WhisperEngine",
     "DeepgramEngine",
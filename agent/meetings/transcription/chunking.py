@@ -0,0 +1,396 @@
+"""
+Speech-bounded chunking and concurrent transcription for batch engines.
+
+Batch engines (Whisper) transcribe each request independently, so sending
+every one-second capture chunk on its own wastes requests on silence and
+cuts words at arbitrary boundaries. This module provides:
+
+- ChunkAggregator: energy-based voice activity detection that merges
+  short capture chunks into segments bounded by pauses in speech
+- PCMBufferPool: reusable segment buffers, exposed as memoryviews so
+  audio is not copied between capture, aggregation and upload
+- transcribe_segments(): keeps several requests in flight and yields the
+  results in the original order
+
+Audio is PCM 16-bit signed little-endian, mono.
+"""
+
+from __future__ import annotations
+
+import asyncio
+import math
+import struct
+from collections import deque
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from io import BytesIO
+from typing import AsyncIterator, Awaitable, Callable, Deque, List, Optional, Union
+
+from agent.meetings.transcription.base import TranscriptSegment
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+
+SAMPLE_WIDTH = 2  # 16-bit PCM
+
+BytesLike = Union[bytes, bytearray, memoryview]
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Audio Helpers
+# ══════════════════════════════════════════════════════════════════════
+
+
+def frame_rms(frame: BytesLike) -> float:
+    """Root-mean-square amplitude of a 16-bit PCM frame (no copy)"""
+    view = memoryview(frame)
+    if view.nbytes < SAMPLE_WIDTH:
+        return 0.0
+
+    if NUMPY_AVAILABLE:
+        samples = np.frombuffer(view, dtype="<i2").astype(np.float32)
+        return float(np.sqrt(np.mean(samples * samples)))
+
+    samples = view[: view.nbytes - view.nbytes % SAMPLE_WIDTH].cast("h")
+    return math.sqrt(sum(s * s for s in samples) / len(samples))
+
+
+def wav_file(pcm: BytesLike, sample_rate: int = 16000, name: str = "audio.wav") -> BytesIO:
+    """
+    Wrap raw PCM in a WAV container.
+
+    Writes the 44-byte RIFF header directly and copies the samples once,
+    instead of going through the wave module.
+    """
+    view = memoryview(pcm)
+    data_size = view.nbytes
+
+    buffer = bytearray(44 + data_size)
+    struct.pack_into(
+        "<4sI4s4sIHHIIHH4sI", buffer, 0,
+        b"RIFF", 36 + data_size, b"WAVE",
+        b"fmt ", 16, 1, 1, sample_rate, sample_rate * SAMPLE_WIDTH, SAMPLE_WIDTH, 16,
+        b"data", data_size,
+    )
+    buffer[44:] = view
+
+    wav = BytesIO(buffer)
+    wav.name = name  # Whisper API needs a filename
+    return wav
+
+
+def chunk_bytes(chunk) -> BytesLike:
+    """Accept raw bytes or AudioChunk objects from meeting bots"""
+    return getattr(chunk, "audio_bytes", chunk)
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Buffers
+# ══════════════════════════════════════════════════════════════════════
+
+
+class PCMBufferPool:
+    """
+    Pool of fixed-capacity bytearrays reused for speech segments.
+
+    Buffers are never resized, so memoryviews over them stay valid; a
+    buffer goes back to the pool when its SpeechSegment is released.
+    """
+
+    def __init__(self, capacity: int, max_pooled: int = 8):
+        self.capacity = capacity
+        self.max_pooled = max_pooled
+        self._free: List[bytearray] = []
+        self.allocated = 0
+
+    def acquire(self) -> bytearray:
+        if self._free:
+            return self._free.pop()
+        self.allocated += 1
+        return bytearray(self.capacity)
+
+    def release(self, buffer: bytearray):
+        if len(self._free) < self.max_pooled and len(buffer) == self.capacity:
+            self._free.append(buffer)
+
+
+@dataclass
+class SpeechSegment:
+    """Speech-bounded audio ready for transcription"""
+    index: int
+    audio: memoryview
+    offset_seconds: float  # Position in the stream
+    duration_seconds: float
+    _buffer: Optional[bytearray] = field(default=None, repr=False)
+    _pool: Optional[PCMBufferPool] = field(default=None, repr=False)
+
+    def release(self):
+        """Return the underlying buffer to its pool (audio is invalid after)"""
+        if self._buffer is not None and self._pool is not None:
+            try:
+                self.audio.release()
+            except BufferError:
+                # Caller still holds a view into the audio; let GC reclaim it
+                self._buffer = None
+                return
+            self._pool.release(self._buffer)
+            self._buffer = None
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Voice Activity Aggregation
+# ══════════════════════════════════════════════════════════════════════
+
+
+class ChunkAggregator:
+    """
+    Merges capture chunks into speech-bounded segments.
+
+    A segment starts at the first voiced frame (plus a short pre-roll) and
+    ends at a pause of ``max_silence_ms`` once it holds at least
+    ``min_segment_ms`` of audio, at a longer pause regardless of length,
+    or when it reaches ``max_segment_ms``. Silence between segments is
+    never sent for transcription.
+
+    Example:
+        aggregator = ChunkAggregator()
+        for chunk in chunks:
+            for segment in aggregator.feed(chunk):
+                text = await engine.transcribe_chunk(segment.audio)
+                segment.release()
+    """
+
+    def __init__(
+        self,
+        sample_rate: int = 16000,
+        frame_ms: int = 30,
+        energy_threshold: float = 500.0,
+        min_segment_ms: int = 1000,
+        max_segment_ms: int = 15000,
+        max_silence_ms: int = 500,
+        pre_roll_ms: int = 150,
+        pool: Optional[PCMBufferPool] = None,
+    ):
+        """
+        Args:
+            sample_rate: Sample rate in Hz
+            frame_ms: VAD frame length
+            energy_threshold: RMS amplitude treated as speech
+            min_segment_ms: Segments shorter than this keep merging across
+                short pauses
+            max_segment_ms: Hard cut for continuous speech
+            max_silence_ms: Pause that ends a segment
+            pre_roll_ms: Audio kept before the first voiced frame
+            pool: Buffer pool (created if not given)
+        """
+        self.sample_rate = sample_rate
+        self.energy_threshold = energy_threshold
+
+        bytes_per_ms = sample_rate * SAMPLE_WIDTH / 1000
+        self.frame_bytes = int(frame_ms * bytes_per_ms) // SAMPLE_WIDTH * SAMPLE_WIDTH
+        self.min_segment_bytes = int(min_segment_ms * bytes_per_ms)
+        self.max_segment_bytes = int(max_segment_ms * bytes_per_ms) // SAMPLE_WIDTH * SAMPLE_WIDTH
+        self.max_silence_bytes = int(max_silence_ms * bytes_per_ms)
+        self.pre_roll_bytes = int(pre_roll_ms * bytes_per_ms) // SAMPLE_WIDTH * SAMPLE_WIDTH
+
+        self.pool = pool or PCMBufferPool(self.max_segment_bytes + self.frame_bytes)
+
+        self._partial = bytearray()  # Incomplete frame carried between chunks
+        self._pre_roll: Deque[bytes] = deque()
+        self._pre_roll_size = 0
+
+        self._buffer: Optional[bytearray] = None
+        self._length = 0
+        self._silence = 0  # Trailing silence in current segment
+        self._segment_start = 0  # Stream byte offset of current segment
+        self._position = 0  # Stream bytes consumed
+        self._next_index = 0
+
+    @property
+    def in_speech(self) -> bool:
+        return self._buffer is not None
+
+    def feed(self, chunk) -> List[SpeechSegment]:
+        """Add captured audio; returns any segments completed by it"""
+        data = memoryview(chunk_bytes(chunk))
+        completed: List[SpeechSegment] = []
+        offset = 0
+
+        # Complete a frame left over from the previous chunk
+        if self._partial:
+            needed = self.frame_bytes - len(self._partial)
+            self._partial += data[:needed]
+            offset = min(needed, data.nbytes)
+            if len(self._partial) < self.frame_bytes:
+                return completed
+            self._process_frame(memoryview(bytes(self._partial)), completed)
+            self._partial.clear()
+
+        while offset + self.frame_bytes <= data.nbytes:
+            self._process_frame(data[offset:offset + self.frame_bytes], completed)
+            offset += self.frame_bytes
+
+        if offset < data.nbytes:
+            self._partial += data[offset:]
+
+        return completed
+
+    def flush(self) -> Optional[SpeechSegment]:
+        """Emit the segment in progress (end of stream)"""
+        if self._partial and self.in_speech:
+            self._append(memoryview(bytes(self._partial)))
+        self._partial.clear()
+
+        if not self.in_speech:
+            return None
+        return self._emit(trim_silence=True)
+
+    def _process_frame(self, frame: memoryview, completed: List[SpeechSegment]):
+        voiced = frame_rms(frame) >= self.energy_threshold
+        frame_start = self._position
+        self._position += frame.nbytes
+
+        if not self.in_speech:
+            if not voiced:
+                self._remember_pre_roll(frame)
+                return
+            self._start_segment(frame_start)
+
+        self._append(frame)
+        self._silence = 0 if voiced else self._silence + frame.nbytes
+
+        if self._length >= self.max_segment_bytes:
+            completed.append(self._emit(trim_silence=False))
+        elif self._silence >= self.max_silence_bytes and (
+            self._length - self._silence >= self.min_segment_bytes
+            or self._silence >= 4 * self.max_silence_bytes
+        ):
+            completed.append(self._emit(trim_silence=True))
+
+    def _remember_pre_roll(self, frame: memoryview):
+        if not self.pre_roll_bytes:
+            return
+        self._pre_roll.append(bytes(frame))
+        self._pre_roll_size += frame.nbytes
+        while self._pre_roll_size - len(self._pre_roll[0]) >= self.pre_roll_bytes:
+            self._pre_roll_size -= len(self._pre_roll.popleft())
+
+    def _start_segment(self, frame_start: int):
+        self._buffer = self.pool.acquire()
+        self._length = 0
+        self._silence = 0
+        self._segment_start = frame_start - self._pre_roll_size
+        for frame in self._pre_roll:
+            self._append(memoryview(frame))
+        self._pre_roll.clear()
+        self._pre_roll_size = 0
+
+    def _append(self, frame: memoryview):
+        end = self._length + frame.nbytes
+        self._buffer[self._length:end] = frame
+        self._length = end
+
+    def _emit(self, trim_silence: bool) -> SpeechSegment:
+        length = self._length
+        if trim_silence:
+            # Keep a little of the pause so the last word isn't clipped
+            length -= max(0, self._silence - self.pre_roll_bytes)
+
+        bytes_per_second = self.sample_rate * SAMPLE_WIDTH
+        segment = SpeechSegment(
+            index=self._next_index,
+            audio=memoryview(self._buffer)[:length],
+            offset_seconds=self._segment_start / bytes_per_second,
+            duration_seconds=length / bytes_per_second,
+            _buffer=self._buffer,
+            _pool=self.pool,
+        )
+        self._next_index += 1
+        self._buffer = None
+        self._length = 0
+        self._silence = 0
+        return segment
+
+    async def segments(self, audio_stream: AsyncIterator) -> AsyncIterator[SpeechSegment]:
+        """Aggregate an async stream of capture chunks"""
+        async for chunk in audio_stream:
+            for segment in self.feed(chunk):
+                yield segment
+
+        segment = self.flush()
+        if segment:
+            yield segment
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Concurrent Transcription
+# ══════════════════════════════════════════════════════════════════════
+
+
+async def transcribe_segments(
+    segments: AsyncIterator[SpeechSegment],
+    transcribe: Callable[[memoryview, int], Awaitable[TranscriptSegment]],
+    sample_rate: int = 16000,
+    max_in_flight: int = 3,
+    stream_start: Optional[datetime] = None,
+) -> AsyncIterator[TranscriptSegment]:
+    """
+    Transcribe segments with up to ``max_in_flight`` concurrent requests.
+
+    Results are yielded in segment order as soon as every earlier segment
+    has finished, with start/end times placed at the segment's position
+    in the stream. Each segment's buffer is released once transcribed.
+
+    Args:
+        segments: Speech segments (e.g. from ChunkAggregator.segments)
+        transcribe: Coroutine (audio, sample_rate) -> TranscriptSegment
+        sample_rate: Sample rate in Hz
+        max_in_flight: Maximum concurrent transcription requests
+        stream_start: Wall-clock time of stream offset 0 (default: now)
+    """
+    stream_start = stream_start or datetime.now()
+    max_in_flight = max(1, max_in_flight)
+
+    async def run(segment: SpeechSegment) -> TranscriptSegment:
+        try:
+            result = await transcribe(segment.audio, sample_rate)
+        finally:
+            segment.release()
+        result.start_time = stream_start + timedelta(seconds=segment.offset_seconds)
+        result.end_time = result.start_time + timedelta(seconds=segment.duration_seconds)
+        return result
+
+    iterator = segments.__aiter__()
+    next_segment: Optional[asyncio.Future] = asyncio.ensure_future(iterator.__anext__())
+    in_flight: Deque[asyncio.Task] = deque()
+
+    try:
+        while next_segment is not None or in_flight:
+            waiting = set()
+            if next_segment is not None and len(in_flight) < max_in_flight:
+                waiting.add(next_segment)
+            if in_flight:
+                waiting.add(in_flight[0])
+            await asyncio.wait(waiting, return_when=asyncio.FIRST_COMPLETED)
+
+            # Ordered reassembly: only the oldest request may be yielded
+            while in_flight and in_flight[0].done():
+                yield in_flight.popleft().result()
+
+            if next_segment is not None and next_segment.done():
+                try:
+                    segment = next_segment.result()
+                except StopAsyncIteration:
+                    next_segment = None
+                    continue
+                in_flight.append(asyncio.create_task(run(segment)))
+                next_segment = asyncio.ensure_future(iterator.__anext__())
+    finally:
+        if next_segment is not None:
+            next_segment.cancel()
+        for task in in_flight:
+            task.cancel()
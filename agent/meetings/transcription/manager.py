@@ -9,7 +9,8 @@ from __future__ import annotations
 
 import asyncio
 import os
-from datetime import datetime
+import wave
+from datetime import datetime, timedelta
 from typing import AsyncIterator, Dict, List, Optional
 
 import agent.core_logging as core_logging
@@ -18,6 +19,7 @@ from agent.meetings.transcription.base import (
     TranscriptSegment,
     TranscriptionProvider,
 )
+from agent.meetings.transcription.chunking import ChunkAggregator, transcribe_segments
 
 
 class TranscriptionManager:
@@ -40,7 +42,9 @@ class TranscriptionManager:
     def __init__(
         self,
         primary_provider: TranscriptionProvider = TranscriptionProvider.DEEPGRAM,
-        fallback_providers: Optional[List[TranscriptionProvider]] = None
+        fallback_providers: Optional[List[TranscriptionProvider]] = None,
+        max_in_flight: int = 3,
+        sample_rate: int = 16000
     ):
         """
         Initialize transcription manager.
@@ -48,11 +52,15 @@ class TranscriptionManager:
         Args:
             primary_provider: Preferred transcription provider
             fallback_providers: List of backup providers (in order)
+            max_in_flight: Concurrent requests for chunk-based engines
+            sample_rate: Sample rate of the audio stream in Hz
         """
         self.primary_provider = primary_provider
         self.fallback_providers = fallback_providers or [
             TranscriptionProvider.WHISPER
         ]
+        self.max_in_flight = max_in_flight
+        self.sample_rate = sample_rate
 
         # Initialize engines
         self.engines: Dict[TranscriptionProvider, TranscriptionEngine] = {}
@@ -170,9 +178,15 @@ class TranscriptionManager:
                     await engine.start_stream()
 
                     try:
-                        async for audio_chunk in audio_stream:
-                            segment = await engine.transcribe_chunk(audio_chunk)
-
+                        # Merge capture chunks into speech-bounded segments
+                        # and keep several requests in flight
+                        aggregator = ChunkAggregator(sample_rate=self.sample_rate)
+                        async for segment in transcribe_segments(
+                            aggregator.segments(audio_stream),
+                            self._chunk_transcriber(engine),
+                            sample_rate=self.sample_rate,
+                            max_in_flight=self.max_in_flight,
+                        ):
                             if segment.text:  # Only yield non-empty
                                 yield segment
 
@@ -205,6 +219,108 @@ class TranscriptionManager:
             })
             raise Exception(error_msg)
 
+    def _chunk_transcriber(self, engine: TranscriptionEngine):
+        """
+        Per-segment transcription for the chunk-based path.
+
+        A request that raises is retried on the fallback providers;
+        the remaining in-flight requests are unaffected.
+        """
+        async def transcribe(audio, sample_rate: int) -> TranscriptSegment:
+            try:
+                return await engine.transcribe_chunk(audio, sample_rate)
+            except Exception as e:
+                core_logging.log_event("transcription_chunk_failed", {
+                    "provider": self.active_provider.value if self.active_provider else None,
+                    "error": str(e),
+                    "error_type": type(e).__name__
+                })
+                return await self._failover_transcribe_chunk(bytes(audio), sample_rate)
+
+        return transcribe
+
+    async def transcribe_file(
+        self,
+        path: str,
+        max_in_flight: int = 4,
+        block_seconds: float = 10.0,
+        recorded_at: Optional[datetime] = None
+    ) -> List[TranscriptSegment]:
+        """
+        Transcribe a recorded WAV file (PCM 16-bit mono).
+
+        The recording is split at pauses in speech and the segments are
+        transcribed concurrently, then returned in order with start/end
+        times placed at their position in the recording.
+
+        Args:
+            path: Path to WAV file
+            max_in_flight: Concurrent transcription requests
+            block_seconds: Audio read from disk per step
+            recorded_at: When the recording started (default: file
+                modification time minus its duration)
+
+        Returns:
+            Non-empty TranscriptSegments in recording order
+
+        Example:
+            segments = await manager.transcribe_file("standup.wav")
+            print(" ".join(s.text for s in segments))
+        """
+        engine = self._select_chunk_engine()
+
+        # Streaming engines share one connection; keep them sequential
+        if engine.supports_streaming():
+            max_in_flight = 1
+
+        with wave.open(path, "rb") as wav:
+            if wav.getnchannels() != 1 or wav.getsampwidth() != 2:
+                raise ValueError("transcribe_file expects 16-bit mono PCM WAV")
+            sample_rate = wav.getframerate()
+            block_frames = max(1, int(sample_rate * block_seconds))
+
+            if recorded_at is None:
+                duration = timedelta(seconds=wav.getnframes() / sample_rate)
+                recorded_at = datetime.fromtimestamp(os.path.getmtime(path)) - duration
+
+            async def read_blocks():
+                while True:
+                    block = wav.readframes(block_frames)
+                    if not block:
+                        return
+                    yield block
+
+            aggregator = ChunkAggregator(sample_rate=sample_rate)
+            await engine.start_stream()
+            try:
+                results = [
+                    segment
+                    async for segment in transcribe_segments(
+                        aggregator.segments(read_blocks()),
+                        self._chunk_transcriber(engine),
+                        sample_rate=sample_rate,
+                        max_in_flight=max_in_flight,
+                        stream_start=recorded_at,
+                    )
+                    if segment.text
+                ]
+            finally:
+                await engine.end_stream()
+
+        return results
+
+    def _select_chunk_engine(self) -> TranscriptionEngine:
+        """Prefer a batch engine for offline work, else any available engine"""
+        providers = [self.primary_provider] + self.fallback_providers
+        engines = [self.engines[p] for p in providers if p in self.engines]
+        if not engines:
+            raise Exception("No transcription providers available")
+
+        for engine in engines:
+            if not engine.supports_streaming():
+                return engine
+        return engines[0]
+
     async def transcribe_chunk(
         self,
         audio_bytes: bytes,
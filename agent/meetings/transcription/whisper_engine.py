@@ -16,6 +16,7 @@ from typing import List
 
 import agent.core_logging as core_logging
 from agent.meetings.transcription.base import TranscriptionEngine, TranscriptSegment
+from agent.meetings.transcription.chunking import wav_file
 
 try:
     import openai
@@ -78,7 +79,7 @@ class WhisperEngine(TranscriptionEngine):
             audio_file = self._create_audio_file(audio_bytes, sample_rate)
 
             core_logging.log_event("whisper_transcription_start", {
-                "audio_size_bytes": len(audio_bytes),
+                "audio_size_bytes": memoryview(audio_bytes).nbytes,
                 "sample_rate": sample_rate
             })
 
@@ -147,30 +148,13 @@ class WhisperEngine(TranscriptionEngine):
         with WAV headers.
 
         Args:
-            audio_bytes: Raw PCM audio (16-bit signed)
+            audio_bytes: Raw PCM audio (16-bit signed); bytes or memoryview
             sample_rate: Sample rate in Hz
 
         Returns:
             BytesIO object with WAV file data
         """
-        import wave
-        import struct
-
-        # Create BytesIO for WAV file
-        wav_file = BytesIO()
-
-        # Write WAV file
-        with wave.open(wav_file, 'wb') as wav:
-            wav.setnchannels(1)  # Mono
-            wav.setsampwidth(2)  # 16-bit
-            wav.setframerate(sample_rate)
-            wav.writeframes(audio_bytes)
-
-        # Reset to beginning
-        wav_file.seek(0)
-        wav_file.name = "audio.wav"  # Whisper API needs a filename
-
-        return wav_file
+        return wav_file(audio_bytes, sample_rate)
 
     async def start_stream(self):
         """
@@ -13,6 +13,10 @@ Features:
 - Time series data storage
 - Real-time and historical queries
 - Health check monitoring
+- Buffered writes: recorders only append to memory; a background thread
+  flushes batches with executemany over one long-lived WAL connection
+- Per-minute and per-hour rollup tables for stats and trends
+- Retention: raw rows and minute rollups expire, hourly rollups remain
 
 Usage:
     >>> from agent.monitoring import get_metrics_collector
@@ -30,18 +34,24 @@ Usage:
     >>> # Get metrics
     >>> stats = metrics.get_mission_stats(hours=24)
     >>> print(f"Success rate: {stats['success_rate']:.1%}")
+
+Queries flush pending writes first, so they always see every recorded
+metric. Benchmark write throughput with:
+    python agent/monitoring.py --benchmark
 """
 
 from __future__ import annotations
 
+import atexit
 import json
 import sqlite3
+import threading
 import time
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 
 # Try to import paths module
 try:
@@ -200,8 +210,80 @@ CREATE INDEX IF NOT EXISTS idx_health_metrics_timestamp
     ON health_metrics(timestamp);
 CREATE INDEX IF NOT EXISTS idx_health_metrics_status
     ON health_metrics(status);
+
+-- Mission rollups per minute and per hour (domain '' = no domain)
+CREATE TABLE IF NOT EXISTS mission_rollups (
+    granularity TEXT NOT NULL,  -- minute, hour
+    bucket_start TEXT NOT NULL,
+    domain TEXT NOT NULL DEFAULT '',
+    total INTEGER NOT NULL DEFAULT 0,
+    successful INTEGER NOT NULL DEFAULT 0,
+    failed INTEGER NOT NULL DEFAULT 0,
+    aborted INTEGER NOT NULL DEFAULT 0,
+    cost_sum REAL NOT NULL DEFAULT 0,
+    duration_sum REAL NOT NULL DEFAULT 0,
+    iterations_sum INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (granularity, bucket_start, domain)
+);
+
+-- Health rollups per minute and per hour
+CREATE TABLE IF NOT EXISTS health_rollups (
+    granularity TEXT NOT NULL,  -- minute, hour
+    bucket_start TEXT NOT NULL,
+    samples INTEGER NOT NULL DEFAULT 0,
+    cpu_sum REAL NOT NULL DEFAULT 0,
+    cpu_count INTEGER NOT NULL DEFAULT 0,
+    memory_sum REAL NOT NULL DEFAULT 0,
+    memory_count INTEGER NOT NULL DEFAULT 0,
+    disk_sum REAL NOT NULL DEFAULT 0,
+    disk_count INTEGER NOT NULL DEFAULT 0,
+    max_active_missions INTEGER NOT NULL DEFAULT 0,
+    max_queue_length INTEGER NOT NULL DEFAULT 0,
+    unhealthy_count INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (granularity, bucket_start)
+);
 """
 
+# Buffered writes are flushed after this many seconds or pending records
+FLUSH_INTERVAL_SECONDS = 1.0
+FLUSH_BATCH_SIZE = 500
+
+# Recorders flush inline once this many batches are waiting (backpressure)
+MAX_PENDING_BATCHES = 20
+
+# Retention: raw rows and minute rollups are downsampled away, hourly
+# rollups keep long-range stats
+RAW_RETENTION_DAYS = 30
+MINUTE_ROLLUP_RETENTION_HOURS = 48
+HOUR_ROLLUP_RETENTION_DAYS = 365
+RETENTION_INTERVAL_SECONDS = 3600
+
+# Rollup granularity -> length of the ISO timestamp prefix that identifies a bucket
+ROLLUP_PREFIX = {"minute": 16, "hour": 13}
+ROLLUP_SUFFIX = {"minute": ":00", "hour": ":00:00"}
+
+MISSION_ROLLUP_COLUMNS = (
+    "total", "successful", "failed", "aborted", "cost_sum", "duration_sum", "iterations_sum"
+)
+HEALTH_ROLLUP_COLUMNS = (
+    "samples", "cpu_sum", "cpu_count", "memory_sum", "memory_count",
+    "disk_sum", "disk_count", "max_active_missions", "max_queue_length", "unhealthy_count",
+)
+
+
+def _bucket(timestamp: str, granularity: str) -> str:
+    """Rollup bucket key for an ISO timestamp"""
+    return timestamp[:ROLLUP_PREFIX[granularity]] + ROLLUP_SUFFIX[granularity]
+
+
+def _ceil(moment: datetime, granularity: str) -> datetime:
+    """Start of the first whole bucket at or after ``moment``"""
+    floor = moment.replace(second=0, microsecond=0)
+    if granularity == "hour":
+        floor = floor.replace(minute=0)
+    step = timedelta(hours=1) if granularity == "hour" else timedelta(minutes=1)
+    return floor if floor == moment else floor + step
+
 
 # ══════════════════════════════════════════════════════════════════════
 # Metrics Collector
@@ -213,14 +295,34 @@ class MetricsCollector:
     Metrics collection and storage system.
 
     Tracks mission metrics, tool usage, errors, and health checks.
+
+    Recording is an in-memory append. A background thread writes pending
+    metrics every ``flush_interval`` seconds, or as soon as ``batch_size``
+    records are waiting, in one transaction over a long-lived WAL
+    connection: raw rows with executemany, tool and error counters as
+    upserts of per-batch deltas, and minute/hour rollups. Every query
+    flushes first.
+
+    Listeners registered with subscribe() receive each metric as it is
+    recorded, so consumers such as alert rules can evaluate incrementally
+    instead of polling the database.
     """
 
-    def __init__(self, db_path: Optional[Path] = None):
+    def __init__(
+        self,
+        db_path: Optional[Path] = None,
+        flush_interval: float = FLUSH_INTERVAL_SECONDS,
+        batch_size: int = FLUSH_BATCH_SIZE,
+    ):
         """
         Initialize metrics collector.
 
         Args:
             db_path: Path to SQLite database (None = default location)
+            flush_interval: Seconds between background flushes
+                            (0 = no background thread; flush inline
+                            whenever ``batch_size`` records are pending)
+            batch_size: Pending records that trigger a flush
         """
         if db_path is None:
             if PATHS_AVAILABLE:
@@ -230,20 +332,387 @@ class MetricsCollector:
 
         self.db_path = db_path
         self.db_path.parent.mkdir(parents=True, exist_ok=True)
+        self.flush_interval = flush_interval
+        self.batch_size = max(1, batch_size)
+
+        # Pending writes
+        self._buffer_lock = threading.Lock()
+        self._missions: List[Tuple] = []
+        self._health: List[Tuple] = []
+        self._tools: Dict[str, List[Any]] = {}
+        self._errors: Dict[Tuple[str, str], List[Any]] = {}
+        self._pending = 0
+        self._listeners: List[Callable[[str, Dict[str, Any]], None]] = []
+
+        # One connection for the collector's lifetime
+        self._db_lock = threading.RLock()
+        self._conn = sqlite3.connect(str(self.db_path), check_same_thread=False)
+        self._conn.row_factory = sqlite3.Row
+        self._last_retention = 0.0
 
         # Initialize database
         self._init_database()
 
+        self._closed = threading.Event()
+        self._wake = threading.Event()
+        self._flusher: Optional[threading.Thread] = None
+        if flush_interval > 0:
+            self._flusher = threading.Thread(
+                target=self._flush_loop, name="metrics-flusher", daemon=True
+            )
+            self._flusher.start()
+
     def _init_database(self) -> None:
         """Create database tables if they don't exist."""
-        with sqlite3.connect(self.db_path) as conn:
-            conn.executescript(MONITORING_SCHEMA)
-            conn.commit()
+        with self._db_lock:
+            self._conn.execute("PRAGMA journal_mode=WAL")
+            self._conn.execute("PRAGMA synchronous=NORMAL")
+            self._conn.executescript(MONITORING_SCHEMA)
+            self._backfill_rollups()
+            self._conn.commit()
+
+    def _backfill_rollups(self) -> None:
+        """Build rollups for databases created before rollup tables existed"""
+        if self._conn.execute("SELECT 1 FROM mission_rollups LIMIT 1").fetchone():
+            return
+        if not self._conn.execute("SELECT 1 FROM mission_metrics LIMIT 1").fetchone():
+            return
+
+        for granularity, length in ROLLUP_PREFIX.items():
+            bucket = f"substr(timestamp, 1, {length}) || '{ROLLUP_SUFFIX[granularity]}'"
+            self._conn.execute(f"""
+                INSERT INTO mission_rollups
+                SELECT
+                    '{granularity}', {bucket}, COALESCE(domain, ''),
+                    COUNT(*),
+                    SUM(status = 'success'), SUM(status = 'failed'), SUM(status = 'aborted'),
+                    SUM(cost_usd), SUM(duration_seconds), SUM(iterations)
+                FROM mission_metrics
+                GROUP BY 2, 3
+            """)
+            self._conn.execute(f"""
+                INSERT INTO health_rollups
+                SELECT
+                    '{granularity}', {bucket},
+                    COUNT(*),
+                    COALESCE(SUM(cpu_percent), 0), COUNT(cpu_percent),
+                    COALESCE(SUM(memory_percent), 0), COUNT(memory_percent),
+                    COALESCE(SUM(disk_percent), 0), COUNT(disk_percent),
+                    MAX(active_missions), MAX(queue_length),
+                    SUM(status = 'unhealthy')
+                FROM health_metrics
+                GROUP BY 2
+            """)
 
     def _now(self) -> str:
         """Get current timestamp in ISO format."""
         return datetime.utcnow().isoformat()
 
+    # ──────────────────────────────────────────────────────────────────
+    # Metric Stream
+    # ──────────────────────────────────────────────────────────────────
+
+    def subscribe(self, listener: Callable[[str, Dict[str, Any]], None]) -> None:
+        """
+        Receive every metric as it is recorded.
+
+        Args:
+            listener: Called as listener(kind, event) with kind one of
+                      "mission", "tool", "error", "health". Runs on the
+                      recording thread, so it should be quick.
+        """
+        if listener not in self._listeners:
+            self._listeners.append(listener)
+
+    def unsubscribe(self, listener: Callable[[str, Dict[str, Any]], None]) -> None:
+        """Stop receiving metrics."""
+        if listener in self._listeners:
+            self._listeners.remove(listener)
+
+    def _publish(self, kind: str, event: Dict[str, Any]) -> None:
+        for listener in list(self._listeners):
+            try:
+                listener(kind, event)
+            except Exception as e:
+                print(f"[Monitoring] Warning: metric listener failed: {e}")
+
+    # ──────────────────────────────────────────────────────────────────
+    # Buffered Writes
+    # ──────────────────────────────────────────────────────────────────
+
+    def _queued(self) -> None:
+        """Called after a record is buffered (with the buffer lock released)"""
+        pending = self._pending
+        if pending >= self.batch_size * MAX_PENDING_BATCHES or (
+            pending >= self.batch_size and self._flusher is None
+        ):
+            self.flush()
+        elif pending >= self.batch_size:
+            self._wake.set()
+
+    def _flush_loop(self) -> None:
+        while not self._closed.is_set():
+            self._wake.wait(self.flush_interval)
+            self._wake.clear()
+            try:
+                self.flush()
+            except Exception as e:
+                print(f"[Monitoring] Warning: metrics flush failed, will retry: {e}")
+
+    def flush(self) -> int:
+        """
+        Write all pending metrics in one transaction.
+
+        Returns:
+            Number of records written
+        """
+        with self._db_lock:
+            with self._buffer_lock:
+                missions, self._missions = self._missions, []
+                health, self._health = self._health, []
+                tools, self._tools = self._tools, {}
+                errors, self._errors = self._errors, {}
+                pending, self._pending = self._pending, 0
+
+            if pending:
+                try:
+                    with self._conn:
+                        self._write_missions(missions)
+                        self._write_health(health)
+                        self._write_tools(tools)
+                        self._write_errors(errors)
+                except Exception:
+                    self._requeue(missions, health, tools, errors, pending)
+                    raise
+
+            if time.monotonic() - self._last_retention >= RETENTION_INTERVAL_SECONDS:
+                self.apply_retention()
+
+        return pending
+
+    def _requeue(self, missions, health, tools, errors, pending) -> None:
+        """Put a failed batch back in front of anything recorded since"""
+        with self._buffer_lock:
+            self._missions = missions + self._missions
+            self._health = health + self._health
+            for tool_name, delta in self._tools.items():
+                self._merge_tool(tools, tool_name, delta)
+            self._tools = tools
+            for key, delta in self._errors.items():
+                self._merge_error(errors, key, delta)
+            self._errors = errors
+            self._pending += pending
+
+    def _write_missions(self, missions: List[Tuple]) -> None:
+        if not missions:
+            return
+        self._conn.executemany("""
+            INSERT INTO mission_metrics (
+                mission_id, status, cost_usd, duration_seconds, iterations,
+                domain, error_type, error_message, metadata, timestamp
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+        """, missions)
+
+        rollups: Dict[Tuple[str, str, str], List[float]] = {}
+        for _, status, cost, duration, iterations, domain, _, _, _, timestamp in missions:
+            for granularity in ROLLUP_PREFIX:
+                row = rollups.setdefault(
+                    (granularity, _bucket(timestamp, granularity), domain or ""),
+                    [0, 0, 0, 0, 0.0, 0.0, 0],
+                )
+                row[0] += 1
+                row[1] += status == "success"
+                row[2] += status == "failed"
+                row[3] += status == "aborted"
+                row[4] += cost
+                row[5] += duration
+                row[6] += iterations
+
+        updates = ", ".join(f"{c} = {c} + excluded.{c}" for c in MISSION_ROLLUP_COLUMNS)
+        self._conn.executemany(f"""
+            INSERT INTO mission_rollups (granularity, bucket_start, domain, {", ".join(MISSION_ROLLUP_COLUMNS)})
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(granularity, bucket_start, domain) DO UPDATE SET {updates}
+        """, [key + tuple(values) for key, values in rollups.items()])
+
+    def _write_health(self, health: List[Tuple]) -> None:
+        if not health:
+            return
+        self._conn.executemany("""
+            INSERT INTO health_metrics (
+                timestamp,
+                cpu_percent,
+                memory_percent,
+                disk_percent,
+                active_missions,
+                queue_length,
+                status,
+                metadata
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+        """, health)
+
+        rollups: Dict[Tuple[str, str], List[float]] = {}
+        for timestamp, cpu, memory, disk, active, queue, status, _ in health:
+            for granularity in ROLLUP_PREFIX:
+                row = rollups.setdefault(
+                    (granularity, _bucket(timestamp, granularity)), [0, 0.0, 0, 0.0, 0, 0.0, 0, 0, 0, 0]
+                )
+                row[0] += 1
+                for position, value in ((1, cpu), (3, memory), (5, disk)):
+                    if value is not None:
+                        row[position] += value
+                        row[position + 1] += 1
+                row[7] = max(row[7], active)
+                row[8] = max(row[8], queue)
+                row[9] += status == "unhealthy"
+
+        updates = ", ".join(
+            f"{c} = MAX({c}, excluded.{c})" if c.startswith("max_") else f"{c} = {c} + excluded.{c}"
+            for c in HEALTH_ROLLUP_COLUMNS
+        )
+        self._conn.executemany(f"""
+            INSERT INTO health_rollups (granularity, bucket_start, {", ".join(HEALTH_ROLLUP_COLUMNS)})
+            VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(granularity, bucket_start) DO UPDATE SET {updates}
+        """, [key + tuple(values) for key, values in rollups.items()])
+
+    def _write_tools(self, tools: Dict[str, List[Any]]) -> None:
+        if not tools:
+            return
+        # Deltas carry the batch's mean duration; the upsert folds it into
+        # the running average weighted by execution counts
+        self._conn.executemany("""
+            INSERT INTO tool_metrics (
+                tool_name,
+                execution_count,
+                success_count,
+                failure_count,
+                avg_duration_seconds,
+                total_cost_usd,
+                last_used,
+                updated_at
+            ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+            ON CONFLICT(tool_name) DO UPDATE SET
+                execution_count = execution_count + excluded.execution_count,
+                success_count = success_count + excluded.success_count,
+                failure_count = failure_count + excluded.failure_count,
+                avg_duration_seconds = (
+                    avg_duration_seconds * execution_count
+                    + excluded.avg_duration_seconds * excluded.execution_count
+                ) / (execution_count + excluded.execution_count),
+                total_cost_usd = total_cost_usd + excluded.total_cost_usd,
+                last_used = excluded.last_used,
+                updated_at = excluded.updated_at
+        """, [
+            (tool_name, count, succ, fail, duration / count, cost, last_used, self._now())
+            for tool_name, (count, succ, fail, duration, cost, last_used) in tools.items()
+        ])
+
+    def _write_errors(self, errors: Dict[Tuple[str, str], List[Any]]) -> None:
+        if not errors:
+            return
+        rows = []
+        for (error_type, error_message), (count, first_seen, last_seen, mission_ids) in errors.items():
+            existing = self._conn.execute(
+                "SELECT mission_ids FROM error_metrics WHERE error_type = ? AND error_message = ?",
+                (error_type, error_message),
+            ).fetchone()
+            merged = json.loads(existing[0]) if existing and existing[0] else []
+            for mission_id in mission_ids:
+                if mission_id not in merged:
+                    merged.append(mission_id)
+            # Keep only last 10 mission IDs
+            rows.append((error_type, error_message, count, first_seen, last_seen, json.dumps(merged[-10:])))
+
+        self._conn.executemany("""
+            INSERT INTO error_metrics (
+                error_type,
+                error_message,
+                count,
+                first_seen,
+                last_seen,
+                mission_ids
+            ) VALUES (?, ?, ?, ?, ?, ?)
+            ON CONFLICT(error_type, error_message) DO UPDATE SET
+                count = count + excluded.count,
+                last_seen = excluded.last_seen,
+                mission_ids = excluded.mission_ids
+        """, rows)
+
+    @staticmethod
+    def _merge_tool(tools: Dict[str, List[Any]], tool_name: str, delta: List[Any]) -> None:
+        current = tools.get(tool_name)
+        if current is None:
+            tools[tool_name] = list(delta)
+            return
+        for position in range(5):
+            current[position] += delta[position]
+        current[5] = max(current[5], delta[5])
+
+    @staticmethod
+    def _merge_error(errors: Dict[Tuple[str, str], List[Any]], key: Tuple[str, str], delta: List[Any]) -> None:
+        current = errors.get(key)
+        if current is None:
+            errors[key] = [delta[0], delta[1], delta[2], list(delta[3])]
+            return
+        current[0] += delta[0]
+        current[1] = min(current[1], delta[1])
+        current[2] = max(current[2], delta[2])
+        current[3].extend(m for m in delta[3] if m not in current[3])
+
+    def close(self) -> None:
+        """Flush pending metrics, stop the flusher and close the connection"""
+        if self._closed.is_set():
+            return
+        self._closed.set()
+        self._wake.set()
+        if self._flusher is not None:
+            self._flusher.join(timeout=5)
+        self.flush()
+        with self._db_lock:
+            self._conn.close()
+
+    # ──────────────────────────────────────────────────────────────────
+    # Retention
+    # ──────────────────────────────────────────────────────────────────
+
+    def apply_retention(self, now: Optional[datetime] = None) -> Dict[str, int]:
+        """
+        Drop raw rows and minute rollups past their retention.
+
+        Hourly rollups already hold everything the dropped rows
+        contributed, so long-range stats are unaffected. Runs
+        automatically at most every RETENTION_INTERVAL_SECONDS.
+
+        Args:
+            now: Reference time (default: current UTC time)
+
+        Returns:
+            Rows deleted per table
+        """
+        now = now or datetime.utcnow()
+        raw_cutoff = (now - timedelta(days=RAW_RETENTION_DAYS)).isoformat()
+        minute_cutoff = (now - timedelta(hours=MINUTE_ROLLUP_RETENTION_HOURS)).isoformat()
+        hour_cutoff = (now - timedelta(days=HOUR_ROLLUP_RETENTION_DAYS)).isoformat()
+
+        deleted = {}
+        with self._db_lock, self._conn:
+            self._last_retention = time.monotonic()
+            for table in ("mission_metrics", "health_metrics"):
+                deleted[table] = self._conn.execute(
+                    f"DELETE FROM {table} WHERE timestamp < ?", (raw_cutoff,)
+                ).rowcount
+            for table in ("mission_rollups", "health_rollups"):
+                deleted[table] = self._conn.execute(
+                    f"""
+                    DELETE FROM {table}
+                    WHERE (granularity = 'minute' AND bucket_start < ?)
+                       OR (granularity = 'hour' AND bucket_start < ?)
+                    """,
+                    (minute_cutoff, hour_cutoff),
+                ).rowcount
+        return deleted
+
     # ──────────────────────────────────────────────────────────────────
     # Mission Metrics
     # ──────────────────────────────────────────────────────────────────
@@ -274,29 +743,90 @@ class MetricsCollector:
             error_message: Error message if failed
             metadata: Additional metadata
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO mission_metrics (
-                    mission_id, status, cost_usd, duration_seconds, iterations,
-                    domain, error_type, error_message, metadata, timestamp
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                mission_id,
-                status,
-                cost_usd,
-                duration_seconds,
-                iterations,
-                domain,
-                error_type,
-                error_message,
-                json.dumps(metadata) if metadata else None,
-                self._now(),
-            ))
-            conn.commit()
+        row = (
+            mission_id,
+            status,
+            cost_usd,
+            duration_seconds,
+            iterations,
+            domain,
+            error_type,
+            error_message,
+            json.dumps(metadata) if metadata else None,
+            self._now(),
+        )
+        with self._buffer_lock:
+            self._missions.append(row)
+            self._pending += 1
+
+        if self._listeners:
+            self._publish("mission", {
+                "mission_id": mission_id,
+                "status": status,
+                "cost_usd": cost_usd,
+                "duration_seconds": duration_seconds,
+                "iterations": iterations,
+                "domain": domain,
+                "timestamp": row[-1],
+            })
 
         # Also record error if failed
         if error_type and error_message:
             self.record_error(error_type, error_message, mission_id)
+        else:
+            self._queued()
+
+    def _mission_hours(
+        self,
+        cutoff: datetime,
+        domain: Optional[str] = None,
+    ) -> Dict[str, List[float]]:
+        """
+        Mission totals per hour for everything at or after ``cutoff``.
+
+        Whole hours come from hourly rollups, whole minutes of the first
+        partial hour from minute rollups, and only the first partial
+        minute from raw rows.
+        """
+        self.flush()
+
+        hour_start = _ceil(cutoff, "hour").isoformat()
+        minute_start = min(_ceil(cutoff, "minute").isoformat(), hour_start)
+        domain_filter = " AND domain = ?" if domain else ""
+        domain_params = [domain] if domain else []
+        sums = ", ".join(f"SUM({c})" for c in MISSION_ROLLUP_COLUMNS)
+
+        queries = [
+            (f"""
+                SELECT bucket_start, {sums} FROM mission_rollups
+                WHERE granularity = 'hour' AND bucket_start >= ?{domain_filter}
+                GROUP BY bucket_start
+            """, [hour_start] + domain_params),
+            (f"""
+                SELECT substr(bucket_start, 1, 13) || ':00:00', {sums} FROM mission_rollups
+                WHERE granularity = 'minute' AND bucket_start >= ? AND bucket_start < ?{domain_filter}
+                GROUP BY 1
+            """, [minute_start, hour_start] + domain_params),
+            (f"""
+                SELECT
+                    substr(timestamp, 1, 13) || ':00:00',
+                    COUNT(*),
+                    SUM(status = 'success'), SUM(status = 'failed'), SUM(status = 'aborted'),
+                    SUM(cost_usd), SUM(duration_seconds), SUM(iterations)
+                FROM mission_metrics
+                WHERE timestamp >= ? AND timestamp < ?{domain_filter}
+                GROUP BY 1
+            """, [cutoff.isoformat(), minute_start] + domain_params),
+        ]
+
+        hours: Dict[str, List[float]] = {}
+        with self._db_lock:
+            for query, params in queries:
+                for row in self._conn.execute(query, params):
+                    totals = hours.setdefault(row[0], [0] * len(MISSION_ROLLUP_COLUMNS))
+                    for position, value in enumerate(row[1:]):
+                        totals[position] += value or 0
+        return hours
 
     def get_mission_stats(
         self,
@@ -313,51 +843,27 @@ class MetricsCollector:
         Returns:
             Dict with mission statistics
         """
-        cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        totals = [0] * len(MISSION_ROLLUP_COLUMNS)
+        for bucket in self._mission_hours(cutoff, domain).values():
+            for position, value in enumerate(bucket):
+                totals[position] += value
+        total, successful, failed, aborted, cost, duration, iterations = totals
 
-            # Build query
-            query = """
-                SELECT
-                    COUNT(*) as total_missions,
-                    SUM(CASE WHEN status = 'success' THEN 1 ELSE 0 END) as successful,
-                    SUM(CASE WHEN status = 'failed' THEN 1 ELSE 0 END) as failed,
-                    SUM(CASE WHEN status = 'aborted' THEN 1 ELSE 0 END) as aborted,
-                    AVG(cost_usd) as avg_cost,
-                    SUM(cost_usd) as total_cost,
-                    AVG(duration_seconds) as avg_duration,
-                    AVG(iterations) as avg_iterations
-                FROM mission_metrics
-                WHERE timestamp >= ?
-            """
-            params = [cutoff]
-
-            if domain:
-                query += " AND domain = ?"
-                params.append(domain)
-
-            cursor.execute(query, params)
-            row = cursor.fetchone()
-
-            total = row["total_missions"] or 0
-            successful = row["successful"] or 0
-
-            return {
-                "total_missions": total,
-                "successful_missions": successful,
-                "failed_missions": row["failed"] or 0,
-                "aborted_missions": row["aborted"] or 0,
-                "success_rate": successful / total if total > 0 else 0,
-                "avg_cost_usd": row["avg_cost"] or 0,
-                "total_cost_usd": row["total_cost"] or 0,
-                "avg_duration_seconds": row["avg_duration"] or 0,
-                "avg_iterations": row["avg_iterations"] or 0,
-                "period_hours": hours,
-                "domain": domain,
-            }
+        return {
+            "total_missions": total,
+            "successful_missions": successful,
+            "failed_missions": failed,
+            "aborted_missions": aborted,
+            "success_rate": successful / total if total > 0 else 0,
+            "avg_cost_usd": cost / total if total > 0 else 0,
+            "total_cost_usd": cost,
+            "avg_duration_seconds": duration / total if total > 0 else 0,
+            "avg_iterations": iterations / total if total > 0 else 0,
+            "period_hours": hours,
+            "domain": domain,
+        }
 
     def get_mission_trend(
         self,
@@ -374,59 +880,49 @@ class MetricsCollector:
         Returns:
             List of time-bucketed metrics
         """
-        cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
+        cutoff = datetime.utcnow() - timedelta(hours=hours)
+
+        result = []
+        for bucket_key, totals in sorted(self._mission_hours(cutoff).items()):
+            total, successful, failed, _, cost, duration, _ = totals
+            if not total:
+                continue
+            result.append({
+                "timestamp": bucket_key,
+                "total": total,
+                "successful": successful,
+                "failed": failed,
+                "total_cost": cost,
+                "avg_duration": duration / total,
+                "success_rate": successful / total,
+            })
+
+        return result
+
+    def recent_missions(self, hours: int = 24) -> List[Dict[str, Any]]:
+        """
+        Raw mission events in the window, oldest first.
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
+        Used to seed stream consumers (see subscribe()) on startup.
 
-            # SQLite doesn't have great time bucketing, so we'll do it in Python
-            cursor.execute("""
-                SELECT
-                    timestamp,
-                    status,
-                    cost_usd,
-                    duration_seconds
+        Args:
+            hours: Number of hours to look back
+
+        Returns:
+            List of dicts with timestamp, status and cost_usd
+        """
+        cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
+
+        self.flush()
+        with self._db_lock:
+            rows = self._conn.execute("""
+                SELECT timestamp, status, cost_usd
                 FROM mission_metrics
                 WHERE timestamp >= ?
                 ORDER BY timestamp ASC
-            """, (cutoff,))
-
-            rows = cursor.fetchall()
-
-            # Bucket by hour
-            buckets = {}
-            for row in rows:
-                ts = datetime.fromisoformat(row["timestamp"])
-                bucket_key = ts.replace(minute=0, second=0, microsecond=0).isoformat()
-
-                if bucket_key not in buckets:
-                    buckets[bucket_key] = {
-                        "timestamp": bucket_key,
-                        "total": 0,
-                        "successful": 0,
-                        "failed": 0,
-                        "total_cost": 0,
-                        "avg_duration": 0,
-                    }
-
-                buckets[bucket_key]["total"] += 1
-                if row["status"] == "success":
-                    buckets[bucket_key]["successful"] += 1
-                elif row["status"] == "failed":
-                    buckets[bucket_key]["failed"] += 1
-                buckets[bucket_key]["total_cost"] += row["cost_usd"]
-                buckets[bucket_key]["avg_duration"] += row["duration_seconds"]
-
-            # Calculate averages
-            result = []
-            for bucket in sorted(buckets.values(), key=lambda x: x["timestamp"]):
-                if bucket["total"] > 0:
-                    bucket["success_rate"] = bucket["successful"] / bucket["total"]
-                    bucket["avg_duration"] = bucket["avg_duration"] / bucket["total"]
-                result.append(bucket)
-
-            return result
+            """, (cutoff,)).fetchall()
+
+        return [dict(row) for row in rows]
 
     # ──────────────────────────────────────────────────────────────────
     # Tool Metrics
@@ -448,81 +944,20 @@ class MetricsCollector:
             duration_seconds: Execution duration
             cost_usd: Cost of execution
         """
-        with sqlite3.connect(self.db_path) as conn:
-            # Try to update existing row
-            cursor = conn.cursor()
-            cursor.execute("""
-                SELECT
-                    execution_count,
-                    success_count,
-                    failure_count,
-                    avg_duration_seconds,
-                    total_cost_usd
-                FROM tool_metrics
-                WHERE tool_name = ?
-            """, (tool_name,))
-
-            row = cursor.fetchone()
-            now = self._now()
-
-            if row:
-                # Update existing
-                exec_count = row[0] + 1
-                succ_count = row[1] + (1 if success else 0)
-                fail_count = row[2] + (0 if success else 1)
-                old_avg_duration = row[3]
-                old_total_cost = row[4]
-
-                # Calculate new average duration
-                new_avg_duration = (old_avg_duration * row[0] + duration_seconds) / exec_count
-                new_total_cost = old_total_cost + cost_usd
-
-                cursor.execute("""
-                    UPDATE tool_metrics
-                    SET
-                        execution_count = ?,
-                        success_count = ?,
-                        failure_count = ?,
-                        avg_duration_seconds = ?,
-                        total_cost_usd = ?,
-                        last_used = ?,
-                        updated_at = ?
-                    WHERE tool_name = ?
-                """, (
-                    exec_count,
-                    succ_count,
-                    fail_count,
-                    new_avg_duration,
-                    new_total_cost,
-                    now,
-                    now,
-                    tool_name,
-                ))
-            else:
-                # Insert new
-                cursor.execute("""
-                    INSERT INTO tool_metrics (
-                        tool_name,
-                        execution_count,
-                        success_count,
-                        failure_count,
-                        avg_duration_seconds,
-                        total_cost_usd,
-                        last_used,
-                        updated_at
-                    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-                """, (
-                    tool_name,
-                    1,
-                    1 if success else 0,
-                    0 if success else 1,
-                    duration_seconds,
-                    cost_usd,
-                    now,
-                    now,
-                ))
-
-            conn.commit()
+        delta = [1, 1 if success else 0, 0 if success else 1, duration_seconds, cost_usd, self._now()]
+        with self._buffer_lock:
+            self._merge_tool(self._tools, tool_name, delta)
+            self._pending += 1
+
+        if self._listeners:
+            self._publish("tool", {
+                "tool_name": tool_name,
+                "success": success,
+                "duration_seconds": duration_seconds,
+                "cost_usd": cost_usd,
+                "timestamp": delta[-1],
+            })
+        self._queued()
 
     def get_tool_stats(
         self,
@@ -549,11 +984,9 @@ class MetricsCollector:
         if order_by not in valid_order_by:
             order_by = "execution_count"
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute(f"""
+        self.flush()
+        with self._db_lock:
+            rows = self._conn.execute(f"""
                 SELECT
                     tool_name,
                     execution_count,
@@ -565,22 +998,21 @@ class MetricsCollector:
                 FROM tool_metrics
                 ORDER BY {order_by} DESC
                 LIMIT ?
-            """, (limit,))
-
-            rows = cursor.fetchall()
-            return [
-                {
-                    "tool_name": row["tool_name"],
-                    "execution_count": row["execution_count"],
-                    "success_count": row["success_count"],
-                    "failure_count": row["failure_count"],
-                    "success_rate": row["success_count"] / row["execution_count"] if row["execution_count"] > 0 else 0,
-                    "avg_duration_seconds": row["avg_duration_seconds"],
-                    "total_cost_usd": row["total_cost_usd"],
-                    "last_used": row["last_used"],
-                }
-                for row in rows
-            ]
+            """, (limit,)).fetchall()
+
+        return [
+            {
+                "tool_name": row["tool_name"],
+                "execution_count": row["execution_count"],
+                "success_count": row["success_count"],
+                "failure_count": row["failure_count"],
+                "success_rate": row["success_count"] / row["execution_count"] if row["execution_count"] > 0 else 0,
+                "avg_duration_seconds": row["avg_duration_seconds"],
+                "total_cost_usd": row["total_cost_usd"],
+                "last_used": row["last_used"],
+            }
+            for row in rows
+        ]
 
     # ──────────────────────────────────────────────────────────────────
     # Error Metrics
@@ -600,64 +1032,20 @@ class MetricsCollector:
             error_message: Error message
             mission_id: Optional mission ID
         """
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            now = self._now()
-
-            # Try to update existing
-            cursor.execute("""
-                SELECT count, mission_ids
-                FROM error_metrics
-                WHERE error_type = ? AND error_message = ?
-            """, (error_type, error_message))
-
-            row = cursor.fetchone()
-
-            if row:
-                # Update existing
-                new_count = row[0] + 1
-                mission_ids = json.loads(row[1]) if row[1] else []
-                if mission_id and mission_id not in mission_ids:
-                    mission_ids.append(mission_id)
-                    # Keep only last 10 mission IDs
-                    mission_ids = mission_ids[-10:]
-
-                cursor.execute("""
-                    UPDATE error_metrics
-                    SET
-                        count = ?,
-                        last_seen = ?,
-                        mission_ids = ?
-                    WHERE error_type = ? AND error_message = ?
-                """, (
-                    new_count,
-                    now,
-                    json.dumps(mission_ids),
-                    error_type,
-                    error_message,
-                ))
-            else:
-                # Insert new
-                mission_ids = [mission_id] if mission_id else []
-                cursor.execute("""
-                    INSERT INTO error_metrics (
-                        error_type,
-                        error_message,
-                        count,
-                        first_seen,
-                        last_seen,
-                        mission_ids
-                    ) VALUES (?, ?, ?, ?, ?, ?)
-                """, (
-                    error_type,
-                    error_message,
-                    1,
-                    now,
-                    now,
-                    json.dumps(mission_ids),
-                ))
-
-            conn.commit()
+        now = self._now()
+        delta = [1, now, now, [mission_id] if mission_id else []]
+        with self._buffer_lock:
+            self._merge_error(self._errors, (error_type, error_message), delta)
+            self._pending += 1
+
+        if self._listeners:
+            self._publish("error", {
+                "error_type": error_type,
+                "error_message": error_message,
+                "mission_id": mission_id,
+                "timestamp": now,
+            })
+        self._queued()
 
     def get_error_stats(
         self,
@@ -676,11 +1064,9 @@ class MetricsCollector:
         """
         cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute("""
+        self.flush()
+        with self._db_lock:
+            rows = self._conn.execute("""
                 SELECT
                     error_type,
                     error_message,
@@ -692,20 +1078,19 @@ class MetricsCollector:
                 WHERE last_seen >= ?
                 ORDER BY count DESC
                 LIMIT ?
-            """, (cutoff, limit))
-
-            rows = cursor.fetchall()
-            return [
-                {
-                    "error_type": row["error_type"],
-                    "error_message": row["error_message"],
-                    "count": row["count"],
-                    "first_seen": row["first_seen"],
-                    "last_seen": row["last_seen"],
-                    "mission_ids": json.loads(row["mission_ids"]) if row["mission_ids"] else [],
-                }
-                for row in rows
-            ]
+            """, (cutoff, limit)).fetchall()
+
+        return [
+            {
+                "error_type": row["error_type"],
+                "error_message": row["error_message"],
+                "count": row["count"],
+                "first_seen": row["first_seen"],
+                "last_seen": row["last_seen"],
+                "mission_ids": json.loads(row["mission_ids"]) if row["mission_ids"] else [],
+            }
+            for row in rows
+        ]
 
     def get_error_rate(self, hours: int = 24) -> Dict[str, Any]:
         """
@@ -771,29 +1156,31 @@ class MetricsCollector:
         if queue_length > 100:
             status = "degraded"
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.execute("""
-                INSERT INTO health_metrics (
-                    timestamp,
-                    cpu_percent,
-                    memory_percent,
-                    disk_percent,
-                    active_missions,
-                    queue_length,
-                    status,
-                    metadata
-                ) VALUES (?, ?, ?, ?, ?, ?, ?, ?)
-            """, (
-                self._now(),
-                cpu_percent,
-                memory_percent,
-                disk_percent,
-                active_missions,
-                queue_length,
-                status,
-                json.dumps(metadata) if metadata else None,
-            ))
-            conn.commit()
+        row = (
+            self._now(),
+            cpu_percent,
+            memory_percent,
+            disk_percent,
+            active_missions,
+            queue_length,
+            status,
+            json.dumps(metadata) if metadata else None,
+        )
+        with self._buffer_lock:
+            self._health.append(row)
+            self._pending += 1
+
+        if self._listeners:
+            self._publish("health", {
+                "timestamp": row[0],
+                "cpu_percent": cpu_percent,
+                "memory_percent": memory_percent,
+                "disk_percent": disk_percent,
+                "active_missions": active_missions,
+                "queue_length": queue_length,
+                "status": status,
+            })
+        self._queued()
 
         return status
 
@@ -804,11 +1191,9 @@ class MetricsCollector:
         Returns:
             Latest health metrics or None
         """
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute("""
+        self.flush()
+        with self._db_lock:
+            row = self._conn.execute("""
                 SELECT
                     timestamp,
                     cpu_percent,
@@ -820,12 +1205,11 @@ class MetricsCollector:
                 FROM health_metrics
                 ORDER BY timestamp DESC
                 LIMIT 1
-            """)
+            """).fetchone()
 
-            row = cursor.fetchone()
-            if row:
-                return dict(row)
-            return None
+        if row:
+            return dict(row)
+        return None
 
     def get_health_trend(self, hours: int = 24) -> List[Dict[str, Any]]:
         """
@@ -839,11 +1223,9 @@ class MetricsCollector:
         """
         cutoff = (datetime.utcnow() - timedelta(hours=hours)).isoformat()
 
-        with sqlite3.connect(self.db_path) as conn:
-            conn.row_factory = sqlite3.Row
-            cursor = conn.cursor()
-
-            cursor.execute("""
+        self.flush()
+        with self._db_lock:
+            rows = self._conn.execute("""
                 SELECT
                     timestamp,
                     cpu_percent,
@@ -855,9 +1237,115 @@ class MetricsCollector:
                 FROM health_metrics
                 WHERE timestamp >= ?
                 ORDER BY timestamp ASC
-            """, (cutoff,))
+            """, (cutoff,)).fetchall()
+
+        return [dict(row) for row in rows]
+
+    def get_health_rollups(
+        self,
+        hours: int = 24,
+        granularity: str = "hour",
+    ) -> List[Dict[str, Any]]:
+        """
+        Get downsampled health metrics.
 
-            return [dict(row) for row in cursor.fetchall()]
+        Unlike get_health_trend(), hourly rollups outlive raw retention.
+
+        Args:
+            hours: Number of hours to look back
+            granularity: Bucket size ("minute" or "hour")
+
+        Returns:
+            List of per-bucket averages and maxima
+        """
+        if granularity not in ROLLUP_PREFIX:
+            raise ValueError(f"Unknown granularity: {granularity}")
+        cutoff = _bucket((datetime.utcnow() - timedelta(hours=hours)).isoformat(), granularity)
+
+        self.flush()
+        with self._db_lock:
+            rows = self._conn.execute(f"""
+                SELECT bucket_start, {", ".join(HEALTH_ROLLUP_COLUMNS)}
+                FROM health_rollups
+                WHERE granularity = ? AND bucket_start >= ?
+                ORDER BY bucket_start ASC
+            """, (granularity, cutoff)).fetchall()
+
+        return [
+            {
+                "timestamp": row["bucket_start"],
+                "samples": row["samples"],
+                "avg_cpu_percent": row["cpu_sum"] / row["cpu_count"] if row["cpu_count"] else None,
+                "avg_memory_percent": row["memory_sum"] / row["memory_count"] if row["memory_count"] else None,
+                "avg_disk_percent": row["disk_sum"] / row["disk_count"] if row["disk_count"] else None,
+                "max_active_missions": row["max_active_missions"],
+                "max_queue_length": row["max_queue_length"],
+                "unhealthy_count": row["unhealthy_count"],
+            }
+            for row in rows
+        ]
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Benchmark
+# ══════════════════════════════════════════════════════════════════════
+
+
+def benchmark_writes(
+    missions: int = 2000,
+    concurrency: int = 8,
+    tools_per_mission: int = 3,
+    db_path: Optional[Path] = None,
+    **collector_kwargs: Any,
+) -> Dict[str, Any]:
+    """
+    Measure metric write throughput under concurrent missions.
+
+    Each of ``concurrency`` threads records its share of missions, each
+    with ``tools_per_mission`` tool executions. Timing includes the final
+    flush, so every write is on disk when the clock stops.
+
+    Args:
+        missions: Total missions to record
+        concurrency: Threads recording at once
+        tools_per_mission: Tool executions recorded per mission
+        db_path: Database to write (default: a temporary file)
+        **collector_kwargs: Passed to MetricsCollector (e.g. batch_size)
+
+    Returns:
+        Dict with writes, seconds and writes_per_second
+    """
+    import tempfile
+
+    with tempfile.TemporaryDirectory() as tmpdir:
+        collector = MetricsCollector(db_path or Path(tmpdir) / "benchmark.db", **collector_kwargs)
+
+        def run_missions(worker: int):
+            for i in range(worker, missions, concurrency):
+                for step in range(tools_per_mission):
+                    collector.record_tool_execution(f"tool_{step}", True, 0.01)
+                collector.record_mission(f"bench_{i}", "success", 0.01, 1.0, 1, domain="bench")
+
+        threads = [threading.Thread(target=run_missions, args=(w,)) for w in range(concurrency)]
+        started = time.perf_counter()
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        collector.flush()
+        elapsed = time.perf_counter() - started
+
+        recorded = collector.get_mission_stats(hours=1)["total_missions"]
+        collector.close()
+
+    writes = missions * (tools_per_mission + 1)
+    return {
+        "missions": recorded,
+        "writes": writes,
+        "concurrency": concurrency,
+        "seconds": round(elapsed, 4),
+        "writes_per_second": round(writes / elapsed, 1) if elapsed > 0 else 0,
+    }
 
 
 # ══════════════════════════════════════════════════════════════════════
@@ -878,6 +1366,7 @@ def get_metrics_collector() -> MetricsCollector:
     global _metrics_collector
     if _metrics_collector is None:
         _metrics_collector = MetricsCollector()
+        atexit.register(_metrics_collector.close)
     return _metrics_collector
 
 
@@ -911,6 +1400,16 @@ def record_health_check(**kwargs) -> str:
 
 
 if __name__ == "__main__":
+    import sys
+
+    if "--benchmark" in sys.argv:
+        print("Metric write throughput (2000 missions x 4 writes, 8 threads)")
+        unbuffered = benchmark_writes(flush_interval=0, batch_size=1)
+        buffered = benchmark_writes()
+        print(f"  Commit per write: {unbuffered['writes_per_second']:>10,.0f} writes/s")
+        print(f"  Buffered batches: {buffered['writes_per_second']:>10,.0f} writes/s")
+        sys.exit(0)
+
     # Demo usage
     print("=" * 60)
     print("Monitoring System Demo")
@@ -12,27 +12,33 @@ Production-grade task scheduler with:
 from .cron import (
     CronExpression,
     CronScheduler,
+    MisfirePolicy,
     ScheduledTask,
 )
 
-from .calendar import (
-    CalendarIntegration,
-    CalendarEvent,
-)
-
-from .persistence import (
-    TaskStore,
-    SchedulerState,
-)
-
 __all__ = [
     "CronExpression",
     "CronScheduler",
+    "MisfirePolicy",
     "ScheduledTask",
-    "CalendarIntegration",
-    "CalendarEvent",
-    "TaskStore",
-    "SchedulerState",
 ]
 
+try:
+    from .calendar import (
+        CalendarIntegration,
+        CalendarEvent,
+    )
+    __all__ += ["CalendarIntegration", "CalendarEvent"]
+except ImportError:
+    pass
+
+try:
+    from .persistence import (
+        TaskStore,
+        SchedulerState,
+    )
+    __all__ += ["TaskStore", "SchedulerState"]
+except ImportError:
+    pass
+
 __version__ = "1.0.0"
@@ -7,11 +7,14 @@ Full cron syntax support with recurring task automation.
 from __future__ import annotations
 
 import asyncio
-import re
+import calendar
+import heapq
+import itertools
+from bisect import bisect_left
 from dataclasses import dataclass, field
 from datetime import datetime, timedelta
 from enum import Enum
-from typing import Any, Callable, Dict, List, Optional, Set
+from typing import Any, Callable, Dict, List, Optional, Set, Tuple
 
 try:
     import pytz
@@ -86,6 +89,9 @@ class CronExpression:
         CronField.DAY_OF_WEEK: (0, 6),  # 0 = Sunday
     }
 
+    # How far ahead get_next() searches before giving up (e.g. "0 0 31 2 *")
+    SEARCH_HORIZON_YEARS = 30
+
     # Month names
     MONTH_NAMES = {
         "jan": 1, "feb": 2, "mar": 3, "apr": 4,
@@ -126,6 +132,12 @@ class CronExpression:
         self.month = self._parse_field(parts[3], CronField.MONTH)
         self.weekday = self._parse_field(parts[4], CronField.DAY_OF_WEEK)
 
+        # Sorted views used by get_next() to jump field by field
+        self._minutes = sorted(self.minute)
+        self._hours = sorted(self.hour)
+        self._days = sorted(self.day)
+        self._months = sorted(self.month)
+
     def _parse_field(self, field: str, field_type: CronField) -> Set[int]:
         """
         Parse a single cron field.
@@ -176,6 +188,13 @@ class CronExpression:
             else:
                 result.add(self._parse_value(part, field_type))
 
+        out_of_range = [v for v in result if v < min_val or v > max_val]
+        if out_of_range:
+            raise ValueError(
+                f"Value(s) {sorted(out_of_range)} out of range "
+                f"{min_val}-{max_val} for {field_type.name}"
+            )
+
         return result
 
     def _parse_value(self, value: str, field_type: CronField) -> int:
@@ -222,9 +241,31 @@ class CronExpression:
             and dt.hour in self.hour
             and dt.day in self.day
             and dt.month in self.month
-            and dt.weekday() in self.weekday
+            and self._cron_weekday(dt.year, dt.month, dt.day) in self.weekday
         )
 
+    @staticmethod
+    def _cron_weekday(year: int, month: int, day: int) -> int:
+        """Weekday in cron numbering (0 = Sunday)"""
+        return (calendar.weekday(year, month, day) + 1) % 7
+
+    @staticmethod
+    def _first_at_or_after(values: List[int], value: int) -> Optional[int]:
+        """Smallest element of sorted ``values`` that is >= ``value``"""
+        idx = bisect_left(values, value)
+        return values[idx] if idx < len(values) else None
+
+    def _next_day(self, year: int, month: int, start_day: int) -> Optional[int]:
+        """First day >= start_day in the month matching both day and weekday"""
+        last_day = calendar.monthrange(year, month)[1]
+        idx = bisect_left(self._days, start_day)
+        for day in self._days[idx:]:
+            if day > last_day:
+                break
+            if self._cron_weekday(year, month, day) in self.weekday:
+                return day
+        return None
+
     def get_next(
         self,
         after: datetime,
@@ -233,20 +274,67 @@ class CronExpression:
         """
         Get next matching datetime after given time.
 
+        Computed arithmetically: each step jumps straight to the next
+        valid month, day, hour or minute instead of scanning minute by
+        minute, so schedules years ahead resolve in a handful of steps.
+
         Args:
             after: Starting datetime
-            max_iterations: Maximum iterations to search
+            max_iterations: Maximum number of field jumps to attempt
 
         Returns:
             Next matching datetime or None
         """
         # Start from next minute
         current = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+        horizon_year = current.year + self.SEARCH_HORIZON_YEARS
 
         for _ in range(max_iterations):
-            if self.matches(current):
-                return current
-            current += timedelta(minutes=1)
+            if current.year > horizon_year:
+                return None
+
+            # Month
+            if current.month not in self.month:
+                month = self._first_at_or_after(self._months, current.month)
+                if month is None:
+                    current = current.replace(
+                        year=current.year + 1, month=self._months[0],
+                        day=1, hour=0, minute=0,
+                    )
+                else:
+                    current = current.replace(month=month, day=1, hour=0, minute=0)
+                continue
+
+            # Day (day-of-month and weekday must both match)
+            day = self._next_day(current.year, current.month, current.day)
+            if day is None:
+                if current.month == 12:
+                    current = current.replace(
+                        year=current.year + 1, month=1, day=1, hour=0, minute=0
+                    )
+                else:
+                    current = current.replace(
+                        month=current.month + 1, day=1, hour=0, minute=0
+                    )
+                continue
+            if day != current.day:
+                current = current.replace(day=day, hour=0, minute=0)
+
+            # Hour
+            hour = self._first_at_or_after(self._hours, current.hour)
+            if hour is None:
+                current = current.replace(hour=0, minute=0) + timedelta(days=1)
+                continue
+            if hour != current.hour:
+                current = current.replace(hour=hour, minute=0)
+
+            # Minute
+            minute = self._first_at_or_after(self._minutes, current.minute)
+            if minute is None:
+                current = current.replace(minute=0) + timedelta(hours=1)
+                continue
+
+            return current.replace(minute=minute)
 
         return None
 
@@ -270,12 +358,24 @@ class CronExpression:
 # Scheduled Task
 # =============================================================================
 
+class MisfirePolicy(Enum):
+    """What to do with fire times missed while the scheduler was behind"""
+    FIRE_ONCE = "fire_once"  # Coalesce all missed runs into a single run
+    FIRE_ALL = "fire_all"  # Replay every missed run (up to max_catch_up)
+    SKIP = "skip"  # Drop missed runs and wait for the next slot
+
+
 @dataclass
 class ScheduledTask:
     """
     A scheduled task.
 
     Tracks execution history and next run time.
+
+    A run that starts within ``misfire_grace_seconds`` of its scheduled
+    time is on time. Later than that it is a misfire and is handled by
+    ``misfire_policy``. At most ``max_concurrent`` executions of the task
+    run at once; runs that come due while the limit is reached are skipped.
     """
     id: str
     name: str
@@ -290,34 +390,94 @@ class ScheduledTask:
     run_count: int = 0
     failure_count: int = 0
     metadata: Dict[str, Any] = field(default_factory=dict)
+    misfire_policy: MisfirePolicy = MisfirePolicy.FIRE_ONCE
+    misfire_grace_seconds: int = 60
+    max_catch_up: int = 100
+    max_concurrent: int = 1
+    running_count: int = 0
+    misfire_count: int = 0
+    skipped_count: int = 0
 
     def __post_init__(self):
         """Calculate initial next_run"""
         if self.next_run is None:
             self.next_run = self.cron.get_next(datetime.utcnow())
 
-    def should_run(self, now: Optional[datetime] = None) -> bool:
-        """Check if task should run now"""
+    def is_active(self) -> bool:
+        """Check if task is enabled and has runs left"""
         if not self.enabled:
             return False
+        return not (self.max_runs and self.run_count >= self.max_runs)
 
-        if self.max_runs and self.run_count >= self.max_runs:
+    def should_run(self, now: Optional[datetime] = None) -> bool:
+        """Check if task should run now"""
+        if not self.is_active():
             return False
 
         now = now or datetime.utcnow()
-        return self.next_run and now >= self.next_run
+        return bool(self.next_run and now >= self.next_run)
+
+    def collect_due(self, now: datetime) -> List[datetime]:
+        """
+        Advance next_run past ``now`` and return the fire times to execute.
+
+        Applies the misfire policy to any fire times that were missed.
+
+        Args:
+            now: Current time
+
+        Returns:
+            Scheduled times to run now, oldest first (may be empty)
+        """
+        if not self.should_run(now):
+            return []
+
+        first = self.next_run
+        on_time = (now - first).total_seconds() <= self.misfire_grace_seconds
+
+        if self.misfire_policy == MisfirePolicy.FIRE_ALL:
+            fires: List[datetime] = []
+            current = first
+            while current is not None and current <= now and len(fires) < self.max_catch_up:
+                fires.append(current)
+                current = self.cron.get_next(current)
+            if current is not None and current <= now:
+                # Over the catch-up limit: drop the rest of the backlog
+                current = self.cron.get_next(now)
+            self.next_run = current
+        else:
+            if on_time or self.misfire_policy == MisfirePolicy.FIRE_ONCE:
+                fires = [first]
+            else:
+                fires = []
+            self.next_run = self.cron.get_next(now)
+
+        if not on_time:
+            self.misfire_count += 1
+
+        if self.max_runs:
+            remaining = self.max_runs - self.run_count - self.running_count
+            fires = fires[:max(remaining, 0)]
+
+        return fires
+
+    def mark_executed(self, success: bool = True, executed_at: Optional[datetime] = None):
+        """
+        Mark task as executed.
+
+        next_run is left alone: the scheduler advances it in collect_due()
+        and keeps the heap in step with it.
 
-    def mark_executed(self, success: bool = True):
-        """Mark task as executed"""
-        self.last_run = datetime.utcnow()
+        Args:
+            success: Whether the run succeeded
+            executed_at: Completion time (default: now, UTC)
+        """
+        self.last_run = executed_at or datetime.utcnow()
         self.run_count += 1
 
         if not success:
             self.failure_count += 1
 
-        # Calculate next run
-        self.next_run = self.cron.get_next(datetime.utcnow())
-
         # Disable if max runs reached
         if self.max_runs and self.run_count >= self.max_runs:
             self.enabled = False
@@ -337,6 +497,12 @@ class CronScheduler:
     - Timezone support
     - Task persistence
     - Concurrent execution
+    - Misfire/catch-up policies and per-task concurrency limits
+
+    Tasks are kept in a min-heap keyed by next fire time, so each wake-up
+    only touches the tasks that are actually due, and the loop sleeps until
+    the earliest fire time (capped at ``check_interval``) instead of
+    polling every task.
 
     Usage:
         scheduler = CronScheduler()
@@ -355,20 +521,30 @@ class CronScheduler:
     def __init__(
         self,
         timezone: str = "UTC",
-        check_interval: int = 60,  # Check every 60 seconds
+        check_interval: int = 60,  # Longest sleep between heap checks
+        clock: Optional[Callable[[], datetime]] = None,
     ):
         """
         Initialize scheduler.
 
         Args:
             timezone: Default timezone
-            check_interval: How often to check for tasks (seconds)
+            check_interval: Maximum time to sleep between checks (seconds)
+            clock: Optional source of the current time (defaults to utcnow)
         """
         self.timezone = timezone
         self.check_interval = check_interval
         self.tasks: Dict[str, ScheduledTask] = {}
         self.running = False
         self._task_counter = 0
+        self._clock = clock or datetime.utcnow
+
+        # (next_run, sequence, task_id); stale entries are skipped on pop
+        self._heap: List[Tuple[datetime, int, str]] = []
+        self._sequence = itertools.count()
+        self._inflight: Set[asyncio.Task] = set()
+        self._wakeup: Optional[asyncio.Event] = None
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
 
     def add_task(
         self,
@@ -378,6 +554,9 @@ class CronScheduler:
         timezone: Optional[str] = None,
         max_runs: Optional[int] = None,
         metadata: Optional[Dict[str, Any]] = None,
+        misfire_policy: MisfirePolicy = MisfirePolicy.FIRE_ONCE,
+        misfire_grace_seconds: int = 60,
+        max_concurrent: int = 1,
     ) -> ScheduledTask:
         """
         Add a scheduled task.
@@ -389,6 +568,9 @@ class CronScheduler:
             timezone: Optional timezone
             max_runs: Maximum number of runs
             metadata: Optional metadata
+            misfire_policy: How to handle missed fire times
+            misfire_grace_seconds: Lateness tolerated before a run is a misfire
+            max_concurrent: Maximum simultaneous executions of this task
 
         Returns:
             Created ScheduledTask
@@ -406,22 +588,43 @@ class CronScheduler:
             timezone=timezone or self.timezone,
             max_runs=max_runs,
             metadata=metadata or {},
+            next_run=cron_expr.get_next(self._clock()),
+            misfire_policy=misfire_policy,
+            misfire_grace_seconds=misfire_grace_seconds,
+            max_concurrent=max_concurrent,
         )
 
-        self.tasks[task_id] = task
+        self.add_scheduled_task(task)
         print(f"[Scheduler] Added task: {name} ({cron})")
         print(f"[Scheduler] Next run: {task.next_run}")
 
         return task
 
+    def add_scheduled_task(self, task: ScheduledTask) -> ScheduledTask:
+        """Add an already-built ScheduledTask"""
+        self.tasks[task.id] = task
+        self._push(task)
+        self._notify()
+        return task
+
     def remove_task(self, task_id: str) -> bool:
         """Remove a task"""
         if task_id in self.tasks:
             task = self.tasks.pop(task_id)
+            self._notify()
             print(f"[Scheduler] Removed task: {task.name}")
             return True
         return False
 
+    def reschedule_task(self, task_id: str) -> bool:
+        """Re-queue a task after its next_run or enabled flag changed"""
+        task = self.tasks.get(task_id)
+        if task is None:
+            return False
+        self._push(task)
+        self._notify()
+        return True
+
     def get_task(self, task_id: str) -> Optional[ScheduledTask]:
         """Get task by ID"""
         return self.tasks.get(task_id)
@@ -433,6 +636,15 @@ class CronScheduler:
             tasks = [t for t in tasks if t.enabled]
         return tasks
 
+    def next_wakeup(self) -> Optional[datetime]:
+        """Earliest pending fire time across all tasks"""
+        while self._heap:
+            run_at, _, task_id = self._heap[0]
+            if self._is_current(run_at, task_id):
+                return run_at
+            heapq.heappop(self._heap)
+        return None
+
     async def start(self):
         """Start the scheduler"""
         if self.running:
@@ -440,12 +652,25 @@ class CronScheduler:
             return
 
         self.running = True
-        print(f"[Scheduler] Started (checking every {self.check_interval}s)")
+        self._loop = asyncio.get_running_loop()
+        self._wakeup = asyncio.Event()
+        print(f"[Scheduler] Started (sleeping until next due task, max {self.check_interval}s)")
 
         while self.running:
             try:
-                await self._check_and_execute()
-                await asyncio.sleep(self.check_interval)
+                self._wakeup.clear()
+                self._dispatch_due(self._clock())
+
+                delay = float(self.check_interval)
+                next_run = self.next_wakeup()
+                if next_run is not None:
+                    until_due = (next_run - self._clock()).total_seconds()
+                    delay = max(0.0, min(delay, until_due))
+
+                try:
+                    await asyncio.wait_for(self._wakeup.wait(), timeout=delay)
+                except asyncio.TimeoutError:
+                    pass
             except Exception as e:
                 print(f"[Scheduler] Error in scheduler loop: {e}")
                 await asyncio.sleep(self.check_interval)
@@ -453,29 +678,89 @@ class CronScheduler:
     def stop(self):
         """Stop the scheduler"""
         self.running = False
+        self._notify()
         print("[Scheduler] Stopped")
 
-    async def _check_and_execute(self):
-        """Check for tasks to execute and run them"""
-        now = datetime.utcnow()
-
-        # Find tasks that should run
-        tasks_to_run = [
-            task for task in self.tasks.values()
-            if task.should_run(now)
-        ]
-
-        if not tasks_to_run:
-            return
-
-        print(f"[Scheduler] Executing {len(tasks_to_run)} task(s)")
+    async def run_pending(self, now: Optional[datetime] = None):
+        """Run every task that is due at ``now`` and wait for them to finish"""
+        launched = self._dispatch_due(now or self._clock())
+        if launched:
+            await asyncio.gather(*launched, return_exceptions=True)
+
+    def _push(self, task: ScheduledTask):
+        """Queue task at its next fire time"""
+        if task.next_run is not None and task.is_active():
+            heapq.heappush(
+                self._heap, (task.next_run, next(self._sequence), task.id)
+            )
 
-        # Execute tasks concurrently
-        await asyncio.gather(
-            *[self._execute_task(task) for task in tasks_to_run],
-            return_exceptions=True
+    def _is_current(self, run_at: datetime, task_id: str) -> bool:
+        """Check a heap entry still reflects the task's schedule"""
+        task = self.tasks.get(task_id)
+        return (
+            task is not None
+            and task.is_active()
+            and task.next_run == run_at
         )
 
+    def _notify(self):
+        """Wake the scheduler loop so it re-reads the heap"""
+        if self._loop is not None and self._wakeup is not None:
+            try:
+                self._loop.call_soon_threadsafe(self._wakeup.set)
+            except RuntimeError:
+                # Loop already closed
+                pass
+
+    def _dispatch_due(self, now: datetime) -> List[asyncio.Task]:
+        """Pop due tasks off the heap and launch their runs"""
+        launched: List[asyncio.Task] = []
+        requeue: List[ScheduledTask] = []
+
+        while self._heap and self._heap[0][0] <= now:
+            run_at, _, task_id = heapq.heappop(self._heap)
+            if not self._is_current(run_at, task_id):
+                continue
+
+            task = self.tasks[task_id]
+            fires = task.collect_due(now)
+            requeue.append(task)
+
+            if not fires:
+                print(f"[Scheduler] Skipped misfired run: {task.name}")
+                continue
+
+            if task.running_count >= task.max_concurrent:
+                task.skipped_count += len(fires)
+                print(
+                    f"[Scheduler] Skipped {task.name}: "
+                    f"{task.running_count} run(s) already in progress"
+                )
+                continue
+
+            task.running_count += 1
+            launched.append(asyncio.ensure_future(self._run_task(task, fires)))
+
+        # Re-queue after the loop so a task is never popped twice per tick
+        for task in requeue:
+            self._push(task)
+
+        if launched:
+            print(f"[Scheduler] Executing {len(launched)} task(s)")
+            for future in launched:
+                self._inflight.add(future)
+                future.add_done_callback(self._inflight.discard)
+
+        return launched
+
+    async def _run_task(self, task: ScheduledTask, fires: List[datetime]):
+        """Execute the collected runs of a task in order"""
+        try:
+            for _ in fires:
+                await self._execute_task(task)
+        finally:
+            task.running_count -= 1
+
     async def _execute_task(self, task: ScheduledTask):
         """Execute a single task"""
         print(f"[Scheduler] Executing: {task.name}")
@@ -487,11 +772,11 @@ class CronScheduler:
             else:
                 task.callback()
 
-            task.mark_executed(success=True)
+            task.mark_executed(success=True, executed_at=self._clock())
             print(f"[Scheduler] ✅ Task completed: {task.name}")
 
         except Exception as e:
-            task.mark_executed(success=False)
+            task.mark_executed(success=False, executed_at=self._clock())
             print(f"[Scheduler] ❌ Task failed: {task.name} - {e}")
 
 
@@ -9,6 +9,7 @@ Run: pytest agent/tests/test_agent_messaging.py -v
 from __future__ import annotations
 
 import asyncio
+import json
 from datetime import datetime
 from unittest.mock import AsyncMock, patch
 
@@ -276,6 +277,43 @@ class TestAgentMessageBus:
         assert len(message_bus.message_history) == 10
         assert message_bus.message_history[0].content == "Message 5"
 
+    @pytest.mark.asyncio
+    async def test_listen_queue(self, message_bus):
+        """Test queue listeners receive messages without a callback"""
+        queue = message_bus.listen(maxsize=2)
+
+        for i in range(3):
+            await message_bus.post_message(AgentRole.EMPLOYEE, f"Message {i}")
+
+        # Oldest dropped when the queue is full
+        assert queue.get_nowait().content == "Message 1"
+        assert queue.get_nowait().content == "Message 2"
+
+        message_bus.stop_listening(queue)
+        await message_bus.post_message(AgentRole.EMPLOYEE, "After")
+        assert queue.empty()
+
+    def test_history_spills_to_file(self, tmp_path):
+        """Test trimmed history is appended to the spill file"""
+        spill = tmp_path / "history.jsonl"
+        bus = AgentMessageBus(max_history=3, spill_path=spill)
+
+        for i in range(5):
+            bus._add_to_history(AgentMessage(
+                message_id=f"msg_{i}",
+                role=AgentRole.MANAGER,
+                content=f"Message {i}",
+                timestamp=datetime.now()
+            ))
+
+        assert [m.content for m in bus.get_recent_messages(10)] == [
+            "Message 2", "Message 3", "Message 4"
+        ]
+        assert bus.get_message("msg_0") is None
+        assert bus.get_message("msg_4").content == "Message 4"
+        lines = spill.read_text().splitlines()
+        assert [json.loads(line)["content"] for line in lines] == ["Message 0", "Message 1"]
+
 
 # ══════════════════════════════════════════════════════════════════════
 # LoopDetector Tests (R1 Reliability Fix)
@@ -0,0 +1,169 @@
+"""
+Tests for the integration credential store.
+
+Checks that the store reads its file once, serves repeated lookups from a
+TTL cache of decrypted values, zeroizes evicted entries, and replaces the
+file atomically with owner-only permissions.
+"""
+
+import json
+import stat
+import threading
+import time
+
+import pytest
+
+from agent.integrations.auth import CredentialEncryption, CredentialStore, create_credential
+
+
+class CountingEncryption(CredentialEncryption):
+    def __init__(self):
+        super().__init__(master_key="test-master-key")
+        self.decrypts = 0
+
+    def decrypt(self, encrypted_data: str) -> str:
+        self.decrypts += 1
+        return super().decrypt(encrypted_data)
+
+
+@pytest.fixture
+def encryption():
+    return CountingEncryption()
+
+
+@pytest.fixture
+def path(tmp_path):
+    return tmp_path / "integrations.json"
+
+
+def make_store(path, encryption, **kwargs):
+    return CredentialStore(str(path), encryption=encryption, **kwargs)
+
+
+def store_db(store, connector_id="db_1", password="s3cret"):
+    store.store(create_credential(
+        connector_id, "basic", {"username": "app", "password": password}, metadata={"engine": "postgresql"}
+    ))
+
+
+def test_roundtrip_and_file_format(path, encryption):
+    store = make_store(path, encryption)
+    store_db(store)
+
+    on_disk = json.loads(path.read_text())
+    assert on_disk["db_1"]["credentials"]["password"] != "s3cret"
+    assert stat.S_IMODE(path.stat().st_mode) == 0o600
+    assert list(path.parent.iterdir()) == [path]  # No temp files left behind
+
+    # A fresh store reads the same file and decrypts it
+    credential = make_store(path, encryption).get("db_1")
+    assert credential.credentials == {"username": "app", "password": "s3cret"}
+    assert credential.metadata == {"engine": "postgresql"}
+    assert make_store(path, encryption).list_all()["db_1"]["auth_type"] == "basic"
+
+
+def test_reads_file_once_and_caches_decrypts(path, encryption, monkeypatch):
+    store_db(make_store(path, encryption))
+    store = make_store(path, encryption)
+    monkeypatch.setattr(store, "_load_data", lambda: pytest.fail("file re-read"))
+
+    for _ in range(5):
+        assert store.get("db_1").credentials["password"] == "s3cret"
+    assert encryption.decrypts == 2  # One per field, on the first miss only
+    assert store.get("missing") is None
+
+    stats = store.get_stats()
+    assert (stats["hits"], stats["misses"], stats["records"]) == (4, 1, 1)
+
+
+def test_returned_credentials_are_copies(path, encryption):
+    store = make_store(path, encryption)
+    store_db(store)
+
+    credential = store.get("db_1")
+    credential.credentials["password"] = "changed"
+    credential.metadata["engine"] = "mysql"
+
+    again = store.get("db_1")
+    assert again.credentials["password"] == "s3cret"
+    assert again.metadata == {"engine": "postgresql"}
+
+
+def test_store_primes_cache_and_replaces_entry(path, encryption):
+    store = make_store(path, encryption)
+    store_db(store)
+    assert store.get("db_1").credentials["password"] == "s3cret"
+    assert encryption.decrypts == 0
+
+    store_db(store, password="rotated")
+    assert store.get("db_1").credentials["password"] == "rotated"
+    assert store.get_stats()["evictions"] == 1
+
+
+def test_eviction_zeroizes_buffers(path, encryption):
+    store = make_store(path, encryption)
+    store_db(store)
+    buffers = list(store._cache["db_1"].values.values())
+
+    assert store.delete("db_1")
+    assert not store.delete("db_1")
+    assert all(buf == bytearray(len(buf)) for buf in buffers)
+    assert store.get("db_1") is None
+    assert "db_1" not in json.loads(path.read_text())
+
+
+def test_expired_entries_are_decrypted_again(path, encryption):
+    store = make_store(path, encryption, cache_ttl=0)
+    store_db(store)
+
+    store.get("db_1")
+    store.get("db_1")
+    assert encryption.decrypts == 4
+    assert store.get_stats()["cached"] == 0
+
+
+def test_lapsed_entries_are_zeroized_on_read(path, encryption):
+    store = make_store(path, encryption, cache_ttl=0.05)
+    store_db(store, "db_1")
+    store_db(store, "db_2")
+    buffers = list(store._cache["db_1"].values.values())
+
+    time.sleep(0.1)
+    assert store.get_stats()["cached"] == 0
+
+    # Any miss sweeps every lapsed entry, not just the one requested
+    store.get("db_2")
+    assert all(buf == bytearray(len(buf)) for buf in buffers)
+    assert list(store._cache) == ["db_2"]
+
+    time.sleep(0.1)
+    assert store.get("missing") is None
+    assert store._cache == {}
+
+
+def test_concurrent_readers_and_writer(path, encryption):
+    store = make_store(path, encryption)
+    for i in range(4):
+        store_db(store, f"db_{i}")
+    errors = []
+
+    def reader(connector_id):
+        try:
+            for _ in range(200):
+                assert store.get(connector_id).credentials["username"] == "app"
+        except Exception as e:  # pragma: no cover - reported below
+            errors.append(e)
+
+    def writer():
+        for i in range(20):
+            store_db(store, "db_0", password=f"p{i}")
+
+    threads = [threading.Thread(target=reader, args=(f"db_{i % 4}",)) for i in range(8)]
+    threads.append(threading.Thread(target=writer))
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    assert errors == []
+    assert make_store(path, encryption).get("db_0").credentials["password"] == "p19"
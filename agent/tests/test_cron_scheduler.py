@@ -0,0 +1,260 @@
+"""
+Cron Scheduler Tests
+
+Tests for arithmetic next-fire computation, the heap-based scheduler,
+misfire policies and per-task concurrency limits.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+from pathlib import Path
+
+import pytest
+
+# Import from parent directory
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from scheduler.cron import (
+    CronExpression,
+    CronScheduler,
+    MisfirePolicy,
+    ScheduledTask,
+)
+
+
+def brute_force_next(cron: CronExpression, after: datetime, limit: int = 200000):
+    """Reference implementation: scan minute by minute."""
+    current = after.replace(second=0, microsecond=0) + timedelta(minutes=1)
+    for _ in range(limit):
+        if cron.matches(current):
+            return current
+        current += timedelta(minutes=1)
+    return None
+
+
+class FakeClock:
+    """Controllable time source."""
+
+    def __init__(self, now: datetime):
+        self.now = now
+
+    def __call__(self) -> datetime:
+        return self.now
+
+
+# ============================================================================
+# CronExpression
+# ============================================================================
+
+@pytest.mark.parametrize("expression", [
+    "*/5 * * * *",
+    "0 9 * * 1-5",
+    "30 2 1 * *",
+    "15,45 */3 * jan-mar sun",
+    "@weekly",
+    "0 12 */2 * *",
+])
+def test_get_next_matches_brute_force(expression):
+    """Arithmetic get_next agrees with a minute-by-minute scan."""
+    cron = CronExpression(expression)
+    after = datetime(2025, 1, 30, 23, 58, 30)
+    for _ in range(5):
+        expected = brute_force_next(cron, after)
+        assert cron.get_next(after) == expected
+        after = expected
+
+
+def test_get_next_far_ahead():
+    """Schedules more than 1000 minutes away are found."""
+    cron = CronExpression("@yearly")
+    assert cron.get_next(datetime(2025, 3, 1)) == datetime(2026, 1, 1, 0, 0)
+
+
+def test_get_next_leap_day():
+    """Feb 29 schedules skip to the next leap year."""
+    cron = CronExpression("0 0 29 2 *")
+    assert cron.get_next(datetime(2025, 1, 1)) == datetime(2028, 2, 29, 0, 0)
+
+
+def test_get_next_impossible_date():
+    """Dates that never exist return None instead of looping."""
+    assert CronExpression("0 0 31 2 *").get_next(datetime(2025, 1, 1)) is None
+
+
+def test_weekday_zero_is_sunday():
+    """Weekday numbering follows cron (0 = Sunday)."""
+    cron = CronExpression("0 9 * * 1-5")
+    assert cron.matches(datetime(2025, 6, 2, 9, 0))  # Monday
+    assert not cron.matches(datetime(2025, 6, 1, 9, 0))  # Sunday
+
+
+def test_out_of_range_value_rejected():
+    """Values outside a field's range raise ValueError."""
+    with pytest.raises(ValueError):
+        CronExpression("75 * * * *")
+
+
+# ============================================================================
+# Misfire policies
+# ============================================================================
+
+def make_task(policy, next_run, **kwargs):
+    return ScheduledTask(
+        id="t1",
+        name="test",
+        cron=CronExpression("*/10 * * * *"),
+        callback=lambda: None,
+        next_run=next_run,
+        misfire_policy=policy,
+        **kwargs,
+    )
+
+
+def test_fire_once_coalesces_missed_runs():
+    """FIRE_ONCE runs a single time for a backlog of missed slots."""
+    task = make_task(MisfirePolicy.FIRE_ONCE, datetime(2025, 1, 1, 9, 0))
+    fires = task.collect_due(datetime(2025, 1, 1, 9, 35))
+    assert fires == [datetime(2025, 1, 1, 9, 0)]
+    assert task.next_run == datetime(2025, 1, 1, 9, 40)
+    assert task.misfire_count == 1
+
+
+def test_fire_all_replays_missed_runs():
+    """FIRE_ALL returns every missed slot in order."""
+    task = make_task(MisfirePolicy.FIRE_ALL, datetime(2025, 1, 1, 9, 0))
+    fires = task.collect_due(datetime(2025, 1, 1, 9, 35))
+    assert fires == [
+        datetime(2025, 1, 1, 9, 0),
+        datetime(2025, 1, 1, 9, 10),
+        datetime(2025, 1, 1, 9, 20),
+        datetime(2025, 1, 1, 9, 30),
+    ]
+    assert task.next_run == datetime(2025, 1, 1, 9, 40)
+
+
+def test_fire_all_respects_catch_up_limit():
+    """FIRE_ALL stops replaying at max_catch_up."""
+    task = make_task(
+        MisfirePolicy.FIRE_ALL, datetime(2025, 1, 1, 9, 0), max_catch_up=2
+    )
+    fires = task.collect_due(datetime(2025, 1, 2, 9, 5))
+    assert len(fires) == 2
+    assert task.next_run == datetime(2025, 1, 2, 9, 10)
+
+
+def test_skip_drops_late_run_but_keeps_on_time_run():
+    """SKIP only runs within the grace period."""
+    late = make_task(MisfirePolicy.SKIP, datetime(2025, 1, 1, 9, 0))
+    assert late.collect_due(datetime(2025, 1, 1, 9, 5)) == []
+    assert late.next_run == datetime(2025, 1, 1, 9, 10)
+
+    on_time = make_task(MisfirePolicy.SKIP, datetime(2025, 1, 1, 9, 0))
+    assert on_time.collect_due(datetime(2025, 1, 1, 9, 0, 30)) == [
+        datetime(2025, 1, 1, 9, 0)
+    ]
+
+
+# ============================================================================
+# CronScheduler
+# ============================================================================
+
+def test_heap_orders_next_wakeup():
+    """next_wakeup returns the earliest fire time among tasks."""
+    clock = FakeClock(datetime(2025, 1, 1, 8, 0))
+    scheduler = CronScheduler(clock=clock)
+    scheduler.add_task("hourly", "0 * * * *", lambda: None)
+    soon = scheduler.add_task("soon", "5 8 * * *", lambda: None)
+
+    assert scheduler.next_wakeup() == datetime(2025, 1, 1, 8, 5)
+
+    scheduler.remove_task(soon.id)
+    assert scheduler.next_wakeup() == datetime(2025, 1, 1, 9, 0)
+
+
+def test_run_pending_executes_only_due_tasks():
+    """Only tasks whose fire time has passed are executed."""
+    clock = FakeClock(datetime(2025, 1, 1, 8, 0))
+    scheduler = CronScheduler(clock=clock)
+    calls = []
+    scheduler.add_task("a", "5 8 * * *", lambda: calls.append("a"))
+    scheduler.add_task("b", "0 12 * * *", lambda: calls.append("b"))
+
+    asyncio.run(scheduler.run_pending(datetime(2025, 1, 1, 8, 5)))
+
+    assert calls == ["a"]
+    assert scheduler.next_wakeup() == datetime(2025, 1, 1, 12, 0)
+
+
+def test_max_concurrent_skips_overlapping_runs():
+    """A task already running at its limit skips the next due run."""
+    clock = FakeClock(datetime(2025, 1, 1, 8, 0))
+    scheduler = CronScheduler(clock=clock)
+
+    async def scenario():
+        release = asyncio.Event()
+
+        async def slow():
+            await release.wait()
+
+        task = scheduler.add_task("slow", "* * * * *", slow, max_concurrent=1)
+
+        first = scheduler._dispatch_due(datetime(2025, 1, 1, 8, 1))
+        second = scheduler._dispatch_due(datetime(2025, 1, 1, 8, 2))
+        assert len(first) == 1
+        assert second == []
+        assert task.skipped_count == 1
+
+        release.set()
+        await asyncio.gather(*first)
+        assert task.running_count == 0
+        assert task.run_count == 1
+
+    asyncio.run(scenario())
+
+
+def test_run_longer_than_interval_fires_again():
+    """A run that overshoots its next fire time stays scheduled."""
+    clock = FakeClock(datetime(2025, 1, 1, 8, 0))
+    scheduler = CronScheduler(clock=clock)
+    calls = []
+
+    def slow():
+        calls.append(clock.now)
+        clock.now += timedelta(minutes=3)  # Runs past the next two fire times
+
+    task = scheduler.add_task("slow", "* * * * *", slow)
+
+    asyncio.run(scheduler.run_pending(datetime(2025, 1, 1, 8, 1)))
+    assert task.run_count == 1
+    assert task.last_run == datetime(2025, 1, 1, 8, 3)
+    assert scheduler.next_wakeup() == datetime(2025, 1, 1, 8, 2)
+
+    asyncio.run(scheduler.run_pending())
+    assert task.run_count == 2
+    assert len(calls) == 2
+    assert scheduler.next_wakeup() is not None
+
+
+def test_start_sleeps_until_due_and_stop():
+    """The run loop fires a due task and exits promptly on stop()."""
+    calls = []
+
+    async def scenario():
+        scheduler = CronScheduler(check_interval=3600)
+        task = scheduler.add_task("now", "* * * * *", lambda: calls.append(1))
+
+        # Make the task due immediately
+        task.next_run = datetime.utcnow()
+        scheduler.reschedule_task(task.id)
+
+        runner = asyncio.ensure_future(scheduler.start())
+        for _ in range(100):
+            if calls:
+                break
+            await asyncio.sleep(0.01)
+        scheduler.stop()
+        await asyncio.wait_for(runner, timeout=1)
+
+    asyncio.run(scenario())
+    assert calls == [1]
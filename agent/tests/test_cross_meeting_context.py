@@ -0,0 +1,160 @@
+"""
+Tests for the cross-meeting context system.
+
+Covers related-meeting scoring over the inverted indexes, the SQLite
+meeting store with lazy hydration, and import of legacy JSON files.
+"""
+
+import json
+from datetime import datetime, timedelta
+
+import pytest
+
+from agent.meetings.cross_meeting_context import (
+    ActionItem,
+    CrossMeetingContext,
+    MeetingRecord,
+)
+
+
+BASE = datetime(2025, 1, 6, 9, 0)
+
+
+def make_meeting(n, participants, topics=(), project=None, series_id=None, action_items=()):
+    return MeetingRecord(
+        meeting_id=f"m{n}",
+        title=f"Meeting {n}",
+        started_at=BASE + timedelta(days=n),
+        ended_at=BASE + timedelta(days=n, minutes=30),
+        participants=list(participants),
+        topics=list(topics),
+        project=project,
+        series_id=series_id,
+        action_items=list(action_items),
+    )
+
+
+def action(item_id, assignee, status="pending"):
+    item = ActionItem(id=item_id, description=f"Do {item_id}", assignee=assignee)
+    item.status = status
+    return item
+
+
+def brute_force_related(context, meeting_id, max_results):
+    """Reference scorer: the original scan over every stored meeting"""
+    meeting = context.meetings[meeting_id]
+    scores = {}
+
+    if meeting.series_id and meeting.series_id in context.meeting_series:
+        for other in context.meeting_series[meeting.series_id].meetings:
+            if other != meeting_id:
+                scores[other] = scores.get(other, 0) + 10.0
+    if meeting.project:
+        for other in context.meetings_by_project[meeting.project]:
+            if other != meeting_id:
+                scores[other] = scores.get(other, 0) + 5.0
+    for participant in meeting.participants:
+        for other in context.meetings_by_participant[participant]:
+            if other != meeting_id:
+                overlap = len(set(meeting.participants) & set(context.meetings[other].participants))
+                scores[other] = scores.get(other, 0) + overlap / len(meeting.participants) * 3.0
+    for other_id in context.meetings:
+        if other_id != meeting_id:
+            common = set(meeting.topics) & set(context.meetings[other_id].topics)
+            if common:
+                scores[other_id] = scores.get(other_id, 0) + len(common) / len(meeting.topics) * 2.0
+
+    ranked = sorted(scores.items(), key=lambda x: x[1], reverse=True)[:max_results]
+    return [mid for mid, _ in ranked]
+
+
+@pytest.fixture
+def context(tmp_path):
+    ctx = CrossMeetingContext(storage_path=tmp_path)
+    people = ["ann@x.com", "bob@x.com", "cat@x.com", "dan@x.com"]
+    topics = ["budget", "hiring", "roadmap", "infra"]
+    for n in range(24):
+        ctx.add_meeting(make_meeting(
+            n,
+            participants=people[n % 3:n % 3 + 2 + n % 2],
+            topics=topics[n % 4:n % 4 + 2],
+            project="alpha" if n % 5 == 0 else None,
+            series_id="standup" if n % 6 == 0 else None,
+            action_items=[action(f"a{n}", people[n % 4], "completed" if n % 3 else "pending")],
+        ))
+    return ctx
+
+
+def test_related_meetings_match_full_scan(context):
+    """Index-based scoring ranks meetings exactly like a full scan"""
+    for meeting_id in ("m0", "m7", "m12", "m23"):
+        related = [m.meeting_id for m in context.get_related_meetings(meeting_id, max_results=5)]
+        assert related == brute_force_related(context, meeting_id, 5)
+
+
+def test_reload_builds_indexes_without_hydrating(tmp_path, context):
+    """A fresh instance indexes the store and parses bodies only on access"""
+    reloaded = CrossMeetingContext(storage_path=tmp_path)
+
+    assert len(reloaded.meetings) == 24
+    assert reloaded.meetings._cache == {}
+    assert reloaded.get_meeting_series("standup").total_meetings == 4
+
+    related = [m.meeting_id for m in reloaded.get_related_meetings("m7", max_results=3)]
+    assert related == [m.meeting_id for m in context.get_related_meetings("m7", max_results=3)]
+    assert len(reloaded.meetings._cache) <= 4
+
+
+def test_participant_context_survives_reload(tmp_path, context):
+    """Counters come from the index; pending items hydrate on first use"""
+    original = context.get_participant_context("ann@x.com")
+    reloaded = CrossMeetingContext(storage_path=tmp_path).get_participant_context("ann@x.com")
+
+    assert reloaded.meetings_attended == original.meetings_attended
+    assert reloaded.total_action_items == original.total_action_items
+    assert reloaded.completed_action_items == original.completed_action_items
+    assert [i.id for i in reloaded.pending_action_items] == [i.id for i in original.pending_action_items]
+
+
+def test_patterns_and_recommendations_use_indexes(context):
+    """Topic counts come from postings rather than scanning bodies"""
+    patterns = context.detect_patterns()
+    assert dict(patterns["most_common_topics"])["budget"] == 6
+
+    recommendations = context.get_contextual_recommendations("m0")
+    assert any("Topic 'budget'" in r for r in recommendations)
+
+
+def test_readding_meeting_does_not_duplicate_postings(context):
+    """Updating a meeting replaces its index entries"""
+    updated = make_meeting(1, ["ann@x.com"], topics=["security"])
+    context.add_meeting(updated)
+
+    assert "m1" in context.meetings_by_topic["security"]
+    assert "m1" not in context.meetings_by_topic["hiring"]
+    assert context.meetings_by_participant["ann@x.com"].count("m1") == 1
+    assert sum(1 for _, mid in context.meetings_by_date if mid == "m1") == 1
+
+    recent = [m.started_at for m in context.get_recent_meetings(limit=len(context.meetings))]
+    assert recent == sorted(recent, reverse=True)
+
+
+def test_legacy_json_files_imported(tmp_path):
+    """Meetings saved one-file-per-meeting are imported into the store"""
+    legacy = {
+        "meeting_id": "old1",
+        "title": "Old planning",
+        "started_at": BASE.isoformat(),
+        "participants": ["ann@x.com"],
+        "topics": ["budget"],
+        "action_items": [{"id": "x", "description": "Ship", "assignee": "ann@x.com"}],
+    }
+    (tmp_path / "old1.json").write_text(json.dumps(legacy))
+
+    context = CrossMeetingContext(storage_path=tmp_path)
+    assert context.get_meeting("old1").title == "Old planning"
+    assert context.get_participant_context("ann@x.com").total_action_items == 1
+
+    # Second start doesn't import again
+    again = CrossMeetingContext(storage_path=tmp_path)
+    assert len(again.meetings) == 1
@@ -0,0 +1,182 @@
+"""
+Tests for the pooled database connector.
+
+Runs DatabaseConnector against file-backed SQLite databases to check
+placeholder translation and the statement cache, concurrent pooled
+queries, batched streaming, idle-connection health checks, and the
+query_database / stream_database tools.
+"""
+
+import asyncio
+import inspect
+
+import pytest
+
+from agent.integrations.base import get_registry
+from agent.integrations.database import DatabaseConnector
+from agent.integrations.db_pool import PoolConfig, PoolTimeoutError, SQLitePool, StatementCache, aclosing
+from agent.integrations.tools import INTEGRATION_TOOLS, query_database, stream_database
+
+
+EMPLOYEES = 2500
+
+
+@pytest.fixture
+def db_path(tmp_path):
+    import sqlite3
+
+    path = tmp_path / "hr.db"
+    conn = sqlite3.connect(path)
+    conn.execute("CREATE TABLE employees (id INTEGER PRIMARY KEY, name TEXT, dept TEXT, salary INTEGER)")
+    conn.executemany(
+        "INSERT INTO employees (name, dept, salary) VALUES (?, ?, ?)",
+        [(f"emp_{i}", "HR" if i % 5 == 0 else "Eng", 1000 + i) for i in range(EMPLOYEES)],
+    )
+    conn.commit()
+    conn.close()
+    return path
+
+
+@pytest.fixture
+async def connector(db_path):
+    connector = DatabaseConnector("db_test", "sqlite", {
+        "database": str(db_path),
+        "pool_size": 4,
+        "pool_min_size": 2,
+        "stream_batch_size": 500,
+    })
+    assert await connector.connect()
+    get_registry().register(connector)
+    yield connector
+    get_registry().unregister(connector.connector_id)
+    await connector.disconnect()
+
+
+@pytest.mark.parametrize("style, query, sql, params, args", [
+    ("qmark", "SELECT * FROM t WHERE a = $1 AND b = $2", "SELECT * FROM t WHERE a = ? AND b = ?",
+     {"a": 1, "b": 2}, (1, 2)),
+    ("qmark", "SELECT * FROM t WHERE a = :a OR b = :a", "SELECT * FROM t WHERE a = ? OR b = ?",
+     {"a": 7}, (7, 7)),
+    ("numeric", "SELECT * FROM t WHERE a = :a OR b = :b OR c = :a", "SELECT * FROM t WHERE a = $1 OR b = $2 OR c = $1",
+     {"b": 2, "a": 1}, (1, 2)),
+    ("numeric", "SELECT $2::int, $1", "SELECT $2::int, $1", [10, 20], (10, 20)),
+    ("format", "SELECT '%:x', name FROM t WHERE a = $2 AND b LIKE '%$1'", "SELECT '%%:x', name FROM t WHERE a = %s AND b LIKE '%%$1'",
+     [1, 2], (2,)),
+    ("qmark", "SELECT * FROM t WHERE a = ?", "SELECT * FROM t WHERE a = ?", ("x",), ("x",)),
+])
+def test_statement_translation(style, query, sql, params, args):
+    cache = StatementCache(style)
+    statement = cache.prepare(query)
+    assert statement.sql == sql
+    assert statement.bind(params) == args
+    assert cache.prepare(query) is statement
+    assert cache.get_stats()["hits"] == 1
+
+
+def test_statement_cache_is_bounded():
+    cache = StatementCache("qmark", max_size=2)
+    for query in ("SELECT 1", "SELECT 2", "SELECT 3", "SELECT 1"):
+        cache.prepare(query)
+    assert cache.get_stats() == {"size": 2, "hits": 0, "misses": 4, "hit_rate": 0.0}
+
+
+async def test_crud_and_introspection(connector):
+    created = await connector.create("employees", {"name": "new", "dept": "Ops", "salary": 1})
+    assert created["id"] == EMPLOYEES + 1
+
+    updated = await connector.update("employees", created["id"], {"dept": "Finance"})
+    assert updated["dept"] == "Finance"
+    assert await connector.query("SELECT dept FROM employees WHERE name = :name", {"name": "new"}) == [
+        {"dept": "Finance"}
+    ]
+
+    assert await connector.delete("employees", created["id"])
+    assert not await connector.delete("employees", created["id"])
+    assert await connector.list_tables() == ["employees"]
+    assert [c["name"] for c in await connector.describe_table("employees")] == ["id", "name", "dept", "salary"]
+
+
+async def test_concurrent_queries_use_pool(connector):
+    query = "SELECT COUNT(*) AS n FROM employees WHERE dept = $1"
+    results = await asyncio.gather(*(connector.query(query, ["HR"]) for _ in range(12)))
+
+    assert all(r == [{"n": EMPLOYEES // 5}] for r in results)
+    stats = connector.pool.get_stats()
+    assert 2 <= stats["open"] <= 4
+    assert stats["in_use"] == 0
+    assert stats["statements"]["hits"] == 11
+
+
+async def test_stream_yields_bounded_batches(connector):
+    sizes = []
+    total = 0
+    async for batch in connector.stream("SELECT * FROM employees ORDER BY id"):
+        sizes.append(len(batch))
+        total += sum(row["salary"] for row in batch)
+
+    assert sizes == [500] * 5
+    assert total == sum(1000 + i for i in range(EMPLOYEES))
+    assert connector.pool.get_stats()["rows_streamed"] == EMPLOYEES
+
+
+async def test_abandoned_stream_returns_connection(connector):
+    async with aclosing(connector.stream("SELECT * FROM employees", batch_size=10)) as batches:
+        async for batch in batches:
+            break
+    assert connector.pool.get_stats()["in_use"] == 0
+
+
+async def test_query_database_tools(connector):
+    rows = await query_database("db_test", "SELECT id FROM employees ORDER BY id", max_rows=1200)
+    assert [r["id"] for r in rows] == list(range(1, 1201))
+    assert connector.pool.get_stats()["rows_streamed"] == 1500  # Three 500-row batches, no more
+
+    batches = [b async for b in stream_database("db_test", "SELECT id FROM employees", batch_size=1000)]
+    assert [len(b) for b in batches] == [1000, 1000, 500]
+
+    with pytest.raises(ValueError):
+        await query_database("missing", "SELECT 1")
+
+    # Generic invokers await catalog functions, so every entry is a coroutine function
+    assert all(inspect.iscoroutinefunction(t['function']) for t in INTEGRATION_TOOLS.values())
+
+
+async def test_health_check_and_stale_connections(db_path):
+    pool = SQLitePool({"database": str(db_path)}, PoolConfig(min_size=1, max_size=2, health_check_interval=0))
+    await pool.open()
+
+    # Break the idle connection behind the pool's back
+    conn, _ = pool._idle[0]
+    await conn.close()
+
+    assert await pool.fetch("SELECT COUNT(*) AS n FROM employees") == [{"n": EMPLOYEES}]
+    stats = pool.get_stats()
+    assert stats["health_check_failures"] == 1
+    assert stats["connections_opened"] == 2
+
+    health = await pool.health_check()
+    assert health["healthy"]
+    assert health["pool"]["open"] == 1
+
+    await pool.close()
+    with pytest.raises(ConnectionError):
+        await pool.fetch("SELECT 1")
+
+
+async def test_acquire_timeout(db_path):
+    pool = SQLitePool({"database": str(db_path)}, PoolConfig(min_size=0, max_size=1, acquire_timeout=0.05))
+    await pool.open()
+
+    async with pool.acquire():
+        with pytest.raises(PoolTimeoutError):
+            await pool.fetch("SELECT 1")
+
+    assert pool.get_stats()["timeouts"] == 1
+    await pool.close()
+
+
+async def test_test_connection_reports_pool(connector):
+    result = await connector.test_connection()
+    assert result["success"]
+    assert result["details"]["pool"]["max_size"] == 4
+    assert connector.get_health()["pool"]["min_size"] == 2
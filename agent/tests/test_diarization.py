@@ -7,9 +7,11 @@ and speaker manager functionality.
 
 from unittest.mock import AsyncMock, Mock, patch
 
+import numpy as np
 import pytest
 
 from agent.meetings.diarization.base import Speaker, SpeakerSegment
+from agent.meetings.diarization.profiles import VoiceProfileIndex
 from agent.meetings.diarization.speaker_manager import SpeakerManager
 
 
@@ -179,9 +181,9 @@ async def test_speaker_identification():
         voice_embedding=[0.5, 0.5, 0.5]
     )
 
-    # Mock engine to return matching speaker
-    mock_engine.identify_speaker = AsyncMock(
-        return_value="SPEAKER_001"
+    # Mock engine to embed the segment close to Alice's voice
+    mock_engine.create_voice_embedding = AsyncMock(
+        return_value=[0.5, 0.45, 0.55]
     )
 
     name = await manager.identify_speaker_in_segment(
@@ -389,5 +391,158 @@ def test_get_speaker_statistics():
     assert "Charlie" in stats["participant_names"]
 
 
+
+# ══════════════════════════════════════════════════════════════════════
+# Test Batched Matching
+# ══════════════════════════════════════════════════════════════════════
+
+
+def voice(seed: int, dim: int = 64) -> np.ndarray:
+    """Deterministic random voice direction"""
+    return np.random.default_rng(seed).normal(size=dim)
+
+
+def noisy(base: np.ndarray, seed: int, scale: float = 0.2) -> list:
+    """Another utterance by the same voice"""
+    noise = np.random.default_rng(seed).normal(size=base.shape[0])
+    return (base + scale * np.linalg.norm(base) / np.sqrt(base.shape[0]) * noise).tolist()
+
+
+def test_profile_index_matches_batch():
+    """One matrix product scores every query against every profile"""
+    index = VoiceProfileIndex()
+    voices = {f"SPEAKER_{i:03d}": voice(i) for i in range(20)}
+    for n, (speaker_id, vector) in enumerate(voices.items()):
+        index.add(speaker_id, vector * (n + 1))  # Raw embeddings vary in scale
+
+    queries = [noisy(voices["SPEAKER_007"], 100), noisy(voices["SPEAKER_013"], 101), voice(999)]
+    matches = index.best_matches(queries)
+
+    assert matches[0][0] == "SPEAKER_007"
+    assert matches[1][0] == "SPEAKER_013"
+    assert matches[2] is None
+    assert np.allclose(np.linalg.norm(index.matrix, axis=1), 1.0)
+
+
+def test_profile_index_incremental_centroid():
+    """Updates keep a running mean; max_weight keeps profiles adapting"""
+    index = VoiceProfileIndex(max_weight=3)
+    index.add("a", [1.0, 0.0])
+    index.update("a", [0.0, 1.0])
+    assert index.centroid("a") == pytest.approx([0.5, 0.5])
+
+    index.update("a", [0.0, 5.0])  # Scale doesn't matter, direction does
+    assert index.centroid("a") == pytest.approx([1 / 3, 2 / 3])
+
+    # Capped at 3: each further update moves the centroid by 1/3
+    index.update("a", [0.0, 1.0])
+    assert index.centroid("a") == pytest.approx([2 / 9, 7 / 9])
+
+    index.remove("a")
+    assert len(index) == 0
+
+
+def test_profile_index_rejects_dimension_mismatch():
+    index = VoiceProfileIndex()
+    index.add("a", [1.0, 0.0, 0.0])
+    with pytest.raises(ValueError):
+        index.add("b", [1.0, 0.0])
+
+
+@pytest.fixture
+def employees():
+    """Twenty registered employees with distinct voices"""
+    return {
+        f"SPEAKER_{i:03d}": Speaker(
+            speaker_id=f"SPEAKER_{i:03d}",
+            name=f"Employee {i}",
+            email=f"e{i}@example.com",
+            voice_embedding=voice(i).tolist(),
+        )
+        for i in range(20)
+    }
+
+
+def meeting_segments(speakers):
+    """Diarized segments: label SPEAKER_0n is employee speakers[n]"""
+    segments = []
+    audio = {}
+    for n, employee in enumerate(speakers):
+        for k in range(6):
+            seg = SpeakerSegment(f"SPEAKER_{n:02d}", k * 60.0 + n, k * 60.0 + n + 2 + k % 3)
+            segments.append((seg, f"{employee}:{k}".encode()))
+            audio[f"{employee}:{k}".encode()] = noisy(voice(employee), 1000 + 10 * employee + k)
+    return segments, audio
+
+
+@pytest.mark.asyncio
+async def test_identify_speakers_batches_whole_meeting(employees):
+    """All labels are matched at once; only the longest samples are embedded"""
+    segments, audio = meeting_segments([3, 11, 17])
+
+    engine = Mock()
+    engine.create_voice_embedding = AsyncMock(side_effect=lambda a: audio[a])
+    engine.identify_speaker = AsyncMock()
+
+    manager = SpeakerManager(diarization_engine=engine)
+    manager.known_speakers.update(employees)
+
+    with patch("agent.core_logging.log_event"):
+        names = await manager.identify_speakers(segments, max_samples_per_speaker=3)
+
+    assert names == {
+        "SPEAKER_00": "Employee 3",
+        "SPEAKER_01": "Employee 11",
+        "SPEAKER_02": "Employee 17",
+    }
+    assert engine.create_voice_embedding.await_count == 9
+    engine.identify_speaker.assert_not_called()
+
+    # Mapped labels resolve without embedding again
+    with patch("agent.core_logging.log_event"):
+        again = await manager.identify_speakers(segments)
+    assert again == names
+    assert engine.create_voice_embedding.await_count == 9
+
+
+@pytest.mark.asyncio
+async def test_attributed_speech_refines_profile(employees):
+    """A matched speaker's centroid absorbs the meeting's embeddings"""
+    segments, audio = meeting_segments([5])
+
+    engine = Mock()
+    engine.create_voice_embedding = AsyncMock(side_effect=lambda a: audio[a])
+
+    manager = SpeakerManager(diarization_engine=engine)
+    manager.known_speakers.update(employees)
+    before = list(employees["SPEAKER_005"].voice_embedding)
+
+    with patch("agent.core_logging.log_event"):
+        await manager.identify_speakers(segments)
+
+    after = employees["SPEAKER_005"].voice_embedding
+    assert after != before
+    assert manager.profiles.centroid("SPEAKER_005") == pytest.approx(after)
+    assert "SPEAKER_00" in manager.participant_profiles
+
+
+@pytest.mark.asyncio
+async def test_meeting_participants_are_preferred(employees):
+    """A voice between two employees goes to the one in the meeting"""
+    engine = Mock()
+    mixed = (voice(1) / np.linalg.norm(voice(1)) + voice(2) / np.linalg.norm(voice(2))) * 3
+    engine.create_voice_embedding = AsyncMock(return_value=mixed.tolist())
+
+    manager = SpeakerManager(diarization_engine=engine, similarity_threshold=0.6)
+    manager.known_speakers.update(employees)
+    manager.known_speakers["SPEAKER_001"].voice_embedding = (voice(1) * 1.01).tolist()
+
+    with patch("agent.core_logging.log_event"):
+        manager.set_meeting_participants([{"name": "Employee 2", "email": "e2@example.com"}])
+        names = await manager.identify_speakers([(SpeakerSegment("SPEAKER_00", 0.0, 3.0), b"x")])
+
+    assert names == {"SPEAKER_00": "Employee 2"}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
@@ -0,0 +1,154 @@
+"""
+Tests for the shared LLM HTTP client pool.
+
+Runs providers against a local HTTP server to check that connections are
+reused across requests and providers, that timeouts are coordinated, and
+that fallback chains respect an overall deadline.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agent.llm.enhanced_router import FallbackChain
+from agent.llm.http_pool import HostLimits, HTTPClientPool, HTTPPoolConfig, get_http_pool, reset_http_pool
+from agent.llm.providers import LLMProvider, OllamaProvider, OpenAIProvider
+
+
+class FakeLLMHandler(BaseHTTPRequestHandler):
+    """Answers OpenAI- and Ollama-style chat requests over keep-alive HTTP/1.1"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.endswith("/chat/completions"):
+            body = {"choices": [{"message": {"content": "hi"}}], "usage": {"prompt_tokens": 1}}
+        else:
+            body = {"message": {"content": "hi"}, "prompt_eval_count": 1, "eval_count": 1}
+        data = json.dumps(body).encode()
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), FakeLLMHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    reset_http_pool(HTTPPoolConfig(http2=False))
+    yield
+    reset_http_pool()
+
+
+async def test_providers_share_keepalive_connections(server):
+    """Sequential requests from two providers to one host reuse one socket"""
+    openai = OpenAIProvider(api_key="test", base_url=f"{server}/v1")
+    ollama = OllamaProvider(host=server)
+
+    for _ in range(3):
+        await openai.chat([{"role": "user", "content": "hello"}])
+        await ollama.chat([{"role": "user", "content": "hello"}])
+
+    stats = get_http_pool().get_stats()
+    host = server.removeprefix("http://")
+    assert stats[host]["requests"] == 6
+    assert stats[host]["connections_opened"] == 1
+    assert stats[host]["reuse_rate"] == pytest.approx(0.833, abs=0.001)
+    assert stats["_total"]["open_clients"] == 1
+
+
+async def test_host_limits_bound_concurrent_connections(server):
+    pool = get_http_pool()
+    pool.set_host_limits(server, HostLimits(max_connections=2, max_keepalive_connections=2))
+    provider = OllamaProvider(host=server)
+
+    await asyncio.gather(*(provider.chat([{"role": "user", "content": "x"}]) for _ in range(8)))
+
+    assert pool.get_stats()[server.removeprefix("http://")]["connections_opened"] <= 2
+
+
+def test_timeouts_are_capped_by_deadline():
+    pool = HTTPClientPool(HTTPPoolConfig(connect_timeout=10, write_timeout=30, pool_timeout=10))
+    timeout = pool.timeout(5)
+    assert timeout.read == 5
+    assert timeout.connect == 5
+    assert timeout.pool == 5
+    assert pool.timeout(120).connect == 10
+
+
+def test_clients_are_per_event_loop(server):
+    """A client from a finished loop is never handed to a new one"""
+    pool = get_http_pool()
+
+    async def grab():
+        return pool.client(server)
+
+    first = asyncio.run(grab())
+    second = asyncio.run(grab())
+    assert first is not second
+    assert pool.get_stats()["_total"]["open_clients"] == 1
+
+
+class SlowProvider(LLMProvider):
+    def __init__(self, name, delay):
+        super().__init__(name)
+        self.delay = delay
+        self.calls = 0
+
+    async def chat(self, messages, model=None, **kwargs):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        raise RuntimeError("unreachable")
+
+    def get_cost_per_token(self, model=None):
+        return (0.0, 0.0)
+
+    async def health_check(self):
+        return self._health
+
+    def get_available_models(self):
+        return []
+
+
+async def test_fallback_chain_deadline_spans_all_attempts():
+    primary = SlowProvider("slow", delay=1.0)
+    fallback = SlowProvider("fallback", delay=1.0)
+    chain = FallbackChain(primary, [fallback], max_retries=1, timeout=0.1)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with pytest.raises(RuntimeError, match="deadline"):
+        await chain.chat_with_fallback([{"role": "user", "content": "x"}])
+
+    assert loop.time() - started < 0.5
+    assert fallback.calls == 0
+
+
+async def test_fallback_chain_retry_backoff_stops_at_deadline():
+    primary = SlowProvider("slow", delay=0.0)
+    chain = FallbackChain(primary, [], max_retries=3, timeout=0.1)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    with pytest.raises(RuntimeError, match="deadline"):
+        await chain.chat_with_fallback([{"role": "user", "content": "x"}])
+
+    # Backoff would otherwise sleep 0.5s before the second attempt
+    assert loop.time() - started < 0.3
+    assert primary.calls == 1
@@ -0,0 +1,217 @@
+"""
+Tests for token streaming through providers, fallback chains and the router.
+
+Providers stream from a local HTTP server (OpenAI-style SSE and Ollama
+NDJSON); fallback behaviour is checked with scripted providers.
+"""
+
+import asyncio
+import json
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+import pytest
+
+from agent.llm.enhanced_router import EnhancedModelRouter, FallbackChain, RouterConfig
+from agent.llm.http_pool import HTTPPoolConfig, reset_http_pool
+from agent.llm.providers import LLMProvider, OllamaProvider, OpenAIProvider
+
+
+class StreamingHandler(BaseHTTPRequestHandler):
+    """Streams "Hello world" as OpenAI SSE or Ollama NDJSON"""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_POST(self):
+        self.rfile.read(int(self.headers.get("Content-Length", 0)))
+        if self.path.endswith("/chat/completions"):
+            events = [{"choices": [{"delta": {"content": t}}]} for t in ("Hello", " world")]
+            events.append({"choices": [{"delta": {}, "finish_reason": "stop"}]})
+            events.append({"choices": [], "usage": {"prompt_tokens": 7, "completion_tokens": 2}})
+            lines = [f"data: {json.dumps(e)}\n\n" for e in events] + ["data: [DONE]\n\n"]
+            content_type = "text/event-stream"
+        else:
+            lines = [json.dumps({"message": {"content": t}, "done": False}) + "\n" for t in ("Hello", " world")]
+            lines.append(json.dumps({"message": {"content": ""}, "done": True, "done_reason": "stop"}) + "\n")
+            content_type = "application/x-ndjson"
+
+        self.send_response(200)
+        self.send_header("Content-Type", content_type)
+        self.send_header("Transfer-Encoding", "chunked")
+        self.end_headers()
+        for line in lines:
+            data = line.encode()
+            self.wfile.write(f"{len(data):x}\r\n".encode() + data + b"\r\n")
+            self.wfile.flush()
+        self.wfile.write(b"0\r\n\r\n")
+
+    def log_message(self, *args):
+        pass
+
+
+@pytest.fixture
+def server():
+    httpd = ThreadingHTTPServer(("127.0.0.1", 0), StreamingHandler)
+    thread = threading.Thread(target=httpd.serve_forever, daemon=True)
+    thread.start()
+    yield f"http://127.0.0.1:{httpd.server_port}"
+    httpd.shutdown()
+
+
+@pytest.fixture(autouse=True)
+def fresh_pool():
+    reset_http_pool(HTTPPoolConfig(http2=False))
+    yield
+    reset_http_pool()
+
+
+class ScriptedProvider(LLMProvider):
+    """Streams ``tokens`` after ``delay``, optionally failing after ``fail_after`` tokens"""
+
+    def __init__(self, name, tokens=("a", "b"), delay=0.0, fail_after=None, cost=(0.0, 0.0)):
+        super().__init__(name)
+        self.tokens = tokens
+        self.delay = delay
+        self.fail_after = fail_after
+        self.cost = cost
+        self.calls = 0
+        self.closed = False
+
+    async def chat(self, messages, model=None, **kwargs):
+        raise NotImplementedError
+
+    async def stream_chat(self, messages, model=None, **kwargs):
+        from agent.llm.providers import StreamChunk
+
+        self.calls += 1
+        try:
+            await asyncio.sleep(self.delay)
+            for i, token in enumerate(self.tokens):
+                if self.fail_after is not None and i >= self.fail_after:
+                    raise ConnectionError(f"{self.name} dropped")
+                yield StreamChunk(content=token, provider=self.name, model="m")
+                await asyncio.sleep(0)
+            yield StreamChunk(provider=self.name, model="m", done=True,
+                              input_tokens=3, output_tokens=len(self.tokens))
+        finally:
+            self.closed = True
+
+    def get_cost_per_token(self, model=None):
+        return self.cost
+
+    async def health_check(self):
+        return self._health
+
+    def get_available_models(self):
+        return []
+
+
+async def collect(stream):
+    return [chunk async for chunk in stream]
+
+
+async def test_openai_provider_streams_sse(server):
+    provider = OpenAIProvider(api_key="test", base_url=f"{server}/v1")
+    chunks = await collect(provider.stream_chat([{"role": "user", "content": "hi"}]))
+
+    assert [c.content for c in chunks if not c.done] == ["Hello", " world"]
+    final = chunks[-1]
+    assert final.done and final.finish_reason == "stop"
+    assert (final.input_tokens, final.output_tokens) == (7, 2)
+    assert final.metadata["estimated_usage"] is False
+
+
+async def test_ollama_provider_streams_ndjson_and_estimates_usage(server):
+    provider = OllamaProvider(host=server)
+    chunks = await collect(provider.stream_chat([{"role": "user", "content": "hello there"}]))
+
+    assert "".join(c.content for c in chunks) == "Hello world"
+    assert chunks[-1].output_tokens == 3  # "Hello world" ~ 11 chars / 4
+    assert chunks[-1].metadata["estimated_usage"] is True
+
+
+async def test_fails_over_on_first_token_deadline():
+    slow = ScriptedProvider("slow", delay=1.0)
+    fast = ScriptedProvider("fast", tokens=("x", "y"))
+    chain = FallbackChain(slow, [fast], max_retries=1)
+
+    loop = asyncio.get_running_loop()
+    started = loop.time()
+    chunks = await collect(chain.stream_with_fallback([], first_token_timeout=0.05))
+
+    assert loop.time() - started < 0.5
+    assert [c.content for c in chunks if not c.done] == ["x", "y"]
+    assert slow.closed
+    assert chunks[-1].metadata["attempts"] == 2
+    assert "first-token deadline" in chunks[-1].metadata["fallback_errors"][0]
+
+
+async def test_fails_over_when_stream_breaks_before_first_token():
+    broken = ScriptedProvider("broken", fail_after=0)
+    backup = ScriptedProvider("backup")
+    chain = FallbackChain(broken, [backup], max_retries=1)
+
+    chunks = await collect(chain.stream_with_fallback([]))
+    assert {c.provider for c in chunks} == {"backup"}
+    assert chain.last_successful_provider == "backup"
+
+
+async def test_no_failover_after_tokens_were_sent():
+    """A partial answer is never spliced together with another provider's"""
+    flaky = ScriptedProvider("flaky", tokens=("a", "b", "c"), fail_after=2)
+    backup = ScriptedProvider("backup")
+    chain = FallbackChain(flaky, [backup], max_retries=2)
+
+    received = []
+    with pytest.raises(ConnectionError):
+        async for chunk in chain.stream_with_fallback([]):
+            received.append(chunk.content)
+
+    assert received == ["a", "b"]
+    assert flaky.calls == 1
+    assert backup.calls == 0
+
+
+def make_router(provider):
+    router = EnhancedModelRouter(RouterConfig(fallback_enabled=False))
+    router.providers = {provider.name: provider}
+    router.select_model = lambda **kwargs: (provider, "m")
+    return router
+
+
+async def test_router_charges_abandoned_streams():
+    provider = ScriptedProvider("paid", tokens=("abcd",) * 10, cost=(1.0, 1.0))
+    router = make_router(provider)
+
+    stream = router.stream_chat([{"role": "user", "content": "12345678"}])
+    async for _ in stream:
+        break
+    await stream.aclose()
+
+    assert provider.closed
+    summary = router.get_cost_summary()
+    assert summary["tokens_by_provider"]["paid"] == 3  # 2 input + 1 output
+    assert summary["by_provider"]["paid"] == pytest.approx(0.003)
+
+
+async def test_router_stops_stream_at_cost_budget():
+    provider = ScriptedProvider("paid", tokens=("abcd",) * 10, cost=(0.0, 1.0))
+    router = make_router(provider)
+    router.config.cost_budget = 0.0025
+
+    chunks = await collect(router.stream_chat([{"role": "user", "content": "hi"}]))
+
+    assert len([c for c in chunks if not c.done]) == 3
+    assert chunks[-1].finish_reason == "cost_budget"
+    assert router.get_cost_summary()["session_cost"] == pytest.approx(0.003)
+
+
+async def test_router_first_token_timeout_zero_disables_deadline():
+    provider = ScriptedProvider("slow", delay=0.1)
+    router = make_router(provider)
+    router.config.first_token_timeout = 0.01
+
+    chunks = await collect(router.stream_chat([{"role": "user", "content": "hi"}], first_token_timeout=0))
+
+    assert [c.content for c in chunks if not c.done] == ["a", "b"]
+    assert provider.calls == 1
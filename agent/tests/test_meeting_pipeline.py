@@ -0,0 +1,208 @@
+"""
+Tests for the staged live-meeting pipeline.
+
+Covers overlapping analysis windows, backpressure when analysis falls
+behind, and that slow analysis never stalls transcription.
+"""
+
+import asyncio
+from datetime import datetime, timedelta
+
+import pytest
+
+from agent.meetings.pipeline import (
+    AnalysisWindow,
+    BackpressurePolicy,
+    MeetingPipeline,
+    StageStats,
+    TranscriptWindower,
+    WindowQueue,
+)
+from agent.meetings.transcription.base import TranscriptSegment
+
+
+START = datetime(2025, 1, 1, 9, 0, 0)
+
+
+def make_segment(second: int, text: str = None, length: int = 5) -> TranscriptSegment:
+    return TranscriptSegment(
+        text=text or f"s{second}",
+        confidence=0.9,
+        start_time=START + timedelta(seconds=second),
+        end_time=START + timedelta(seconds=second + length),
+        is_final=True,
+    )
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Windowing
+# ══════════════════════════════════════════════════════════════════════
+
+
+def test_windows_overlap():
+    """Segments in the trailing overlap are repeated in the next window"""
+    windower = TranscriptWindower(window_seconds=20, overlap_seconds=5)
+
+    windows = []
+    for second in range(0, 60, 5):
+        window = windower.add(make_segment(second))
+        if window:
+            windows.append(window)
+
+    assert windows[0].text == "s0 s5 s10 s15"
+    assert windows[1].text.startswith("s15 ")
+    assert [w.index for w in windows] == list(range(len(windows)))
+
+
+def test_flush_emits_remaining_segments_once():
+    """End of meeting flushes unanalyzed speech but not pure overlap"""
+    windower = TranscriptWindower(window_seconds=20, overlap_seconds=5)
+    for second in (0, 5, 10, 15):
+        windower.add(make_segment(second))
+
+    assert windower.flush() is None
+
+    windower.add(make_segment(20))
+    assert windower.flush().text == "s15 s20"
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Backpressure
+# ══════════════════════════════════════════════════════════════════════
+
+
+def window(index: int, *seconds: int) -> AnalysisWindow:
+    return AnalysisWindow(index=index, segments=[make_segment(s) for s in seconds])
+
+
+@pytest.mark.asyncio
+async def test_merge_policy_folds_new_window_into_pending():
+    """When full, MERGE extends the newest pending window"""
+    stats = StageStats("analysis")
+    queue = WindowQueue(1, BackpressurePolicy.MERGE, stats)
+
+    first = window(0, 0, 5)
+    await queue.put(first)
+    await queue.put(AnalysisWindow(index=1, segments=[first.segments[-1], make_segment(10)]))
+
+    assert len(queue) == 1
+    assert (await queue.get()).text == "s0 s5 s10"
+    assert stats.merged == 1
+
+
+@pytest.mark.asyncio
+async def test_drop_oldest_policy():
+    """When full, DROP_OLDEST discards stale windows"""
+    stats = StageStats("analysis")
+    queue = WindowQueue(1, BackpressurePolicy.DROP_OLDEST, stats)
+
+    await queue.put(window(0, 0))
+    await queue.put(window(1, 5))
+
+    assert (await queue.get()).index == 1
+    assert stats.dropped == 1
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Pipeline
+# ══════════════════════════════════════════════════════════════════════
+
+
+async def audio_source(chunks: int):
+    for i in range(chunks):
+        yield b"\x00" * 32
+        await asyncio.sleep(0)
+
+
+def fake_transcriber(seconds_per_chunk: int = 5):
+    async def transcribe(audio):
+        second = 0
+        async for _ in audio:
+            yield make_segment(second)
+            second += seconds_per_chunk
+    return transcribe
+
+
+@pytest.mark.asyncio
+async def test_slow_analysis_does_not_stall_transcription():
+    """Transcription finishes while analysis is still busy"""
+    transcribed = []
+    analysis_started = asyncio.Event()
+    release = asyncio.Event()
+
+    async def analyze(window):
+        analysis_started.set()
+        await release.wait()
+        return window.text
+
+    pipeline = MeetingPipeline(
+        analyze=analyze,
+        on_segment=transcribed.append,
+        window_seconds=10,
+        overlap_seconds=0,
+        max_pending_windows=1,
+    )
+    runner = asyncio.create_task(pipeline.run(audio_source(40), fake_transcriber()))
+
+    await analysis_started.wait()
+    for _ in range(200):
+        if len(transcribed) == 40:
+            break
+        await asyncio.sleep(0)
+
+    # All audio was transcribed although the first analysis is still blocked
+    assert len(transcribed) == 40
+    assert not runner.done()
+
+    release.set()
+    stats = await asyncio.wait_for(runner, timeout=2)
+    assert stats["analysis"]["merged"] > 0
+    assert stats["transcription"]["processed"] == 40
+
+
+@pytest.mark.asyncio
+async def test_actions_run_for_each_understanding():
+    """Every analyzed window flows through to the action stage"""
+    acted = []
+
+    async def analyze(window):
+        return window.text
+
+    async def act(understanding):
+        acted.append(understanding)
+
+    pipeline = MeetingPipeline(
+        analyze=analyze,
+        act=act,
+        window_seconds=10,
+        overlap_seconds=0,
+        max_pending_windows=100,
+    )
+    stats = await pipeline.run(audio_source(6), fake_transcriber())
+
+    assert acted == ["s0 s5", "s10 s15", "s20 s25"]
+    assert stats["action"]["processed"] == 3
+    assert all(stats[name]["queue_depth"] == 0 for name in stats)
+
+
+@pytest.mark.asyncio
+async def test_analysis_errors_are_counted_not_fatal(caplog):
+    """A failing analysis call is skipped, counted and logged"""
+    calls = []
+
+    async def analyze(window):
+        calls.append(window.index)
+        if window.index == 0:
+            raise RuntimeError("llm down")
+        return window.text
+
+    pipeline = MeetingPipeline(
+        analyze=analyze, window_seconds=10, overlap_seconds=0, max_pending_windows=100
+    )
+    stats = await pipeline.run(audio_source(4), fake_transcriber())
+
+    assert calls == [0, 1]
+    assert stats["analysis"]["errors"] == 1
+    assert stats["analysis"]["processed"] == 1
+    assert "Meeting analysis failed" in caplog.text
+    assert "llm down" in caplog.text
@@ -25,10 +25,10 @@ from llm.ollama_client import OllamaClient, OllamaModel, OllamaResponse
 
 @pytest.fixture
 def mock_httpx_client():
-    """Create mock httpx.AsyncClient."""
-    with patch("llm.ollama_client.httpx.AsyncClient") as mock:
+    """Create mock httpx.AsyncClient handed out by the shared pool."""
+    with patch("llm.ollama_client.get_http_pool") as mock:
         client = AsyncMock()
-        mock.return_value = client
+        mock.return_value.client.return_value = client
         yield client
 
 
@@ -4,6 +4,7 @@ PHASE 9.3: Performance Tracker Tests
 Tests for LLM performance tracking and analytics.
 """
 
+import json
 import tempfile
 import time
 from pathlib import Path
@@ -25,9 +26,11 @@ def temp_storage():
 
     yield temp_path
 
-    # Cleanup
-    if temp_path.exists():
-        temp_path.unlink()
+    # Cleanup (metrics are stored in a SQLite file next to the .jsonl path)
+    for path in (temp_path, temp_path.with_suffix(".db"),
+                 temp_path.with_suffix(".db-wal"), temp_path.with_suffix(".db-shm")):
+        if path.exists():
+            path.unlink()
 
 
 @pytest.fixture
@@ -325,3 +328,79 @@ def test_performance_metric_serialization():
     metric2 = PerformanceMetric.from_dict(data)
     assert metric2.model == metric.model
     assert metric2.latency_ms == metric.latency_ms
+
+
+def test_latency_sketch_quantiles():
+    """Sketch quantiles stay within relative accuracy and survive serialization."""
+    from llm.performance_tracker import LatencySketch
+
+    sketch = LatencySketch(relative_accuracy=0.01)
+    values = list(range(1, 10001))
+    for v in values:
+        sketch.add(v)
+
+    for q in (0.5, 0.95, 0.99):
+        exact = values[int(q * (len(values) - 1))]
+        assert sketch.quantile(q) == pytest.approx(exact, rel=0.02)
+
+    restored = LatencySketch.from_bytes(sketch.to_bytes())
+    assert restored.counts == sketch.counts
+    assert restored.quantile(0.95) == sketch.quantile(0.95)
+    assert len(sketch.to_bytes()) < 8 * 1024
+
+
+@pytest.mark.asyncio
+async def test_startup_loads_totals_and_bounded_ring(tmp_path):
+    """History stays on disk; memory holds totals plus the newest calls."""
+    path = tmp_path / "perf.db"
+    tracker1 = PerformanceTracker(storage_path=path, raw_sample_limit=5)
+    for i in range(20):
+        await tracker1.record_call("gpt-4o", 100 + i, 0.01, True)
+    assert len(tracker1.metrics) == 5
+
+    tracker2 = PerformanceTracker(storage_path=path, raw_sample_limit=5)
+    assert [m.latency_ms for m in tracker2.metrics] == [115, 116, 117, 118, 119]
+    stats = tracker2.get_model_stats("gpt-4o")
+    assert stats.total_calls == 20
+    assert stats.latency_percentile(0.5) == pytest.approx(109.5, rel=0.02)
+    assert len(tracker2.get_metrics_by_time_range()) == 20
+
+
+@pytest.mark.asyncio
+async def test_imports_legacy_jsonl(tmp_path):
+    legacy = tmp_path / "llm_performance.jsonl"
+    with open(legacy, "w") as f:
+        for i in range(3):
+            metric = PerformanceMetric(time.time() - 7200 * i, "llama3", 500, 0.0, True)
+            f.write(json.dumps(metric.to_dict()) + "\n")
+
+    tracker = PerformanceTracker(storage_path=legacy)
+    assert tracker.db_path == tmp_path / "llm_performance.db"
+    assert tracker.get_model_stats("llama3").total_calls == 3
+    assert len(tracker.get_bucketed_stats(model="llama3")) == 3
+
+    # Imported once only
+    assert PerformanceTracker(storage_path=legacy).get_model_stats("llama3").total_calls == 3
+
+
+@pytest.mark.asyncio
+async def test_retention_keeps_totals(tracker):
+    await tracker.record_call("gpt-4o", 1000, 0.05, True)
+
+    removed = tracker.prune(now=time.time() + 400 * 86400)
+
+    assert removed == {"samples": 1, "buckets": 1}
+    assert tracker.get_metrics_by_time_range() == []
+    assert tracker.get_model_stats("gpt-4o").total_calls == 1
+
+
+@pytest.mark.asyncio
+async def test_best_model_cache_follows_new_calls(tracker):
+    await tracker.record_call("fast", 100, 0.0, True)
+    await tracker.record_call("slow", 900, 0.0, True)
+    assert tracker.get_best_model_for_latency() == "fast"
+
+    for _ in range(9):
+        await tracker.record_call("fast", 5000, 0.0, True)
+    assert tracker.get_best_model_for_latency() == "slow"
+    assert tracker.get_best_model_for_latency(percentile=0.05) == "fast"
@@ -0,0 +1,145 @@
+"""
+Tests for the columnar spreadsheet engine.
+
+Covers type inference at load, streaming CSV loading, and that the
+vectorized aggregations, filters, sorts and group-bys match the
+row-by-row results.
+"""
+
+import io
+import random
+
+import pytest
+
+from agent.finance.spreadsheet_engine import SpreadsheetData, SpreadsheetEngine
+
+
+LEDGER = """date,account,amount,category,memo
+2025-01-03,1000,"1,200.50",Travel,Flight
+2025-01-04,1000,$45,Meals,Lunch
+2025-01-05,2000,300,Travel,
+2025-01-06,2000,99.99,Software,License
+2025-01-07,3000,12,Meals,Coffee
+2025-01-08,3000,,,Pending
+"""
+
+
+@pytest.fixture
+def engine():
+    engine = SpreadsheetEngine()
+    engine.load_csv(LEDGER, "ledger")
+    return engine
+
+
+def random_rows(n, seed=7):
+    rng = random.Random(seed)
+    categories = ["Travel", "Meals", "Software", "Rent", None]
+    return [
+        [f"2025-01-{rng.randint(1, 28):02d}", rng.choice(categories),
+         rng.choice([rng.randint(-500, 5000), round(rng.uniform(0, 900), 2), None])]
+        for _ in range(n)
+    ]
+
+
+def test_column_types_inferred_at_load(engine):
+    data = engine.current_data
+    assert data.get_numeric_columns() == ["account", "amount"]
+    assert data.get_date_columns() == ["date"]
+    assert data.column("category").kind == "text"
+
+
+def test_rows_round_trip(engine):
+    """Typed columns rebuild the original converted cells"""
+    data = engine.current_data
+    assert data.row_count == 6
+    assert data.rows[0] == ["2025-01-03", 1000, 1200.5, "Travel", "Flight"]
+    assert data.rows[5] == ["2025-01-08", 3000, None, None, "Pending"]
+    assert data.get_column("amount", limit=2) == [1200.5, 45]
+
+
+def test_streams_csv_from_file(tmp_path):
+    path = tmp_path / "ledger.csv"
+    path.write_text(LEDGER)
+
+    data = SpreadsheetEngine().load_csv_file(str(path))
+    assert data.sheet_name == "ledger"
+    assert data.row_count == 6
+
+    # Chunk boundaries don't change the result
+    chunked = SpreadsheetEngine().load_csv(io.StringIO(LEDGER), chunk_rows=2)
+    assert chunked.rows == data.rows
+
+
+def test_aggregations(engine):
+    result = engine.query("total amount")
+    assert result.data["result"] == pytest.approx(1657.49)
+    assert result.data["count"] == 5
+
+    assert engine.query("max amount").data["result"] == 1200.5
+    assert engine.query("count memo").data["count"] == 5
+
+
+def test_filter_and_sort(engine):
+    result = engine.query("show me where amount > 99")
+    assert result.data["total_matches"] == 3
+
+    result = engine.query("where category = meals")
+    assert [r[4] for r in result.data["rows"]] == ["Lunch", "Coffee"]
+
+    result = engine.query("sort by amount descending")
+    assert [r[2] for r in result.data["rows"][:3]] == [1200.5, 300, 99.99]
+
+
+def test_groupby_keeps_first_seen_order(engine):
+    result = engine.query("breakdown of amount by category")
+    assert result.data["groups"] == pytest.approx(
+        {"Travel": 1500.5, "Meals": 57, "Software": 99.99}
+    )
+    assert list(result.data["groups"]) == ["Travel", "Meals", "Software"]
+
+
+def test_non_numeric_cells_kept_in_numeric_column():
+    """Stray text in a numeric column is preserved but not aggregated"""
+    rows = [[i, float(i)] for i in range(12)] + [[12, "n/a"]]
+    data = SpreadsheetData(headers=["id", "amount"], rows=rows)
+
+    assert data.column("amount").kind == "number"
+    assert data.column("amount").tolist()[-1] == "n/a"
+    result = SpreadsheetEngine().query("sum of amount", data)
+    assert result.data["result"] == 66.0
+    assert result.data["count"] == 12
+
+
+def test_min_max_keep_cell_types_in_mixed_column():
+    """An int extreme stays an int even when the column also holds floats"""
+    rows = [[i, v] for i, v in enumerate([9588, 12.5, 300, 40.25] * 3)]
+    data = SpreadsheetData(headers=["id", "amount"], rows=rows)
+    engine = SpreadsheetEngine()
+
+    largest = engine.query("max amount", data).data["result"]
+    smallest = engine.query("min amount", data).data["result"]
+    assert (largest, type(largest)) == (9588, int)
+    assert (smallest, type(smallest)) == (12.5, float)
+
+
+def test_vectorized_results_match_row_scan():
+    """Group sums, filters and sort order agree with plain Python"""
+    rows = random_rows(5000)
+    data = SpreadsheetData(headers=["date", "category", "amount"], rows=rows)
+    engine = SpreadsheetEngine()
+
+    expected = {}
+    for _, category, amount in rows:
+        if isinstance(amount, (int, float)):
+            expected[str(category)] = expected.get(str(category), 0) + amount
+    groups = engine.query("group by category amount", data).data["groups"]
+    assert list(groups) == list(expected)
+    assert groups == pytest.approx(expected)
+
+    matches = [r for r in rows if isinstance(r[2], (int, float)) and r[2] < 100]
+    result = engine.query("where amount < 100", data).data
+    assert result["total_matches"] == len(matches)
+    assert result["rows"] == matches[:100]
+
+    ordered = sorted(rows, key=lambda r: r[2] if r[2] is not None else 0, reverse=True)
+    assert engine.query("sort amount desc", data).data["rows"] == ordered[:100]
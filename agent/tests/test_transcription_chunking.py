@@ -0,0 +1,205 @@
+"""
+Tests for speech-bounded chunk aggregation and concurrent transcription.
+
+Covers voice-activity merging, buffer reuse, ordered reassembly of
+in-flight requests, and offline file transcription.
+"""
+
+import asyncio
+import math
+import random
+import struct
+import wave
+from datetime import datetime
+from unittest.mock import patch
+
+import pytest
+
+from agent.meetings.transcription.base import TranscriptionEngine, TranscriptSegment
+from agent.meetings.transcription.chunking import (
+    ChunkAggregator,
+    frame_rms,
+    transcribe_segments,
+    wav_file,
+)
+from agent.meetings.transcription.manager import TranscriptionManager
+
+
+RATE = 16000
+
+
+def tone(seconds: float, amplitude: int = 8000) -> bytes:
+    samples = int(RATE * seconds)
+    return struct.pack(
+        f"<{samples}h",
+        *(int(amplitude * math.sin(2 * math.pi * 440 * i / RATE)) for i in range(samples))
+    )
+
+
+def silence(seconds: float) -> bytes:
+    return b"\x00\x00" * int(RATE * seconds)
+
+
+def one_second_chunks(pcm: bytes):
+    step = RATE * 2
+    return [pcm[i:i + step] for i in range(0, len(pcm), step)]
+
+
+async def aiter(items):
+    for item in items:
+        yield item
+        await asyncio.sleep(0)
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Aggregation
+# ══════════════════════════════════════════════════════════════════════
+
+
+def test_frame_rms_distinguishes_speech_from_silence():
+    """Energy of a tone is well above the default threshold"""
+    assert frame_rms(silence(0.03)) == 0.0
+    assert frame_rms(tone(0.03)) > 5000
+
+
+def test_aggregator_merges_chunks_into_speech_segments():
+    """Short chunks merge into one segment per utterance; silence is skipped"""
+    pcm = silence(1) + tone(2.5) + silence(1.5) + tone(1.2) + silence(1)
+    aggregator = ChunkAggregator(sample_rate=RATE)
+
+    segments = []
+    for chunk in one_second_chunks(pcm):
+        segments.extend(aggregator.feed(chunk))
+    tail = aggregator.flush()
+    if tail:
+        segments.append(tail)
+
+    assert len(segments) == 2
+    assert segments[0].offset_seconds == pytest.approx(0.85, abs=0.05)
+    assert segments[0].duration_seconds == pytest.approx(2.8, abs=0.1)
+    assert segments[1].offset_seconds == pytest.approx(4.85, abs=0.05)
+
+
+def test_aggregator_cuts_long_speech():
+    """Continuous speech is cut at max_segment_ms"""
+    aggregator = ChunkAggregator(sample_rate=RATE, max_segment_ms=3000)
+    segments = []
+    for chunk in one_second_chunks(tone(7)):
+        segments.extend(aggregator.feed(chunk))
+
+    assert [round(s.duration_seconds) for s in segments] == [3, 3]
+
+
+def test_released_buffers_are_reused():
+    """Segment buffers return to the pool after release()"""
+    aggregator = ChunkAggregator(sample_rate=RATE)
+    pcm = (tone(1.5) + silence(1)) * 4
+
+    emitted = 0
+    for chunk in one_second_chunks(pcm):
+        for segment in aggregator.feed(chunk):
+            emitted += 1
+            segment.release()
+
+    # A chunk can end one utterance and start the next before release()
+    assert emitted == 4
+    assert aggregator.pool.allocated <= 2
+
+
+def test_wav_file_header():
+    """wav_file output is readable by the wave module"""
+    pcm = tone(0.5)
+    with wave.open(wav_file(memoryview(pcm), RATE), "rb") as wav:
+        assert wav.getframerate() == RATE
+        assert wav.getsampwidth() == 2
+        assert wav.readframes(wav.getnframes()) == pcm
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Concurrent transcription
+# ══════════════════════════════════════════════════════════════════════
+
+
+class FakeBatchEngine(TranscriptionEngine):
+    """Chunk engine with random latency that tracks concurrency"""
+
+    def __init__(self):
+        self.active = 0
+        self.peak = 0
+        self.calls = 0
+
+    async def transcribe_chunk(self, audio_bytes, sample_rate=16000):
+        self.calls += 1
+        call = self.calls
+        self.active += 1
+        self.peak = max(self.peak, self.active)
+        await asyncio.sleep(random.uniform(0.001, 0.02))
+        self.active -= 1
+        now = datetime.now()
+        return TranscriptSegment(
+            text=f"utterance {call} ({memoryview(audio_bytes).nbytes} bytes)",
+            confidence=0.9, start_time=now, end_time=now, is_final=True,
+        )
+
+    async def start_stream(self):
+        pass
+
+    async def end_stream(self):
+        pass
+
+    def supports_streaming(self):
+        return False
+
+    async def get_supported_languages(self):
+        return ["en"]
+
+
+def test_transcribe_segments_keeps_order_with_requests_in_flight():
+    """Results come back in segment order although requests overlap"""
+    engine = FakeBatchEngine()
+    pcm = (tone(1.2) + silence(1)) * 8
+    start = datetime(2025, 1, 1, 9, 0)
+
+    async def run():
+        aggregator = ChunkAggregator(sample_rate=RATE)
+        return [
+            s async for s in transcribe_segments(
+                aggregator.segments(aiter(one_second_chunks(pcm))),
+                engine.transcribe_chunk,
+                max_in_flight=3,
+                stream_start=start,
+            )
+        ]
+
+    results = asyncio.run(run())
+
+    assert len(results) == 8
+    assert engine.peak > 1
+    assert engine.peak <= 3
+    assert [r.start_time for r in results] == sorted(r.start_time for r in results)
+    assert results[0].start_time == start
+    assert (results[1].start_time - start).total_seconds() == pytest.approx(2.05, abs=0.05)
+
+
+def test_transcribe_file_concurrent(tmp_path):
+    """Offline mode splits a recording and transcribes segments concurrently"""
+    path = tmp_path / "recording.wav"
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(RATE)
+        wav.writeframes((silence(0.5) + tone(1.5) + silence(1)) * 6)
+
+    engine = FakeBatchEngine()
+    with patch("agent.core_logging.log_event"):
+        manager = TranscriptionManager()
+        manager.engines = {manager.fallback_providers[0]: engine}
+
+        recorded_at = datetime(2025, 1, 1, 9, 0)
+        segments = asyncio.run(
+            manager.transcribe_file(str(path), max_in_flight=4, recorded_at=recorded_at)
+        )
+
+    assert len(segments) == 6
+    assert engine.peak > 1
+    assert (segments[1].start_time - recorded_at).total_seconds() == pytest.approx(3.35, abs=0.05)
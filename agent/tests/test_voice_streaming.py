@@ -0,0 +1,191 @@
+"""
+Tests for sentence-pipelined voice synthesis.
+
+Covers incremental sentence splitting, synthesizing the next sentence
+while the current one plays, and the phrase cache.
+"""
+
+import asyncio
+from unittest.mock import patch
+
+import pytest
+
+import jarvis_voice
+from jarvis_voice import (
+    JarvisVoice,
+    SentenceSplitter,
+    TTSEngine,
+    VoiceConfig,
+    split_sentences,
+)
+
+
+class FakeTTS(TTSEngine):
+    """Streams two chunks per sentence and records call timing"""
+
+    voice_id = "fake"
+
+    def __init__(self, delay: float = 0.02):
+        self.delay = delay
+        self.events = []
+        self.calls = []
+
+    async def synthesize(self, text):
+        self.calls.append(text)
+        return f"<{text}>".encode()
+
+    async def stream_synthesize(self, text):
+        self.calls.append(text)
+        self.events.append(("start", text))
+        await asyncio.sleep(self.delay)
+        yield f"<{text}".encode()
+        await asyncio.sleep(self.delay)
+        yield b">"
+        self.events.append(("end", text))
+
+    def get_provider_name(self):
+        return "Fake"
+
+
+@pytest.fixture
+def voice(tmp_path):
+    with patch.object(jarvis_voice.core_logging, "log_event"):
+        voice = JarvisVoice(VoiceConfig(cache_dir=str(tmp_path / "cache")))
+        voice.tts_engine = FakeTTS()
+        yield voice
+
+
+async def deltas(text, size=3):
+    for i in range(0, len(text), size):
+        yield text[i:i + size]
+        await asyncio.sleep(0)
+
+
+# =============================================================================
+# Sentence splitting
+# =============================================================================
+
+def test_splitter_waits_for_sentence_end():
+    splitter = SentenceSplitter()
+    assert splitter.feed("Good morning, sir. The wea") == ["Good morning, sir."]
+    assert splitter.feed("ther is fine today.") == []
+    assert splitter.feed(" ") == ["The weather is fine today."]
+    assert splitter.flush() is None
+
+
+def test_splitter_skips_abbreviations_and_numbers():
+    splitter = SentenceSplitter()
+    text = "Dr. Smith said the build costs 3.5 dollars. That is e.g. cheap enough for us. "
+    assert splitter.feed(text) == [
+        "Dr. Smith said the build costs 3.5 dollars.",
+        "That is e.g. cheap enough for us.",
+    ]
+    assert splitter.feed("We shipped version 2. Then we rested for a while. ") == [
+        "We shipped version 2.",
+        "Then we rested for a while.",
+    ]
+
+
+def test_splitter_holds_short_fragments_after_first():
+    splitter = SentenceSplitter(min_chars=20)
+    assert splitter.feed("Yes. ") == ["Yes."]
+    assert splitter.feed("Of course. ") == []
+    assert splitter.feed("I shall see to it at once. ") == [
+        "Of course. I shall see to it at once."
+    ]
+    assert splitter.feed("Done") == []
+    assert splitter.flush() == "Done"
+
+
+@pytest.mark.asyncio
+async def test_split_sentences_from_stream_matches_full_text():
+    text = "Certainly, sir. I have scheduled the meeting for Tuesday! Anything else?"
+    streamed = [s async for s in split_sentences(deltas(text))]
+    full = [s async for s in split_sentences(text)]
+    assert streamed == full == [
+        "Certainly, sir.",
+        "I have scheduled the meeting for Tuesday!",
+        "Anything else?",
+    ]
+
+
+# =============================================================================
+# Pipelined synthesis
+# =============================================================================
+
+@pytest.mark.asyncio
+async def test_next_sentence_synthesizes_while_current_plays(voice):
+    """Sentence N+1 starts synthesizing before sentence N finishes playing"""
+    text = "First sentence of the reply. Second sentence of the reply. Third one here, sir."
+    events = voice.tts_engine.events
+
+    async for chunk in voice.stream_speech(deltas(text), lookahead=1):
+        if chunk.final:
+            await asyncio.sleep(0.05)  # Playback
+            events.append(("played", chunk.text))
+
+    assert events.index(("start", "Second sentence of the reply.")) < \
+        events.index(("played", "First sentence of the reply."))
+    assert events.index(("start", "Third one here, sir.")) < \
+        events.index(("played", "Second sentence of the reply."))
+    assert [e[1] for e in events if e[0] == "played"] == [
+        "First sentence of the reply.",
+        "Second sentence of the reply.",
+        "Third one here, sir.",
+    ]
+
+
+@pytest.mark.asyncio
+async def test_chunks_stream_in_order(voice):
+    chunks = [c async for c in voice.stream_speech("One two three four. Five six seven eight.")]
+    assert b"".join(c.audio for c in chunks) == b"<One two three four.><Five six seven eight.>"
+    assert [c.final for c in chunks] == [False, True, False, True]
+    assert [c.index for c in chunks] == [0, 0, 1, 1]
+
+
+@pytest.mark.asyncio
+async def test_lookahead_bounds_concurrent_synthesis(voice):
+    """With lookahead=1 at most two sentences synthesize at once"""
+    text = " ".join(f"This is sentence number {i}." for i in range(6))
+    active = peak = 0
+    engine = voice.tts_engine
+    original = engine.stream_synthesize
+
+    async def tracked(sentence):
+        nonlocal active, peak
+        active += 1
+        peak = max(peak, active)
+        try:
+            async for chunk in original(sentence):
+                yield chunk
+        finally:
+            active -= 1
+
+    engine.stream_synthesize = tracked
+    async for chunk in voice.stream_speech(text, lookahead=1):
+        await asyncio.sleep(0.01)
+
+    assert peak == 2
+
+
+@pytest.mark.asyncio
+async def test_repeated_phrases_come_from_cache(voice):
+    await voice.synthesize("One moment, sir. Processing your request now.")
+    await voice.synthesize("One moment, sir. Something else entirely here.")
+
+    assert voice.tts_engine.calls.count("One moment, sir.") == 1
+
+    chunks = [c async for c in voice.stream_speech("One moment, sir.")]
+    assert chunks[0].cached
+    assert voice.tts_engine.calls.count("One moment, sir.") == 1
+
+
+def test_memory_cache_is_bounded(tmp_path):
+    cache = jarvis_voice.VoiceCache(str(tmp_path), memory_items=2)
+    for phrase in ("a", "b", "c"):
+        cache.set(phrase, "v", phrase.encode())
+
+    assert len(cache._memory) == 2
+    # Evicted from memory, still on disk
+    assert cache.get("a", "v") == b"a"
+    assert cache.get("  a ", "v") == b"a"
@@ -0,0 +1,156 @@
+"""
+Tests for the workspace search index.
+
+Covers literal extraction for candidate narrowing, rglob-compatible glob
+matching, indexed grep against a brute-force scan, incremental updates,
+and the JarvisTools / FileContextManager integrations.
+"""
+
+import asyncio
+import os
+import re
+
+import pytest
+
+from file_context import FileContextManager
+from jarvis_tools import JarvisTools
+from workspace_index import WorkspaceIndex, compile_glob, required_literals
+
+
+FILES = {
+    "src/config.py": "import os\n\ndef load_config(path):\n    return os.environ.get(path)\n",
+    "src/app/main.py": "from config import load_config\n\nCONFIG = load_config('APP')\n",
+    "src/app/view.ts": "export const loadConfig = () => fetch('/config');\n",
+    "docs/README.md": "# Config\n\nCall load_config() before anything else.\n",
+    "docs/.drafts/notes.md": "TODO(alice): document load_config\n",
+    "data/blob.bin": "\0\1\2 load_config \3",
+    "empty.txt": "",
+}
+
+
+@pytest.fixture
+def workspace(tmp_path):
+    for rel, content in FILES.items():
+        path = tmp_path / rel
+        path.parent.mkdir(parents=True, exist_ok=True)
+        path.write_text(content)
+    return tmp_path
+
+
+def brute_force(root, regex, pattern="*"):
+    matches = []
+    for path in sorted(root.rglob(pattern)):
+        if not path.is_file() or b"\0" in path.read_bytes()[:8192]:
+            continue
+        for i, line in enumerate(path.read_text(errors="ignore").splitlines()):
+            if regex.search(line):
+                matches.append((path.relative_to(root).as_posix(), i + 1))
+    return matches
+
+
+@pytest.mark.parametrize("pattern, literals", [
+    (r"def\s+load_config", ["def", "load_config"]),
+    (r"(?i)Load.*CONFIG", ["load", "config"]),
+    (r"TODO\(\w+\)", ["todo(", ")"]),
+    (r"(abc)+xyz?", ["abc", "xy"]),
+    (r"load|store", []),
+    (r"^import os$", ["import os"]),
+])
+def test_required_literals(pattern, literals):
+    assert required_literals(pattern) == literals
+
+
+@pytest.mark.parametrize("pattern", ["*.py", "*.md", "app/*", "src/**/*.py", "**/*.ts", "*", "[cm]*.py"])
+def test_glob_matches_rglob(workspace, pattern):
+    index = WorkspaceIndex(workspace)
+    expected = {p.relative_to(workspace).as_posix() for p in workspace.rglob(pattern)}
+    assert {e.path for e in index.glob(pattern)} == expected
+    assert compile_glob(pattern).match(next(iter(expected))) if expected else True
+
+
+@pytest.mark.parametrize("pattern, flags", [
+    (r"load_config", 0),
+    (r"def\s+load_\w+", 0),
+    (r"LOAD_?CONFIG", re.IGNORECASE),
+    (r"config|environ", 0),
+    (r"^$", 0),
+])
+def test_indexed_grep_matches_brute_force(workspace, pattern, flags):
+    regex = re.compile(pattern, flags)
+    index = WorkspaceIndex(workspace)
+
+    results, _ = index.grep(regex, max_results=1000)
+    assert [(r["path"], r["line"]) for r in results] == brute_force(workspace, regex)
+
+
+def test_candidates_skip_files_without_literals(workspace):
+    index = WorkspaceIndex(workspace)
+    results, files_read = index.grep(re.compile(r"def\s+load_config"))
+
+    assert [r["path"] for r in results] == ["src/config.py"]
+    assert files_read == 1
+    assert index.get_stats()["files"] == len(FILES)
+
+
+def test_incremental_updates(workspace):
+    index = WorkspaceIndex(workspace, refresh_interval=60)
+    regex = re.compile("reload_settings")
+    assert index.grep(regex)[0] == []
+
+    # Reported changes are picked up without waiting for a scan
+    (workspace / "src/config.py").write_text("def reload_settings():\n    pass\n")
+    (workspace / "src/new.py").write_text("reload_settings()\n")
+    index.notify_changed(workspace / "src/config.py", workspace / "src/new.py")
+    assert [r["path"] for r in index.grep(regex)[0]] == ["src/config.py", "src/new.py"]
+
+    # Unreported changes are found by the next mtime scan
+    os.remove(workspace / "src/new.py")
+    (workspace / "docs/README.md").write_text("reload_settings is documented here\n")
+    stat = (workspace / "docs/README.md").stat()
+    os.utime(workspace / "docs/README.md", (stat.st_atime, stat.st_mtime + 5))
+    # README.md changed, and so did src/ (an entry was removed)
+    assert index.refresh(force=True) == {"added": 0, "changed": 2, "removed": 1}
+    assert [r["path"] for r in index.grep(regex)[0]] == ["docs/README.md", "src/config.py"]
+
+
+async def test_jarvis_tools_search_runs_off_loop(workspace):
+    tools = JarvisTools(str(workspace))
+    ticks = 0
+
+    async def ticker():
+        nonlocal ticks
+        while True:
+            ticks += 1
+            await asyncio.sleep(0)
+
+    task = asyncio.create_task(ticker())
+    result = await tools.grep(r"load_config\(", file_pattern="*.md")
+    task.cancel()
+
+    assert result.success
+    assert result.output == "docs/README.md:3: Call load_config() before anything else."
+    assert ticks > 0  # The loop kept running while the index searched
+
+    result = await tools.glob("*.md")
+    assert result.output.splitlines() == ["docs/README.md (51 bytes)"]
+
+    await tools.write("src/extra.md", "load_config( again\n")
+    result = await tools.grep(r"load_config\(", file_pattern="*.md")
+    assert "src/extra.md:1: load_config( again" in result.output
+
+
+def test_file_context_manager_uses_index(workspace):
+    manager = FileContextManager(workspace)
+
+    assert manager.find_files("main.py") == [workspace / "src/app/main.py"]
+    assert sorted(manager.find_files_by_pattern("*.py", workspace / "src")) == [
+        workspace / "src/app/main.py",
+        workspace / "src/config.py",
+    ]
+
+    matches = manager.search_in_files("LOAD_CONFIG", "*.py")
+    assert [(m["file"], m["line_number"]) for m in matches] == [
+        ("src/app/main.py", 1),
+        ("src/app/main.py", 3),
+        ("src/config.py", 3),
+    ]
@@ -1,3 +1,6 @@
+import json
+import threading
+from collections import deque
 from pathlib import Path
 
 import cost_tracker
@@ -111,3 +114,112 @@ def test_check_cost_cap_would_exceed() -> None:
     assert would_exceed is True
     assert "would be exceeded" in message
     assert current > 0.0
+
+
+def test_reserve_cost_cap_holds_estimate() -> None:
+    """Reservations count against the cap until committed or released."""
+    cost_tracker.reset()
+
+    # gpt-4o output pricing: 5000 tokens ~= $0.05 per reservation
+    would_exceed, first, _, _ = cost_tracker.reserve_cost_cap(0.08, 5000, "gpt-4o")
+    assert would_exceed is False and first is not None
+
+    # A second concurrent call would push the in-flight total over the cap
+    would_exceed, second, _, message = cost_tracker.reserve_cost_cap(0.08, 5000, "gpt-4o")
+    assert would_exceed is True and second is None
+    assert "in-flight" in message
+
+    assert cost_tracker.release_cost_reservation(first) is True
+    assert cost_tracker.get_reserved_cost_usd() == 0.0
+
+    _, third, _, _ = cost_tracker.reserve_cost_cap(0.08, 5000, "gpt-4o")
+    cost_tracker.commit_cost_reservation(third, "manager", "gpt-4o", 100, 100)
+    assert cost_tracker.get_reserved_cost_usd() == 0.0
+    assert cost_tracker.get_summary()["num_calls"] == 1
+
+
+def test_summary_counters_survive_record_eviction(monkeypatch) -> None:
+    """Totals stay exact once old CallRecords fall out of the recent ring."""
+    cost_tracker.reset()
+    small = cost_tracker.CostState(calls=deque(maxlen=3))
+    monkeypatch.setattr(cost_tracker, "_GLOBAL_STATE", small)
+
+    for _ in range(10):
+        cost_tracker.register_call("manager", "gpt-4o-mini", 100, 200)
+
+    summary = cost_tracker.get_summary()
+    assert summary["num_calls"] == 10
+    assert summary["total_input_tokens"] == 1_000
+    assert summary["by_role"]["manager"]["num_calls"] == 10
+    assert len(cost_tracker.get_recent_calls()) == 3
+
+
+def test_window_summary_rolls_off_old_calls() -> None:
+    """Rolling windows only include calls within the requested span."""
+    state = cost_tracker.CostState()
+    old = state.add_call("manager", "gpt-4o", 1_000, 0)
+    state.add_call("manager", "gpt-4o", 1_000, 0)
+
+    now = old.timestamp
+    assert state.window(300, now=now)["num_calls"] == 2
+    assert state.window(300, now=now + 3600)["num_calls"] == 0
+
+
+def test_concurrent_register_call_is_exact() -> None:
+    """Parallel updates from threads don't lose counts."""
+    cost_tracker.reset()
+
+    def worker() -> None:
+        for _ in range(500):
+            cost_tracker.register_call("employee", "gpt-4o-mini", 1, 1)
+
+    threads = [threading.Thread(target=worker) for _ in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+
+    assert cost_tracker.get_summary()["num_calls"] == 4_000
+
+
+def test_runtime_history_is_batched(tmp_path: Path, monkeypatch) -> None:
+    """Runtime history writes are buffered and flushed together."""
+    history_file = tmp_path / "cost_history.json"
+    monkeypatch.setattr(cost_tracker, "HISTORY_FILE", history_file)
+    monkeypatch.setattr(cost_tracker, "HISTORY_BATCH_SIZE", 3)
+    monkeypatch.setattr(cost_tracker, "HISTORY_FLUSH_INTERVAL_SECONDS", 3600)
+    cost_tracker.flush_history()
+
+    cost_tracker.append_history(total_usd=0.1, model="gpt-4o")
+    cost_tracker.append_history(total_usd=0.2, model="gpt-4o")
+    assert not history_file.exists()
+
+    cost_tracker.append_history(total_usd=0.3, model="gpt-4o")
+    assert len(json.loads(history_file.read_text())) == 3
+
+    cost_tracker.append_history(total_usd=0.4, model="gpt-4o")
+    assert len(cost_tracker.load_history()) == 4
+
+
+def test_failed_history_flush_keeps_records(tmp_path: Path, monkeypatch) -> None:
+    """Records stay buffered when saving fails and are written on the next flush."""
+    history_file = tmp_path / "cost_history.json"
+    monkeypatch.setattr(cost_tracker, "HISTORY_FILE", history_file)
+    monkeypatch.setattr(cost_tracker, "HISTORY_BATCH_SIZE", 100)
+    monkeypatch.setattr(cost_tracker, "HISTORY_FLUSH_INTERVAL_SECONDS", 3600)
+    cost_tracker.flush_history()
+
+    cost_tracker.append_history(total_usd=0.1, model="gpt-4o")
+    cost_tracker.append_history(total_usd=0.2, model="gpt-4o")
+
+    save = cost_tracker.save_history
+
+    def failing_save(history):
+        raise OSError("disk full")
+
+    monkeypatch.setattr(cost_tracker, "save_history", failing_save)
+    assert cost_tracker.flush_history() == 0
+
+    monkeypatch.setattr(cost_tracker, "save_history", save)
+    assert cost_tracker.flush_history() == 2
+    assert [r["total_usd"] for r in json.loads(history_file.read_text())] == [0.1, 0.2]
@@ -258,6 +258,73 @@ async def test_excel_generation_real(execution_context):
     assert output_path.stat().st_size > 0
 
 
+def test_excel_streaming_spec(temp_project_dir):
+    """Rows stream from a generator; formulas, totals and charts in one pass"""
+    openpyxl = pytest.importorskip("openpyxl")
+    from agent.documents.excel_generator import ExcelGenerator
+
+    def ledger():
+        for i in range(1, 501):
+            yield [f"Item {i}", i]
+
+    path = temp_project_dir / "output" / "ledger.xlsx"
+    ExcelGenerator().write_workbook({
+        "Ledger": {
+            "header": ["Item", "Amount", "Double"],
+            "rows": ledger(),
+            "freeze_panes": "A2",
+            "number_formats": {"B": "#,##0.00"},
+            "formulas": {"C": "=B{row}*2"},
+            "totals": {"B": "SUM"},
+            "charts": [{"type": "bar", "data": "B1:B{last_row}", "categories": "A2:A{last_row}"}],
+        }
+    }, path)
+
+    ws = openpyxl.load_workbook(path)["Ledger"]
+    assert ws["A1"].font.bold is True
+    assert ws.freeze_panes == "A2"
+    assert ws["B2"].number_format == "#,##0.00"
+    assert ws["C501"].value == "=B501*2"
+    assert ws["A502"].value == "Total"
+    assert ws["B502"].value == "=SUM(B2:B501)"
+
+
+def test_excel_iter_rows_is_lazy(temp_project_dir):
+    """iter_rows yields rows one at a time and honours ranges"""
+    pytest.importorskip("openpyxl")
+    from agent.documents.excel_generator import ExcelGenerator
+
+    generator = ExcelGenerator()
+    path = generator.create_workbook(
+        {"Data": ([i, i * i] for i in range(1000))},
+        temp_project_dir / "output" / "data.xlsx",
+    )
+
+    rows = generator.iter_rows(path, "Data")
+    assert next(rows) == (0, 0)
+    assert next(rows) == (1, 1)
+    rows.close()
+
+    assert generator.read_data(path, "Data", "B10:B11") == [[81], [100]]
+
+
+def test_excel_add_chart_accepts_sheet_qualified_range(temp_project_dir):
+    """add_chart takes plain and "Sheet!A1:B2" ranges"""
+    openpyxl = pytest.importorskip("openpyxl")
+    from agent.documents.excel_generator import ExcelGenerator
+
+    generator = ExcelGenerator()
+    path = generator.create_workbook(
+        {"Q1 Sales": [["Region", "Sales"], ["East", 10], ["West", 20]]},
+        temp_project_dir / "output" / "sales.xlsx",
+    )
+    generator.add_chart(path, "Q1 Sales", "bar", "'Q1 Sales'!B1:B3", "D2")
+    generator.add_chart(path, "Q1 Sales", "line", "B1:B3", "D20")
+
+    charts = openpyxl.load_workbook(path)["Q1 Sales"]._charts
+    assert len(charts) == 2
+
+
 # ══════════════════════════════════════════════════════════════════════
 # Test: PDF Generation
 # ══════════════════════════════════════════════════════════════════════
@@ -16,8 +16,10 @@ Run with: pytest agent/tests/unit/test_permissions.py -v
 
 from __future__ import annotations
 
+import json
 import sys
 import tempfile
+from datetime import datetime, timedelta
 from pathlib import Path
 
 import pytest
@@ -36,7 +38,11 @@ from agent.permissions import (
     SYSTEM_ROLES,
 )
 from agent.tool_audit_log import (
+    clear_old_logs,
+    flush_access_statistics,
+    get_access_statistics,
     get_audit_logs,
+    get_partitioned_log,
     log_tool_access,
 )
 
@@ -54,9 +60,9 @@ def temp_audit_log():
 
     yield log_path
 
-    # Cleanup
-    if log_path.exists():
-        log_path.unlink()
+    # Cleanup (daily partitions and stats live next to the log path)
+    for path in log_path.parent.glob(f"{log_path.stem}*"):
+        path.unlink()
 
 
 @pytest.fixture
@@ -404,6 +410,86 @@ def test_query_audit_logs_by_allowed(temp_audit_log):
     assert all(not log.allowed for log in denied_logs)
 
 
+def write_partition(log_path, day, events):
+    """Write events (role, tool, allowed) directly into a day's partition"""
+    partition = get_partitioned_log(log_path).partition_path(day.isoformat())
+    with open(partition, "a", encoding="utf-8") as f:
+        for role_id, tool_name, allowed in events:
+            f.write(json.dumps({
+                "timestamp": f"{day.isoformat()}T12:00:00Z",
+                "mission_id": "m",
+                "role_id": role_id,
+                "tool_name": tool_name,
+                "domain": "hr",
+                "allowed": allowed,
+            }) + "\n")
+
+
+def test_audit_log_partitioned_by_day(temp_audit_log):
+    """Test events land in daily partitions and old days are skipped"""
+    today = datetime.utcnow().date()
+    write_partition(temp_audit_log, today - timedelta(days=40), [("old", "tool1", True)])
+    log_tool_access("m1", "hr_manager", "tool1", "hr", True, log_path=temp_audit_log)
+
+    assert get_partitioned_log(temp_audit_log).partition_path(today.isoformat()).exists()
+    assert [log.role_id for log in get_audit_logs(days=30, log_path=temp_audit_log)] == ["hr_manager"]
+    assert len(get_audit_logs(days=60, log_path=temp_audit_log)) == 2
+
+
+def test_access_statistics_from_counters(temp_audit_log):
+    """Test incremental counters match the logged events"""
+    yesterday = datetime.utcnow().date() - timedelta(days=1)
+    write_partition(temp_audit_log, yesterday, [("r1", "tool1", True), ("r2", "tool2", False)])
+    log_tool_access("m1", "r1", "tool1", "hr", True, log_path=temp_audit_log)
+    log_tool_access("m2", "r2", "tool2", "hr", False, "denied", log_path=temp_audit_log)
+    log_tool_access("m3", "r2", "tool2", "hr", False, "denied", log_path=temp_audit_log)
+
+    stats = get_access_statistics(days=7, log_path=temp_audit_log)
+    assert stats["total"] == 5
+    assert stats["granted"] == 2
+    assert stats["denied"] == 3
+    assert stats["grant_rate"] == 40.0
+    assert stats["top_tools"] == [("tool2", 3), ("tool1", 2)]
+    assert stats["top_denied_tools"] == [("tool2", 3)]
+    assert stats["top_domains"] == [("hr", 5)]
+
+    # Persisted counters are picked up and brought up to date
+    flush_access_statistics()
+    write_partition(temp_audit_log, yesterday, [("r3", "tool3", True)])
+    counts = json.loads(get_partitioned_log(temp_audit_log).stats_path.read_text())
+    assert counts["days"][yesterday.isoformat()]["total"] == 2
+    assert get_access_statistics(days=7, log_path=temp_audit_log)["total"] == 6
+
+
+def test_clear_old_logs_drops_partitions(temp_audit_log):
+    """Test retention deletes whole partitions and their counters"""
+    today = datetime.utcnow().date()
+    write_partition(temp_audit_log, today - timedelta(days=100), [("r1", "tool1", True)] * 3)
+    write_partition(temp_audit_log, today - timedelta(days=5), [("r1", "tool1", True)])
+
+    assert clear_old_logs(days=90, log_path=temp_audit_log) == 3
+    assert len(get_partitioned_log(temp_audit_log).partitions()) == 1
+    assert get_access_statistics(days=365, log_path=temp_audit_log)["total"] == 1
+
+
+def test_legacy_single_file_log_migrated(temp_audit_log):
+    """Test a pre-partitioning log file is split into days"""
+    today = datetime.utcnow().date()
+    temp_audit_log.write_text(json.dumps({
+        "timestamp": f"{today.isoformat()}T00:00:01Z",
+        "mission_id": "m",
+        "role_id": "legacy",
+        "tool_name": "tool1",
+        "domain": None,
+        "allowed": False,
+        "reason": "denied",
+    }) + "\n")
+
+    logs = get_audit_logs(days=2, log_path=temp_audit_log)
+    assert [log.role_id for log in logs] == ["legacy"]
+    assert not temp_audit_log.exists()
+
+
 # ══════════════════════════════════════════════════════════════════════
 # Test: Escalation Paths
 # ══════════════════════════════════════════════════════════════════════
@@ -9,6 +9,16 @@ Features:
 - Structured logging with timestamps
 - Success and failure tracking
 - Query and reporting capabilities
+- Daily partitions: queries read only the days they cover, retention
+  deletes whole partitions
+- Incremental per-day counters (by tool, role, domain, allow/deny),
+  persisted periodically, so statistics don't re-read the log
+
+Storage layout (for log_path=data/tool_access_log.jsonl):
+    tool_access_log.2025-01-31.jsonl   One partition per UTC day
+    tool_access_log.stats.json         Per-day counters
+A pre-existing single-file log at log_path is split into partitions the
+first time it is used.
 
 Usage:
     from agent.tool_audit_log import log_tool_access, get_audit_logs
@@ -29,12 +39,16 @@ Usage:
 
 from __future__ import annotations
 
+import atexit
 import json
 import logging
-from dataclasses import asdict, dataclass
-from datetime import datetime, timedelta
+import os
+import threading
+import time
+from dataclasses import asdict, dataclass, field
+from datetime import date, datetime, timedelta
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Dict, Iterator, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -47,6 +61,10 @@ logger = logging.getLogger(__name__)
 # Default audit log location
 DEFAULT_AUDIT_LOG_PATH = Path(__file__).parent.parent / "data" / "tool_access_log.jsonl"
 
+# Counters are written to disk after this many events or seconds
+STATS_FLUSH_EVENTS = 100
+STATS_FLUSH_INTERVAL_SECONDS = 30.0
+
 
 # ══════════════════════════════════════════════════════════════════════
 # Data Models
@@ -82,6 +100,305 @@ class ToolAccessEvent:
     metadata: Dict[str, Any] = None
 
 
+def _top(counts: Dict[str, int], n: int = 10) -> List[Tuple[str, int]]:
+    return sorted(counts.items(), key=lambda x: x[1], reverse=True)[:n]
+
+
+@dataclass
+class AccessCounters:
+    """
+    Access counts for one day partition.
+
+    ``size`` is how many bytes of the partition the counts cover, so
+    counters persisted before a crash (or by another process) are
+    brought up to date by scanning only the bytes after it.
+    """
+    total: int = 0
+    granted: int = 0
+    denied: int = 0
+    tools: Dict[str, int] = field(default_factory=dict)
+    roles: Dict[str, int] = field(default_factory=dict)
+    domains: Dict[str, int] = field(default_factory=dict)
+    denied_tools: Dict[str, int] = field(default_factory=dict)
+    size: int = 0
+
+    def add(self, event: Dict[str, Any]):
+        """Count one event (as stored in the log)"""
+        tool_name = event.get("tool_name")
+        self.total += 1
+        self.tools[tool_name] = self.tools.get(tool_name, 0) + 1
+        self.roles[event.get("role_id")] = self.roles.get(event.get("role_id"), 0) + 1
+        if event.get("domain"):
+            self.domains[event["domain"]] = self.domains.get(event["domain"], 0) + 1
+        if event.get("allowed"):
+            self.granted += 1
+        else:
+            self.denied += 1
+            self.denied_tools[tool_name] = self.denied_tools.get(tool_name, 0) + 1
+
+    def merge(self, other: AccessCounters):
+        self.total += other.total
+        self.granted += other.granted
+        self.denied += other.denied
+        for name in ("tools", "roles", "domains", "denied_tools"):
+            mine = getattr(self, name)
+            for key, count in getattr(other, name).items():
+                mine[key] = mine.get(key, 0) + count
+
+    def to_statistics(self) -> Dict[str, Any]:
+        """Format as returned by get_access_statistics()"""
+        return {
+            "total": self.total,
+            "granted": self.granted,
+            "denied": self.denied,
+            "grant_rate": round(self.granted / self.total * 100, 2) if self.total > 0 else 0,
+            "top_tools": _top(self.tools),
+            "top_roles": _top(self.roles),
+            "top_domains": _top(self.domains),
+            "top_denied_tools": _top(self.denied_tools),
+        }
+
+
+class PartitionedAccessLog:
+    """
+    Tool access log split into one JSONL file per UTC day.
+
+    Keeps running per-day counters that are updated on every append and
+    written to a sidecar every STATS_FLUSH_EVENTS events or
+    STATS_FLUSH_INTERVAL_SECONDS (and at exit). Use get_partitioned_log()
+    rather than constructing this directly so all callers for a path
+    share one set of counters.
+    """
+
+    def __init__(self, log_path: Path):
+        self.log_path = Path(log_path)
+        self.stats_path = self.log_path.with_name(f"{self.log_path.stem}.stats.json")
+        self._counters: Optional[Dict[str, AccessCounters]] = None
+        self._lock = threading.RLock()
+        self._unflushed = 0
+        self._last_flush = time.monotonic()
+
+    # ──────────────────────────────────────────────────────────────
+    # Partitions
+    # ──────────────────────────────────────────────────────────────
+
+    def partition_path(self, day: str) -> Path:
+        """Partition file for a YYYY-MM-DD day"""
+        return self.log_path.with_name(f"{self.log_path.stem}.{day}{self.log_path.suffix}")
+
+    def partitions(self, since: Optional[date] = None) -> List[Tuple[str, Path]]:
+        """(day, path) for existing partitions, oldest first"""
+        self._migrate_legacy_log()
+        prefix = self.log_path.stem + "."
+        found = []
+        for path in self.log_path.parent.glob(f"{prefix}*{self.log_path.suffix}"):
+            day = path.name[len(prefix):len(path.name) - len(self.log_path.suffix)]
+            try:
+                parsed = date.fromisoformat(day)
+            except ValueError:
+                continue
+            if since is None or parsed >= since:
+                found.append((day, path))
+        return sorted(found)
+
+    def _migrate_legacy_log(self):
+        """Split a single-file log from before partitioning into days"""
+        if not self.log_path.is_file() or self.log_path.stat().st_size == 0:
+            return
+
+        with self._lock:
+            by_day: Dict[str, List[str]] = {}
+            with open(self.log_path, "r", encoding="utf-8") as f:
+                for line in f:
+                    if not line.strip():
+                        continue
+                    try:
+                        day = json.loads(line)["timestamp"][:10]
+                        date.fromisoformat(day)
+                    except Exception:
+                        logger.warning("Dropping malformed audit log line during migration")
+                        continue
+                    by_day.setdefault(day, []).append(line if line.endswith("\n") else line + "\n")
+
+            for day, lines in by_day.items():
+                with open(self.partition_path(day), "a", encoding="utf-8") as f:
+                    f.writelines(lines)
+            self.log_path.unlink()
+            logger.info(f"Migrated audit log into {len(by_day)} daily partitions")
+
+    # ──────────────────────────────────────────────────────────────
+    # Writing
+    # ──────────────────────────────────────────────────────────────
+
+    def append(self, event: ToolAccessEvent):
+        """Append an event to its day's partition and count it"""
+        event_dict = asdict(event)
+        day = event.timestamp[:10]
+        data = (json.dumps(event_dict, ensure_ascii=False) + "\n").encode("utf-8")
+
+        with self._lock:
+            counters = self._load_counters()
+            with open(self.partition_path(day), "ab") as f:
+                f.write(data)
+                end = f.tell()
+
+            day_counters = counters.get(day)
+            if day_counters is not None and day_counters.size == end - len(data):
+                day_counters.add(event_dict)
+                day_counters.size = end
+            else:
+                # New day, or another process wrote in between: catch up from disk
+                self.counters_for(day)
+
+            self._unflushed += 1
+            if (
+                self._unflushed >= STATS_FLUSH_EVENTS
+                or time.monotonic() - self._last_flush >= STATS_FLUSH_INTERVAL_SECONDS
+            ):
+                self.flush()
+
+    # ──────────────────────────────────────────────────────────────
+    # Counters
+    # ──────────────────────────────────────────────────────────────
+
+    def _load_counters(self) -> Dict[str, AccessCounters]:
+        if self._counters is None:
+            self._counters = {}
+            try:
+                data = json.loads(self.stats_path.read_text(encoding="utf-8"))
+                for day, values in data.get("days", {}).items():
+                    self._counters[day] = AccessCounters(**values)
+            except FileNotFoundError:
+                pass
+            except Exception as e:
+                logger.warning(f"Ignoring unreadable audit statistics, recounting: {e}")
+                self._counters = {}
+        return self._counters
+
+    def counters_for(self, day: str) -> AccessCounters:
+        """Counters for a day, scanning only partition bytes not yet counted"""
+        with self._lock:
+            counters = self._load_counters()
+            path = self.partition_path(day)
+            size = path.stat().st_size if path.exists() else 0
+
+            day_counters = counters.get(day)
+            if day_counters is None or day_counters.size > size:
+                day_counters = counters[day] = AccessCounters()
+
+            if day_counters.size < size:
+                for event_dict, end in self._read_from(path, day_counters.size):
+                    day_counters.add(event_dict)
+                    day_counters.size = end
+                self._unflushed += 1
+            return day_counters
+
+    @staticmethod
+    def _read_from(path: Path, offset: int) -> Iterator[Tuple[Dict[str, Any], int]]:
+        """Complete lines after ``offset`` as (event dict, end offset)"""
+        with open(path, "rb") as f:
+            f.seek(offset)
+            for raw in f:
+                if not raw.endswith(b"\n"):
+                    break  # Partial write in progress
+                offset += len(raw)
+                try:
+                    yield json.loads(raw), offset
+                except ValueError:
+                    logger.warning(f"Failed to parse audit log line in {path.name}")
+
+    def flush(self):
+        """Persist counters to the stats sidecar"""
+        with self._lock:
+            self._last_flush = time.monotonic()
+            if self._counters is None or not self._unflushed:
+                return
+            try:
+                payload = {"days": {day: asdict(c) for day, c in sorted(self._counters.items())}}
+                tmp = self.stats_path.with_name(self.stats_path.name + ".tmp")
+                tmp.write_text(json.dumps(payload), encoding="utf-8")
+                os.replace(tmp, self.stats_path)
+                self._unflushed = 0
+            except Exception as e:
+                logger.error(f"Failed to persist audit statistics: {e}")
+
+    # ──────────────────────────────────────────────────────────────
+    # Reading
+    # ──────────────────────────────────────────────────────────────
+
+    def iter_events(self, since: datetime) -> Iterator[Dict[str, Any]]:
+        """Stored events at or after ``since``, reading only partitions from that day on"""
+        cutoff = since.isoformat()
+        for _, path in self.partitions(since.date()):
+            for event_dict, _ in self._read_from(path, 0):
+                if event_dict.get("timestamp", "").rstrip("Z") >= cutoff:
+                    yield event_dict
+
+    def statistics(self, since: datetime) -> AccessCounters:
+        """
+        Totals for events at or after ``since``.
+
+        Whole days come from the counters; only the partition containing
+        ``since`` is read to count its later events.
+        """
+        first_day = since.date().isoformat()
+        cutoff = since.isoformat()
+        totals = AccessCounters()
+
+        with self._lock:
+            for day, path in self.partitions(since.date()):
+                if day == first_day:
+                    for event_dict, _ in self._read_from(path, 0):
+                        if event_dict.get("timestamp", "").rstrip("Z") >= cutoff:
+                            totals.add(event_dict)
+                else:
+                    totals.merge(self.counters_for(day))
+        return totals
+
+    def drop_before(self, day: date) -> int:
+        """Delete partitions older than ``day``; returns events removed"""
+        removed = 0
+        with self._lock:
+            counters = self._load_counters()
+            for name, path in self.partitions():
+                if date.fromisoformat(name) >= day:
+                    break
+                removed += self.counters_for(name).total
+                path.unlink()
+                counters.pop(name, None)
+                self._unflushed += 1
+
+            # Forget counters whose partitions are gone
+            for name in [d for d in counters if d < day.isoformat()]:
+                del counters[name]
+            self.flush()
+        return removed
+
+
+_partitioned_logs: Dict[Path, PartitionedAccessLog] = {}
+_partitioned_logs_lock = threading.Lock()
+
+
+def get_partitioned_log(log_path: Optional[Path] = None) -> PartitionedAccessLog:
+    """Shared PartitionedAccessLog for a log path"""
+    log_path = Path(log_path or DEFAULT_AUDIT_LOG_PATH).resolve()
+    with _partitioned_logs_lock:
+        if log_path not in _partitioned_logs:
+            _partitioned_logs[log_path] = PartitionedAccessLog(log_path)
+        return _partitioned_logs[log_path]
+
+
+def flush_access_statistics():
+    """Persist buffered counters for every open log"""
+    with _partitioned_logs_lock:
+        logs = list(_partitioned_logs.values())
+    for log in logs:
+        log.flush()
+
+
+atexit.register(flush_access_statistics)
+
+
 # ══════════════════════════════════════════════════════════════════════
 # Audit Logging Functions
 # ══════════════════════════════════════════════════════════════════════
@@ -112,7 +429,8 @@ def log_tool_access(
         user_id: Optional user identifier
         permissions_checked: Permissions that were checked
         metadata: Additional event metadata
-        log_path: Custom log path (defaults to data/tool_access_log.jsonl)
+        log_path: Custom log path (defaults to data/tool_access_log.jsonl);
+                  events go to daily partitions next to it
 
     Example:
         log_tool_access(
@@ -124,9 +442,6 @@ def log_tool_access(
             reason="Missing permission: offer_approve"
         )
     """
-    if log_path is None:
-        log_path = DEFAULT_AUDIT_LOG_PATH
-
     # Create event
     event = ToolAccessEvent(
         timestamp=datetime.utcnow().isoformat() + "Z",
@@ -141,17 +456,18 @@ def log_tool_access(
         metadata=metadata or {}
     )
 
+    log = get_partitioned_log(log_path)
+
     # Ensure directory exists
     try:
-        log_path.parent.mkdir(parents=True, exist_ok=True)
+        log.log_path.parent.mkdir(parents=True, exist_ok=True)
     except Exception as e:
         logger.error(f"Failed to create audit log directory: {e}")
         return
 
-    # Append to log file
+    # Append to today's partition
     try:
-        with open(log_path, "a", encoding="utf-8") as f:
-            f.write(json.dumps(asdict(event), ensure_ascii=False) + "\n")
+        log.append(event)
 
         # Log to application logger as well
         if allowed:
@@ -200,42 +516,28 @@ def get_audit_logs(
         for event in denied:
             print(f"{event.timestamp}: {event.tool_name} - {event.reason}")
     """
-    if log_path is None:
-        log_path = DEFAULT_AUDIT_LOG_PATH
-
-    if not log_path.exists():
-        return []
-
     cutoff_time = datetime.utcnow() - timedelta(days=days)
     results = []
 
     try:
-        with open(log_path, "r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    event_dict = json.loads(line)
-                    event = ToolAccessEvent(**event_dict)
-
-                    # Parse timestamp
-                    event_time = datetime.fromisoformat(event.timestamp.rstrip("Z"))
-                    if event_time < cutoff_time:
-                        continue
-
-                    # Apply filters
-                    if role_id and event.role_id != role_id:
-                        continue
-                    if tool_name and event.tool_name != tool_name:
-                        continue
-                    if domain and event.domain != domain:
-                        continue
-                    if allowed is not None and event.allowed != allowed:
-                        continue
+        # Only partitions from the cutoff day onwards are read
+        for event_dict in get_partitioned_log(log_path).iter_events(cutoff_time):
+            try:
+                # Apply filters
+                if role_id and event_dict.get("role_id") != role_id:
+                    continue
+                if tool_name and event_dict.get("tool_name") != tool_name:
+                    continue
+                if domain and event_dict.get("domain") != domain:
+                    continue
+                if allowed is not None and event_dict.get("allowed") != allowed:
+                    continue
 
-                    results.append(event)
+                results.append(ToolAccessEvent(**event_dict))
 
-                except Exception as e:
-                    logger.warning(f"Failed to parse audit log line: {e}")
-                    continue
+            except Exception as e:
+                logger.warning(f"Failed to parse audit log line: {e}")
+                continue
 
     except Exception as e:
         logger.error(f"Failed to read audit log: {e}")
@@ -251,6 +553,9 @@ def get_access_statistics(
     """
     Get statistics on tool access patterns.
 
+    Served from the per-day counters; only the partition for the first
+    day of the window is read.
+
     Args:
         days: Number of days to analyze
         log_path: Custom log path
@@ -264,50 +569,21 @@ def get_access_statistics(
         print(f"Denied: {stats['denied']}")
         print(f"Top tools: {stats['top_tools']}")
     """
-    logs = get_audit_logs(days=days, log_path=log_path)
-
-    total = len(logs)
-    granted = sum(1 for log in logs if log.allowed)
-    denied = sum(1 for log in logs if not log.allowed)
-
-    # Count by tool
-    tool_counts = {}
-    for log in logs:
-        tool_counts[log.tool_name] = tool_counts.get(log.tool_name, 0) + 1
-
-    # Count by role
-    role_counts = {}
-    for log in logs:
-        role_counts[log.role_id] = role_counts.get(log.role_id, 0) + 1
-
-    # Count by domain
-    domain_counts = {}
-    for log in logs:
-        if log.domain:
-            domain_counts[log.domain] = domain_counts.get(log.domain, 0) + 1
-
-    # Top denied tools
-    denied_logs = [log for log in logs if not log.allowed]
-    denied_tool_counts = {}
-    for log in denied_logs:
-        denied_tool_counts[log.tool_name] = denied_tool_counts.get(log.tool_name, 0) + 1
-
-    return {
-        "total": total,
-        "granted": granted,
-        "denied": denied,
-        "grant_rate": round(granted / total * 100, 2) if total > 0 else 0,
-        "top_tools": sorted(tool_counts.items(), key=lambda x: x[1], reverse=True)[:10],
-        "top_roles": sorted(role_counts.items(), key=lambda x: x[1], reverse=True)[:10],
-        "top_domains": sorted(domain_counts.items(), key=lambda x: x[1], reverse=True)[:10],
-        "top_denied_tools": sorted(denied_tool_counts.items(), key=lambda x: x[1], reverse=True)[:10],
-    }
+    cutoff_time = datetime.utcnow() - timedelta(days=days)
+    try:
+        return get_partitioned_log(log_path).statistics(cutoff_time).to_statistics()
+    except Exception as e:
+        logger.error(f"Failed to compute audit statistics: {e}")
+        return AccessCounters().to_statistics()
 
 
 def clear_old_logs(days: int = 90, log_path: Optional[Path] = None) -> int:
     """
     Remove audit logs older than specified days.
 
+    Deletes whole daily partitions, so events from the day the cutoff
+    falls on are kept until that day's partition expires.
+
     Args:
         days: Remove logs older than this many days
         log_path: Custom log path
@@ -319,37 +595,10 @@ def clear_old_logs(days: int = 90, log_path: Optional[Path] = None) -> int:
         removed = clear_old_logs(days=90)
         print(f"Removed {removed} old audit logs")
     """
-    if log_path is None:
-        log_path = DEFAULT_AUDIT_LOG_PATH
-
-    if not log_path.exists():
-        return 0
-
-    cutoff_time = datetime.utcnow() - timedelta(days=days)
-    kept_logs = []
-    removed = 0
+    cutoff_day = (datetime.utcnow() - timedelta(days=days)).date()
 
     try:
-        # Read all logs
-        with open(log_path, "r", encoding="utf-8") as f:
-            for line in f:
-                try:
-                    event_dict = json.loads(line)
-                    event_time = datetime.fromisoformat(event_dict["timestamp"].rstrip("Z"))
-
-                    if event_time >= cutoff_time:
-                        kept_logs.append(line)
-                    else:
-                        removed += 1
-
-                except Exception:
-                    # Keep malformed lines
-                    kept_logs.append(line)
-
-        # Write back kept logs
-        with open(log_path, "w", encoding="utf-8") as f:
-            f.writelines(kept_logs)
-
+        removed = get_partitioned_log(log_path).drop_before(cutoff_day)
         logger.info(f"Cleared {removed} audit logs older than {days} days")
         return removed
 
@@ -10,6 +10,7 @@ Features:
 - Freeze panes
 - Formulas
 - Charts
+- Written in a single streaming pass
 
 Usage:
     tool = GenerateExcelTool()
@@ -62,7 +63,10 @@ class GenerateExcelTool(ToolPlugin):
                     },
                     "formatting": {
                         "type": "object",
-                        "description": "Optional formatting per sheet"
+                        "description": (
+                            "Optional formatting per sheet: header_row, freeze_panes, "
+                            "column_widths, auto_filter, number_formats, formulas, totals, charts"
+                        )
                     }
                 },
                 "required": ["sheets", "output_path"]
@@ -7,6 +7,7 @@ Provides:
 - POST /api/voice/speak - Text-to-speech
 - POST /api/voice/listen - Speech-to-text
 - POST /api/voice/chat - Full voice conversation turn
+- POST /api/voice/chat/stream - SSE voice turn with per-sentence audio
 - WebSocket /api/voice/stream - Real-time voice streaming
 
 Usage:
@@ -23,7 +24,7 @@ from pathlib import Path
 from typing import Any, Dict, Optional
 
 from fastapi import APIRouter, Depends, HTTPException, WebSocket, WebSocketDisconnect
-from fastapi.responses import Response
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel
 
 import core_logging
@@ -85,6 +86,7 @@ class VoiceChatRequest(BaseModel):
     audio_base64: str
     return_audio: bool = True
     language: str = "en"
+    stream_audio: bool = False  # Send audio per sentence as it is synthesized
 
 
 class VoiceChatResponse(BaseModel):
@@ -233,26 +235,42 @@ async def speak_audio(
     """
     Convert text to speech and return raw audio.
 
-    Returns MP3 audio file directly for streaming playback.
+    Streams MP3 audio sentence by sentence: playback can start as soon as
+    the first sentence is synthesized while the rest are still in flight.
     """
     try:
         voice_chat = get_voice_chat()
+        if not voice_chat.voice.tts_engine:
+            raise HTTPException(status_code=503, detail="TTS engine not available")
 
-        # Get raw audio bytes
-        audio_bytes = await voice_chat.voice.tts_engine.synthesize(request.text)
-
-        return Response(
-            content=audio_bytes,
-            media_type="audio/mpeg",
-            headers={
-                "Content-Disposition": f"inline; filename=jarvis_speech.mp3"
-            }
-        )
+        speech = voice_chat.voice.stream_speech(request.text)
 
+        # Surface synthesis errors as a 500 before the response starts
+        first = await speech.__anext__()
+    except StopAsyncIteration:
+        return Response(content=b"", media_type="audio/mpeg")
+    except HTTPException:
+        raise
     except Exception as e:
         core_logging.log_event("voice_speak_audio_error", {"error": str(e)})
         raise HTTPException(status_code=500, detail=str(e))
 
+    async def audio_chunks():
+        yield first.audio
+        try:
+            async for chunk in speech:
+                yield chunk.audio
+        except Exception as e:
+            core_logging.log_event("voice_speak_audio_error", {"error": str(e)})
+
+    return StreamingResponse(
+        audio_chunks(),
+        media_type="audio/mpeg",
+        headers={
+            "Content-Disposition": "inline; filename=jarvis_speech.mp3"
+        }
+    )
+
 
 @router.post("/listen", response_model=ListenResponse)
 async def listen(
@@ -369,6 +387,11 @@ async def voice_chat_stream(
     3. "Thinking" acknowledgment before LLM processing
     4. Final response with audio
 
+    With ``stream_audio`` set, the response text is sent first and its
+    audio follows as one ``audio`` event per sentence (sentence N+1 is
+    synthesized while the client plays sentence N); the final
+    ``response`` event then carries no audio.
+
     This prevents users from speaking again during processing,
     as they receive immediate feedback that their input was heard.
 
@@ -380,13 +403,14 @@ async def voice_chat_stream(
                 // Show "Thinking..." to user
             } else if (data.type === 'transcription') {
                 // Show what user said
+            } else if (data.type === 'audio') {
+                // Queue sentence audio for playback (stream_audio only)
             } else if (data.type === 'response') {
                 // Show and play JARVIS response
             }
         };
     """
     import random
-    from fastapi.responses import StreamingResponse
     import json as json_module
 
     async def generate_events():
@@ -433,7 +457,16 @@ async def voice_chat_stream(
 
             # Generate audio if requested
             jarvis_audio_base64 = None
-            if request.return_audio:
+            if request.return_audio and request.stream_audio:
+                yield f"data: {json_module.dumps({'type': 'text', 'text': jarvis_text})}\n\n"
+                sentence = []
+                async for chunk in voice_chat.voice.stream_speech(jarvis_text):
+                    sentence.append(chunk.audio)
+                    if chunk.final:
+                        audio = base64.b64encode(b''.join(sentence)).decode('utf-8')
+                        sentence = []
+                        yield f"data: {json_module.dumps({'type': 'audio', 'index': chunk.index, 'text': chunk.text, 'audio': audio})}\n\n"
+            elif request.return_audio:
                 jarvis_audio_base64 = await voice_chat.voice.get_audio_base64(jarvis_text)
 
             processing_time = (datetime.now() - start_time).total_seconds() * 1000
@@ -1431,7 +1431,6 @@ async def api_get_approvals(
         """, (yesterday,))
 
         rows = cursor.fetchall()
-        conn.close()
 
         stats = {
             'pending': total_pending,
@@ -1666,7 +1665,6 @@ async def api_get_workflows(domain: Optional[str] = None):
 
         cursor.execute(query, params)
         rows = cursor.fetchall()
-        conn.close()
 
         workflows = []
         for row in rows:
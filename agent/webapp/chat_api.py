@@ -18,6 +18,7 @@ from pydantic import BaseModel
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
 from jarvis_chat import JarvisChat
+from jarvis_persona import JARVIS_SYSTEM_PROMPT
 from file_context import FileContextManager
 
 
@@ -27,6 +28,7 @@ router = APIRouter(prefix="/api/chat", tags=["chat"])
 # Global instances
 jarvis_chat: Optional[JarvisChat] = None
 file_manager: Optional[FileContextManager] = None
+llm_router = None
 
 
 def get_jarvis() -> JarvisChat:
@@ -45,6 +47,15 @@ def get_file_manager() -> FileContextManager:
     return file_manager
 
 
+def get_llm_router():
+    """Get or create the multi-provider router used for token streaming"""
+    global llm_router
+    if llm_router is None:
+        from llm.enhanced_router import create_router
+        llm_router = create_router()
+    return llm_router
+
+
 # Request/Response models
 class ChatMessage(BaseModel):
     message: str
@@ -57,6 +68,17 @@ class ChatResponse(BaseModel):
     conversation_id: Optional[str] = None
 
 
+class StreamRequest(BaseModel):
+    message: Optional[str] = None
+    messages: Optional[List[Dict[str, str]]] = None
+    model: Optional[str] = None
+    task_type: str = "simple"
+    complexity: str = "medium"
+    temperature: float = 0.7
+    max_tokens: Optional[int] = None
+    first_token_timeout: Optional[float] = None
+
+
 class SessionRequest(BaseModel):
     user_id: str = "default_user"
 
@@ -141,6 +163,78 @@ async def stream_message(request: ChatMessage):
     )
 
 
+def _sse(event: Dict) -> str:
+    return f"data: {json.dumps(event)}\n\n"
+
+
+@router.post("/stream")
+async def stream_tokens(request: StreamRequest):
+    """
+    Stream model tokens as server-sent events.
+
+    Tokens are forwarded as the provider generates them. Events:
+    {"type": "token", "content": ...} per chunk, then one
+    {"type": "complete", "usage": ...} or {"type": "error", "content": ...}.
+    Providers that fail before their first token are failed over; a
+    client that disconnects stops generation upstream.
+    """
+    if request.messages:
+        messages = request.messages
+    elif request.message:
+        messages = [
+            {"role": "system", "content": JARVIS_SYSTEM_PROMPT},
+            {"role": "user", "content": request.message},
+        ]
+    else:
+        raise HTTPException(status_code=400, detail="message or messages is required")
+
+    llm = get_llm_router()
+
+    async def generate():
+        try:
+            async for chunk in llm.stream_chat(
+                messages,
+                task_type=request.task_type,
+                complexity=request.complexity,
+                model=request.model,
+                first_token_timeout=request.first_token_timeout,
+                temperature=request.temperature,
+                max_tokens=request.max_tokens
+            ):
+                if chunk.done:
+                    yield _sse({
+                        "type": "complete",
+                        "provider": chunk.provider,
+                        "model": chunk.model,
+                        "finish_reason": chunk.finish_reason,
+                        "usage": {
+                            "input_tokens": chunk.input_tokens,
+                            "output_tokens": chunk.output_tokens,
+                            "cost": chunk.cost,
+                            "estimated": chunk.metadata.get("estimated_usage", False),
+                        },
+                        "first_token_ms": chunk.metadata.get("first_token_ms"),
+                        "attempts": chunk.metadata.get("attempts", 1),
+                        "timestamp": asyncio.get_event_loop().time()
+                    })
+                else:
+                    yield _sse({"type": "token", "content": chunk.content})
+
+        except Exception as e:
+            yield _sse({
+                "type": "error",
+                "content": str(e),
+                "timestamp": asyncio.get_event_loop().time()
+            })
+
+    return StreamingResponse(
+        generate(),
+        media_type="text/event-stream",
+        # Keep proxies from buffering the stream into one late response
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"}
+    )
+
+
 @router.get("/history")
 async def get_history():
     """Get conversation history"""
@@ -213,7 +307,8 @@ async def search_files(request: FileSearchRequest):
 
     try:
         search_path = Path(request.search_path) if request.search_path else None
-        matches = file_mgr.find_files(request.filename, search_path)
+        # Index scans and lookups can block; keep them off the event loop
+        matches = await asyncio.to_thread(file_mgr.find_files, request.filename, search_path)
 
         return {
             "success": True,
@@ -11,7 +11,7 @@ from fastapi import APIRouter, HTTPException, UploadFile, File, Form
 from pydantic import BaseModel, Field
 from typing import Optional, List, Dict, Any
 import json
-import tempfile
+import io
 import os
 
 # Import finance modules
@@ -188,27 +188,21 @@ async def upload_spreadsheet(
     Returns the parsed data and available columns.
     """
     try:
-        # Save uploaded file temporarily
-        content = await file.read()
-
-        with tempfile.NamedTemporaryFile(mode='wb', suffix='.csv', delete=False) as tmp:
-            tmp.write(content)
-            tmp_path = tmp.name
-
+        # Parse straight from the spooled upload rather than reading it into memory
+        dataset_name = name or file.filename or "uploaded"
+        stream = io.TextIOWrapper(file.file, encoding="utf-8-sig", newline="")
         try:
-            # Load CSV
-            dataset_name = name or file.filename or "uploaded"
-            data = spreadsheet_engine.load_csv(tmp_path, dataset_name)
-
-            return {
-                "success": True,
-                "name": dataset_name,
-                "columns": data.columns,
-                "row_count": len(data.rows),
-                "sample_rows": data.rows[:5] if data.rows else []
-            }
+            data = spreadsheet_engine.load_csv(stream, dataset_name)
         finally:
-            os.unlink(tmp_path)
+            stream.detach()
+
+        return {
+            "success": True,
+            "name": dataset_name,
+            "columns": data.headers,
+            "row_count": data.row_count,
+            "sample_rows": data.take(range(min(5, data.row_count)))
+        }
 
     except Exception as e:
         raise HTTPException(status_code=400, detail=str(e))
@@ -0,0 +1,660 @@
+"""
+Workspace Index
+
+In-memory index of a workspace for code search:
+- File list with size/mtime, so glob-style lookups never walk or stat
+- Trigram content index, so a search only reads files that can match
+- Incremental refresh: a periodic mtime scan re-indexes changed files,
+  and writers can report changes directly with notify_changed()
+- Blocking work (scans, searches) runs in a shared worker pool when
+  called through the async helpers
+
+A regex is narrowed to candidate files using the literal runs it
+requires (e.g. ``def\\s+load_config`` requires "def" and "load_config"),
+then every candidate is verified with the real regex. Patterns without
+a usable literal fall back to verifying every file.
+
+Usage:
+    from workspace_index import get_workspace_index
+
+    index = get_workspace_index("/path/to/repo")
+    results, searched = await index.grep_async(re.compile(r"TODO\\(\\w+\\)"), file_pattern="*.py")
+    entries = await index.glob_async("src/**/*.ts")
+
+Environment:
+    WORKSPACE_INDEX_REFRESH_SECONDS: Minimum seconds between mtime scans (default: 2)
+    WORKSPACE_INDEX_MAX_FILE_BYTES: Larger files are searched but not indexed (default: 2MB)
+"""
+
+import asyncio
+import os
+import re
+import threading
+import time
+from array import array
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import partial
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterable, List, Optional, Set, Tuple, Union
+
+try:
+    from re import _parser as sre_parse  # Python 3.11+
+except ImportError:  # pragma: no cover
+    import sre_parse
+
+
+REFRESH_INTERVAL_SECONDS = float(os.getenv("WORKSPACE_INDEX_REFRESH_SECONDS", "2"))
+MAX_INDEX_FILE_BYTES = int(os.getenv("WORKSPACE_INDEX_MAX_FILE_BYTES", str(2 * 1024 * 1024)))
+
+# Version-control metadata is never searched or listed
+SKIPPED_DIRS = {".git", ".hg", ".svn"}
+
+# Candidate narrowing uses at most this many (rarest) trigrams
+MAX_QUERY_TRIGRAMS = 8
+
+# Characters that re.IGNORECASE treats as ASCII letters but lower() doesn't
+_FOLD = str.maketrans({"ſ": "s", "K": "k", "ı": "i", "İ": "i"})
+
+Trigram = Tuple[str, str, str]
+
+
+def fold(text: str) -> str:
+    """Case-fold text the way the index stores it."""
+    if text.isascii():
+        return text.lower()
+    return text.translate(_FOLD).lower()
+
+
+def trigrams(text: str) -> Set[Trigram]:
+    """Distinct trigrams of already-folded text."""
+    return set(zip(text, text[1:], text[2:]))
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Query Planning
+# ══════════════════════════════════════════════════════════════════════
+
+
+def required_literals(pattern: Union[str, "re.Pattern"], flags: int = 0) -> List[str]:
+    """
+    Literal strings every match of ``pattern`` must contain.
+
+    Conservative: anything the walk doesn't understand (classes,
+    alternation, optional parts) just ends the current literal run.
+
+    Args:
+        pattern: Regex source or compiled pattern
+        flags: re flags (ignored for compiled patterns)
+
+    Returns:
+        Folded literal runs (may be empty)
+    """
+    if isinstance(pattern, re.Pattern):
+        pattern, flags = pattern.pattern, pattern.flags
+    if isinstance(pattern, bytes):
+        return []
+    try:
+        parsed = sre_parse.parse(pattern, flags)
+    except Exception:
+        return []
+
+    ignore_case = bool(parsed.state.flags & re.IGNORECASE)
+    return [fold(run) for run in _literal_runs(parsed, ignore_case)]
+
+
+def _literal_runs(parsed, ignore_case: bool) -> List[str]:
+    runs: List[str] = []
+    current: List[str] = []
+
+    def end_run():
+        if current:
+            runs.append("".join(current))
+            current.clear()
+
+    for op, arg in parsed:
+        if op is sre_parse.LITERAL:
+            char = chr(arg)
+            if ignore_case and not char.isascii():
+                end_run()  # Non-ASCII case folding is too loose to index
+            else:
+                current.append(char)
+        elif op is sre_parse.AT:
+            continue  # Anchors are zero-width
+        elif op in (sre_parse.MAX_REPEAT, sre_parse.MIN_REPEAT):
+            low, _, sub = arg
+            end_run()
+            if low >= 1:
+                runs.extend(_literal_runs(sub, ignore_case))
+        elif op is sre_parse.SUBPATTERN:
+            _, add_flags, _, sub = arg
+            end_run()
+            runs.extend(_literal_runs(sub, ignore_case or bool(add_flags & re.IGNORECASE)))
+        else:
+            end_run()
+    end_run()
+    return runs
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Glob Matching
+# ══════════════════════════════════════════════════════════════════════
+
+
+def _segment_regex(segment: str) -> str:
+    out, i = [], 0
+    while i < len(segment):
+        char = segment[i]
+        if char == "*":
+            out.append("[^/]*")
+        elif char == "?":
+            out.append("[^/]")
+        elif char == "[":
+            end = segment.find("]", i + 2 if segment[i + 1:i + 2] in ("!", "]") else i + 1)
+            if end == -1:
+                out.append(re.escape(char))
+            else:
+                body = segment[i + 1:end]
+                if body.startswith("!"):
+                    body = "^" + body[1:]
+                out.append(f"[{body.replace(chr(92), chr(92) * 2)}]")
+                i = end
+        else:
+            out.append(re.escape(char))
+        i += 1
+    return "".join(out)
+
+
+def compile_glob(pattern: str, recursive: bool = True) -> "re.Pattern":
+    """
+    Compile a pathlib-style glob for matching relative POSIX paths.
+
+    Args:
+        pattern: Glob such as "*.py" or "src/**/*.ts"
+        recursive: Match at any depth, like Path.rglob()
+
+    Returns:
+        Compiled regex matched against the whole relative path
+    """
+    parts = [p for p in pattern.strip("/").split("/") if p and p != "."]
+    body = ""
+    for index, part in enumerate(parts):
+        last = index == len(parts) - 1
+        if part == "**":
+            body += "(?:[^/]+/)*" if not last else "(?:[^/]+/)*[^/]+"
+        else:
+            body += _segment_regex(part) + ("" if last else "/")
+    prefix = "(?:[^/]+/)*" if recursive else ""
+    return re.compile(f"{prefix}{body}\\Z" if body else r"[^/]+\Z", re.DOTALL)
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Workspace Index
+# ══════════════════════════════════════════════════════════════════════
+
+
+@dataclass
+class IndexedPath:
+    """A file or directory known to the index."""
+    path: str  # POSIX path relative to the index root
+    is_dir: bool
+    size: int
+    mtime: float
+    doc_id: int = -1  # Row in the trigram index (-1 = not content-indexed)
+    binary: bool = False
+
+
+class WorkspaceIndex:
+    """
+    File list and trigram content index for one directory tree.
+
+    Thread-safe. The sync methods block while they scan or read files;
+    use the ``*_async`` variants from event-loop code.
+    """
+
+    def __init__(
+        self,
+        root: Union[str, Path],
+        refresh_interval: float = REFRESH_INTERVAL_SECONDS,
+        max_file_bytes: int = MAX_INDEX_FILE_BYTES,
+    ):
+        """
+        Initialize index (built lazily on first use).
+
+        Args:
+            root: Directory to index
+            refresh_interval: Minimum seconds between mtime scans
+            max_file_bytes: Larger files are searched directly, not indexed
+        """
+        self.root = Path(root).resolve()
+        self.refresh_interval = refresh_interval
+        self.max_file_bytes = max_file_bytes
+
+        self._entries: Dict[str, IndexedPath] = {}
+        self._postings: Dict[Trigram, array] = {}
+        self._doc_paths: List[Optional[str]] = []  # doc_id -> path (None = dead)
+        self._dead_docs = 0
+        self._dirty: Set[str] = set()
+        self._last_refresh: Optional[float] = None
+        self._lock = threading.RLock()
+        self.stats = {"scans": 0, "indexed": 0, "searches": 0, "candidates": 0, "verified_files": 0}
+
+    def __len__(self) -> int:
+        return sum(1 for e in self._entries.values() if not e.is_dir)
+
+    # ──────────────────────────────────────────────────────────────────
+    # Maintenance
+    # ──────────────────────────────────────────────────────────────────
+
+    def refresh(self, force: bool = False) -> Dict[str, int]:
+        """
+        Bring the index up to date with the filesystem.
+
+        Walks the tree comparing size and mtime, re-indexing only files
+        that changed. Skipped if the last scan was within refresh_interval
+        (paths passed to notify_changed() are re-indexed regardless).
+
+        Args:
+            force: Scan even if the last scan was recent
+
+        Returns:
+            Counts of added, changed and removed paths
+        """
+        with self._lock:
+            counts = {"added": 0, "changed": 0, "removed": 0}
+            recent = (
+                self._last_refresh is not None
+                and time.monotonic() - self._last_refresh < self.refresh_interval
+            )
+            if recent and not force:
+                for rel in list(self._dirty):
+                    self._refresh_path(rel, counts)
+                self._dirty.clear()
+                return counts
+
+            seen: Set[str] = set()
+            for rel, is_dir, size, mtime in self._walk():
+                seen.add(rel)
+                entry = self._entries.get(rel)
+                if entry is None:
+                    self._add(rel, is_dir, size, mtime)
+                    counts["added"] += 1
+                elif entry.is_dir != is_dir or entry.size != size or entry.mtime != mtime:
+                    self._remove(rel)
+                    self._add(rel, is_dir, size, mtime)
+                    counts["changed"] += 1
+
+            for rel in [r for r in self._entries if r not in seen]:
+                self._remove(rel)
+                counts["removed"] += 1
+
+            self._dirty.clear()
+            self._last_refresh = time.monotonic()
+            self.stats["scans"] += 1
+            self._maybe_compact()
+            return counts
+
+    def notify_changed(self, *paths: Union[str, Path]):
+        """
+        Mark paths as created, modified or deleted.
+
+        They are re-indexed on the next lookup without waiting for a scan.
+        """
+        with self._lock:
+            for path in paths:
+                rel = self._relative(path)
+                if rel is not None:
+                    self._dirty.add(rel)
+
+    def _refresh_path(self, rel: str, counts: Dict[str, int]):
+        path = self.root / rel
+        existed = rel in self._entries
+        self._remove(rel)
+        try:
+            stat = path.stat()
+        except OSError:
+            counts["removed"] += existed
+            return
+        self._ensure_parents(rel)
+        self._add(rel, path.is_dir(), stat.st_size, stat.st_mtime)
+        counts["changed" if existed else "added"] += 1
+
+    def _ensure_parents(self, rel: str):
+        parent = rel.rpartition("/")[0]
+        while parent and parent not in self._entries:
+            try:
+                mtime = (self.root / parent).stat().st_mtime
+            except OSError:
+                mtime = 0.0
+            self._entries[parent] = IndexedPath(parent, True, 0, mtime)
+            parent = parent.rpartition("/")[0]
+
+    def _walk(self) -> Iterable[Tuple[str, bool, int, float]]:
+        """(relative path, is_dir, size, mtime) for everything under root."""
+        stack = [("", self.root)]
+        while stack:
+            prefix, directory = stack.pop()
+            try:
+                with os.scandir(directory) as it:
+                    entries = list(it)
+            except OSError:
+                continue
+            for entry in entries:
+                rel = prefix + entry.name
+                try:
+                    if entry.is_dir(follow_symlinks=False):
+                        if entry.name in SKIPPED_DIRS:
+                            continue
+                        stat = entry.stat(follow_symlinks=False)
+                        yield rel, True, 0, stat.st_mtime
+                        stack.append((rel + "/", entry.path))
+                    else:
+                        stat = entry.stat()
+                        yield rel, False, stat.st_size, stat.st_mtime
+                except OSError:
+                    continue
+
+    def _add(self, rel: str, is_dir: bool, size: int, mtime: float):
+        entry = IndexedPath(rel, is_dir, size, mtime)
+        self._entries[rel] = entry
+        if is_dir or size > self.max_file_bytes:
+            return
+
+        try:
+            data = (self.root / rel).read_bytes()
+        except OSError:
+            return
+        if b"\0" in data[:8192]:
+            entry.binary = True
+            return
+
+        entry.doc_id = len(self._doc_paths)
+        self._doc_paths.append(rel)
+        for gram in trigrams(fold(data.decode("utf-8", errors="ignore"))):
+            postings = self._postings.get(gram)
+            if postings is None:
+                self._postings[gram] = array("i", (entry.doc_id,))
+            else:
+                postings.append(entry.doc_id)
+        self.stats["indexed"] += 1
+
+    def _remove(self, rel: str):
+        entry = self._entries.pop(rel, None)
+        if entry is not None and entry.doc_id >= 0:
+            self._doc_paths[entry.doc_id] = None
+            self._dead_docs += 1
+
+    def _maybe_compact(self):
+        """Drop postings of removed/changed files once they dominate."""
+        if self._dead_docs < 1000 or self._dead_docs * 2 < len(self._doc_paths):
+            return
+        remap: Dict[int, int] = {}
+        paths: List[Optional[str]] = []
+        for old_id, rel in enumerate(self._doc_paths):
+            if rel is not None:
+                remap[old_id] = len(paths)
+                paths.append(rel)
+                self._entries[rel].doc_id = remap[old_id]
+        postings = {}
+        for gram, ids in self._postings.items():
+            kept = array("i", (remap[i] for i in ids if i in remap))
+            if kept:
+                postings[gram] = kept
+        self._postings = postings
+        self._doc_paths = paths
+        self._dead_docs = 0
+
+    def _relative(self, path: Union[str, Path]) -> Optional[str]:
+        path = Path(path)
+        if not path.is_absolute():
+            path = self.root / path
+        try:
+            rel = path.resolve().relative_to(self.root).as_posix()
+        except ValueError:
+            return None
+        return rel if rel != "." else None
+
+    # ──────────────────────────────────────────────────────────────────
+    # Lookups
+    # ──────────────────────────────────────────────────────────────────
+
+    def glob(
+        self,
+        pattern: str = "*",
+        base: Optional[Union[str, Path]] = None,
+        include_dirs: bool = True,
+        include_hidden: bool = True,
+    ) -> List[IndexedPath]:
+        """
+        Entries under ``base`` matching ``pattern`` at any depth (like rglob).
+
+        Args:
+            pattern: pathlib-style glob
+            base: Directory to search (default: root)
+            include_dirs: Include directories
+            include_hidden: Include paths with a dot-prefixed part below base
+
+        Returns:
+            Matching entries sorted by path
+        """
+        self.refresh()
+        prefix = self._base_prefix(base)
+        if prefix is None:
+            return []
+        matcher = compile_glob(pattern)
+
+        with self._lock:
+            entries = list(self._entries.values())
+
+        matches = []
+        for entry in entries:
+            if not entry.path.startswith(prefix) or (entry.is_dir and not include_dirs):
+                continue
+            rel = entry.path[len(prefix):]
+            if not rel:
+                continue
+            if not include_hidden and any(part.startswith(".") for part in rel.split("/")):
+                continue
+            if matcher.match(rel):
+                matches.append(entry)
+        matches.sort(key=lambda e: e.path)
+        return matches
+
+    def candidates(
+        self,
+        literals: List[str],
+        pattern: str = "*",
+        base: Optional[Union[str, Path]] = None,
+        path_filter: Optional[Callable[[str], bool]] = None,
+    ) -> Tuple[List[IndexedPath], int]:
+        """
+        Files that may contain every literal.
+
+        Args:
+            literals: Folded strings that must all appear (see required_literals)
+            pattern: Glob restricting which files are considered
+            base: Directory to search (default: root)
+            path_filter: Extra predicate on the relative path
+
+        Returns:
+            (candidate files sorted by path, number of files considered)
+        """
+        files = [
+            e for e in self.glob(pattern, base, include_dirs=False)
+            if not e.binary and (path_filter is None or path_filter(e.path))
+        ]
+        grams = {g for literal in literals for g in trigrams(literal)}
+        if not grams:
+            return files, len(files)
+
+        with self._lock:
+            postings = [self._postings.get(g) for g in grams]
+            if any(p is None for p in postings):
+                allowed: Set[int] = set()
+            else:
+                postings.sort(key=len)
+                allowed = set(postings[0])
+                for ids in postings[1:MAX_QUERY_TRIGRAMS]:
+                    allowed.intersection_update(ids)
+                    if not allowed:
+                        break
+
+        # Unindexed (oversized) files can't be ruled out
+        selected = [e for e in files if e.doc_id in allowed or e.doc_id < 0]
+        self.stats["candidates"] += len(selected)
+        return selected, len(files)
+
+    def _base_prefix(self, base: Optional[Union[str, Path]]) -> Optional[str]:
+        if base is None:
+            return ""
+        rel = self._relative(base)
+        if rel is None:
+            return "" if Path(base).resolve() == self.root else None
+        return rel + "/"
+
+    # ──────────────────────────────────────────────────────────────────
+    # Search
+    # ──────────────────────────────────────────────────────────────────
+
+    def grep(
+        self,
+        regex: "re.Pattern",
+        base: Optional[Union[str, Path]] = None,
+        file_pattern: str = "*",
+        path_filter: Optional[Callable[[str], bool]] = None,
+        context_lines: int = 0,
+        max_results: int = 100,
+    ) -> Tuple[List[Dict[str, Any]], int]:
+        """
+        Lines matching ``regex`` in indexed files.
+
+        Args:
+            regex: Compiled pattern, searched line by line
+            base: Directory to search (default: root)
+            file_pattern: Glob restricting which files are searched
+            path_filter: Extra predicate on the relative path
+            context_lines: Lines of context to include around each match
+            max_results: Stop after this many matches
+
+        Returns:
+            (matches with path/line/content/lines, files read)
+        """
+        self.stats["searches"] += 1
+        files, _ = self.candidates(required_literals(regex), file_pattern, base, path_filter)
+
+        results: List[Dict[str, Any]] = []
+        files_read = 0
+        for entry in files:
+            try:
+                content = (self.root / entry.path).read_text(encoding="utf-8", errors="ignore")
+            except OSError:
+                continue
+            files_read += 1
+            lines = content.splitlines()
+            for i, line in enumerate(lines):
+                if regex.search(line):
+                    match = {"path": entry.path, "line": i + 1, "content": line}
+                    if context_lines > 0:
+                        match["context"] = lines[max(0, i - context_lines):i + context_lines + 1]
+                    results.append(match)
+                    if len(results) >= max_results:
+                        break
+            if len(results) >= max_results:
+                break
+
+        self.stats["verified_files"] += files_read
+        return results, files_read
+
+    # ──────────────────────────────────────────────────────────────────
+    # Async Helpers
+    # ──────────────────────────────────────────────────────────────────
+
+    async def run(self, func: Callable, *args, **kwargs):
+        """Run a blocking index call in the shared worker pool."""
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(_get_executor(), partial(func, *args, **kwargs))
+
+    async def glob_async(self, *args, **kwargs) -> List[IndexedPath]:
+        return await self.run(self.glob, *args, **kwargs)
+
+    async def grep_async(self, *args, **kwargs) -> Tuple[List[Dict[str, Any]], int]:
+        return await self.run(self.grep, *args, **kwargs)
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Index size and search counters."""
+        with self._lock:
+            return {
+                **self.stats,
+                "files": len(self),
+                "indexed_files": len(self._doc_paths) - self._dead_docs,
+                "trigrams": len(self._postings),
+            }
+
+
+# ══════════════════════════════════════════════════════════════════════
+# Shared Instances
+# ══════════════════════════════════════════════════════════════════════
+
+
+_indexes: Dict[Path, WorkspaceIndex] = {}
+_indexes_lock = threading.Lock()
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        with _indexes_lock:
+            if _executor is None:
+                _executor = ThreadPoolExecutor(max_workers=4, thread_name_prefix="workspace-index")
+    return _executor
+
+
+def get_workspace_index(root: Union[str, Path]) -> WorkspaceIndex:
+    """
+    Get the shared index for a directory.
+
+    Args:
+        root: Workspace directory
+
+    Returns:
+        WorkspaceIndex (one per resolved root)
+    """
+    key = Path(root).resolve()
+    with _indexes_lock:
+        index = _indexes.get(key)
+        if index is None:
+            index = _indexes[key] = WorkspaceIndex(key)
+        return index
+
+
+def index_for(path: Union[str, Path], preferred_root: Optional[Union[str, Path]] = None) -> WorkspaceIndex:
+    """
+    Index that covers ``path``: ``preferred_root``'s when path is inside
+    it, otherwise one rooted at path itself.
+    """
+    path = Path(path).resolve()
+    if preferred_root is not None:
+        root = Path(preferred_root).resolve()
+        if path == root or root in path.parents:
+            return get_workspace_index(root)
+    return get_workspace_index(path)
+
+
+def notify_changed(*paths: Union[str, Path]):
+    """Tell every shared index that covers these paths that they changed."""
+    with _indexes_lock:
+        indexes = list(_indexes.values())
+    for index in indexes:
+        index.notify_changed(*paths)
+
+
+__all__ = [
+    "WorkspaceIndex",
+    "IndexedPath",
+    "compile_glob",
+    "required_literals",
+    "get_workspace_index",
+    "index_for",
+    "notify_changed",
+]
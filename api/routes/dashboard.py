@@ -2,16 +2,28 @@
 Dashboard API Routes
 
 Provides system overview, domain status, and specialist details.
+
+All endpoints are served from one cached DashboardSnapshot that is rebuilt
+after a short TTL or when pools / evolution state change, and support
+conditional GET via ETag / If-None-Match.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import threading
+import time
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, Hashable, List, Optional, Tuple
 from uuid import UUID
 
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, HTTPException, Query, Request, Response
+from fastapi.encoders import jsonable_encoder
+from fastapi.responses import JSONResponse
 from pydantic import BaseModel, Field
 
 
@@ -163,29 +175,15 @@ router = APIRouter(prefix="/api/dashboard", tags=["dashboard"])
 
 
 @router.get("/overview", response_model=DashboardOverview)
-async def get_overview():
+async def get_overview(request: Request):
     """
     Get complete dashboard overview.
 
     Returns status of all domains, budget, and evaluation configuration.
     """
     try:
-        domains = await _get_all_domain_statuses()
-        budget = await _get_budget_status()
-        evaluation = await _get_evaluation_status()
-
-        total_specialists = sum(d.specialists for d in domains)
-        total_tasks = sum(d.tasks_today for d in domains)
-
-        return DashboardOverview(
-            domains=domains,
-            budget=budget,
-            evaluation=evaluation,
-            total_tasks_today=total_tasks,
-            total_specialists=total_specialists,
-            system_health="healthy",
-            last_updated=datetime.utcnow(),
-        )
+        snapshot = get_snapshot_service().get()
+        return _snapshot_response(request, snapshot, "overview", snapshot.overview)
 
     except Exception as e:
         logger.error(f"Failed to get dashboard overview: {e}")
@@ -193,17 +191,18 @@ async def get_overview():
 
 
 @router.get("/domains", response_model=List[DomainStatus])
-async def list_domains():
+async def list_domains(request: Request):
     """Get status of all domains."""
     try:
-        return await _get_all_domain_statuses()
+        snapshot = get_snapshot_service().get()
+        return _snapshot_response(request, snapshot, "domains", lambda: snapshot.domains)
     except Exception as e:
         logger.error(f"Failed to list domains: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/domains/{domain}", response_model=DomainDetail)
-async def get_domain_detail(domain: str):
+async def get_domain_detail(request: Request, domain: str):
     """
     Get detailed information about a domain.
 
@@ -211,10 +210,11 @@ async def get_domain_detail(domain: str):
         domain: Domain name (e.g., code_generation, business_documents)
     """
     try:
-        detail = await _get_domain_detail(domain)
+        snapshot = get_snapshot_service().get()
+        detail = snapshot.domain_details.get(domain)
         if not detail:
             raise HTTPException(status_code=404, detail=f"Domain '{domain}' not found")
-        return detail
+        return _snapshot_response(request, snapshot, ("domain", domain), lambda: detail)
 
     except HTTPException:
         raise
@@ -225,20 +225,27 @@ async def get_domain_detail(domain: str):
 
 @router.get("/specialists", response_model=List[SpecialistSummary])
 async def list_specialists(
+    request: Request,
     domain: Optional[str] = Query(None, description="Filter by domain"),
     active_only: bool = Query(True, description="Only show active specialists"),
     limit: int = Query(50, ge=1, le=200, description="Maximum results"),
 ):
     """List specialists with optional filtering."""
     try:
-        return await _get_specialists_list(domain, active_only, limit)
+        snapshot = get_snapshot_service().get()
+        return _snapshot_response(
+            request,
+            snapshot,
+            ("specialists", domain, active_only, limit),
+            lambda: snapshot.list_specialists(domain, active_only, limit),
+        )
     except Exception as e:
         logger.error(f"Failed to list specialists: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/specialists/{specialist_id}", response_model=SpecialistDetail)
-async def get_specialist_detail(specialist_id: UUID):
+async def get_specialist_detail(request: Request, specialist_id: UUID):
     """
     Get detailed information about a specialist.
 
@@ -246,13 +253,14 @@ async def get_specialist_detail(specialist_id: UUID):
         specialist_id: UUID of the specialist
     """
     try:
-        detail = await _get_specialist_detail(specialist_id)
+        snapshot = get_snapshot_service().get()
+        detail = snapshot.specialist_details.get(specialist_id)
         if not detail:
             raise HTTPException(
                 status_code=404,
                 detail=f"Specialist '{specialist_id}' not found",
             )
-        return detail
+        return _snapshot_response(request, snapshot, ("specialist", specialist_id), lambda: detail)
 
     except HTTPException:
         raise
@@ -262,107 +270,444 @@ async def get_specialist_detail(specialist_id: UUID):
 
 
 @router.get("/budget", response_model=BudgetStatus)
-async def get_budget():
+async def get_budget(request: Request):
     """Get current budget status."""
     try:
-        return await _get_budget_status()
+        snapshot = get_snapshot_service().get()
+        return _snapshot_response(request, snapshot, "budget", lambda: snapshot.budget)
     except Exception as e:
         logger.error(f"Failed to get budget status: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
 @router.get("/stats")
-async def get_stats():
+async def get_stats(request: Request):
     """Get system-wide statistics."""
     try:
-        return await _get_system_stats()
+        snapshot = get_snapshot_service().get()
+        return _snapshot_response(request, snapshot, "stats", lambda: snapshot.stats)
     except Exception as e:
         logger.error(f"Failed to get system stats: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _snapshot_response(
+    request: Request,
+    snapshot: "DashboardSnapshot",
+    key: Hashable,
+    build: Callable[[], Any],
+) -> Response:
+    """
+    Serve a view of the snapshot, honouring If-None-Match.
+
+    The body and its ETag are rendered once per snapshot, so repeated
+    polls cost a dictionary lookup and unchanged data is answered with
+    an empty 304.
+    """
+    body, etag = snapshot.render(key, build)
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+
+    if _etag_matches(request.headers.get("if-none-match"), etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=body, media_type="application/json", headers=headers)
+
+
+def _etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Check an If-None-Match header against an ETag (weak comparison)."""
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    candidates = (tag.strip().removeprefix("W/") for tag in if_none_match.split(","))
+    return etag in candidates
+
+
 # ============================================================================
-# Helper Functions
+# Snapshot
 # ============================================================================
 
 
-async def _get_all_domain_statuses() -> List[DomainStatus]:
-    """Get status of all domains from real data."""
-    domains = []
+DEFAULT_SNAPSHOT_TTL_SECONDS = float(os.getenv("DASHBOARD_SNAPSHOT_TTL_SECONDS", "2"))
 
-    try:
-        from core.specialists import get_pool_manager
-        pool_manager = get_pool_manager()
-    except ImportError:
-        pool_manager = None
 
-    try:
-        from core.evolution import get_evolution_controller
-        evolution_controller = get_evolution_controller()
-    except ImportError:
-        evolution_controller = None
+@dataclass
+class DashboardSnapshot:
+    """
+    One consolidated view of everything the dashboard endpoints serve.
+
+    Built in a single pass over the pools and evolution state, then treated
+    as read-only: endpoints render (and memoize) their slice of it.
+    """
+
+    generation: int
+    expires_at: float
+    fingerprint: str
+    last_updated: datetime
+    domains: List[DomainStatus]
+    domain_details: Dict[str, DomainDetail]
+    specialists: List[Tuple[str, SpecialistSummary]]
+    specialist_details: Dict[UUID, SpecialistDetail]
+    budget: BudgetStatus
+    evaluation: EvaluationStatus
+    stats: Dict[str, Any]
+    _rendered: Dict[Hashable, Tuple[bytes, str]] = field(default_factory=dict, repr=False)
+
+    def overview(self) -> DashboardOverview:
+        """Build the overview response from the snapshot."""
+        return DashboardOverview(
+            domains=self.domains,
+            budget=self.budget,
+            evaluation=self.evaluation,
+            total_tasks_today=sum(d.tasks_today for d in self.domains),
+            total_specialists=sum(d.specialists for d in self.domains),
+            system_health="healthy",
+            last_updated=self.last_updated,
+        )
+
+    def list_specialists(
+        self,
+        domain: Optional[str],
+        active_only: bool,
+        limit: int,
+    ) -> List[SpecialistSummary]:
+        """Specialists in pool order, optionally filtered."""
+        return [
+            summary for spec_domain, summary in self.specialists
+            if (domain is None or spec_domain == domain)
+            and (summary.is_active or not active_only)
+        ][:limit]
+
+    def render(self, key: Hashable, build: Callable[[], Any]) -> Tuple[bytes, str]:
+        """
+        JSON body and ETag for one view of the snapshot.
+
+        Args:
+            key: Identifies the view (endpoint plus any parameters)
+            build: Produces the response value on first use
+
+        Returns:
+            (body, etag) tuple
+        """
+        rendered = self._rendered.get(key)
+        if rendered is None:
+            body = JSONResponse(content=jsonable_encoder(build())).body
+            rendered = (body, f'"{hashlib.blake2b(body, digest_size=16).hexdigest()}"')
+            self._rendered[key] = rendered
+        return rendered
+
+
+class DashboardSnapshotService:
+    """
+    Builds and caches the dashboard snapshot.
+
+    A snapshot is reused until its TTL expires or a pool/evolution change
+    invalidates it. Concurrent requests for a stale snapshot wait for one
+    rebuild instead of each recomputing it. Evaluation mode and budget
+    changes are picked up on the next TTL expiry.
+
+    Usage:
+        service = get_snapshot_service()
+        snapshot = service.get()
+        snapshot.domains
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_SNAPSHOT_TTL_SECONDS):
+        """
+        Initialize the service.
+
+        Args:
+            ttl_seconds: Maximum age of a snapshot
+        """
+        self.ttl_seconds = ttl_seconds
+        self._snapshot: Optional[DashboardSnapshot] = None
+        self._generation = 0
+        self._lock = threading.Lock()
+
+        # Sources whose change callbacks point at this service
+        self._subscribed: List[Any] = []
+
+        # Statistics
+        self._builds = 0
+        self._hits = 0
+        self._invalidations = 0
+
+    def get(self) -> DashboardSnapshot:
+        """Get the current snapshot, rebuilding it if stale."""
+        snapshot = self._snapshot
+        if snapshot is not None and self._is_fresh(snapshot):
+            self._hits += 1
+            return snapshot
+
+        with self._lock:
+            snapshot = self._snapshot
+            if snapshot is not None and self._is_fresh(snapshot):
+                self._hits += 1
+                return snapshot
+
+            snapshot = self._build(previous=snapshot)
+            self._snapshot = snapshot
+            self._builds += 1
+            return snapshot
+
+    def invalidate(self, domain: Optional[str] = None, event: Optional[str] = None) -> None:
+        """
+        Mark the current snapshot stale.
+
+        Matches the (domain, event) change callback signature of PoolManager
+        and EvolutionController so it can be registered directly.
+        """
+        self._generation += 1
+        self._invalidations += 1
+        logger.debug(f"Dashboard snapshot invalidated ({domain}: {event})")
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get cache statistics."""
+        return {
+            "builds": self._builds,
+            "hits": self._hits,
+            "invalidations": self._invalidations,
+            "ttl_seconds": self.ttl_seconds,
+        }
+
+    def _is_fresh(self, snapshot: DashboardSnapshot) -> bool:
+        return snapshot.generation == self._generation and time.monotonic() < snapshot.expires_at
+
+    def _subscribe(self, source: Any) -> None:
+        """Register for change callbacks from a pool manager or controller."""
+        if source is None or any(s is source for s in self._subscribed):
+            return
+        if hasattr(source, "add_change_callback"):
+            source.add_change_callback(self.invalidate)
+            self._subscribed.append(source)
+
+    def _build(self, previous: Optional[DashboardSnapshot]) -> DashboardSnapshot:
+        """Compute a new snapshot from the pools, controllers and budget."""
+        # Read the generation first: a change during the build leaves the
+        # result stale, so the next request rebuilds again
+        generation = self._generation
+
+        try:
+            from core.specialists import get_pool_manager
+            pool_manager = get_pool_manager()
+        except ImportError:
+            pool_manager = None
+
+        try:
+            from core.evolution import get_evolution_controller
+            evolution_controller = get_evolution_controller()
+        except ImportError:
+            evolution_controller = None
+
+        self._subscribe(pool_manager)
+        self._subscribe(evolution_controller)
+
+        domains, details, specialists, specialist_details = _build_domain_views(
+            pool_manager, evolution_controller
+        )
+        budget = _build_budget_status()
+        evaluation = _build_evaluation_status()
+        stats = _build_system_stats(specialists, evolution_controller)
+
+        # Keep the previous timestamp when nothing changed, so unchanged
+        # data keeps the same overview ETag across rebuilds
+        fingerprint = hashlib.blake2b(
+            json.dumps(
+                jsonable_encoder([domains, details, specialist_details, budget, evaluation, stats]),
+                sort_keys=True,
+            ).encode(),
+            digest_size=16,
+        ).hexdigest()
+        if previous is not None and previous.fingerprint == fingerprint:
+            last_updated = previous.last_updated
+        else:
+            last_updated = datetime.utcnow()
+
+        return DashboardSnapshot(
+            generation=generation,
+            expires_at=time.monotonic() + self.ttl_seconds,
+            fingerprint=fingerprint,
+            last_updated=last_updated,
+            domains=domains,
+            domain_details=details,
+            specialists=specialists,
+            specialist_details=specialist_details,
+            budget=budget,
+            evaluation=evaluation,
+            stats=stats,
+        )
+
+
+_snapshot_service: Optional[DashboardSnapshotService] = None
+
+
+def get_snapshot_service() -> DashboardSnapshotService:
+    """Get the global dashboard snapshot service."""
+    global _snapshot_service
+    if _snapshot_service is None:
+        _snapshot_service = DashboardSnapshotService()
+    return _snapshot_service
+
+
+def reset_snapshot_service() -> None:
+    """Reset the global snapshot service (for testing)."""
+    global _snapshot_service
+    _snapshot_service = None
+
+
+# ============================================================================
+# Snapshot Builders
+# ============================================================================
+
+
+def _build_domain_views(
+    pool_manager: Any,
+    evolution_controller: Any,
+) -> Tuple[
+    List[DomainStatus],
+    Dict[str, DomainDetail],
+    List[Tuple[str, SpecialistSummary]],
+    Dict[UUID, SpecialistDetail],
+]:
+    """
+    Build every domain and specialist view in one pass over the pools.
 
-    # If no pool manager, return empty list (no fake data)
+    Scores, evolution state and convergence progress are computed once per
+    domain and shared by the status, detail and specialist views.
+    """
+    domains: List[DomainStatus] = []
+    details: Dict[str, DomainDetail] = {}
+    specialists: List[Tuple[str, SpecialistSummary]] = []
+    specialist_details: Dict[UUID, SpecialistDetail] = {}
+
+    # If no pool manager, return empty views (no fake data)
     if not pool_manager:
-        return domains
+        return domains, details, specialists, specialist_details
 
-    # Get all domains from pool manager
     try:
-        domain_names = pool_manager.get_domains()
-    except Exception:
-        return domains
+        domain_names = pool_manager.list_domains()
+    except Exception as e:
+        logger.warning(f"Failed to list domains: {e}")
+        return domains, details, specialists, specialist_details
 
-    for domain_name in domain_names:
-        specialists = 0
-        best_score = 0.0
-        avg_score = 0.0
-        tasks_today = 0
-        current_jarvis = None
-        evolution_paused = False
-        convergence_progress = 0.0
+    try:
+        from core.specialists import get_domain_loader
+        loader = get_domain_loader()
+    except ImportError:
+        loader = None
 
+    for domain_name in domain_names:
         try:
             pool = pool_manager.get_pool(domain_name)
-            if pool:
-                specialists = len(pool.specialists)
-                if pool.specialists:
-                    scores = [s.score for s in pool.specialists if hasattr(s, 'score')]
-                    if scores:
-                        best_score = max(scores)
-                        avg_score = sum(scores) / len(scores)
-
-                # For administration, get current JARVIS
-                if domain_name == "administration" and pool.specialists:
-                    best = max(pool.specialists, key=lambda s: getattr(s, 'score', 0))
-                    current_jarvis = best.name if hasattr(best, 'name') else None
-        except Exception:
-            pass
-
-        # Check evolution status from controller if available
+        except Exception as e:
+            logger.warning(f"Failed to get pool for {domain_name}: {e}")
+            continue
+
+        summaries = []
+        for spec in pool.specialists:
+            summary = SpecialistSummary(
+                id=spec.id,
+                name=spec.name,
+                generation=spec.generation,
+                score=spec.performance.avg_score,
+                task_count=spec.performance.task_count,
+                is_active=spec.is_eligible_for_tasks(),
+            )
+            summaries.append(summary)
+            specialists.append((domain_name, summary))
+            specialist_details[spec.id] = _build_specialist_detail(spec)
+
+        scores = [s.score for s in summaries]
+        best_score = max(scores) if scores else 0.0
+        avg_score = sum(scores) / len(scores) if scores else 0.0
+
+        # For administration, the best specialist is the current JARVIS
+        current_jarvis = None
+        if pool.is_jarvis_domain() and summaries:
+            current_jarvis = max(summaries, key=lambda s: s.score).name
+
+        # Evolution status (also computes convergence progress)
+        status = None
         if evolution_controller:
             try:
-                status = evolution_controller.get_domain_status(domain_name)
-                if status:
-                    evolution_paused = status.get("paused", False)
-                    convergence_progress = status.get("convergence_progress", 0.0)
-            except Exception:
-                pass
+                status = evolution_controller.get_status(domain_name)
+            except Exception as e:
+                logger.warning(f"Failed to get evolution status for {domain_name}: {e}")
+
+        evolution_paused = pool.evolution_paused
+        convergence_progress = 0.0
+        if status is not None:
+            evolution_paused = evolution_paused or status.state.value == "paused"
+            convergence_progress = round(status.convergence_progress * 100, 1)
 
         domains.append(DomainStatus(
             name=domain_name,
-            specialists=specialists,
+            specialists=len(summaries),
             best_score=best_score,
             avg_score=avg_score,
             evolution_paused=evolution_paused,
             convergence_progress=convergence_progress,
-            tasks_today=tasks_today,
+            tasks_today=0,
             current_jarvis=current_jarvis,
         ))
 
-    return domains
+        domain_config = None
+        if loader:
+            try:
+                domain_config = loader.load(domain_name)
+            except (FileNotFoundError, ValueError):
+                pass
+
+        details[domain_name] = DomainDetail(
+            name=domain_name,
+            description=domain_config.description if domain_config else "",
+            specialists=summaries,
+            pool_size=len(summaries),
+            min_pool_size=getattr(domain_config, "min_pool_size", 3),
+            max_pool_size=pool.max_size,
+            evolution_paused=evolution_paused,
+            pause_reason=(status.pause_reason if status else None) or pool.pause_reason,
+            generations_completed=status.total_evolutions if status else 0,
+            convergence_status={
+                "state": status.state.value,
+                "progress": convergence_progress,
+            } if status else {},
+            tasks_today=0,
+            tasks_total=sum(s.task_count for s in summaries),
+            avg_score=avg_score,
+            best_score=best_score,
+            score_trend="stable",
+            recent_tasks=[],
+            last_evolution_at=status.last_evolution if status else None,
+        )
+
+    return domains, details, specialists, specialist_details
+
+
+def _build_specialist_detail(spec: Any) -> SpecialistDetail:
+    """Build detailed information about a specialist."""
+    perf = spec.performance
+    return SpecialistDetail(
+        id=spec.id,
+        name=spec.name,
+        domain=spec.domain,
+        generation=spec.generation,
+        created_at=spec.created_at,
+        is_active=spec.is_eligible_for_tasks(),
+        total_tasks=perf.task_count,
+        successful_tasks=perf.success_count,
+        success_rate=perf.success_rate,
+        avg_score=perf.avg_score,
+        recent_scores=list(perf.recent_scores),
+        system_prompt_preview=spec.config.system_prompt[:500],
+        model_preference=spec.config.preferred_model_tier,
+        temperature=spec.config.temperature,
+        parent_id=spec.parent_id,
+        mutation_summary=None,
+        learnings_applied=len(spec.config.learned_techniques),
+    )
 
 
-async def _get_budget_status() -> BudgetStatus:
+def _build_budget_status() -> BudgetStatus:
     """Get current budget status from real data."""
     # Default values (zeros) when no real data available
     default_budget = BudgetStatus(
@@ -405,7 +750,7 @@ async def _get_budget_status() -> BudgetStatus:
         return default_budget
 
 
-async def _get_evaluation_status() -> EvaluationStatus:
+def _build_evaluation_status() -> EvaluationStatus:
     """Get current evaluation configuration."""
     try:
         from core.evaluation import get_evaluation_controller
@@ -427,182 +772,26 @@ async def _get_evaluation_status() -> EvaluationStatus:
         )
 
 
-async def _get_domain_detail(domain: str) -> Optional[DomainDetail]:
-    """Get detailed information about a domain."""
-    try:
-        from core.specialists import get_pool_manager
-        from core.specialists.domain_config import get_domain_loader
-        pool_manager = get_pool_manager()
-        loader = get_domain_loader()
-        domain_config = loader.load(domain) if loader else None
-    except ImportError:
-        pool_manager = None
-        domain_config = None
-
-    if not domain_config:
-        return None
-
-    specialists = []
-    pool_size = 0
-    best_score = 0.0
-    avg_score = 0.0
-
-    if pool_manager:
-        pool = pool_manager.get_pool(domain)
-        if pool:
-            pool_size = len(pool.specialists)
-            for spec in pool.specialists:
-                specialists.append(SpecialistSummary(
-                    id=spec.id,
-                    name=spec.name,
-                    generation=getattr(spec, 'generation', 1),
-                    score=getattr(spec, 'score', 0.0),
-                    task_count=getattr(spec, 'task_count', 0),
-                    is_active=getattr(spec, 'is_active', True),
-                ))
-            if specialists:
-                scores = [s.score for s in specialists]
-                best_score = max(scores)
-                avg_score = sum(scores) / len(scores)
-
-    # Get evolution status
-    evolution_paused = False
-    pause_reason = None
-    generations = 0
-    convergence_status = {}
-
-    try:
-        from core.evolution import get_evolution_controller
-        controller = get_evolution_controller()
-        status = controller.get_domain_status(domain)
-        if status:
-            evolution_paused = status.get("paused", False)
-            pause_reason = status.get("pause_reason")
-            generations = status.get("generations", 0)
-            convergence_status = status.get("convergence", {})
-    except ImportError:
-        pass
-
-    return DomainDetail(
-        name=domain,
-        description=domain_config.description if domain_config else "",
-        specialists=specialists,
-        pool_size=pool_size,
-        min_pool_size=domain_config.min_pool_size if domain_config else 3,
-        max_pool_size=domain_config.max_pool_size if domain_config else 10,
-        evolution_paused=evolution_paused,
-        pause_reason=pause_reason,
-        generations_completed=generations,
-        convergence_status=convergence_status,
-        tasks_today=0,
-        tasks_total=0,
-        avg_score=avg_score,
-        best_score=best_score,
-        score_trend="stable",
-        recent_tasks=[],
-        last_evolution_at=None,
-    )
-
-
-async def _get_specialists_list(
-    domain: Optional[str],
-    active_only: bool,
-    limit: int,
-) -> List[SpecialistSummary]:
-    """Get list of specialists."""
-    specialists = []
-
-    try:
-        from core.specialists import get_pool_manager
-        pool_manager = get_pool_manager()
-
-        domains_to_check = [domain] if domain else pool_manager.get_domains()
-
-        for d in domains_to_check:
-            pool = pool_manager.get_pool(d)
-            if pool:
-                for spec in pool.specialists:
-                    is_active = getattr(spec, 'is_active', True)
-                    if active_only and not is_active:
-                        continue
-
-                    specialists.append(SpecialistSummary(
-                        id=spec.id,
-                        name=spec.name,
-                        generation=getattr(spec, 'generation', 1),
-                        score=getattr(spec, 'score', 0.0),
-                        task_count=getattr(spec, 'task_count', 0),
-                        is_active=is_active,
-                    ))
-
-                    if len(specialists) >= limit:
-                        break
-
-            if len(specialists) >= limit:
-                break
-
-    except ImportError:
-        # No pool manager available, return empty list (no fake data)
-        pass
-
-    return specialists[:limit]
-
-
-async def _get_specialist_detail(specialist_id: UUID) -> Optional[SpecialistDetail]:
-    """Get detailed information about a specialist."""
-    try:
-        from core.specialists import get_pool_manager
-        pool_manager = get_pool_manager()
-
-        spec = pool_manager.get_specialist(specialist_id)
-        if not spec:
-            return None
-
-        return SpecialistDetail(
-            id=spec.id,
-            name=spec.name,
-            domain=getattr(spec, 'domain', 'unknown'),
-            generation=getattr(spec, 'generation', 1),
-            created_at=getattr(spec, 'created_at', datetime.utcnow()),
-            is_active=getattr(spec, 'is_active', True),
-            total_tasks=getattr(spec, 'task_count', 0),
-            successful_tasks=getattr(spec, 'successful_tasks', 0),
-            success_rate=getattr(spec, 'success_rate', 0.0),
-            avg_score=getattr(spec, 'score', 0.0),
-            recent_scores=getattr(spec, 'recent_scores', []),
-            system_prompt_preview=getattr(spec, 'system_prompt', '')[:500],
-            model_preference=getattr(spec, 'model_preference', None),
-            temperature=getattr(spec, 'temperature', 0.7),
-            parent_id=getattr(spec, 'parent_id', None),
-            mutation_summary=getattr(spec, 'mutation_summary', None),
-            learnings_applied=getattr(spec, 'learnings_count', 0),
-        )
-
-    except ImportError:
-        return None
-
-
-async def _get_system_stats() -> Dict[str, Any]:
+def _build_system_stats(
+    specialists: List[Tuple[str, SpecialistSummary]],
+    evolution_controller: Any,
+) -> Dict[str, Any]:
     """Get system-wide statistics."""
     stats = {
         "uptime_seconds": 0,
         "total_requests": 0,
-        "total_specialists": 0,
+        "total_specialists": len(specialists),
         "total_evolutions": 0,
         "graveyard_size": 0,
     }
 
-    try:
-        from core.specialists import get_pool_manager
-        pool_manager = get_pool_manager()
-        stats["total_specialists"] = pool_manager.get_total_specialists()
-    except ImportError:
-        pass
+    if evolution_controller:
+        stats["total_evolutions"] = evolution_controller.get_stats().get("total_evolutions", 0)
 
     try:
         from core.evolution import get_graveyard
         graveyard = get_graveyard()
-        stats["graveyard_size"] = graveyard.get_count()
+        stats["graveyard_size"] = graveyard.get_stats().get("total_entries", 0)
     except ImportError:
         pass
 
@@ -610,7 +799,7 @@ async def _get_system_stats() -> Dict[str, Any]:
         from core.routing import get_task_router
         router = get_task_router()
         router_stats = router.get_stats()
-        stats["total_requests"] = router_stats.get("total_requests", 0)
+        stats["total_requests"] = router_stats.get("total_routes", 0)
     except ImportError:
         pass
 
@@ -13,6 +13,8 @@ from typing import Any, Dict, List, Literal, Optional
 from fastapi import APIRouter, HTTPException
 from pydantic import BaseModel, Field
 
+from .dashboard import get_snapshot_service
+
 
 # Configure logging
 logger = logging.getLogger(__name__)
@@ -140,6 +142,7 @@ async def set_mode(request: EvaluationModeRequest):
     """
     try:
         new_config = _set_evaluation_mode(request.mode)
+        get_snapshot_service().invalidate(event="evaluation_mode_changed")
 
         logger.info(f"Evaluation mode changed to: {request.mode}")
 
@@ -41,6 +41,7 @@ from .loader import (
     BenchmarkLoader,
     get_benchmark_loader,
     reset_benchmark_loader,
+    compile_rule_pattern,
 )
 
 from .verifier import (
@@ -49,6 +50,8 @@ from .verifier import (
     VerificationSummary,
     # Base
     BaseChecker,
+    ContextChecker,
+    VerificationContext,
     # Checkers
     SyntaxValidChecker,
     HasErrorHandlingChecker,
@@ -88,11 +91,14 @@ __all__ = [
     "BenchmarkLoader",
     "get_benchmark_loader",
     "reset_benchmark_loader",
+    "compile_rule_pattern",
     # Verifier results
     "VerificationResult",
     "VerificationSummary",
     # Verifier base
     "BaseChecker",
+    "ContextChecker",
+    "VerificationContext",
     # Checkers
     "SyntaxValidChecker",
     "HasErrorHandlingChecker",
@@ -420,6 +420,11 @@ class BenchmarkExecutor:
             task_result = await self._execute_task(task, benchmark.domain)
             results.append(task_result)
 
+            if task_result.status == "skipped":
+                run.status = "paused"
+                logger.warning(f"Budget limit reached for benchmark: {benchmark.name}")
+                break
+
             # Update totals
             if task_result.cost:
                 total_cost += task_result.cost
@@ -478,9 +483,14 @@ class BenchmarkExecutor:
         try:
             # Use router if available
             if self.router:
+                # The router reserves each call against the benchmark budget
                 routing, result = await self.router.route_and_execute(
                     request=task.prompt,
-                    context={"benchmark": True, "domain": domain},
+                    context={
+                        "benchmark": True,
+                        "domain": domain,
+                        "budget_category": self._config.budget_category,
+                    },
                 )
 
                 # Verify result
@@ -523,6 +533,14 @@ class BenchmarkExecutor:
                 error="Task timeout exceeded",
             )
         except Exception as e:
+            from core.models.budget import BudgetExceededError
+
+            if isinstance(e, BudgetExceededError):
+                return BenchmarkTaskResult(
+                    task_id=task.id,
+                    status="skipped",
+                    reason="Budget limit reached",
+                )
             logger.error(f"Task execution failed: {e}")
             return BenchmarkTaskResult(
                 task_id=task.id,
@@ -18,13 +18,24 @@ Usage:
 
     # Load all benchmarks for a domain
     benchmarks = loader.load_domain("code_generation")
+
+Parsed benchmarks are cached in memory (revalidated by file mtime/size)
+and on disk as JSON keyed by the YAML content hash, so repeated loads and
+fresh processes skip YAML parsing. Cold suites are parsed in parallel.
 """
 
 from __future__ import annotations
 
+import hashlib
+import json
 import logging
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from functools import lru_cache
 from pathlib import Path
-from typing import Any, Dict, List, Literal, Optional
+from typing import Any, Dict, List, Literal, Optional, Pattern, Tuple
 
 import yaml
 from pydantic import BaseModel, Field
@@ -33,6 +44,48 @@ from pydantic import BaseModel, Field
 # Configure logging
 logger = logging.getLogger(__name__)
 
+# Use the libyaml parser when available
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Bump when the serialized Benchmark layout changes
+CACHE_FORMAT_VERSION = 1
+
+# Rule types whose params carry a regex to pre-compile at load time
+REGEX_RULE_TYPES = {"regex_match"}
+
+
+@lru_cache(maxsize=1024)
+def _compile_cached(pattern: str, flags: int) -> Pattern:
+    return re.compile(pattern, flags)
+
+
+def compile_rule_pattern(params: Dict[str, Any]) -> Optional[Pattern]:
+    """
+    Get the compiled regex for a rule's params.
+
+    Compiled patterns are shared by pattern and flags, so each distinct
+    regex is compiled once per process.
+
+    Raises:
+        re.error: If the pattern is invalid
+    """
+    pattern = params.get("pattern", "")
+    if not pattern:
+        return None
+
+    flags = 0
+    if params.get("case_insensitive", False):
+        flags |= re.IGNORECASE
+    if params.get("multiline", False):
+        flags |= re.MULTILINE
+
+    return _compile_cached(pattern, flags)
+
+
+def _parse_yaml_bytes(data: bytes) -> Any:
+    """Parse YAML content (top-level so worker processes can run it)."""
+    return yaml.load(data, Loader=_YAML_LOADER)
+
 
 # ============================================================================
 # Verification Rule
@@ -54,6 +107,15 @@ class VerificationRule(BaseModel):
         description="Weight of this rule in scoring",
     )
 
+    def compile(self) -> None:
+        """Pre-compile regex params so verification runs don't pay for it."""
+        if self.type not in REGEX_RULE_TYPES:
+            return
+        try:
+            compile_rule_pattern(self.params)
+        except re.error as e:
+            logger.warning(f"Invalid regex in {self.type} rule: {e}")
+
 
 # ============================================================================
 # Benchmark Task
@@ -187,16 +249,41 @@ class BenchmarkLoader:
     """
 
     DEFAULT_BENCHMARK_DIR = "benchmarks"
+    CACHE_DIR_NAME = ".cache"
+
+    # Parse in worker processes only when enough files are cold
+    PARALLEL_THRESHOLD = 4
 
-    def __init__(self, benchmark_dir: Optional[str] = None):
+    def __init__(
+        self,
+        benchmark_dir: Optional[str] = None,
+        cache_dir: Optional[str] = None,
+        use_disk_cache: bool = True,
+        max_workers: Optional[int] = None,
+    ):
         """
         Initialize the loader.
 
         Args:
             benchmark_dir: Root directory for benchmarks
+            cache_dir: Directory for serialized benchmarks
+                (default: <benchmark_dir>/.cache)
+            use_disk_cache: Persist parsed benchmarks between processes
+            max_workers: Worker processes for parallel parsing (1 disables)
         """
         self._benchmark_dir = Path(benchmark_dir or self.DEFAULT_BENCHMARK_DIR)
+        self._cache_dir = (
+            Path(cache_dir) if cache_dir else self._benchmark_dir / self.CACHE_DIR_NAME
+        )
+        self._use_disk_cache = use_disk_cache
+        self._max_workers = max_workers or min(4, os.cpu_count() or 1)
         self._cache: Dict[str, Benchmark] = {}
+        self._stamps: Dict[str, Tuple[int, int]] = {}
+
+        # Statistics
+        self._memory_hits = 0
+        self._disk_hits = 0
+        self._parsed = 0
 
     # -------------------------------------------------------------------------
     # Properties
@@ -207,6 +294,11 @@ class BenchmarkLoader:
         """Get benchmark directory."""
         return self._benchmark_dir
 
+    @property
+    def cache_dir(self) -> Path:
+        """Get serialized benchmark cache directory."""
+        return self._cache_dir
+
     # -------------------------------------------------------------------------
     # Loading
     # -------------------------------------------------------------------------
@@ -225,24 +317,64 @@ class BenchmarkLoader:
             FileNotFoundError: If file doesn't exist
             ValueError: If file format is invalid
         """
-        # Check cache
-        if path in self._cache:
-            return self._cache[path]
+        cached = self._get_fresh(path)
+        if cached is not None:
+            return cached
 
-        file_path = Path(path)
-        if not file_path.exists():
-            raise FileNotFoundError(f"Benchmark file not found: {path}")
+        stamp, data, digest, benchmark = self._read(path)
+        if benchmark is None:
+            try:
+                raw = _parse_yaml_bytes(data)
+            except yaml.YAMLError as e:
+                raise ValueError(f"Invalid YAML in benchmark file: {e}")
+            benchmark = self._finish_parse(path, raw, digest)
 
-        try:
-            with open(file_path, "r") as f:
-                raw = yaml.safe_load(f)
+        self._store(path, stamp, benchmark)
+        return benchmark
+
+    def load_many(self, paths: List[str]) -> List[Benchmark]:
+        """
+        Load several benchmark files, parsing cold ones in parallel.
 
-            benchmark = self._parse_benchmark(raw, file_path)
-            self._cache[path] = benchmark
-            return benchmark
+        Files that fail to load are logged and skipped.
+
+        Args:
+            paths: Paths to benchmark YAML files
+
+        Returns:
+            Loaded Benchmarks, in input order
+        """
+        loaded: Dict[str, Benchmark] = {}
+        to_parse: List[Tuple[str, Tuple[int, int], bytes, str]] = []
+
+        for path in paths:
+            try:
+                cached = self._get_fresh(path)
+                if cached is not None:
+                    loaded[path] = cached
+                    continue
+
+                stamp, data, digest, benchmark = self._read(path)
+                if benchmark is not None:
+                    self._store(path, stamp, benchmark)
+                    loaded[path] = benchmark
+                else:
+                    to_parse.append((path, stamp, data, digest))
+            except Exception as e:
+                logger.error(f"Failed to load benchmark {path}: {e}")
+
+        for (path, stamp, _, digest), raw in zip(to_parse, self._parse_all(to_parse)):
+            if isinstance(raw, Exception):
+                logger.error(f"Failed to load benchmark {path}: {raw}")
+                continue
+            try:
+                benchmark = self._finish_parse(path, raw, digest)
+                self._store(path, stamp, benchmark)
+                loaded[path] = benchmark
+            except Exception as e:
+                logger.error(f"Failed to load benchmark {path}: {e}")
 
-        except yaml.YAMLError as e:
-            raise ValueError(f"Invalid YAML in benchmark file: {e}")
+        return [loaded[p] for p in paths if p in loaded]
 
     def load_domain(self, domain: str) -> List[Benchmark]:
         """
@@ -259,15 +391,7 @@ class BenchmarkLoader:
             logger.warning(f"No benchmark directory for domain: {domain}")
             return []
 
-        benchmarks = []
-        for yaml_file in domain_dir.glob("*.yaml"):
-            try:
-                benchmark = self.load(str(yaml_file))
-                benchmarks.append(benchmark)
-            except Exception as e:
-                logger.error(f"Failed to load benchmark {yaml_file}: {e}")
-
-        return benchmarks
+        return self.load_many([str(f) for f in domain_dir.glob("*.yaml")])
 
     def load_all(self) -> List[Benchmark]:
         """
@@ -276,19 +400,140 @@ class BenchmarkLoader:
         Returns:
             List of all Benchmarks
         """
-        benchmarks = []
-
         if not self._benchmark_dir.exists():
             logger.warning(f"Benchmark directory not found: {self._benchmark_dir}")
             return []
 
-        # Iterate through domain directories
+        # Collect files across domains so they share one parallel parse
+        paths: List[str] = []
         for domain_dir in self._benchmark_dir.iterdir():
             if domain_dir.is_dir() and not domain_dir.name.startswith("."):
-                domain_benchmarks = self.load_domain(domain_dir.name)
-                benchmarks.extend(domain_benchmarks)
+                paths.extend(str(f) for f in domain_dir.glob("*.yaml"))
 
-        return benchmarks
+        return self.load_many(paths)
+
+    def _get_fresh(self, path: str) -> Optional[Benchmark]:
+        """Return the in-memory benchmark if the file is unchanged."""
+        cached = self._cache.get(path)
+        if cached is None:
+            return None
+        try:
+            stat = os.stat(path)
+        except OSError:
+            return None
+        if self._stamps.get(path) != (stat.st_mtime_ns, stat.st_size):
+            return None
+        self._memory_hits += 1
+        return cached
+
+    def _read(
+        self, path: str
+    ) -> Tuple[Tuple[int, int], bytes, str, Optional[Benchmark]]:
+        """Read a file and look it up in the disk cache by content hash."""
+        file_path = Path(path)
+        if not file_path.exists():
+            raise FileNotFoundError(f"Benchmark file not found: {path}")
+
+        stat = file_path.stat()
+        data = file_path.read_bytes()
+        digest = hashlib.sha256(data).hexdigest()
+        return (stat.st_mtime_ns, stat.st_size), data, digest, self._read_disk_cache(path, digest)
+
+    def _parse_all(self, items: List[Tuple[str, Tuple[int, int], bytes, str]]) -> List[Any]:
+        """Parse YAML payloads, in worker processes when worthwhile."""
+        if len(items) >= self.PARALLEL_THRESHOLD and self._max_workers > 1:
+            try:
+                workers = min(self._max_workers, len(items))
+                with ProcessPoolExecutor(max_workers=workers) as pool:
+                    futures = [pool.submit(_parse_yaml_bytes, data) for _, _, data, _ in items]
+                    results: List[Any] = []
+                    for future in futures:
+                        try:
+                            results.append(future.result())
+                        except BrokenProcessPool:
+                            raise
+                        except Exception as e:
+                            results.append(ValueError(f"Invalid YAML in benchmark file: {e}"))
+                    return results
+            except (OSError, BrokenProcessPool) as e:
+                logger.warning(f"Parallel benchmark parsing unavailable, parsing serially: {e}")
+
+        results = []
+        for _, _, data, _ in items:
+            try:
+                results.append(_parse_yaml_bytes(data))
+            except yaml.YAMLError as e:
+                results.append(ValueError(f"Invalid YAML in benchmark file: {e}"))
+        return results
+
+    def _finish_parse(self, path: str, raw: Any, digest: str) -> Benchmark:
+        """Build a Benchmark from parsed YAML and persist it."""
+        if not isinstance(raw, dict):
+            raise ValueError(f"Benchmark file must contain a mapping: {path}")
+        benchmark = self._parse_benchmark(raw, Path(path))
+        self._parsed += 1
+        self._write_disk_cache(path, digest, benchmark)
+        return benchmark
+
+    def _store(self, path: str, stamp: Tuple[int, int], benchmark: Benchmark) -> None:
+        """Remember a benchmark and compile its verification rules."""
+        for task in benchmark.tasks:
+            for rule in task.verification:
+                rule.compile()
+        self._cache[path] = benchmark
+        self._stamps[path] = stamp
+
+    # -------------------------------------------------------------------------
+    # Disk Cache
+    # -------------------------------------------------------------------------
+
+    def _cache_file(self, path: str) -> Path:
+        """Cache file location for a benchmark path."""
+        key = hashlib.sha1(str(Path(path).resolve()).encode()).hexdigest()
+        return self._cache_dir / f"{key}.json"
+
+    def _read_disk_cache(self, path: str, digest: str) -> Optional[Benchmark]:
+        """Load a serialized benchmark if it matches the content hash."""
+        if not self._use_disk_cache:
+            return None
+
+        cache_file = self._cache_file(path)
+        if not cache_file.exists():
+            return None
+
+        try:
+            with open(cache_file, "r") as f:
+                entry = json.load(f)
+            if entry.get("format") != CACHE_FORMAT_VERSION or entry.get("sha256") != digest:
+                return None
+            benchmark = Benchmark.model_validate(entry["benchmark"])
+        except Exception as e:
+            logger.debug(f"Ignoring unreadable benchmark cache {cache_file}: {e}")
+            return None
+
+        self._disk_hits += 1
+        return benchmark
+
+    def _write_disk_cache(self, path: str, digest: str, benchmark: Benchmark) -> None:
+        """Persist a parsed benchmark (atomic replace, best effort)."""
+        if not self._use_disk_cache:
+            return
+
+        cache_file = self._cache_file(path)
+        entry = {
+            "format": CACHE_FORMAT_VERSION,
+            "source": str(path),
+            "sha256": digest,
+            "benchmark": benchmark.model_dump(mode="json"),
+        }
+        try:
+            self._cache_dir.mkdir(parents=True, exist_ok=True)
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            with open(tmp_file, "w") as f:
+                json.dump(entry, f)
+            os.replace(tmp_file, cache_file)
+        except OSError as e:
+            logger.debug(f"Could not write benchmark cache {cache_file}: {e}")
 
     # -------------------------------------------------------------------------
     # Discovery
@@ -332,8 +577,19 @@ class BenchmarkLoader:
             return None
 
         try:
-            with open(path, "r") as f:
-                raw = yaml.safe_load(f)
+            cached = self._get_fresh(str(path))
+            if cached is not None:
+                return {
+                    "name": cached.name,
+                    "domain": cached.domain,
+                    "version": cached.version,
+                    "description": cached.description,
+                    "task_count": cached.total_tasks,
+                    "path": str(path),
+                }
+
+            with open(path, "rb") as f:
+                raw = _parse_yaml_bytes(f.read())
 
             return {
                 "name": raw.get("name", name),
@@ -399,10 +655,24 @@ class BenchmarkLoader:
     # Cache Management
     # -------------------------------------------------------------------------
 
-    def clear_cache(self) -> int:
-        """Clear benchmark cache. Returns items cleared."""
+    def clear_cache(self, disk: bool = False) -> int:
+        """
+        Clear benchmark cache. Returns items cleared.
+
+        Args:
+            disk: Also delete serialized benchmarks from the cache directory
+        """
         count = len(self._cache)
         self._cache.clear()
+        self._stamps.clear()
+
+        if disk and self._cache_dir.exists():
+            for cache_file in self._cache_dir.glob("*.json"):
+                try:
+                    cache_file.unlink()
+                except OSError:
+                    pass
+
         return count
 
     def get_cache_size(self) -> int:
@@ -424,6 +694,10 @@ class BenchmarkLoader:
             "total_benchmarks": total_benchmarks,
             "benchmarks_per_domain": {k: len(v) for k, v in discovered.items()},
             "cache_size": len(self._cache),
+            "cache_dir": str(self._cache_dir) if self._use_disk_cache else None,
+            "memory_hits": self._memory_hits,
+            "disk_hits": self._disk_hits,
+            "parsed": self._parsed,
         }
 
 
@@ -14,19 +14,24 @@ Usage:
 
     # Run individual check
     check_result = await verifier.run_check(task_result, rule)
+
+Each response is wrapped in a VerificationContext that extracts code
+blocks, parses the AST and normalises text at most once, and all rules for
+a task are checked in turn against that shared context.
 """
 
 from __future__ import annotations
 
 import ast
+import json
 import logging
 import re
 from abc import ABC, abstractmethod
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Dict, List, Optional, Tuple, TYPE_CHECKING
 
 from pydantic import BaseModel, Field
 
-from .loader import VerificationRule
+from .loader import VerificationRule, compile_rule_pattern
 
 if TYPE_CHECKING:
     from core.routing import TaskResult
@@ -89,6 +94,113 @@ class VerificationSummary(BaseModel):
         }
 
 
+# ============================================================================
+# Verification Context
+# ============================================================================
+
+
+_GENERIC_BLOCK_RE = re.compile(r"```\s*(.*?)```", re.DOTALL)
+_JSON_BLOCK_RE = re.compile(r"```json\s*(.*?)```", re.DOTALL)
+_FUNC_DEF_RE = re.compile(r"\bdef\s+\w+\s*\(")
+_DOCSTRING_RE = re.compile(r'def\s+\w+\s*\([^)]*\)\s*(?:->.*?)?\s*:\s*\n\s*["\'][\'"]{2}')
+_TYPED_DEF_RE = re.compile(r"\bdef\s+\w+\s*\([^)]*\)\s*->")
+
+_ERROR_HANDLING_PATTERNS = {
+    "python": [
+        re.compile(r"\btry\s*:"),
+        re.compile(r"\bexcept\s+"),
+        re.compile(r"\braise\s+"),
+    ],
+    "javascript": [
+        re.compile(r"\btry\s*{"),
+        re.compile(r"\bcatch\s*\("),
+        re.compile(r"\bthrow\s+"),
+    ],
+    "default": [
+        re.compile(r"\btry\b"),
+        re.compile(r"\bcatch\b"),
+        re.compile(r"\bexcept\b"),
+    ],
+}
+_ERROR_HANDLING_PATTERNS["typescript"] = _ERROR_HANDLING_PATTERNS["javascript"]
+
+
+class VerificationContext:
+    """
+    Parsed artifacts for one response, shared by every checker.
+
+    Code extraction, AST parsing and text normalisation are computed on
+    first use and cached, so a response is parsed once no matter how many
+    rules inspect it.
+    """
+
+    def __init__(self, response: str):
+        self.response = response
+        self._lower: Optional[str] = None
+        self._blocks: Dict[str, List[str]] = {}
+        self._trees: Dict[str, Tuple[Optional[ast.AST], Optional[SyntaxError]]] = {}
+        self._functions: Dict[str, List[Tuple[str, Optional[List[ast.AST]]]]] = {}
+        self._json: Optional[Tuple[bool, Optional[str]]] = None
+
+    @property
+    def lower(self) -> str:
+        """Lower-cased response for case-insensitive checks."""
+        if self._lower is None:
+            self._lower = self.response.lower()
+        return self._lower
+
+    def code_blocks(self, language: str = "python") -> List[str]:
+        """Every code block for ``language`` (falls back to any block, then the text)."""
+        if language not in self._blocks:
+            pattern = re.compile(rf"```{re.escape(language)}\s*(.*?)```", re.DOTALL | re.IGNORECASE)
+            blocks = pattern.findall(self.response) or _GENERIC_BLOCK_RE.findall(self.response)
+            self._blocks[language] = [b.strip() for b in blocks] or [self.response.strip()]
+        return self._blocks[language]
+
+    def code(self, language: str = "python") -> str:
+        """First code block for ``language``."""
+        return self.code_blocks(language)[0]
+
+    def parse(self, code: str) -> Tuple[Optional[ast.AST], Optional[SyntaxError]]:
+        """Parsed AST of ``code``, or the SyntaxError raised."""
+        if code not in self._trees:
+            try:
+                self._trees[code] = (ast.parse(code), None)
+            except SyntaxError as e:
+                self._trees[code] = (None, e)
+        return self._trees[code]
+
+    def python_ast(self, language: str = "python") -> Tuple[Optional[ast.AST], Optional[SyntaxError]]:
+        """Parsed AST of the first code block, or the SyntaxError raised."""
+        return self.parse(self.code(language))
+
+    def python_functions(self, language: str = "python") -> List[Tuple[str, Optional[List[ast.AST]]]]:
+        """(block, function definitions) for every code block; None where a block doesn't parse."""
+        if language not in self._functions:
+            functions = []
+            for block in self.code_blocks(language):
+                tree, _ = self.parse(block)
+                nodes = None if tree is None else [
+                    node for node in ast.walk(tree)
+                    if isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef))
+                ]
+                functions.append((block, nodes))
+            self._functions[language] = functions
+        return self._functions[language]
+
+    def json_status(self) -> Tuple[bool, Optional[str]]:
+        """Whether the JSON block (or whole response) parses, plus the error."""
+        if self._json is None:
+            match = _JSON_BLOCK_RE.search(self.response)
+            json_str = match.group(1) if match else self.response
+            try:
+                json.loads(json_str.strip())
+                self._json = (True, None)
+            except json.JSONDecodeError as e:
+                self._json = (False, str(e))
+        return self._json
+
+
 # ============================================================================
 # Abstract Checker Base
 # ============================================================================
@@ -121,26 +233,60 @@ class BaseChecker(ABC):
         """
         pass
 
+    async def check_context(
+        self,
+        context: VerificationContext,
+        params: Dict[str, Any],
+    ) -> VerificationResult:
+        """
+        Run the check against a shared VerificationContext.
+
+        Checkers that can reuse parsed artifacts override this; the default
+        falls back to check() on the raw response.
+        """
+        return await self.check(context.response, params)
+
+
+class ContextChecker(BaseChecker):
+    """Checker implemented against a VerificationContext."""
+
+    async def check(
+        self,
+        response: str,
+        params: Dict[str, Any],
+    ) -> VerificationResult:
+        return await self.check_context(VerificationContext(response), params)
+
+    @abstractmethod
+    async def check_context(
+        self,
+        context: VerificationContext,
+        params: Dict[str, Any],
+    ) -> VerificationResult:
+        pass
+
 
 # ============================================================================
 # Code Verification Checkers
 # ============================================================================
 
 
-class SyntaxValidChecker(BaseChecker):
+class SyntaxValidChecker(ContextChecker):
     """Check that code parses without syntax errors."""
 
     @property
     def check_type(self) -> str:
         return "syntax_valid"
 
-    async def check(
+    async def check_context(
         self,
-        response: str,
+        context: VerificationContext,
         params: Dict[str, Any],
     ) -> VerificationResult:
+        language = params.get("language", "python")
+
         # Extract code blocks from response
-        code = self._extract_code(response, params.get("language", "python"))
+        code = context.code(language)
 
         if not code:
             return VerificationResult(
@@ -150,12 +296,10 @@ class SyntaxValidChecker(BaseChecker):
                 details="No code block found in response",
             )
 
-        language = params.get("language", "python")
-
         if language == "python":
-            return await self._check_python(code)
+            return self._check_python(context, language)
         elif language == "javascript":
-            return await self._check_javascript(code)
+            return self._check_javascript(code)
         else:
             return VerificationResult(
                 rule_type=self.check_type,
@@ -164,26 +308,25 @@ class SyntaxValidChecker(BaseChecker):
                 details=f"Syntax check not implemented for {language}",
             )
 
-    async def _check_python(self, code: str) -> VerificationResult:
+    def _check_python(self, context: VerificationContext, language: str) -> VerificationResult:
         """Check Python syntax."""
-        try:
-            ast.parse(code)
+        tree, error = context.python_ast(language)
+        if tree is not None:
             return VerificationResult(
                 rule_type=self.check_type,
                 passed=True,
                 score=1.0,
                 details="Python syntax is valid",
             )
-        except SyntaxError as e:
-            return VerificationResult(
-                rule_type=self.check_type,
-                passed=False,
-                score=0.0,
-                details=f"Syntax error at line {e.lineno}: {e.msg}",
-                error=str(e),
-            )
+        return VerificationResult(
+            rule_type=self.check_type,
+            passed=False,
+            score=0.0,
+            details=f"Syntax error at line {error.lineno}: {error.msg}",
+            error=str(error),
+        )
 
-    async def _check_javascript(self, code: str) -> VerificationResult:
+    def _check_javascript(self, code: str) -> VerificationResult:
         """Basic JavaScript syntax check (heuristic)."""
         # Basic bracket matching
         brackets = {"(": ")", "[": "]", "{": "}"}
@@ -218,52 +361,25 @@ class SyntaxValidChecker(BaseChecker):
 
     def _extract_code(self, response: str, language: str) -> str:
         """Extract code block from markdown response."""
-        # Try to find language-specific code block
-        pattern = rf"```{language}\s*(.*?)```"
-        match = re.search(pattern, response, re.DOTALL | re.IGNORECASE)
-        if match:
-            return match.group(1).strip()
+        return VerificationContext(response).code(language)
 
-        # Try generic code block
-        pattern = r"```\s*(.*?)```"
-        match = re.search(pattern, response, re.DOTALL)
-        if match:
-            return match.group(1).strip()
 
-        # Return full response if no code block
-        return response.strip()
-
-
-class HasErrorHandlingChecker(BaseChecker):
+class HasErrorHandlingChecker(ContextChecker):
     """Check that code includes error handling."""
 
     @property
     def check_type(self) -> str:
         return "has_error_handling"
 
-    async def check(
+    async def check_context(
         self,
-        response: str,
+        context: VerificationContext,
         params: Dict[str, Any],
     ) -> VerificationResult:
         language = params.get("language", "python")
+        patterns = _ERROR_HANDLING_PATTERNS.get(language, _ERROR_HANDLING_PATTERNS["default"])
 
-        if language == "python":
-            patterns = [
-                r"\btry\s*:",
-                r"\bexcept\s+",
-                r"\braise\s+",
-            ]
-        elif language in ("javascript", "typescript"):
-            patterns = [
-                r"\btry\s*{",
-                r"\bcatch\s*\(",
-                r"\bthrow\s+",
-            ]
-        else:
-            patterns = [r"\btry\b", r"\bcatch\b", r"\bexcept\b"]
-
-        matches = sum(1 for p in patterns if re.search(p, response))
+        matches = sum(1 for p in patterns if p.search(context.response))
 
         if matches >= 2:
             return VerificationResult(
@@ -288,28 +404,30 @@ class HasErrorHandlingChecker(BaseChecker):
             )
 
 
-class HasDocstringsChecker(BaseChecker):
+class HasDocstringsChecker(ContextChecker):
     """Check that functions have docstrings."""
 
     @property
     def check_type(self) -> str:
         return "has_docstrings"
 
-    async def check(
+    async def check_context(
         self,
-        response: str,
+        context: VerificationContext,
         params: Dict[str, Any],
     ) -> VerificationResult:
         language = params.get("language", "python")
 
         if language == "python":
-            # Count function definitions
-            func_pattern = r"\bdef\s+\w+\s*\("
-            functions = len(re.findall(func_pattern, response))
-
-            # Count docstrings (triple quotes after def)
-            docstring_pattern = r'def\s+\w+\s*\([^)]*\)\s*(?:->.*?)?\s*:\s*\n\s*["\'][\'"]{2}'
-            docstrings = len(re.findall(docstring_pattern, response))
+            functions = docstrings = 0
+            for block, nodes in context.python_functions(language):
+                if nodes is not None:
+                    functions += len(nodes)
+                    docstrings += sum(1 for n in nodes if ast.get_docstring(n) is not None)
+                else:
+                    # Block doesn't parse: fall back to pattern counting
+                    functions += len(_FUNC_DEF_RE.findall(block))
+                    docstrings += len(_DOCSTRING_RE.findall(block))
 
             if functions == 0:
                 return VerificationResult(
@@ -337,25 +455,27 @@ class HasDocstringsChecker(BaseChecker):
         )
 
 
-class HasTypeHintsChecker(BaseChecker):
+class HasTypeHintsChecker(ContextChecker):
     """Check that Python functions have type hints."""
 
     @property
     def check_type(self) -> str:
         return "has_type_hints"
 
-    async def check(
+    async def check_context(
         self,
-        response: str,
+        context: VerificationContext,
         params: Dict[str, Any],
     ) -> VerificationResult:
-        # Count function definitions
-        func_pattern = r"\bdef\s+\w+\s*\("
-        functions = len(re.findall(func_pattern, response))
-
-        # Count functions with return type hints
-        typed_pattern = r"\bdef\s+\w+\s*\([^)]*\)\s*->"
-        typed_functions = len(re.findall(typed_pattern, response))
+        functions = typed_functions = 0
+        for block, nodes in context.python_functions("python"):
+            if nodes is not None:
+                functions += len(nodes)
+                typed_functions += sum(1 for n in nodes if n.returns is not None)
+            else:
+                # Block doesn't parse: fall back to pattern counting
+                functions += len(_FUNC_DEF_RE.findall(block))
+                typed_functions += len(_TYPED_DEF_RE.findall(block))
 
         if functions == 0:
             return VerificationResult(
@@ -381,16 +501,16 @@ class HasTypeHintsChecker(BaseChecker):
 # ============================================================================
 
 
-class ContainsChecker(BaseChecker):
+class ContainsChecker(ContextChecker):
     """Check that response contains specific content."""
 
     @property
     def check_type(self) -> str:
         return "contains"
 
-    async def check(
+    async def check_context(
         self,
-        response: str,
+        context: VerificationContext,
         params: Dict[str, Any],
     ) -> VerificationResult:
         required = params.get("required", [])
@@ -398,7 +518,7 @@ class ContainsChecker(BaseChecker):
             required = [required]
 
         case_sensitive = params.get("case_sensitive", False)
-        check_text = response if case_sensitive else response.lower()
+        check_text = context.response if case_sensitive else context.lower
 
         found = []
         missing = []
@@ -430,16 +550,16 @@ class ContainsChecker(BaseChecker):
         )
 
 
-class NotContainsChecker(BaseChecker):
+class NotContainsChecker(ContextChecker):
     """Check that response doesn't contain prohibited content."""
 
     @property
     def check_type(self) -> str:
         return "not_contains"
 
-    async def check(
+    async def check_context(
         self,
-        response: str,
+        context: VerificationContext,
         params: Dict[str, Any],
     ) -> VerificationResult:
         prohibited = params.get("prohibited", [])
@@ -447,7 +567,7 @@ class NotContainsChecker(BaseChecker):
             prohibited = [prohibited]
 
         case_sensitive = params.get("case_sensitive", False)
-        check_text = response if case_sensitive else response.lower()
+        check_text = context.response if case_sensitive else context.lower
 
         found = []
         for item in prohibited:
@@ -535,13 +655,7 @@ class RegexMatchChecker(BaseChecker):
             )
 
         try:
-            flags = 0
-            if params.get("case_insensitive", False):
-                flags |= re.IGNORECASE
-            if params.get("multiline", False):
-                flags |= re.MULTILINE
-
-            match = re.search(pattern, response, flags)
+            match = compile_rule_pattern(params).search(response)
             passed = match is not None
 
             return VerificationResult(
@@ -565,24 +679,25 @@ class RegexMatchChecker(BaseChecker):
 # ============================================================================
 
 
-class FormatValidChecker(BaseChecker):
+class FormatValidChecker(ContextChecker):
     """Check that document format is correct."""
 
     @property
     def check_type(self) -> str:
         return "format_valid"
 
-    async def check(
+    async def check_context(
         self,
-        response: str,
+        context: VerificationContext,
         params: Dict[str, Any],
     ) -> VerificationResult:
+        response = context.response
         format_type = params.get("format", "markdown")
 
         if format_type == "markdown":
             return await self._check_markdown(response)
         elif format_type == "json":
-            return await self._check_json(response)
+            return await self._check_json(context)
         elif format_type == "email":
             return await self._check_email(response)
         else:
@@ -613,33 +728,23 @@ class FormatValidChecker(BaseChecker):
             details=f"Markdown format: headers={has_headers}, structure={has_structure}",
         )
 
-    async def _check_json(self, response: str) -> VerificationResult:
+    async def _check_json(self, context: VerificationContext) -> VerificationResult:
         """Check JSON validity."""
-        import json
-
-        # Extract JSON block
-        json_match = re.search(r"```json\s*(.*?)```", response, re.DOTALL)
-        if json_match:
-            json_str = json_match.group(1)
-        else:
-            json_str = response
-
-        try:
-            json.loads(json_str.strip())
+        valid, error = context.json_status()
+        if valid:
             return VerificationResult(
                 rule_type=self.check_type,
                 passed=True,
                 score=1.0,
                 details="Valid JSON",
             )
-        except json.JSONDecodeError as e:
-            return VerificationResult(
-                rule_type=self.check_type,
-                passed=False,
-                score=0.0,
-                details="Invalid JSON",
-                error=str(e),
-            )
+        return VerificationResult(
+            rule_type=self.check_type,
+            passed=False,
+            score=0.0,
+            details="Invalid JSON",
+            error=error,
+        )
 
     async def _check_email(self, response: str) -> VerificationResult:
         """Check email format."""
@@ -769,12 +874,13 @@ class Verifier:
                 results=[],
             )
 
-        results = []
-        total_weight = 0.0
+        # Parse once and share across all checks; they are CPU-bound, so
+        # run them in order rather than scheduling tasks
+        context = VerificationContext(response)
+        results = [await self.run_check(context, rule) for rule in rules]
 
+        total_weight = 0.0
         for rule in rules:
-            check_result = await self.run_check(response, rule)
-            results.append(check_result)
             total_weight += rule.weight
 
             # Update stats
@@ -802,19 +908,23 @@ class Verifier:
 
     async def run_check(
         self,
-        response: str,
+        response: Any,  # Response string or VerificationContext
         rule: VerificationRule,
     ) -> VerificationResult:
         """
         Run a single verification check.
 
         Args:
-            response: Response string to verify
+            response: Response string (or shared VerificationContext) to verify
             rule: Verification rule to apply
 
         Returns:
             VerificationResult
         """
+        context = (
+            response if isinstance(response, VerificationContext)
+            else VerificationContext(response)
+        )
         checker = self._checkers.get(rule.type)
 
         if not checker:
@@ -827,7 +937,7 @@ class Verifier:
             )
 
         try:
-            return await checker.check(response, rule.params)
+            return await checker.check_context(context, rule.params)
         except Exception as e:
             logger.error(f"Verification check failed: {e}")
             return VerificationResult(
@@ -24,7 +24,7 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, TYPE_CHECKING
+from typing import Any, Callable, Dict, List, Optional, TYPE_CHECKING
 from uuid import UUID
 
 from pydantic import BaseModel, Field
@@ -294,6 +294,9 @@ class EvolutionController:
         self._total_evolutions = 0
         self._initialized_at = datetime.utcnow()
 
+        # Change notification
+        self._change_callbacks: List[Callable[[str, str], None]] = []
+
     # -------------------------------------------------------------------------
     # Properties
     # -------------------------------------------------------------------------
@@ -466,6 +469,8 @@ class EvolutionController:
             self._total_evolutions += 1
             self._last_evolution[domain] = datetime.utcnow()
 
+            self._notify(domain, "evolved")
+
             logger.info(
                 f"Evolution complete for {domain}: "
                 f"culled={len(culled_names)}, spawned={len(spawned_names)}, "
@@ -544,6 +549,7 @@ class EvolutionController:
             self._resume_checker.record_pause(domain, best_score)
 
         logger.info(f"Paused evolution for {domain}: {reason}")
+        self._notify(domain, "paused")
 
     def resume_evolution(self, domain: str, trigger: str = "") -> None:
         """
@@ -570,12 +576,14 @@ class EvolutionController:
         self._convergence_detector.clear_history(domain)
 
         logger.info(f"Resumed evolution for {domain}: {trigger}")
+        self._notify(domain, "resumed")
 
     def disable_evolution(self, domain: str) -> None:
         """Disable evolution for a domain (manual override)."""
         status = self._get_or_create_status(domain, None)
         status.state = EvolutionState.DISABLED
         logger.info(f"Disabled evolution for {domain}")
+        self._notify(domain, "disabled")
 
     def enable_evolution(self, domain: str) -> None:
         """Enable evolution for a domain."""
@@ -583,6 +591,33 @@ class EvolutionController:
         if status.state == EvolutionState.DISABLED:
             status.state = EvolutionState.ACTIVE
         logger.info(f"Enabled evolution for {domain}")
+        self._notify(domain, "enabled")
+
+    # -------------------------------------------------------------------------
+    # Change Notification
+    # -------------------------------------------------------------------------
+
+    def add_change_callback(self, callback: Callable[[str, str], None]) -> None:
+        """
+        Register a callback for evolution state changes.
+
+        Args:
+            callback: Function called with (domain, event) after an
+                evolution cycle, pause, resume, disable or enable
+        """
+        self._change_callbacks.append(callback)
+
+    def remove_change_callback(self, callback: Callable[[str, str], None]) -> None:
+        """Unregister an evolution change callback."""
+        if callback in self._change_callbacks:
+            self._change_callbacks.remove(callback)
+
+    def _notify(self, domain: str, event: str) -> None:
+        for callback in list(self._change_callbacks):
+            try:
+                callback(domain, event)
+            except Exception as e:
+                logger.error(f"Evolution change callback error: {e}")
 
     # -------------------------------------------------------------------------
     # Status
@@ -144,8 +144,12 @@ from .budget import (
     BudgetStatus,
     SpendingRecord,
     BudgetLimits,
+    BudgetReservation,
+    # Errors
+    BudgetExceededError,
     # Main class
     BudgetController,
+    BudgetLedger,
     # Convenience functions
     get_budget_controller,
     reset_budget_controller,
@@ -220,7 +224,10 @@ __all__ = [
     "BudgetStatus",
     "SpendingRecord",
     "BudgetLimits",
+    "BudgetReservation",
+    "BudgetExceededError",
     "BudgetController",
+    "BudgetLedger",
     "get_budget_controller",
     "reset_budget_controller",
     "can_afford",
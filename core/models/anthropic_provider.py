@@ -25,7 +25,7 @@ import asyncio
 import logging
 import os
 import time
-from typing import Any, AsyncIterator, Dict, List, Optional
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional
 
 from .provider import (
     Completion,
@@ -226,6 +226,7 @@ class AnthropicProvider(ModelProvider):
         max_retries: int = 3,
         requests_per_minute: int = 60,
         tokens_per_minute: int = 100000,
+        http_client_factory: Optional[Callable[[], Any]] = None,
     ):
         """
         Initialize Anthropic provider.
@@ -236,6 +237,10 @@ class AnthropicProvider(ModelProvider):
             max_retries: Maximum retry attempts
             requests_per_minute: Rate limit for requests
             tokens_per_minute: Rate limit for tokens
+            http_client_factory: Returns the httpx.AsyncClient to send
+                requests through (e.g. a shared keep-alive pool). Called
+                from the running event loop; the SDK client is rebuilt if
+                it returns a different client.
         """
         super().__init__("anthropic")
 
@@ -244,12 +249,16 @@ class AnthropicProvider(ModelProvider):
         self._max_retries = max_retries
         self._rate_limiter = RateLimiter(requests_per_minute, tokens_per_minute)
 
+        self._http_client_factory = http_client_factory
+
         # Lazy-loaded client
         self._client: Optional[Any] = None
+        self._http_client: Optional[Any] = None
 
     def _get_client(self) -> Any:
         """Get or create Anthropic client."""
-        if self._client is None:
+        http_client = self._http_client_factory() if self._http_client_factory else None
+        if self._client is None or http_client is not self._http_client:
             try:
                 import anthropic
 
@@ -258,6 +267,9 @@ class AnthropicProvider(ModelProvider):
                     kwargs["api_key"] = self._api_key
                 if self._base_url:
                     kwargs["base_url"] = self._base_url
+                if http_client is not None:
+                    kwargs["http_client"] = http_client
+                self._http_client = http_client
 
                 self._client = anthropic.AsyncAnthropic(**kwargs)
             except ImportError:
@@ -19,17 +19,25 @@ Usage:
     # Get current status
     status = controller.get_status(BudgetCategory.PRODUCTION)
     print(f"Daily: ${status.daily_spent:.4f} / ${status.daily_limit:.2f}")
+
+    # Concurrent callers: hold the estimate, then settle with the actual cost
+    with controller.reservation(0.05, BudgetCategory.PRODUCTION) as held:
+        ...  # Make the API call
+        controller.commit(held, SpendingRecord.create(...))
 """
 
 from __future__ import annotations
 
 import logging
 import os
+import sqlite3
+import threading
+from contextlib import contextmanager
 from dataclasses import dataclass
 from datetime import datetime, timedelta
 from enum import Enum
 from pathlib import Path
-from typing import Any, Callable, Dict, List, Optional
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
 import uuid
 
 import yaml
@@ -46,6 +54,14 @@ DEFAULT_BUDGET_CONFIG_PATH = "config/models/budget.yaml"
 # Precision for cost calculations
 COST_PRECISION = 4
 
+# Seconds before an uncommitted reservation is released automatically
+DEFAULT_RESERVATION_TTL_SECONDS = 600
+
+
+class BudgetExceededError(Exception):
+    """Raised when a reservation cannot be made within budget limits."""
+    pass
+
 
 # ============================================================================
 # Enums
@@ -103,6 +119,7 @@ class BudgetStatus(BaseModel):
     is_warning: bool
     alert_level: AlertLevel
     next_reset: datetime
+    reserved: float = 0.0
 
     class Config:
         use_enum_values = True
@@ -158,6 +175,21 @@ class BudgetLimits:
     monthly_cad: float
 
 
+@dataclass
+class BudgetReservation:
+    """Estimated cost held for an in-flight call until committed or released."""
+    id: str
+    category: BudgetCategory
+    amount: float
+    created_at: datetime
+    expires_at: datetime
+    settled: bool = False
+
+    @property
+    def is_expired(self) -> bool:
+        return datetime.utcnow() >= self.expires_at
+
+
 # ============================================================================
 # In-Memory Budget State (for non-database use)
 # ============================================================================
@@ -200,6 +232,7 @@ class CategoryState:
     def __init__(self, category: BudgetCategory, limits: BudgetLimits):
         self.category = category
         self.limits = limits
+        self.reserved = 0.0
         now = datetime.utcnow()
 
         self.daily = PeriodState(
@@ -269,13 +302,22 @@ class CategoryState:
         self.monthly.spent = round(self.monthly.spent + amount, COST_PRECISION)
 
     def can_afford(self, amount: float) -> bool:
-        """Check if all periods can afford the amount."""
+        """Check if all periods can afford the amount on top of reservations."""
+        amount = round(amount + self.reserved, COST_PRECISION)
         return (
             self.daily.remaining >= amount and
             self.weekly.remaining >= amount and
             self.monthly.remaining >= amount
         )
 
+    def period_starts(self) -> Dict[BudgetPeriod, datetime]:
+        """Start of the current daily, weekly and monthly periods."""
+        return {
+            BudgetPeriod.DAILY: self.daily.reset_at - timedelta(days=1),
+            BudgetPeriod.WEEKLY: self.weekly.reset_at - timedelta(days=7),
+            BudgetPeriod.MONTHLY: (self.monthly.reset_at - timedelta(days=1)).replace(day=1),
+        }
+
     def get_alert_level(self, warn_percent: float, critical_percent: float) -> AlertLevel:
         """Get highest alert level across all periods."""
         max_percent = max(
@@ -293,6 +335,225 @@ class CategoryState:
         return AlertLevel.NORMAL
 
 
+# ============================================================================
+# Shared SQLite Ledger
+# ============================================================================
+
+
+class BudgetLedger:
+    """
+    Spend and reservation ledger in SQLite, shared between processes.
+
+    Reservations are checked against the period totals and inserted inside
+    one BEGIN IMMEDIATE transaction, so concurrent workers (threads or
+    processes) cannot jointly overshoot a limit. Each thread uses its own
+    WAL-mode connection.
+    """
+
+    def __init__(self, path: str, timeout: float = 30.0):
+        """
+        Initialize the ledger.
+
+        Args:
+            path: SQLite database file
+            timeout: Seconds to wait for another writer's lock
+        """
+        self.path = path
+        self._timeout = timeout
+        self._local = threading.local()
+        Path(path).parent.mkdir(parents=True, exist_ok=True)
+        self._init_schema()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Get this thread's connection."""
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=self._timeout, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            self._local.conn = conn
+        return conn
+
+    @contextmanager
+    def _transaction(self) -> Iterator[sqlite3.Connection]:
+        """Write transaction holding the database write lock."""
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            yield conn
+        except BaseException:
+            conn.execute("ROLLBACK")
+            raise
+        conn.execute("COMMIT")
+
+    def _init_schema(self) -> None:
+        conn = self._connect()
+        conn.executescript("""
+            CREATE TABLE IF NOT EXISTS budget_spend (
+                id INTEGER PRIMARY KEY AUTOINCREMENT,
+                category TEXT NOT NULL,
+                amount REAL NOT NULL,
+                spent_at TEXT NOT NULL,
+                reservation_id TEXT
+            );
+            CREATE INDEX IF NOT EXISTS idx_budget_spend_category_time
+                ON budget_spend(category, spent_at);
+            CREATE TABLE IF NOT EXISTS budget_reservations (
+                id TEXT PRIMARY KEY,
+                category TEXT NOT NULL,
+                amount REAL NOT NULL,
+                created_at TEXT NOT NULL,
+                expires_at TEXT NOT NULL
+            );
+            CREATE TABLE IF NOT EXISTS budget_resets (
+                category TEXT NOT NULL,
+                period TEXT NOT NULL,
+                reset_at TEXT NOT NULL,
+                PRIMARY KEY (category, period)
+            );
+        """)
+
+    @staticmethod
+    def _ts(dt: datetime) -> str:
+        return dt.isoformat(timespec="microseconds")
+
+    def _effective_starts(
+        self,
+        conn: sqlite3.Connection,
+        category: BudgetCategory,
+        starts: Dict[BudgetPeriod, datetime],
+    ) -> Dict[BudgetPeriod, str]:
+        """Period starts, moved forward by any forced resets."""
+        result = {period: self._ts(start) for period, start in starts.items()}
+        rows = conn.execute(
+            "SELECT period, reset_at FROM budget_resets WHERE category = ?",
+            (category.value,),
+        ).fetchall()
+        for period_value, reset_at in rows:
+            period = BudgetPeriod(period_value)
+            if period in result and reset_at > result[period]:
+                result[period] = reset_at
+        return result
+
+    def _totals(
+        self,
+        conn: sqlite3.Connection,
+        category: BudgetCategory,
+        starts: Dict[BudgetPeriod, datetime],
+    ) -> Tuple[float, float, float, float]:
+        """(daily, weekly, monthly, reserved) totals for a category."""
+        effective = self._effective_starts(conn, category, starts)
+        daily, weekly, monthly = (
+            effective[BudgetPeriod.DAILY],
+            effective[BudgetPeriod.WEEKLY],
+            effective[BudgetPeriod.MONTHLY],
+        )
+        row = conn.execute(
+            """
+            SELECT
+                COALESCE(SUM(CASE WHEN spent_at >= ? THEN amount END), 0),
+                COALESCE(SUM(CASE WHEN spent_at >= ? THEN amount END), 0),
+                COALESCE(SUM(CASE WHEN spent_at >= ? THEN amount END), 0)
+            FROM budget_spend
+            WHERE category = ? AND spent_at >= ?
+            """,
+            (daily, weekly, monthly, category.value, min(daily, weekly, monthly)),
+        ).fetchone()
+        reserved = conn.execute(
+            "SELECT COALESCE(SUM(amount), 0) FROM budget_reservations "
+            "WHERE category = ? AND expires_at > ?",
+            (category.value, self._ts(datetime.utcnow())),
+        ).fetchone()[0]
+        return (
+            round(row[0], COST_PRECISION),
+            round(row[1], COST_PRECISION),
+            round(row[2], COST_PRECISION),
+            round(reserved, COST_PRECISION),
+        )
+
+    def totals(
+        self,
+        category: BudgetCategory,
+        starts: Dict[BudgetPeriod, datetime],
+    ) -> Tuple[float, float, float, float]:
+        """
+        Get current totals for a category.
+
+        Returns:
+            (daily_spent, weekly_spent, monthly_spent, reserved)
+        """
+        return self._totals(self._connect(), category, starts)
+
+    def try_reserve(
+        self,
+        reservation: BudgetReservation,
+        limits: BudgetLimits,
+        starts: Dict[BudgetPeriod, datetime],
+    ) -> bool:
+        """
+        Atomically hold a reservation if every period can afford it.
+
+        Returns:
+            True if the reservation was recorded
+        """
+        with self._transaction() as conn:
+            conn.execute(
+                "DELETE FROM budget_reservations WHERE expires_at <= ?",
+                (self._ts(datetime.utcnow()),),
+            )
+            daily, weekly, monthly, reserved = self._totals(conn, reservation.category, starts)
+            needed = reservation.amount + reserved
+            if (
+                daily + needed > limits.daily_cad + 1e-9
+                or weekly + needed > limits.weekly_cad + 1e-9
+                or monthly + needed > limits.monthly_cad + 1e-9
+            ):
+                return False
+            conn.execute(
+                "INSERT INTO budget_reservations (id, category, amount, created_at, expires_at) "
+                "VALUES (?, ?, ?, ?, ?)",
+                (
+                    reservation.id,
+                    reservation.category.value,
+                    reservation.amount,
+                    self._ts(reservation.created_at),
+                    self._ts(reservation.expires_at),
+                ),
+            )
+            return True
+
+    def add_spend(
+        self,
+        category: BudgetCategory,
+        amount: float,
+        spent_at: datetime,
+        reservation_id: Optional[str] = None,
+    ) -> None:
+        """Record actual spend, settling its reservation in the same transaction."""
+        with self._transaction() as conn:
+            if reservation_id:
+                conn.execute("DELETE FROM budget_reservations WHERE id = ?", (reservation_id,))
+            conn.execute(
+                "INSERT INTO budget_spend (category, amount, spent_at, reservation_id) "
+                "VALUES (?, ?, ?, ?)",
+                (category.value, round(amount, COST_PRECISION), self._ts(spent_at), reservation_id),
+            )
+
+    def release(self, reservation_id: str) -> bool:
+        """Drop a reservation without spending. Returns True if it existed."""
+        with self._transaction() as conn:
+            cursor = conn.execute("DELETE FROM budget_reservations WHERE id = ?", (reservation_id,))
+            return cursor.rowcount > 0
+
+    def record_reset(self, category: BudgetCategory, period: BudgetPeriod, at: datetime) -> None:
+        """Start a period afresh from ``at`` (forced reset)."""
+        with self._transaction() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO budget_resets (category, period, reset_at) VALUES (?, ?, ?)",
+                (category.value, period.value, self._ts(at)),
+            )
+
+
 # ============================================================================
 # Budget Controller
 # ============================================================================
@@ -305,12 +566,19 @@ class BudgetController:
     Tracks spending across multiple categories (production, benchmark, development)
     with daily, weekly, and monthly limits. Supports automatic period resets
     and configurable overflow behavior.
+
+    Concurrent callers should reserve() the estimated cost before a call and
+    commit() the actual spend (or release()) afterwards; outstanding
+    reservations count against the limits so parallel calls cannot overshoot.
+    With a ledger_path, spend and reservations live in a shared SQLite ledger
+    so every worker process sees the same budget.
     """
 
     def __init__(
         self,
         config_path: Optional[str] = None,
         use_database: bool = False,
+        ledger_path: Optional[str] = None,
     ):
         """
         Initialize budget controller.
@@ -318,6 +586,8 @@ class BudgetController:
         Args:
             config_path: Path to budget YAML config
             use_database: Whether to persist to database (False = in-memory)
+            ledger_path: SQLite ledger shared across processes
+                (default: reservations.ledger_path from config, else in-process)
         """
         self._use_database = use_database
         self._config = self._load_config(config_path)
@@ -325,6 +595,18 @@ class BudgetController:
         self._spending_log: List[SpendingRecord] = []
         self._alert_callbacks: List[Callable[[BudgetCategory, AlertLevel, BudgetStatus], None]] = []
 
+        # Reservations (one lock per category keeps callers from contending)
+        self._reservations: Dict[str, BudgetReservation] = {}
+        self._locks: Dict[BudgetCategory, threading.RLock] = {
+            category: threading.RLock() for category in BudgetCategory
+        }
+        reservation_config = self._config.get("reservations") or {}
+        ledger_path = ledger_path or reservation_config.get("ledger_path") or None
+        self._reservation_ttl = reservation_config.get(
+            "ttl_seconds", DEFAULT_RESERVATION_TTL_SECONDS
+        )
+        self._ledger: Optional[BudgetLedger] = BudgetLedger(ledger_path) if ledger_path else None
+
         # Initialize state for each category
         self._initialize_state()
 
@@ -436,7 +718,9 @@ class BudgetController:
             logger.warning(f"Unknown budget category: {category}")
             return True  # Allow if category not configured
 
-        return self._state[category].can_afford(estimated_cost)
+        with self._locks[category]:
+            self._sync_state(category)
+            return self._state[category].can_afford(estimated_cost)
 
     def record_spend(self, record: SpendingRecord) -> None:
         """
@@ -445,6 +729,162 @@ class BudgetController:
         Args:
             record: Spending record with cost details
         """
+        self._apply_spend(record, None)
+
+    # -------------------------------------------------------------------------
+    # Reservations
+    # -------------------------------------------------------------------------
+
+    def reserve(
+        self,
+        estimated_cost: float,
+        category: BudgetCategory = BudgetCategory.PRODUCTION,
+        ttl_seconds: Optional[float] = None,
+    ) -> Optional[BudgetReservation]:
+        """
+        Hold the estimated cost of a call before making it.
+
+        Args:
+            estimated_cost: Estimated cost in CAD
+            category: Budget category
+            ttl_seconds: Seconds before an unsettled hold lapses
+
+        Returns:
+            BudgetReservation, or None if the budget can't cover it
+        """
+        self.reset_if_needed()
+
+        now = datetime.utcnow()
+        reservation = BudgetReservation(
+            id=uuid.uuid4().hex,
+            category=category,
+            amount=round(estimated_cost, COST_PRECISION),
+            created_at=now,
+            expires_at=now + timedelta(seconds=ttl_seconds or self._reservation_ttl),
+        )
+
+        if category not in self._state:
+            logger.warning(f"Unknown budget category: {category}")
+            reservation.settled = True  # Nothing held for unconfigured categories
+            return reservation
+
+        state = self._state[category]
+        with self._locks[category]:
+            if self._ledger is not None:
+                held = self._ledger.try_reserve(reservation, state.limits, state.period_starts())
+                self._sync_state(category)
+            else:
+                self._expire_reservations(category, now)
+                held = state.can_afford(reservation.amount)
+                if held:
+                    state.reserved = round(state.reserved + reservation.amount, COST_PRECISION)
+
+            if not held:
+                return None
+            self._reservations[reservation.id] = reservation
+
+        return reservation
+
+    def commit(self, reservation: BudgetReservation, record: SpendingRecord) -> None:
+        """
+        Settle a reservation with the actual spend of the call.
+
+        Args:
+            reservation: Reservation returned by reserve()
+            record: Spending record with the actual cost
+        """
+        self._apply_spend(record, reservation)
+
+    def release(self, reservation: BudgetReservation) -> bool:
+        """
+        Drop a reservation without spending (e.g. the call failed).
+
+        Returns:
+            True if the reservation was still held
+        """
+        if reservation.settled:
+            return False
+        reservation.settled = True
+
+        category = reservation.category
+        if category not in self._state:
+            return False
+
+        with self._locks[category]:
+            held = self._reservations.pop(reservation.id, None) is not None
+            if self._ledger is not None:
+                held = self._ledger.release(reservation.id) or held
+                self._sync_state(category)
+            elif held:
+                state = self._state[category]
+                state.reserved = max(0.0, round(state.reserved - reservation.amount, COST_PRECISION))
+        return held
+
+    @contextmanager
+    def reservation(
+        self,
+        estimated_cost: float,
+        category: BudgetCategory = BudgetCategory.PRODUCTION,
+        ttl_seconds: Optional[float] = None,
+    ) -> Iterator[BudgetReservation]:
+        """
+        Reserve for the duration of a block.
+
+        Call commit() inside the block with the actual spend; a reservation
+        that is still open when the block exits (including on error) is
+        released.
+
+        Raises:
+            BudgetExceededError: If the budget can't cover the estimate
+        """
+        held = self.reserve(estimated_cost, category, ttl_seconds)
+        if held is None:
+            raise BudgetExceededError(
+                f"Cannot reserve ${estimated_cost:.4f} CAD from {category.value} budget"
+            )
+        try:
+            yield held
+        finally:
+            if not held.settled:
+                self.release(held)
+
+    def get_reserved(self, category: BudgetCategory) -> float:
+        """Total outstanding reservations for a category."""
+        if category not in self._state:
+            return 0.0
+        with self._locks[category]:
+            self._sync_state(category)
+            if self._ledger is None:
+                self._expire_reservations(category, datetime.utcnow())
+            return self._state[category].reserved
+
+    def _expire_reservations(self, category: BudgetCategory, now: datetime) -> None:
+        """Release in-process reservations whose TTL has lapsed (lock held)."""
+        state = self._state[category]
+        for reservation_id, reservation in list(self._reservations.items()):
+            if reservation.category == category and reservation.expires_at <= now:
+                del self._reservations[reservation_id]
+                reservation.settled = True
+                state.reserved = max(0.0, round(state.reserved - reservation.amount, COST_PRECISION))
+                logger.warning(f"Budget reservation {reservation_id} expired unsettled")
+
+    def _sync_state(self, category: BudgetCategory) -> None:
+        """Refresh a category's totals from the shared ledger (lock held)."""
+        if self._ledger is None:
+            return
+        state = self._state[category]
+        daily, weekly, monthly, reserved = self._ledger.totals(category, state.period_starts())
+        state.daily.spent = daily
+        state.weekly.spent = weekly
+        state.monthly.spent = monthly
+        state.reserved = reserved
+
+    def _apply_spend(
+        self,
+        record: SpendingRecord,
+        reservation: Optional[BudgetReservation],
+    ) -> None:
+        """Record spend, settling ``reservation`` in the same step if given."""
         category = BudgetCategory(record.category) if isinstance(record.category, str) else record.category
 
         # Reset if needed first
@@ -452,7 +892,29 @@ class BudgetController:
 
         # Add to state
         if category in self._state:
-            self._state[category].add_spending(record.cost_cad)
+            state = self._state[category]
+            with self._locks[category]:
+                open_reservation = None
+                if reservation is not None and not reservation.settled:
+                    reservation.settled = True
+                    open_reservation = self._reservations.pop(reservation.id, None)
+
+                if self._ledger is not None:
+                    self._ledger.add_spend(
+                        category,
+                        record.cost_cad,
+                        record.timestamp,
+                        reservation_id=reservation.id if reservation is not None else None,
+                    )
+                    self._sync_state(category)
+                else:
+                    if open_reservation is not None:
+                        state.reserved = max(
+                            0.0, round(state.reserved - open_reservation.amount, COST_PRECISION)
+                        )
+                    state.add_spending(record.cost_cad)
+        elif reservation is not None:
+            reservation.settled = True
 
         # Log spending
         self._spending_log.append(record)
@@ -510,6 +972,8 @@ class BudgetController:
             raise ValueError(f"Unknown budget category: {category}")
 
         state = self._state[category]
+        with self._locks[category]:
+            self._sync_state(category)
         alert_level = state.get_alert_level(self.warn_percent, self.critical_percent)
 
         return BudgetStatus(
@@ -523,10 +987,11 @@ class BudgetController:
             monthly_spent=state.monthly.spent,
             monthly_limit=state.monthly.limit,
             monthly_remaining=state.monthly.remaining,
-            is_exceeded=not state.can_afford(0),
+            is_exceeded=state.daily.is_exceeded or state.weekly.is_exceeded or state.monthly.is_exceeded,
             is_warning=alert_level in (AlertLevel.WARNING, AlertLevel.CRITICAL),
             alert_level=alert_level,
             next_reset=state.daily.reset_at or datetime.utcnow(),
+            reserved=state.reserved,
         )
 
     def get_all_status(self) -> Dict[BudgetCategory, BudgetStatus]:
@@ -584,6 +1049,10 @@ class BudgetController:
             state.monthly.spent = 0.0
             state.monthly.reset_at = state._next_monthly_reset(now)
 
+        if self._ledger is not None:
+            for reset_period in ([period] if period else list(BudgetPeriod)):
+                self._ledger.record_reset(category, reset_period, now)
+
         logger.info(f"Force reset budget: {category.value} {period.value if period else 'all'}")
 
     def set_limit(
@@ -706,6 +1175,7 @@ _controller_cache: Optional[BudgetController] = None
 def get_budget_controller(
     config_path: Optional[str] = None,
     use_database: bool = False,
+    ledger_path: Optional[str] = None,
 ) -> BudgetController:
     """
     Get budget controller (cached).
@@ -713,6 +1183,7 @@ def get_budget_controller(
     Args:
         config_path: Path to config file
         use_database: Whether to persist to database
+        ledger_path: SQLite ledger shared across processes
 
     Returns:
         BudgetController instance
@@ -720,7 +1191,7 @@ def get_budget_controller(
     global _controller_cache
 
     if _controller_cache is None:
-        _controller_cache = BudgetController(config_path, use_database)
+        _controller_cache = BudgetController(config_path, use_database, ledger_path)
 
     return _controller_cache
 
@@ -23,9 +23,10 @@ Usage:
 
 from __future__ import annotations
 
+import asyncio
 import logging
 import os
-from typing import Any, Dict, List, Optional, Type
+from typing import Any, AsyncIterator, Callable, Dict, List, Optional, Type
 
 from .provider import (
     Completion,
@@ -70,6 +71,21 @@ class ProviderNotAvailableError(Exception):
 # ============================================================================
 
 
+def _shared_http_client(base_url: str) -> Optional[Callable[[], Any]]:
+    """
+    Factory for the agent's process-wide keep-alive HTTP client.
+
+    Providers created here then share sockets, TLS sessions and limits
+    with the agent's own LLM providers. Returns None (SDK default client)
+    when the agent package isn't importable.
+    """
+    try:
+        from agent.llm.http_pool import get_http_pool
+    except ImportError:
+        return None
+    return lambda: get_http_pool().client(base_url)
+
+
 class ProviderRegistry:
     """
     Central registry for all model providers.
@@ -198,6 +214,9 @@ class ProviderRegistry:
                 max_retries=config.retry_attempts,
                 requests_per_minute=config.rate_limits.requests_per_minute,
                 tokens_per_minute=config.rate_limits.tokens_per_minute,
+                http_client_factory=_shared_http_client(
+                    config.base_url or "https://api.anthropic.com"
+                ),
             )
         elif name == "openai":
             # Future: OpenAI provider
@@ -343,22 +362,59 @@ class ProviderRegistry:
         self,
         messages: List[Message],
         model: str,
+        first_token_timeout: Optional[float] = None,
+        fallback_models: Optional[List[str]] = None,
         **kwargs: Any,
-    ):
+    ) -> AsyncIterator[str]:
         """
         Stream completion using appropriate provider.
 
+        If a model fails or produces nothing within ``first_token_timeout``,
+        the next of ``fallback_models`` is tried. Once a token has been
+        yielded the stream is committed to that model: a later failure is
+        raised rather than replayed from another model.
+
         Args:
             messages: Conversation messages
             model: Model to use
+            first_token_timeout: Seconds to wait for the first token
+            fallback_models: Models to fail over to before the first token
             **kwargs: Additional parameters
 
         Yields:
             String tokens
         """
-        provider = self.get_by_model(model)
-        async for token in provider.stream(messages, model, **kwargs):
-            yield token
+        candidates = [model] + list(fallback_models or [])
+        errors: List[str] = []
+
+        for index, candidate in enumerate(candidates):
+            emitted = False
+            tokens = None
+            try:
+                provider = self.get_by_model(candidate)
+                tokens = provider.stream(messages, candidate, **kwargs).__aiter__()
+                first = await asyncio.wait_for(tokens.__anext__(), first_token_timeout)
+                emitted = True
+                yield first
+                async for token in tokens:
+                    yield token
+                return
+            except StopAsyncIteration:
+                return
+            except Exception as e:
+                if emitted or index == len(candidates) - 1 and not errors:
+                    raise
+                if isinstance(e, asyncio.TimeoutError):
+                    e = TimeoutError(f"no token within {first_token_timeout}s")
+                errors.append(f"{candidate}: {e}")
+                logger.warning(f"Stream from {candidate} failed before first token: {e}")
+            finally:
+                if tokens is not None and hasattr(tokens, "aclose"):
+                    await tokens.aclose()
+
+        raise ProviderNotAvailableError(
+            "All models failed before streaming:\n" + "\n".join(errors)
+        )
 
     # -------------------------------------------------------------------------
     # Health Checks
@@ -59,6 +59,15 @@ class ExecutionError(Exception):
         self.attempts = attempts
 
 
+def _is_budget_error(error: Optional[Exception]) -> bool:
+    """True if ``error`` means the budget couldn't cover a call."""
+    try:
+        from core.models.budget import BudgetExceededError
+    except ImportError:
+        return False
+    return isinstance(error, BudgetExceededError)
+
+
 # ============================================================================
 # Model Selection (stub for integration)
 # ============================================================================
@@ -233,6 +242,11 @@ class RouterConfig(BaseModel):
         default=True,
         description="Record costs to budget controller",
     )
+    reserve_output_tokens: int = Field(
+        default=1024,
+        ge=0,
+        description="Output tokens held against the budget before each call",
+    )
 
     # Logging
     log_routing: bool = Field(
@@ -344,7 +358,7 @@ class TaskRouter:
         """Get budget controller (lazy load)."""
         if self._budget_controller is None:
             try:
-                from core.budget import get_budget_controller
+                from core.models.budget import get_budget_controller
                 self._budget_controller = get_budget_controller()
             except ImportError:
                 logger.debug("Budget controller not available")
@@ -591,6 +605,9 @@ class TaskRouter:
 
         # All attempts failed
         self._total_failures += 1
+        if _is_budget_error(last_error):
+            # Out of budget for every model tried: let callers stop, not retry
+            raise last_error
         raise ExecutionError(
             f"All models failed after {attempts} attempts: {last_error}",
             task_id=routing.task_id,
@@ -624,6 +641,11 @@ class TaskRouter:
         output_tokens = 0
         cost_cad = 0.0
 
+        # Hold the estimated cost first so concurrent calls can't overshoot
+        reservation = None
+        if self._config.record_costs and self.budget_controller:
+            reservation = self._reserve_budget(model, messages, context)
+
         try:
             # Try to use provider registry
             if self._provider_registry:
@@ -646,9 +668,10 @@ class TaskRouter:
             # Estimate cost
             cost_cad = self._estimate_cost(model, input_tokens, output_tokens)
 
-            # Record cost if budget controller available
-            if self._config.record_costs and self.budget_controller:
-                await self._record_cost(
+            # Settle the reservation with the actual cost
+            if reservation is not None:
+                self._record_cost(
+                    reservation=reservation,
                     task_id=task_id,
                     provider=provider,
                     model=model,
@@ -659,6 +682,8 @@ class TaskRouter:
 
         except Exception as e:
             logger.error(f"Execution error: {e}")
+            if reservation is not None:
+                self.budget_controller.release(reservation)
             raise
 
         execution_time_ms = int((time.time() - start_time) * 1000)
@@ -736,8 +761,36 @@ Be concise but thorough. If you're unsure about something, say so."""
         # Convert to CAD (rough estimate)
         return usd_cost * 1.35
 
-    async def _record_cost(
+    def _reserve_budget(
+        self,
+        model: str,
+        messages: List[Dict[str, str]],
+        context: Optional[Dict[str, Any]],
+    ) -> Any:
+        """
+        Reserve the estimated cost of a call from the budget.
+
+        Raises:
+            BudgetExceededError: If the budget can't cover the estimate
+        """
+        from core.models.budget import BudgetCategory, BudgetExceededError
+
+        category = BudgetCategory((context or {}).get("budget_category", BudgetCategory.PRODUCTION))
+
+        # Rough estimate: ~4 characters per input token
+        input_tokens = sum(len(m["content"]) for m in messages) // 4 + 1
+        estimate = self._estimate_cost(model, input_tokens, self._config.reserve_output_tokens)
+
+        reservation = self.budget_controller.reserve(estimate, category)
+        if reservation is None:
+            raise BudgetExceededError(
+                f"Cannot reserve ${estimate:.4f} CAD from {category.value} budget for {model}"
+            )
+        return reservation
+
+    def _record_cost(
         self,
+        reservation: Any,
         task_id: UUID,
         provider: str,
         model: str,
@@ -745,25 +798,26 @@ Be concise but thorough. If you're unsure about something, say so."""
         output_tokens: int,
         cost_cad: float,
     ) -> None:
-        """Record cost to budget controller."""
+        """Settle a budget reservation with the actual cost of the call."""
         try:
-            from core.budget import SpendingRecord, BudgetCategory
+            from core.models.budget import SpendingRecord
 
             record = SpendingRecord(
                 timestamp=datetime.utcnow(),
-                category=BudgetCategory.PRODUCTION,
+                category=reservation.category,
                 provider=provider,
                 model=model,
                 input_tokens=input_tokens,
                 output_tokens=output_tokens,
                 cost_cad=cost_cad,
-                task_id=task_id,
+                task_id=str(task_id),
             )
 
-            await self.budget_controller.record_spend(record)
+            self.budget_controller.commit(reservation, record)
 
         except Exception as e:
             logger.warning(f"Failed to record cost: {e}")
+            self.budget_controller.release(reservation)
 
     # -------------------------------------------------------------------------
     # Combined Flow
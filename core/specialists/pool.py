@@ -24,7 +24,7 @@ import logging
 import random
 from datetime import datetime
 from enum import Enum
-from typing import Any, Dict, List, Optional, Tuple
+from typing import Any, Callable, Dict, List, Optional, Tuple
 from uuid import UUID, uuid4
 
 from pydantic import BaseModel, Field
@@ -144,6 +144,9 @@ class DomainPool(BaseModel):
 
     # Selection tracking
     _round_robin_index: int = -1
+
+    # Change notification (set by PoolManager): called with (domain, event)
+    _on_change: Optional[Callable[[str, str], None]] = None
     selection_count: int = Field(default=0, description="Total selections made")
 
     # Timestamps
@@ -155,6 +158,15 @@ class DomainPool(BaseModel):
     def __init__(self, **data):
         super().__init__(**data)
         self._round_robin_index = -1
+        self._on_change = None
+
+    def _notify(self, event: str) -> None:
+        """Report a change in pool contents or evolution state."""
+        if self._on_change is not None:
+            try:
+                self._on_change(self.domain, event)
+            except Exception as e:
+                logger.error(f"Pool change callback failed for {self.domain}: {e}")
 
     # -------------------------------------------------------------------------
     # Selection
@@ -264,6 +276,7 @@ class DomainPool(BaseModel):
             f"Added {specialist.name} to {self.domain} pool "
             f"(rank={self._get_rank(specialist.id)})"
         )
+        self._notify("specialist_added")
 
     def remove(self, specialist_id: UUID) -> Specialist:
         """
@@ -283,6 +296,7 @@ class DomainPool(BaseModel):
                 removed = self.specialists.pop(i)
                 self.updated_at = datetime.utcnow()
                 logger.info(f"Removed {removed.name} from {self.domain} pool")
+                self._notify("specialist_removed")
                 return removed
 
         raise SpecialistNotFoundError(specialist_id)
@@ -370,6 +384,7 @@ class DomainPool(BaseModel):
         self.pause_reason = reason
         self.updated_at = datetime.utcnow()
         logger.info(f"Paused evolution for {self.domain}: {reason}")
+        self._notify("evolution_paused")
 
     def resume_evolution(self) -> None:
         """Resume automatic evolution."""
@@ -377,11 +392,13 @@ class DomainPool(BaseModel):
         self.pause_reason = None
         self.updated_at = datetime.utcnow()
         logger.info(f"Resumed evolution for {self.domain}")
+        self._notify("evolution_resumed")
 
     def increment_generation(self) -> int:
         """Increment and return new generation number."""
         self.generation += 1
         self.updated_at = datetime.utcnow()
+        self._notify("generation_incremented")
         return self.generation
 
     # -------------------------------------------------------------------------
@@ -24,7 +24,7 @@ from __future__ import annotations
 import logging
 from datetime import datetime
 from pathlib import Path
-from typing import Any, Dict, List, Optional
+from typing import Any, Callable, Dict, List, Optional
 from uuid import UUID
 
 from .pool import DomainPool, NoSpecialistsError, SelectionMode
@@ -98,6 +98,7 @@ class PoolManager:
             use_database: Whether to persist to database
         """
         self._pools: Dict[str, DomainPool] = {}
+        self._change_callbacks: List[Callable[[str, str], None]] = []
         self._config_path = config_path or "config/domains"
         self._use_database = use_database
         self._initialized_at = datetime.utcnow()
@@ -111,7 +112,39 @@ class PoolManager:
         """Ensure default domain pools exist."""
         for domain in self.DEFAULT_DOMAINS:
             if domain not in self._pools:
-                self._pools[domain] = DomainPool(domain=domain)
+                self._pools[domain] = self._track(DomainPool(domain=domain))
+
+    # -------------------------------------------------------------------------
+    # Change Notification
+    # -------------------------------------------------------------------------
+
+    def add_change_callback(self, callback: Callable[[str, str], None]) -> None:
+        """
+        Register a callback for pool changes.
+
+        Args:
+            callback: Function called with (domain, event) when a pool is
+                created or removed, gains or loses a specialist, or has
+                its evolution paused/resumed
+        """
+        self._change_callbacks.append(callback)
+
+    def remove_change_callback(self, callback: Callable[[str, str], None]) -> None:
+        """Unregister a pool change callback."""
+        if callback in self._change_callbacks:
+            self._change_callbacks.remove(callback)
+
+    def _track(self, pool: DomainPool) -> DomainPool:
+        """Route a pool's change events through this manager."""
+        pool._on_change = self._on_pool_change
+        return pool
+
+    def _on_pool_change(self, domain: str, event: str) -> None:
+        for callback in list(self._change_callbacks):
+            try:
+                callback(domain, event)
+            except Exception as e:
+                logger.error(f"Pool change callback error: {e}")
 
     # -------------------------------------------------------------------------
     # Pool Access
@@ -128,8 +161,9 @@ class PoolManager:
             DomainPool for the domain
         """
         if domain not in self._pools:
-            self._pools[domain] = DomainPool(domain=domain)
+            self._pools[domain] = self._track(DomainPool(domain=domain))
             logger.info(f"Created new pool for domain: {domain}")
+            self._on_pool_change(domain, "pool_created")
 
         return self._pools[domain]
 
@@ -148,9 +182,10 @@ class PoolManager:
             logger.warning(f"Pool for {domain} already exists")
             return self._pools[domain]
 
-        pool = DomainPool(domain=domain, max_size=max_size)
+        pool = self._track(DomainPool(domain=domain, max_size=max_size))
         self._pools[domain] = pool
         logger.info(f"Created pool for {domain} (max_size={max_size})")
+        self._on_pool_change(domain, "pool_created")
 
         return pool
 
@@ -178,7 +213,9 @@ class PoolManager:
         """
         if domain in self._pools:
             pool = self._pools.pop(domain)
+            pool._on_change = None
             logger.info(f"Removed pool for {domain}")
+            self._on_pool_change(domain, "pool_removed")
             return pool
         return None
 
@@ -389,7 +426,7 @@ class PoolManager:
         for config_file in config_dir.glob("*.yaml"):
             domain = config_file.stem
             if domain not in self._pools:
-                self._pools[domain] = DomainPool(domain=domain)
+                self._pools[domain] = self._track(DomainPool(domain=domain))
                 discovered.append(domain)
                 logger.info(f"Auto-discovered domain: {domain}")
 
@@ -397,10 +434,13 @@ class PoolManager:
         for config_file in config_dir.glob("*.yml"):
             domain = config_file.stem
             if domain not in self._pools:
-                self._pools[domain] = DomainPool(domain=domain)
+                self._pools[domain] = self._track(DomainPool(domain=domain))
                 discovered.append(domain)
                 logger.info(f"Auto-discovered domain: {domain}")
 
+        for domain in discovered:
+            self._on_pool_change(domain, "pool_created")
+
         return discovered
 
     # -------------------------------------------------------------------------
@@ -447,7 +487,8 @@ class PoolManager:
                     ]
 
                     pool = DomainPool.from_db_row(pool_dict, specialists)
-                    self._pools[pool.domain] = pool
+                    self._pools[pool.domain] = self._track(pool)
+                    self._on_pool_change(pool.domain, "pool_loaded")
 
                 logger.info(f"Loaded {len(pool_rows)} pools from database")
 
@@ -6,9 +6,13 @@ Tests for budget tracking, enforcement, and cost recording.
 Run with: pytest tests/models/test_budget.py -v
 """
 
+import asyncio
 from datetime import datetime, timedelta
+from types import SimpleNamespace
 from unittest.mock import patch, MagicMock
+import threading
 import uuid
+from uuid import uuid4
 
 import pytest
 
@@ -23,6 +27,7 @@ from core.models import (
     get_budget_controller,
     reset_budget_controller,
     can_afford,
+    BudgetExceededError,
 )
 from core.models.budget import PeriodState, CategoryState, BudgetLimits
 
@@ -527,3 +532,222 @@ class TestDatabasePersistence:
             assert abs(log.cost_cad - 0.5678) < 0.0001
             assert log.input_tokens == 1000
             assert log.output_tokens == 500
+
+
+# ============================================================================
+# Test Reservations
+# ============================================================================
+
+
+@pytest.mark.budget
+class TestReservations:
+    """Tests for reserve/commit/release and the shared ledger."""
+
+    def test_reservation_counts_against_limit(self, budget_controller):
+        """Outstanding reservations block requests that would over-commit."""
+        held = budget_controller.reserve(15.00, BudgetCategory.PRODUCTION)
+        assert held is not None
+
+        # $15 held of $20 daily: a second $10 reservation must fail
+        assert budget_controller.reserve(10.00, BudgetCategory.PRODUCTION) is None
+        assert not budget_controller.can_afford(10.00, BudgetCategory.PRODUCTION)
+        assert budget_controller.get_status(BudgetCategory.PRODUCTION).reserved == 15.00
+
+    def test_commit_replaces_estimate_with_actual(self, budget_controller, make_spending_record):
+        """Committing records the actual cost and frees the estimate."""
+        held = budget_controller.reserve(5.00, BudgetCategory.PRODUCTION)
+        budget_controller.commit(held, make_spending_record(cost_cad=1.25))
+
+        status = budget_controller.get_status(BudgetCategory.PRODUCTION)
+        assert status.reserved == 0.0
+        assert status.daily_spent == 1.25
+        assert held.settled
+
+    def test_release_frees_hold(self, budget_controller):
+        """Released reservations no longer count against the budget."""
+        held = budget_controller.reserve(18.00, BudgetCategory.PRODUCTION)
+        assert budget_controller.release(held)
+        assert not budget_controller.release(held)
+        assert budget_controller.can_afford(18.00, BudgetCategory.PRODUCTION)
+
+    def test_expired_reservation_lapses(self, budget_controller):
+        """Unsettled reservations past their TTL are dropped."""
+        held = budget_controller.reserve(18.00, BudgetCategory.PRODUCTION)
+        held.expires_at = datetime.utcnow() - timedelta(seconds=1)
+
+        assert budget_controller.get_reserved(BudgetCategory.PRODUCTION) == 0.0
+        assert budget_controller.reserve(18.00, BudgetCategory.PRODUCTION) is not None
+
+    def test_context_manager_releases_on_error(self, budget_controller):
+        """The reservation() block releases its hold if the call fails."""
+        with pytest.raises(RuntimeError):
+            with budget_controller.reservation(10.00, BudgetCategory.PRODUCTION):
+                raise RuntimeError("provider failed")
+
+        assert budget_controller.get_reserved(BudgetCategory.PRODUCTION) == 0.0
+
+    def test_context_manager_raises_when_unaffordable(self, budget_controller):
+        """reservation() raises BudgetExceededError instead of returning None."""
+        with pytest.raises(BudgetExceededError):
+            with budget_controller.reservation(100.00, BudgetCategory.PRODUCTION):
+                pass
+
+    def test_concurrent_reservations_never_overshoot(self, budget_controller):
+        """Parallel callers can't collectively reserve past the limit."""
+        granted = []
+        barrier = threading.Barrier(16)
+
+        def worker():
+            barrier.wait()
+            held = budget_controller.reserve(3.00, BudgetCategory.PRODUCTION)
+            if held is not None:
+                granted.append(held)
+
+        threads = [threading.Thread(target=worker) for _ in range(16)]
+        for t in threads:
+            t.start()
+        for t in threads:
+            t.join()
+
+        # $20 daily limit admits six $3 reservations
+        assert len(granted) == 6
+
+    def test_ledger_shared_between_controllers(self, tmp_path, make_spending_record):
+        """Controllers on the same ledger see each other's spend and holds."""
+        ledger = str(tmp_path / "budget.db")
+        first = BudgetController(ledger_path=ledger)
+        second = BudgetController(ledger_path=ledger)
+
+        first.record_spend(make_spending_record(cost_cad=12.00))
+        held = first.reserve(6.00, BudgetCategory.PRODUCTION)
+        assert held is not None
+
+        status = second.get_status(BudgetCategory.PRODUCTION)
+        assert status.daily_spent == 12.00
+        assert status.reserved == 6.00
+        assert second.reserve(4.00, BudgetCategory.PRODUCTION) is None
+
+        first.commit(held, make_spending_record(cost_cad=2.00))
+        assert second.get_status(BudgetCategory.PRODUCTION).daily_spent == 14.00
+        assert second.reserve(4.00, BudgetCategory.PRODUCTION) is not None
+
+    def test_ledger_force_reset(self, tmp_path, make_spending_record):
+        """Forced resets are recorded in the ledger for every controller."""
+        ledger = str(tmp_path / "budget.db")
+        first = BudgetController(ledger_path=ledger)
+        second = BudgetController(ledger_path=ledger)
+
+        first.record_spend(make_spending_record(cost_cad=5.00))
+        second.force_reset(BudgetCategory.PRODUCTION, BudgetPeriod.DAILY)
+
+        status = first.get_status(BudgetCategory.PRODUCTION)
+        assert status.daily_spent == 0.0
+        assert status.monthly_spent == 5.00
+
+
+# ============================================================================
+# Test Call-Path Reservations
+# ============================================================================
+
+
+class GatedRegistry:
+    """Provider registry whose calls block until ``gate`` is set."""
+
+    def __init__(self, fail: bool = False):
+        self.gate = asyncio.Event()
+        self.fail = fail
+        self.calls = 0
+
+    def get(self, provider):
+        return self
+
+    async def complete(self, messages, model, temperature):
+        self.calls += 1
+        await self.gate.wait()
+        if self.fail:
+            raise RuntimeError("provider down")
+        return SimpleNamespace(content="ok", input_tokens=10, output_tokens=10)
+
+
+def make_task_router(budget_controller, registry):
+    from core.routing.router import RouterConfig, TaskRouter
+
+    router = TaskRouter(
+        config=RouterConfig(),
+        budget_controller=budget_controller,
+        provider_registry=registry,
+    )
+    router._estimate_cost = lambda model, input_tokens, output_tokens: 3.00
+    return router
+
+
+def execute(router, context=None):
+    return router._execute_with_model(
+        task_id=uuid4(),
+        request="hello",
+        specialist=None,
+        model="sonnet",
+        provider="anthropic",
+        context=context,
+    )
+
+
+class TestCallPathReservations:
+    """Tests that the task router and benchmark executor reserve before calling."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_router_calls_never_overshoot(self, budget_controller):
+        """In-flight router calls hold their estimate against the limit."""
+        registry = GatedRegistry()
+        router = make_task_router(budget_controller, registry)
+
+        calls = [asyncio.ensure_future(execute(router)) for _ in range(10)]
+        await asyncio.sleep(0)
+        registry.gate.set()
+        results = await asyncio.gather(*calls, return_exceptions=True)
+
+        # $20 daily limit admits six $3 calls; the rest never reach the provider
+        assert registry.calls == 6
+        assert sum(isinstance(r, BudgetExceededError) for r in results) == 4
+        status = budget_controller.get_status(BudgetCategory.PRODUCTION)
+        assert (status.daily_spent, status.reserved) == (18.00, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_failed_router_call_releases_reservation(self, budget_controller):
+        """A provider error drops the hold without recording spend."""
+        registry = GatedRegistry(fail=True)
+        registry.gate.set()
+        router = make_task_router(budget_controller, registry)
+
+        with pytest.raises(RuntimeError):
+            await execute(router, {"budget_category": "benchmark"})
+
+        status = budget_controller.get_status(BudgetCategory.BENCHMARK)
+        assert (status.daily_spent, status.reserved) == (0.0, 0.0)
+
+    @pytest.mark.asyncio
+    async def test_benchmark_stops_when_budget_exhausted(self):
+        """The executor reserves from its budget category and pauses when refused."""
+        from core.benchmark.executor import BenchmarkExecutor
+        from core.benchmark.loader import Benchmark, BenchmarkTask
+
+        contexts = []
+
+        class RefusingRouter:
+            async def route_and_execute(self, request, context=None):
+                contexts.append(context)
+                raise BudgetExceededError("benchmark budget exhausted")
+
+        executor = BenchmarkExecutor(router=RefusingRouter())
+        benchmark = Benchmark(
+            name="budget",
+            domain="code_generation",
+            tasks=[BenchmarkTask(id=f"t{i}", difficulty="easy", prompt="Write code") for i in range(3)],
+        )
+
+        run = await executor.run(benchmark)
+
+        assert run.status == "paused"
+        assert [r.status for r in run.results] == ["skipped"]
+        assert run.results[0].reason == "Budget limit reached"
+        assert contexts == [{"benchmark": True, "domain": "code_generation", "budget_category": "benchmark"}]
@@ -7,6 +7,8 @@ and budget integration.
 Run with: pytest tests/models/test_routing_integration.py -v
 """
 
+import asyncio
+
 import pytest
 from unittest.mock import patch, MagicMock
 
@@ -462,3 +464,59 @@ class TestRouterInitialization:
         # Should have budget state
         state = router.get_budget_state()
         assert state is not None
+
+
+# ============================================================================
+# Test Registry Streaming
+# ============================================================================
+
+
+@pytest.fixture
+def streaming_registry(mock_provider):
+    """Registry where "opus" stalls before its first token"""
+    from core.models.config import CostControlsConfig, DefaultsConfig, ModelsConfig
+    from core.models.registry import ProviderRegistry
+
+    from .conftest import MockModelProvider
+
+    class StallingProvider(MockModelProvider):
+        def stream(self, messages, model, **kwargs):
+            async def _stream():
+                await asyncio.sleep(1.0)
+                yield "late"
+
+            return _stream()
+
+    registry = ProviderRegistry(
+        ModelsConfig(providers={}, defaults=DefaultsConfig(), cost_controls=CostControlsConfig())
+    )
+    registry.register("mock", mock_provider)
+    stalling = StallingProvider(name="stalling")
+    stalling._models = [m for m in stalling._models if m.name == "opus"]
+    registry.register("stalling", stalling)
+    return registry
+
+
+@pytest.mark.routing
+class TestRegistryStreaming:
+    """Tests for first-token deadlines and failover in registry.stream."""
+
+    def test_fails_over_before_first_token(self, streaming_registry):
+        """A model that misses the first-token deadline falls to the next."""
+        async def collect():
+            return [
+                t async for t in streaming_registry.stream(
+                    [], "opus", first_token_timeout=0.05, fallback_models=["sonnet"]
+                )
+            ]
+
+        assert "".join(asyncio.run(collect())) == "Mock stream from sonnet"
+
+    def test_single_model_timeout_is_raised(self, streaming_registry):
+        """Without fallbacks the deadline surfaces as a timeout."""
+        async def drain():
+            async for _ in streaming_registry.stream([], "opus", first_token_timeout=0.05):
+                pass
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(drain())
@@ -7,6 +7,8 @@ Tests all approval workflow features:
 - Conditional branching
 - Parallel approvals
 - Timeouts and escalations
+- Bulk request creation and decisions
+- Workflow and condition caching
 - Integration with orchestrator
 
 Usage:
@@ -21,6 +23,8 @@ import os
 from pathlib import Path
 import time
 
+import pytest
+
 # Add agent directory to path
 sys.path.insert(0, str(Path(__file__).parent.parent / "agent"))
 
@@ -32,7 +36,8 @@ from approval_engine import (
     DecisionType,
     create_hr_offer_letter_workflow,
     create_finance_expense_workflow,
-    create_legal_contract_workflow
+    create_legal_contract_workflow,
+    compile_condition
 )
 from orchestrator_integration import (
     OrchestrationPauseManager,
@@ -484,8 +489,113 @@ def test_statistics(engine: ApprovalEngine, results: TestResults):
         return False
 
 
+def test_bulk_operations(engine: ApprovalEngine, results: TestResults):
+    """Test 10: Bulk Request Creation and Decisions"""
+    test_name = "Bulk Request Creation and Decisions"
+
+    try:
+        # Batch import: interns auto-approve, the rest wait for the hiring manager
+        requests = engine.create_approval_requests(
+            workflow_id="hr_offer_letter_v1",
+            items=[
+                {
+                    "mission_id": f"bulk_mission_{i:03d}",
+                    "payload": {"salary": 40000 if i % 2 else 90000, "level": "intern" if i % 2 else "junior"}
+                }
+                for i in range(20)
+            ],
+            created_by="hr_import"
+        )
+
+        assert len(requests) == 20, "Should create all requests"
+        auto = [r for r in requests if r.status == ApprovalStatus.APPROVED]
+        pending = [r for r in requests if r.status == ApprovalStatus.PENDING]
+        assert len(auto) == 10 and len(pending) == 10, "Half should be auto-approved"
+        assert all(r.created_by == "hr_import" for r in requests), "Default created_by applied"
+        stored = engine.get_request(pending[0].request_id)
+        assert stored.current_step_ids == ["hiring_manager"], "Should be persisted"
+
+        # Approve every pending request in one transaction
+        updated = engine.process_decisions([
+            {
+                "request_id": r.request_id,
+                "approver_user_id": "manager_001",
+                "decision": DecisionType.APPROVE,
+                "approver_role": "hr_hiring_manager"
+            }
+            for r in pending
+        ])
+        assert [r.current_step_ids for r in updated] == [["hr_head"]] * 10, "Should skip director"
+
+        # An invalid decision rolls back the whole batch
+        try:
+            engine.process_decisions([
+                {
+                    "request_id": pending[0].request_id,
+                    "approver_user_id": "hr_head_001",
+                    "decision": DecisionType.APPROVE,
+                    "approver_role": "hr_head"
+                },
+                {
+                    "request_id": "missing_request",
+                    "approver_user_id": "hr_head_001",
+                    "decision": DecisionType.APPROVE
+                }
+            ])
+            pytest.fail("Batch with an unknown request should fail")
+        except ValueError:
+            pass
+
+        stored = engine.get_request(pending[0].request_id)
+        assert stored.status == ApprovalStatus.PENDING, "First decision should be rolled back"
+        assert len(stored.decisions) == 1, "Only the hiring manager decision should remain"
+
+        results.add_pass(test_name)
+        return True
+
+    except AssertionError as e:
+        results.add_fail(test_name, str(e))
+        return False
+    except Exception as e:
+        results.add_fail(test_name, f"Unexpected error: {e}")
+        return False
+
+
+def test_workflow_and_condition_caches(engine: ApprovalEngine, results: TestResults):
+    """Test 11: Workflow and Condition Caching"""
+    test_name = "Workflow and Condition Caching"
+
+    try:
+        # Workflows are served from memory after the first lookup
+        workflow = engine.get_workflow("hr_offer_letter_v1")
+        assert engine.get_workflow("hr_offer_letter_v1") is workflow, "Should reuse cached workflow"
+        assert engine.get_workflow_by_type("hr", "offer_letter") is workflow, "Type lookup should hit cache"
+
+        # Conditions are compiled once and reused across requests
+        condition = "payload.get('salary', 0) > 100000"
+        hits = compile_condition.cache_info().hits
+        assert engine._evaluate_condition(condition, {"salary": 150000})
+        assert not engine._evaluate_condition(condition, {"salary": 50000})
+        assert compile_condition.cache_info().hits >= hits + 2, "Compiled condition should be reused"
+
+        # Unsafe or invalid expressions never evaluate
+        assert compile_condition("[x for x in payload]") is None, "Comprehensions are not allowed"
+        assert not engine._evaluate_condition("__import__('os')", {}), "Builtins are not reachable"
+        assert not engine._evaluate_condition("payload[", {}), "Syntax errors evaluate to False"
+
+        results.add_pass(test_name)
+        return True
+
+    except AssertionError as e:
+        results.add_fail(test_name, str(e))
+        return False
+    except Exception as e:
+        results.add_fail(test_name, f"Unexpected error: {e}")
+        return False
+
+
 def test_orchestrator_integration(results: TestResults):
-    """Test 10: Orchestrator Integration"""
+    """Test 12: Orchestrator Integration"""
     test_name = "Orchestrator Integration"
 
     try:
@@ -546,6 +656,8 @@ def main():
         ("Auto-Approval Conditions", lambda: test_auto_approval(engine, results)),
         ("Pending Approvals Query", lambda: test_pending_approvals_query(engine, results)),
         ("Statistics Generation", lambda: test_statistics(engine, results)),
+        ("Bulk Request Creation and Decisions", lambda: test_bulk_operations(engine, results)),
+        ("Workflow and Condition Caching", lambda: test_workflow_and_condition_caches(engine, results)),
         ("Orchestrator Integration", lambda: test_orchestrator_integration(results))
     ]
 
@@ -8,6 +8,7 @@ Tests all audit logging functionality:
 - Query functionality
 - Integrity verification
 - WORM guarantees
+- Segment rotation, indexes and chain head sidecar
 
 Run with: python tests/test_audit_log.py
 """
@@ -506,6 +507,117 @@ def run_tests():
 
     runner.test("Persistence across restarts", test_persistence_across_restarts)
 
+    # ──────────────────────────────────────────────────────────────
+    # Segment & Chain Head Tests
+    # ──────────────────────────────────────────────────────────────
+    print("\n[SEGMENTS] Segment & Chain Head Tests")
+    print("-" * 60)
+
+    def test_rotation_preserves_chain():
+        """Test rotated segments verify as one chain."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "audit.jsonl"
+            audit = AuditLogger(log_file=log_file, secret_key="k", max_segment_bytes=2000)
+
+            for i in range(30):
+                audit.log_action(f"user{i % 3}@test.com", f"action{i % 2}", "file", f"f{i}")
+
+            segments = sorted(Path(tmpdir).glob("audit.0*.jsonl"))
+            assert len(segments) > 1, "Expected rotation into segments"
+            assert all(s.with_suffix(".idx").exists() for s in segments)
+
+            is_valid, issues = audit.verify_log_integrity(workers=1)
+            assert is_valid, issues
+            is_valid, issues = audit.verify_log_integrity(workers=2)
+            assert is_valid, issues
+
+            assert len(audit.query_logs()) == 30
+            assert audit.get_stats()["total_entries"] == 30
+
+    runner.test("Rotation preserves signature chain", test_rotation_preserves_chain)
+
+    def test_indexed_query_across_segments():
+        """Test filtered queries through segment indexes match a full scan."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "audit.jsonl"
+            audit = AuditLogger(log_file=log_file, secret_key="k", max_segment_bytes=2000)
+
+            for i in range(30):
+                audit.log_action(f"user{i % 3}@test.com", f"action{i % 2}", "file", f"f{i}")
+
+            entries = audit.query_logs(user_id="user1@test.com", action="action0")
+            assert [e.entity_id for e in entries] == [f"f{i}" for i in (28, 22, 16, 10, 4)]
+
+            limited = audit.query_logs(user_id="user1@test.com", limit=2)
+            assert [e.entity_id for e in limited] == ["f28", "f25"]
+
+            # A fresh logger rebuilds a missing index
+            next(Path(tmpdir).glob("audit.0*.idx")).unlink()
+            fresh = AuditLogger(log_file=log_file, secret_key="k", max_segment_bytes=2000)
+            assert len(fresh.query_logs(user_id="user1@test.com")) == 10
+            assert fresh.get_stats()["actions_by_type"] == {"action0": 15, "action1": 15}
+
+    runner.test("Indexed queries across segments", test_indexed_query_across_segments)
+
+    def test_tampered_sealed_segment_detected():
+        """Test tampering inside a sealed segment is detected."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "audit.jsonl"
+            audit = AuditLogger(log_file=log_file, secret_key="k", max_segment_bytes=2000)
+
+            for i in range(30):
+                audit.log_action("user@test.com", "action", "file", f"f{i}")
+
+            segment = sorted(Path(tmpdir).glob("audit.0*.jsonl"))[0]
+            lines = segment.read_text().splitlines()
+            lines.pop(1)  # Drop an entry from the middle of the chain
+            segment.write_text("\n".join(lines) + "\n")
+
+            is_valid, issues = audit.verify_log_integrity(workers=2)
+            assert is_valid is False
+            assert any(segment.name in issue and "Broken signature chain" in issue for issue in issues)
+
+    runner.test("Tampered sealed segment detected", test_tampered_sealed_segment_detected)
+
+    def test_chain_head_sidecar():
+        """Test the head sidecar tracks the chain and detects truncation."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "audit.jsonl"
+            audit = AuditLogger(log_file=log_file, secret_key="k")
+
+            audit.log_action("user@test.com", "a", "t", "1")
+            last = audit.log_action("user@test.com", "a", "t", "2")
+
+            head = json.loads(log_file.with_name("audit.jsonl.head").read_text())
+            assert head["entry_id"] == 2
+            assert head["signature"] == last.signature
+
+            # Dropping the last line leaves a valid chain, but the head catches it
+            lines = log_file.read_text().splitlines()
+            log_file.write_text(lines[0] + "\n")
+            is_valid, issues = audit.verify_log_integrity()
+            assert is_valid is False
+            assert "Chain head mismatch" in issues[-1]
+
+    runner.test("Chain head sidecar detects truncation", test_chain_head_sidecar)
+
+    def test_second_writer_continues_chain():
+        """Test two loggers on one file keep a single chain."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            log_file = Path(tmpdir) / "audit.jsonl"
+            first = AuditLogger(log_file=log_file, secret_key="k")
+            second = AuditLogger(log_file=log_file, secret_key="k")
+
+            first.log_action("user@test.com", "a", "t", "1")
+            entry = second.log_action("user@test.com", "a", "t", "2")
+            first.log_action("user@test.com", "a", "t", "3")
+
+            assert entry.entry_id == 2
+            is_valid, issues = first.verify_log_integrity()
+            assert is_valid, issues
+
+    runner.test("Second writer continues chain", test_second_writer_continues_chain)
+
     # ──────────────────────────────────────────────────────────────
     # Acceptance Criteria Tests
     # ──────────────────────────────────────────────────────────────
@@ -0,0 +1,138 @@
+"""
+Benchmark Loader Cache Tests
+
+Tests the in-memory and on-disk benchmark caches, parallel suite loading
+and load-time compilation of regex verification rules.
+"""
+
+import os
+import time
+from pathlib import Path
+
+import pytest
+
+# Import from parent directory
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.benchmark.loader import (
+    BenchmarkLoader,
+    _compile_cached,
+    compile_rule_pattern,
+)
+
+
+BENCHMARK_YAML = """
+name: {name}
+version: "1.0"
+tasks:
+  - id: task_1
+    difficulty: easy
+    prompt: "Write a function"
+    verification:
+      - syntax_valid
+      - type: regex_match
+        params:
+          pattern: "def \\\\w+_{name}"
+          case_insensitive: true
+"""
+
+
+def write_benchmark(directory: Path, name: str) -> Path:
+    directory.mkdir(parents=True, exist_ok=True)
+    path = directory / f"{name}.yaml"
+    path.write_text(BENCHMARK_YAML.format(name=name))
+    return path
+
+
+@pytest.fixture
+def bench_dir(tmp_path):
+    root = tmp_path / "benchmarks"
+    for i in range(3):
+        write_benchmark(root / "code_generation", f"suite_{i}")
+    for i in range(3):
+        write_benchmark(root / "business_documents", f"doc_{i}")
+    return root
+
+
+def test_memory_cache_revalidates_on_change(bench_dir):
+    """Unchanged files come from memory; edited files are re-parsed."""
+    loader = BenchmarkLoader(benchmark_dir=str(bench_dir))
+    path = str(bench_dir / "code_generation" / "suite_0.yaml")
+
+    first = loader.load(path)
+    assert loader.load(path) is first
+    assert loader.get_stats()["memory_hits"] == 1
+
+    # Rewrite with a different name and a bumped mtime
+    Path(path).write_text(BENCHMARK_YAML.format(name="renamed"))
+    later = time.time() + 5
+    os.utime(path, (later, later))
+
+    reloaded = loader.load(path)
+    assert reloaded.name == "renamed"
+
+
+def test_disk_cache_shared_between_loaders(bench_dir):
+    """A fresh loader reuses serialized benchmarks instead of parsing YAML."""
+    warm = BenchmarkLoader(benchmark_dir=str(bench_dir), max_workers=1)
+    assert len(warm.load_all()) == 6
+    assert warm.get_stats()["parsed"] == 6
+    assert any(warm.cache_dir.glob("*.json"))
+
+    cold = BenchmarkLoader(benchmark_dir=str(bench_dir), max_workers=1)
+    benchmarks = cold.load_all()
+    stats = cold.get_stats()
+
+    assert len(benchmarks) == 6
+    assert stats["parsed"] == 0
+    assert stats["disk_hits"] == 6
+    assert benchmarks[0].tasks[0].verification[1].type == "regex_match"
+
+
+def test_disk_cache_ignored_when_content_changes(bench_dir):
+    """Serialized entries are keyed by content hash."""
+    path = write_benchmark(bench_dir / "code_generation", "suite_0")
+    BenchmarkLoader(benchmark_dir=str(bench_dir)).load(str(path))
+
+    path.write_text(BENCHMARK_YAML.format(name="changed"))
+    loader = BenchmarkLoader(benchmark_dir=str(bench_dir))
+    assert loader.load(str(path)).name == "changed"
+    assert loader.get_stats()["disk_hits"] == 0
+
+
+def test_parallel_load_matches_serial(bench_dir):
+    """Worker-process parsing yields the same benchmarks as serial parsing."""
+    serial = BenchmarkLoader(benchmark_dir=str(bench_dir), use_disk_cache=False, max_workers=1)
+    parallel = BenchmarkLoader(benchmark_dir=str(bench_dir), use_disk_cache=False, max_workers=2)
+
+    serial_names = sorted(b.name for b in serial.load_all())
+    parallel_names = sorted(b.name for b in parallel.load_all())
+
+    assert serial_names == parallel_names
+    assert len(parallel_names) == 6
+
+
+def test_invalid_file_skipped(bench_dir):
+    """A broken suite is logged and skipped without failing the domain."""
+    (bench_dir / "code_generation" / "broken.yaml").write_text("tasks: [unclosed")
+    loader = BenchmarkLoader(benchmark_dir=str(bench_dir), use_disk_cache=False)
+
+    assert len(loader.load_domain("code_generation")) == 3
+
+    with pytest.raises(ValueError):
+        loader.load(str(bench_dir / "code_generation" / "broken.yaml"))
+
+
+def test_regex_rules_compiled_at_load(bench_dir):
+    """Regex rules are compiled during loading and reused by verification."""
+    _compile_cached.cache_clear()
+    loader = BenchmarkLoader(benchmark_dir=str(bench_dir), use_disk_cache=False)
+    benchmark = loader.load(str(bench_dir / "code_generation" / "suite_1.yaml"))
+
+    assert _compile_cached.cache_info().currsize == 1
+
+    params = benchmark.tasks[0].verification[1].params
+    pattern = compile_rule_pattern(params)
+    assert pattern.search("DEF build_suite_1")
+    assert _compile_cached.cache_info().hits >= 1
@@ -0,0 +1,145 @@
+"""
+Benchmark Verifier Tests
+
+Tests that verification shares one parsed VerificationContext across all
+checkers and inspects every code block in a response.
+"""
+
+import ast
+import asyncio
+from pathlib import Path
+from typing import Any, Dict
+from unittest.mock import patch
+
+# Import from parent directory
+import sys
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from core.benchmark.loader import VerificationRule
+from core.benchmark.verifier import (
+    BaseChecker,
+    VerificationContext,
+    VerificationResult,
+    Verifier,
+)
+
+
+RESPONSE = '''Here is the code:
+
+```python
+def add(a: int, b: int) -> int:
+    """Add two numbers."""
+    try:
+        return a + b
+    except TypeError:
+        raise ValueError("bad input")
+
+
+def sub(a, b):
+    return a - b
+```
+'''
+
+CODE_RULES = [
+    VerificationRule(type="syntax_valid"),
+    VerificationRule(type="has_docstrings"),
+    VerificationRule(type="has_type_hints"),
+    VerificationRule(type="has_error_handling"),
+]
+
+
+def test_response_parsed_once_for_all_checkers():
+    """Syntax, docstring and type-hint checks share one ast.parse call."""
+    verifier = Verifier()
+    real_parse = ast.parse
+
+    with patch("core.benchmark.verifier.ast.parse", side_effect=real_parse) as parse:
+        summary = asyncio.run(verifier.verify_detailed(RESPONSE, CODE_RULES))
+
+    assert parse.call_count == 1
+    assert summary.total_rules == 4
+
+
+def test_ast_based_results():
+    """Docstring and type-hint ratios come from the parsed functions."""
+    summary = asyncio.run(Verifier().verify_detailed(RESPONSE, CODE_RULES))
+    by_type = {r.rule_type: r for r in summary.results}
+
+    assert by_type["syntax_valid"].passed
+    assert by_type["has_docstrings"].details == "1/2 functions have docstrings"
+    assert by_type["has_type_hints"].details == "1/2 functions have type hints"
+    assert by_type["has_error_handling"].score == 1.0
+
+
+def test_unparseable_code_falls_back_to_patterns():
+    """Invalid code still gets pattern-based docstring counting."""
+    context = VerificationContext("```python\ndef broken(:\n    '''Doc.'''\n```")
+    assert context.python_functions()[0][1] is None
+
+    result = asyncio.run(
+        Verifier().run_check(context, VerificationRule(type="has_docstrings"))
+    )
+    assert result.details == "0/1 functions have docstrings"
+
+
+def test_context_caches_artifacts():
+    """Code extraction and normalised text are computed once."""
+    context = VerificationContext(RESPONSE)
+    assert context.code("python") is context.code("python")
+    assert context.python_ast()[0] is context.python_ast()[0]
+    assert context.lower == RESPONSE.lower()
+
+
+def test_every_code_block_is_checked():
+    """Docstring and type-hint counts cover all blocks, parseable or not."""
+    response = RESPONSE + '''
+And a helper:
+
+```python
+def mul(a: int, b: int) -> int:
+    """Multiply two numbers."""
+    return a * b
+```
+
+```python
+def broken(a) -> int:
+    """Doc."""
+    return (
+```
+'''
+    summary = asyncio.run(Verifier().verify_detailed(response, CODE_RULES))
+    by_type = {r.rule_type: r for r in summary.results}
+
+    assert len(VerificationContext(response).code_blocks()) == 3
+    assert by_type["has_docstrings"].details == "3/4 functions have docstrings"
+    assert by_type["has_type_hints"].details == "3/4 functions have type hints"
+
+
+class StringChecker(BaseChecker):
+    """Custom checker using only the string-based interface."""
+
+    def __init__(self, name: str):
+        self._name = name
+
+    @property
+    def check_type(self) -> str:
+        return self._name
+
+    async def check(self, response: str, params: Dict[str, Any]) -> VerificationResult:
+        return VerificationResult(
+            rule_type=self.check_type, passed=True, score=1.0, details=response[:4]
+        )
+
+
+def test_custom_checkers_keep_rule_order():
+    """String-based checkers still run, with results in rule order."""
+    verifier = Verifier()
+    for name in ("custom_a", "custom_b", "custom_c"):
+        verifier.register_checker(StringChecker(name))
+    rules = [VerificationRule(type=n) for n in ("custom_c", "custom_a", "custom_b")]
+
+    summary = asyncio.run(verifier.verify_detailed("text response", rules))
+
+    assert summary.passed_rules == 3
+    assert [r.rule_type for r in summary.results] == ["custom_c", "custom_a", "custom_b"]
+    assert summary.results[0].details == "text"
@@ -0,0 +1,138 @@
+"""
+Dashboard Snapshot Tests
+
+Checks that the dashboard endpoints are served from one cached snapshot,
+that pool and evolution changes invalidate it, and that conditional GETs
+are answered with 304 while the data is unchanged.
+"""
+
+import pytest
+from fastapi import FastAPI
+from fastapi.testclient import TestClient
+
+from api.routes.dashboard import (
+    DashboardSnapshotService,
+    get_snapshot_service,
+    reset_snapshot_service,
+    router,
+)
+from core.evolution.controller import get_evolution_controller, reset_evolution_controller
+from core.evolution.convergence import reset_convergence_detector
+from core.evolution.graveyard import reset_graveyard
+from core.specialists.pool_manager import get_pool_manager, reset_pool_manager
+from core.specialists.specialist import Specialist, SpecialistConfig, SpecialistStatus
+
+
+def make_specialist(domain: str, name: str, score: float) -> Specialist:
+    specialist = Specialist(
+        domain=domain,
+        name=name,
+        config=SpecialistConfig(system_prompt=f"You are {name}."),
+    )
+    specialist.performance.avg_score = score
+    specialist.performance.task_count = 4
+    return specialist
+
+
+@pytest.fixture(autouse=True)
+def reset_singletons():
+    for reset in (reset_pool_manager, reset_evolution_controller, reset_graveyard,
+                  reset_convergence_detector, reset_snapshot_service):
+        reset()
+    yield
+    for reset in (reset_pool_manager, reset_evolution_controller, reset_graveyard,
+                  reset_convergence_detector, reset_snapshot_service):
+        reset()
+
+
+@pytest.fixture
+def pool_manager():
+    manager = get_pool_manager()
+    for i, score in enumerate([0.9, 0.6]):
+        manager.get_pool("administration").add(make_specialist("administration", f"admin_{i}", score))
+    manager.get_pool("code_generation").add(make_specialist("code_generation", "coder", 0.7))
+    return manager
+
+
+@pytest.fixture
+def client(pool_manager):
+    app = FastAPI()
+    app.include_router(router)
+    return TestClient(app)
+
+
+def test_endpoints_share_one_snapshot(client):
+    overview = client.get("/api/dashboard/overview").json()
+    domains = client.get("/api/dashboard/domains").json()
+    stats = client.get("/api/dashboard/stats").json()
+    specialists = client.get("/api/dashboard/specialists", params={"domain": "administration"}).json()
+
+    assert overview["domains"] == domains
+    assert overview["total_specialists"] == stats["total_specialists"] == 3
+    admin = next(d for d in domains if d["name"] == "administration")
+    assert admin["best_score"] == 0.9
+    assert admin["current_jarvis"] == "admin_0"
+    assert [s["name"] for s in specialists] == ["admin_0", "admin_1"]
+
+    detail = client.get(f"/api/dashboard/specialists/{specialists[0]['id']}").json()
+    assert detail["domain"] == "administration"
+    assert detail["system_prompt_preview"] == "You are admin_0."
+
+    assert get_snapshot_service().get_stats()["builds"] == 1
+
+
+def test_conditional_get_returns_304(client):
+    first = client.get("/api/dashboard/domains")
+    etag = first.headers["etag"]
+
+    second = client.get("/api/dashboard/domains", headers={"If-None-Match": etag})
+    assert second.status_code == 304
+    assert second.content == b""
+    assert second.headers["etag"] == etag
+
+    other = client.get("/api/dashboard/domains", headers={"If-None-Match": '"stale"'})
+    assert other.status_code == 200
+
+
+def test_pool_and_evolution_changes_invalidate(client, pool_manager):
+    etag = client.get("/api/dashboard/domains").headers["etag"]
+
+    pool_manager.get_pool("code_generation").add(make_specialist("code_generation", "coder_2", 0.8))
+    response = client.get("/api/dashboard/domains", headers={"If-None-Match": etag})
+    assert response.status_code == 200
+    code = next(d for d in response.json() if d["name"] == "code_generation")
+    assert code["specialists"] == 2
+
+    get_evolution_controller().pause_evolution("code_generation", "Manual pause")
+    detail = client.get("/api/dashboard/domains/code_generation").json()
+    assert detail["evolution_paused"] is True
+    assert detail["pause_reason"] == "Manual pause"
+
+    assert get_snapshot_service().get_stats()["invalidations"] >= 2
+
+
+def test_unchanged_rebuild_keeps_etag(pool_manager):
+    service = DashboardSnapshotService(ttl_seconds=0)
+
+    def overview_etag(snapshot):
+        return snapshot.render("overview", snapshot.overview)[1]
+
+    first = service.get()
+    second = service.get()
+    assert second is not first
+    assert second.last_updated == first.last_updated
+    assert overview_etag(second) == overview_etag(first)
+
+    pool_manager.get_pool("research").add(make_specialist("research", "scholar", 0.5))
+    assert overview_etag(service.get()) != overview_etag(first)
+
+
+def test_inactive_specialists_filtered(client, pool_manager):
+    pool_manager.get_pool("administration").specialists[1].status = SpecialistStatus.RETIRED
+    get_snapshot_service().invalidate()
+
+    active = client.get("/api/dashboard/specialists").json()
+    everyone = client.get("/api/dashboard/specialists", params={"active_only": False, "limit": 2}).json()
+
+    assert [s["name"] for s in active] == ["admin_0", "coder"]
+    assert [s["name"] for s in everyone] == ["admin_0", "admin_1"]
@@ -4,6 +4,7 @@ STAGE 3 INTEGRATION: Unit Tests for inter_agent_bus.py
 Tests the inter-agent communication bus system.
 """
 
+import asyncio
 import json
 import time
 import unittest
@@ -256,6 +257,119 @@ class TestInterAgentBus(unittest.TestCase):
         self.assertEqual(pending[0].subject, "Question 1")
 
 
+class TestIndexedBus(unittest.TestCase):
+    """Test inbox indexes, retention and push delivery."""
+
+    def setUp(self):
+        """Set up test fixtures."""
+        self.bus = inter_agent_bus.InterAgentBus(max_messages=20)
+
+    def tearDown(self):
+        self.bus.close()
+
+    def send(self, subject, message_type=inter_agent_bus.MessageType.INFO,
+             from_agent="employee", to_agent="manager", **kwargs):
+        return self.bus.send_message(
+            from_agent=from_agent,
+            to_agent=to_agent,
+            message_type=message_type,
+            subject=subject,
+            body={"subject": subject},
+            **kwargs,
+        )
+
+    def test_combined_filters(self):
+        """Test filters combine across the type, sender and unread indexes."""
+        blocker = inter_agent_bus.MessageType.BLOCKER_REPORT
+        self.send("b1", blocker, requires_response=True)
+        self.send("b2", blocker, from_agent="supervisor", requires_response=True)
+        b3 = self.send("b3", blocker, requires_response=True)
+        self.send("info", from_agent="employee")
+        self.bus.respond_to_message(b3, "manager", "Re: b3", "ok")
+
+        messages = self.bus.get_messages_for(
+            "manager", message_type=blocker, from_agent="employee", unread_only=True
+        )
+        self.assertEqual([m.subject for m in messages], ["b1"])
+        self.assertEqual(len(self.bus.get_messages_for("manager", from_agent="employee")), 3)
+
+    def test_retention_spills_to_disk(self):
+        """Test old messages leave memory but stay reachable by id and thread."""
+        root = self.send("question", requires_response=True)
+        first = self.send("first")
+        for i in range(40):
+            self.send(f"filler {i}")
+
+        stats = self.bus.get_stats()
+        self.assertLessEqual(stats["messages_in_memory"], 20)
+        self.assertEqual(stats["total_messages"], 42)
+        self.assertEqual(stats["messages_spilled"], 42 - stats["messages_in_memory"])
+
+        # Spilled messages come back from disk
+        self.assertEqual(self.bus.get_message(first).body, {"subject": "first"})
+        self.assertNotIn(first, [m.id for m in self.bus.get_all_messages()])
+
+        # Messages awaiting a response are kept in memory
+        self.assertEqual([m.subject for m in self.bus.get_pending_requests("manager")], ["question"])
+        reply = self.bus.respond_to_message(root, "manager", "Re: question", "answer")
+        self.assertEqual(
+            [m.id for m in self.bus.get_conversation(reply)], [root, reply]
+        )
+        self.assertEqual(self.bus.get_stats()["pending_responses"], 0)
+
+    def test_retention_bounds_thread_indexes(self):
+        """Test thread indexes and late responses leave memory with their messages."""
+        root = self.send("root")
+        reply = self.bus.respond_to_message(root, "manager", "Re: root", "a")
+        previous = None
+        for i in range(300):
+            previous = self.send(f"chat {i}", in_reply_to=previous if i % 3 else None)
+        for i in range(30):
+            self.send(f"pending {i}", requires_response=True)
+
+        bus = self.bus
+        self.assertLessEqual(len(bus._thread_roots), len(bus._messages))
+        self.assertLessEqual(len(bus._threads), len(bus._messages))
+
+        # A spilled thread is still complete, and can grow and be answered
+        late = bus.respond_to_message(reply, "manager", "Re: Re: root", "b")
+        self.assertEqual([m.id for m in bus.get_conversation(root)], [root, reply, late])
+        self.assertEqual(bus.get_response(reply).id, late)
+        self.assertEqual(len(bus.get_pending_requests("manager")), 30)
+
+    def test_conversation_index(self):
+        """Test threads are found from any message in them."""
+        root = self.send("root")
+        reply = self.bus.respond_to_message(root, "manager", "Re: root", "a")
+        nested = self.send("follow-up", in_reply_to=reply)
+        self.send("unrelated")
+
+        for msg_id in (root, reply, nested):
+            thread = self.bus.get_conversation(msg_id)
+            self.assertEqual([m.id for m in thread], [root, reply, nested])
+
+    def test_receive_and_subscribe(self):
+        """Test awaitable delivery and callbacks replace polling."""
+        received = []
+        self.bus.subscribe("manager", received.append)
+
+        async def consume():
+            waiting = asyncio.create_task(self.bus.receive("manager", timeout=1))
+            await asyncio.sleep(0.01)
+            self.send("live")
+            first = await waiting
+            self.send("queued")
+            second = await self.bus.receive("manager", timeout=1)
+            third = await self.bus.receive("manager", timeout=0.05)
+            return first, second, third
+
+        first, second, third = asyncio.run(consume())
+        self.assertEqual(first.subject, "live")
+        self.assertEqual(second.subject, "queued")
+        self.assertIsNone(third)
+        self.assertEqual([m.subject for m in received], ["live", "queued"])
+
+
 def run_tests():
     """Run all tests."""
     suite = unittest.TestLoader().loadTestsFromModule(sys.modules[__name__])
@@ -8,7 +8,9 @@ Run with: python tests/test_monitoring_alerting.py
 
 from __future__ import annotations
 
+import importlib.util
 import json
+import sqlite3
 import sys
 import tempfile
 import time
@@ -20,8 +22,15 @@ agent_dir = Path(__file__).resolve().parent.parent / "agent"
 if str(agent_dir) not in sys.path:
     sys.path.insert(0, str(agent_dir))
 
-from monitoring import MetricsCollector
-from alerting import AlertManager, AlertRule, Alert
+# agent/monitoring/ (the Prometheus-style package) shadows agent/monitoring.py
+# on sys.path, so load the mission metrics module from its file
+_spec = importlib.util.spec_from_file_location("mission_monitoring", agent_dir / "monitoring.py")
+mission_monitoring = importlib.util.module_from_spec(_spec)
+sys.modules["mission_monitoring"] = mission_monitoring
+_spec.loader.exec_module(mission_monitoring)
+MetricsCollector = mission_monitoring.MetricsCollector
+
+from alerting import AlertDispatcher, AlertManager, AlertRule, Alert, ChannelLimits  # noqa: E402 - needs agent/ on sys.path
 
 
 class TestRunner:
@@ -230,6 +239,119 @@ def run_tests():
 
     runner.test("Health status degradation", test_health_status_degraded)
 
+    # ──────────────────────────────────────────────────────────────
+    # Buffered Writer Tests
+    # ──────────────────────────────────────────────────────────────
+    print("\n[BUFFER] Buffered Metrics Writer Tests")
+    print("-" * 60)
+
+    def test_writes_buffered_until_flush():
+        """Test recorders don't touch disk until a flush."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "monitoring.db"
+            metrics = MetricsCollector(db_path, flush_interval=0, batch_size=100)
+
+            metrics.record_mission("m1", "success", 1.0, 10, 1)
+            metrics.record_tool_execution("git_status", True, 0.5)
+
+            with sqlite3.connect(db_path) as conn:
+                assert conn.execute("SELECT COUNT(*) FROM mission_metrics").fetchone()[0] == 0
+
+            # Queries flush first
+            assert metrics.get_mission_stats(hours=1)["total_missions"] == 1
+            with sqlite3.connect(db_path) as conn:
+                assert conn.execute("SELECT COUNT(*) FROM mission_metrics").fetchone()[0] == 1
+            metrics.close()
+
+    runner.test("Writes buffered until flush", test_writes_buffered_until_flush)
+
+    def test_batch_size_triggers_flush():
+        """Test the size threshold flushes without a query."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "monitoring.db"
+            metrics = MetricsCollector(db_path, flush_interval=0, batch_size=3)
+
+            for i in range(3):
+                metrics.record_tool_execution("pytest", i != 1, float(i + 1))
+
+            with sqlite3.connect(db_path) as conn:
+                row = conn.execute(
+                    "SELECT execution_count, failure_count, avg_duration_seconds FROM tool_metrics"
+                ).fetchone()
+            assert row == (3, 1, 2.0)
+            metrics.close()
+
+    runner.test("Batch size triggers flush", test_batch_size_triggers_flush)
+
+    def test_background_flusher():
+        """Test the timer flushes pending metrics."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "monitoring.db"
+            metrics = MetricsCollector(db_path, flush_interval=0.05)
+            metrics.record_health_check(cpu_percent=10.0)
+
+            deadline = time.time() + 2
+            count = 0
+            while time.time() < deadline and not count:
+                time.sleep(0.05)
+                with sqlite3.connect(db_path) as conn:
+                    count = conn.execute("SELECT COUNT(*) FROM health_metrics").fetchone()[0]
+            assert count == 1
+            metrics.close()
+
+    runner.test("Background flusher writes on a timer", test_background_flusher)
+
+    def test_stats_survive_raw_retention():
+        """Test hourly rollups keep stats after raw rows expire."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            db_path = Path(tmpdir) / "monitoring.db"
+            metrics = MetricsCollector(db_path, flush_interval=0)
+
+            metrics.record_mission("m1", "success", 1.0, 100, 2, domain="coding")
+            metrics.record_mission("m2", "failed", 3.0, 200, 4, domain="coding")
+            metrics.record_mission("m3", "success", 2.0, 300, 3, domain="finance")
+            metrics.record_health_check(cpu_percent=40.0, queue_length=7)
+            metrics.flush()
+
+            # Age everything by two hours and expire the raw rows
+            with metrics._conn:
+                two_hours = "-2 hours"
+                metrics._conn.execute(
+                    "UPDATE mission_metrics SET timestamp = strftime('%Y-%m-%dT%H:%M:%f', timestamp, ?)",
+                    (two_hours,),
+                )
+                for table in ("mission_rollups", "health_rollups"):
+                    metrics._conn.execute(
+                        f"UPDATE {table} SET bucket_start = strftime('%Y-%m-%dT%H:%M:%S', bucket_start, ?)",
+                        (two_hours,),
+                    )
+            future = datetime.utcnow() + timedelta(days=mission_monitoring.RAW_RETENTION_DAYS, hours=1)
+            deleted = metrics.apply_retention(now=future)
+            assert deleted["mission_metrics"] == 3
+            assert deleted["mission_rollups"] > 0  # Minute rollups downsampled away
+
+            stats = metrics.get_mission_stats(hours=24)
+            assert stats["total_missions"] == 3
+            assert stats["avg_cost_usd"] == 2.0
+            assert metrics.get_mission_stats(hours=24, domain="coding")["failed_missions"] == 1
+            assert metrics.get_mission_stats(hours=1)["total_missions"] == 0
+
+            health = metrics.get_health_rollups(hours=24)
+            assert health[0]["avg_cpu_percent"] == 40.0
+            assert health[0]["max_queue_length"] == 7
+            metrics.close()
+
+    runner.test("Stats survive raw retention", test_stats_survive_raw_retention)
+
+    def test_concurrent_write_benchmark():
+        """Test no writes are lost under concurrent missions."""
+        result = mission_monitoring.benchmark_writes(missions=400, concurrency=8, batch_size=50)
+        assert result["missions"] == 400
+        assert result["writes"] == 1600
+        assert result["writes_per_second"] > 0
+
+    runner.test("Concurrent write benchmark", test_concurrent_write_benchmark)
+
     # ──────────────────────────────────────────────────────────────
     # Alerting Tests
     # ──────────────────────────────────────────────────────────────
@@ -420,6 +542,160 @@ def run_tests():
 
     runner.test("Alert history recording", test_alert_history)
 
+    # ──────────────────────────────────────────────────────────────────
+    # Dispatch Tests
+    # ──────────────────────────────────────────────────────────────────
+    print("\n[DISPATCH] Alert Dispatch Tests")
+    print("-" * 60)
+
+    class RecordingNotifier:
+        """Records delivered alerts, optionally slowly."""
+
+        def __init__(self, delay=0.0):
+            self.delay = delay
+            self.sent = []
+
+        def send(self, alert):
+            time.sleep(self.delay)
+            self.sent.append((time.monotonic(), alert))
+            return True
+
+    def make_alert(rule="Cost Alert", fingerprint="", message="Cost high"):
+        return Alert(
+            rule_name=rule,
+            severity="warning",
+            message=message,
+            current_value=1.0,
+            threshold=0.5,
+            timestamp=datetime.utcnow().isoformat(),
+            fingerprint=fingerprint,
+        )
+
+    def test_slow_channel_does_not_block():
+        """Test a slow channel delays neither the caller nor other channels."""
+        slow = RecordingNotifier(delay=0.5)
+        fast = RecordingNotifier()
+        dispatcher = AlertDispatcher({"slow": slow, "fast": fast}, group_window_seconds=0)
+        try:
+            started = time.monotonic()
+            for i in range(3):
+                dispatcher.dispatch(make_alert(fingerprint=str(i)), ["slow", "fast"])
+            assert time.monotonic() - started < 0.1, "dispatch() blocked"
+
+            deadline = time.monotonic() + 2
+            while len(fast.sent) < 3 and time.monotonic() < deadline:
+                time.sleep(0.01)
+            assert len(fast.sent) == 3
+            assert len(slow.sent) < 3, "fast channel waited on slow one"
+
+            assert dispatcher.drain(timeout=5)
+            assert len(slow.sent) == 3
+        finally:
+            dispatcher.close()
+
+    runner.test("Slow channel doesn't block others", test_slow_channel_does_not_block)
+
+    def test_repeats_are_grouped():
+        """Test repeats within the window become one follow-up alert."""
+        notifier = RecordingNotifier()
+        dispatcher = AlertDispatcher({"slack": notifier}, group_window_seconds=0.2)
+        try:
+            for _ in range(5):
+                dispatcher.dispatch(make_alert(fingerprint="db"), ["slack"])
+            dispatcher.dispatch(make_alert(fingerprint="api"), ["slack"])
+            assert dispatcher.drain(timeout=2)
+            assert len(notifier.sent) == 2  # First of each fingerprint
+
+            time.sleep(0.3)
+            assert dispatcher.drain(timeout=2)
+            assert len(notifier.sent) == 3
+            summary = notifier.sent[-1][1]
+            assert summary.fingerprint == "db"
+            assert summary.metadata["grouped_count"] == 4
+            assert "4 similar alerts" in summary.message
+            assert dispatcher.get_stats()["suppressed"] == 4
+        finally:
+            dispatcher.close()
+
+    runner.test("Repeats grouped by rule and fingerprint", test_repeats_are_grouped)
+
+    def test_channel_rate_limit():
+        """Test sends beyond the burst are spaced by the channel rate."""
+        notifier = RecordingNotifier()
+        limits = {"email": ChannelLimits(rate_per_minute=600, burst=2, concurrency=1)}
+        dispatcher = AlertDispatcher({"email": notifier}, limits=limits, group_window_seconds=0)
+        try:
+            for i in range(4):
+                dispatcher.dispatch(make_alert(fingerprint=str(i)), ["email"])
+            assert dispatcher.drain(timeout=5)
+
+            times = [sent_at for sent_at, _ in notifier.sent]
+            assert len(times) == 4
+            # 10/s after a burst of 2: the 4th send waits ~0.2s
+            assert times[3] - times[0] >= 0.15
+            assert dispatcher.get_stats()["channels"]["email"]["sent"] == 4
+        finally:
+            dispatcher.close()
+
+    runner.test("Per-channel rate limit", test_channel_rate_limit)
+
+    def test_channel_limits_reject_zero_rate():
+        """Test a non-positive channel rate is rejected up front."""
+        for rate in (0, -1):
+            try:
+                ChannelLimits(rate_per_minute=rate)
+                raise AssertionError(f"rate_per_minute={rate} should be rejected")
+            except ValueError:
+                pass
+
+    runner.test("Channel limits reject non-positive rate", test_channel_limits_reject_zero_rate)
+
+    def test_rules_evaluated_from_metric_stream():
+        """Test rules fire as metrics are recorded, without polling."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            metrics = MetricsCollector(Path(tmpdir) / "monitoring.db")
+            notifier = RecordingNotifier()
+            dispatcher = AlertDispatcher({"slack": notifier}, group_window_seconds=0)
+            alert_mgr = AlertManager(
+                Path(tmpdir) / "alerting.db", metrics_collector=metrics, dispatcher=dispatcher,
+            )
+            try:
+                metrics.record_mission("m0", "success", 40.0, 100, 2)
+
+                alert_mgr.add_rule(
+                    name="Cost Alert",
+                    condition="daily_cost_exceeds",
+                    threshold=100.0,
+                    channels=["slack"],
+                )
+                alert_mgr.add_rule(
+                    name="Queue Alert",
+                    condition="queue_length_exceeds",
+                    threshold=10,
+                    channels=["slack"],
+                )
+
+                metrics.record_mission("m1", "success", 50.0, 100, 2)
+                assert alert_mgr.get_alert_history() == []
+
+                metrics.record_mission("m2", "success", 20.0, 100, 2)
+                metrics.record_health_check(10.0, 10.0, 10.0, 1, 25)
+                # In cooldown: no second cost alert
+                metrics.record_mission("m3", "success", 20.0, 100, 2)
+
+                history = alert_mgr.get_alert_history()
+                assert sorted(a["rule_name"] for a in history) == ["Cost Alert", "Queue Alert"]
+                cost_alert = next(a for a in history if a["rule_name"] == "Cost Alert")
+                assert cost_alert["current_value"] == 110.0
+
+                assert alert_mgr.flush_notifications(timeout=2)
+                assert len(notifier.sent) == 2
+            finally:
+                dispatcher.close()
+                metrics.close()
+
+    runner.test("Rules evaluated from metric stream", test_rules_evaluated_from_metric_stream)
+
     # ──────────────────────────────────────────────────────────────
     # Acceptance Criteria Tests
     # ──────────────────────────────────────────────────────────────